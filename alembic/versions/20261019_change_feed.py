@@ -0,0 +1,43 @@
+# File: /alembic/versions/20261019_change_feed.py | Version: 1.1 | Title: Change feed outbox table
+"""change_event outbox (GET /workspaces/{id}/changes)"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "change_feed_20261019"
+down_revision = "jobs_20261019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "change_event",
+        sa.Column(
+            "seq",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            autoincrement=True,
+            nullable=False,
+        ),
+        sa.Column("workspace_id", sa.String(), nullable=False),
+        sa.Column("entity", sa.String(length=40), nullable=False),
+        sa.Column("entity_id", sa.String(), nullable=False),
+        sa.Column("op", sa.String(length=20), nullable=False),
+        sa.Column("task_id", sa.String(), nullable=True),
+        sa.Column("list_id", sa.String(), nullable=True),
+        sa.Column("data", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspace.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("seq"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(
+        "ix_change_event_workspace_seq", "change_event", ["workspace_id", "seq"]
+    )
+    op.create_index(op.f("ix_change_event_created_at"), "change_event", ["created_at"])
+
+
+def downgrade():
+    op.drop_index(op.f("ix_change_event_created_at"), table_name="change_event")
+    op.drop_index("ix_change_event_workspace_seq", table_name="change_event")
+    op.drop_table("change_event")
@@ -0,0 +1,48 @@
+# File: /alembic/versions/20261019_jobs.py | Version: 1.1 | Title: Background job queue table
+"""job table (DB-backed background job queue)"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "jobs_20261019"
+down_revision = "task_import_20261019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "job",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("kind", sa.String(length=100), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_after", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "cancel_requested", sa.Boolean(), server_default=sa.false(), nullable=False
+        ),
+        sa.Column("locked_by", sa.String(length=100), nullable=True),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", sa.String(), nullable=True),
+        sa.Column("workspace_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["created_by"], ["user.id"]),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspace.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_job_status_run_after", "job", ["status", "run_after"])
+    op.create_index(op.f("ix_job_created_by"), "job", ["created_by"])
+    op.create_index(op.f("ix_job_workspace_id"), "job", ["workspace_id"])
+
+
+def downgrade():
+    op.drop_index(op.f("ix_job_workspace_id"), table_name="job")
+    op.drop_index(op.f("ix_job_created_by"), table_name="job")
+    op.drop_index("ix_job_status_run_after", table_name="job")
+    op.drop_table("job")
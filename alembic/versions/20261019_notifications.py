@@ -0,0 +1,73 @@
+# File: /alembic/versions/20261019_notifications.py | Version: 1.1 | Title: Watcher notification inbox
+"""notification inbox, unread counters, dispatch cursor; change_event.actor_id"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "notifications_20261019"
+down_revision = "change_feed_20261019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("change_event") as batch:
+        batch.add_column(sa.Column("actor_id", sa.String(), nullable=True))
+
+    op.create_table(
+        "notification",
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            autoincrement=True,
+            nullable=False,
+        ),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("workspace_id", sa.String(), nullable=False),
+        sa.Column("task_id", sa.String(), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.Column("first_seq", sa.BigInteger(), nullable=False),
+        sa.Column("last_seq", sa.BigInteger(), nullable=False),
+        sa.Column("summary", sa.JSON(), nullable=True),
+        sa.Column("read_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspace.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index("ix_notification_user_id_id", "notification", ["user_id", "id"])
+    op.create_index(
+        "ix_notification_task_updated", "notification", ["task_id", "updated_at"]
+    )
+
+    op.create_table(
+        "notification_counter",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("unread", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    op.create_table(
+        "notification_cursor",
+        sa.Column("name", sa.String(length=40), nullable=False),
+        sa.Column("seq", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    # Start at the current head so existing history isn't replayed as notifications.
+    op.execute(
+        "INSERT INTO notification_cursor (name, seq) "
+        "SELECT 'notifications', COALESCE(MAX(seq), 0) FROM change_event"
+    )
+
+
+def downgrade():
+    op.drop_table("notification_cursor")
+    op.drop_table("notification_counter")
+    op.drop_index("ix_notification_task_updated", table_name="notification")
+    op.drop_index("ix_notification_user_id_id", table_name="notification")
+    op.drop_table("notification")
+    with op.batch_alter_table("change_event") as batch:
+        batch.drop_column("actor_id")
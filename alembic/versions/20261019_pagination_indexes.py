@@ -0,0 +1,27 @@
+# File: /alembic/versions/20261019_pagination_indexes.py | Version: 1.1 | Title: Composite indexes for keyset-paginated lists
+"""keyset pagination indexes on task and tag"""
+
+from alembic import op
+
+revision = "pagination_indexes_20261019"
+down_revision = "scope_version_20261019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_task_list_id_created_at_id", "task", ["list_id", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_task_parent_task_id_created_at_id",
+        "task",
+        ["parent_task_id", "created_at", "id"],
+    )
+    op.create_index("ix_tag_workspace_id_name", "tag", ["workspace_id", "name"])
+
+
+def downgrade():
+    op.drop_index("ix_tag_workspace_id_name", table_name="tag")
+    op.drop_index("ix_task_parent_task_id_created_at_id", table_name="task")
+    op.drop_index("ix_task_list_id_created_at_id", table_name="task")
@@ -0,0 +1,25 @@
+# File: /alembic/versions/20261019_scope_version.py | Version: 1.0 | Title: Per-scope write versions (ETags)
+"""scope_version counters bumped by change-event commits"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "scope_version_20261019"
+down_revision = "notifications_20261019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # No backfill: a missing row reads as version 0 and the next write creates it.
+    op.create_table(
+        "scope_version",
+        sa.Column("scope", sa.String(length=20), nullable=False),
+        sa.Column("scope_id", sa.String(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "scope_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("scope_version")
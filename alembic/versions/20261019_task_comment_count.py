@@ -0,0 +1,26 @@
+# File: /alembic/versions/20261019_task_comment_count.py | Version: 1.0 | Title: Per-task comment counter
+"""task.comment_count, backfilled from comment"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "task_comment_count_20261019"
+down_revision = "pagination_indexes_20261019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("task") as batch:
+        batch.add_column(
+            sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False)
+        )
+    op.execute(
+        "UPDATE task SET comment_count = "
+        "(SELECT COUNT(*) FROM comment WHERE comment.task_id = task.id)"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("task") as batch:
+        batch.drop_column("comment_count")
@@ -0,0 +1,44 @@
+# File: /alembic/versions/20261019_task_import.py | Version: 1.1 | Title: Bulk task import checkpoints
+"""task_import table (bulk import progress + error report)"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "task_import_20261019"
+down_revision = "time_tracking_20261019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "task_import",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("workspace_id", sa.String(), nullable=False),
+        sa.Column("list_id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("source", sa.String(length=255), nullable=True),
+        sa.Column("format", sa.String(length=10), nullable=False),
+        sa.Column(
+            "status", sa.String(length=20), server_default="pending", nullable=False
+        ),
+        sa.Column("rows_processed", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("rows_imported", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("rows_failed", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("errors", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspace.id"]),
+        sa.ForeignKeyConstraint(["list_id"], ["list.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_task_import_workspace_id"), "task_import", ["workspace_id"]
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_task_import_workspace_id"), table_name="task_import")
+    op.drop_table("task_import")
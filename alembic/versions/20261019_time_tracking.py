@@ -0,0 +1,70 @@
+# File: /alembic/versions/20261019_time_tracking.py | Version: 1.0 | Title: Time tracking (timer columns + daily rollup)
+"""time tracking: time_entry.ended_at/note and time_entry_daily rollup"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "time_tracking_20261019"
+down_revision = "add_views_20250814"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("time_entry") as batch:
+        batch.add_column(
+            sa.Column("ended_at", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch.add_column(sa.Column("note", sa.Text(), nullable=True))
+    # Entries written before timers existed are all finished.
+    op.execute(
+        "UPDATE time_entry SET ended_at = COALESCE(started_at, created_at) "
+        "WHERE ended_at IS NULL"
+    )
+    op.create_index("ix_time_entry_user_ended", "time_entry", ["user_id", "ended_at"])
+
+    op.create_table(
+        "time_entry_daily",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("task_id", sa.String(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("workspace_id", sa.String(), nullable=False),
+        sa.Column("minutes", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.ForeignKeyConstraint(["task_id"], ["task.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspace.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "task_id", "day"),
+    )
+    op.create_index(
+        "ix_time_daily_workspace_day", "time_entry_daily", ["workspace_id", "day"]
+    )
+    op.create_index("ix_time_daily_user_day", "time_entry_daily", ["user_id", "day"])
+    op.create_index(
+        op.f("ix_time_entry_daily_task_id"), "time_entry_daily", ["task_id"]
+    )
+
+    # Backfill the rollup from existing entries.
+    op.execute(
+        "INSERT INTO time_entry_daily (user_id, task_id, day, workspace_id, minutes) "
+        "SELECT te.user_id, te.task_id, DATE(COALESCE(te.started_at, te.created_at)), "
+        "s.workspace_id, SUM(te.minutes) "
+        "FROM time_entry te "
+        "JOIN task t ON t.id = te.task_id "
+        'JOIN "list" l ON l.id = t.list_id '
+        "JOIN space s ON s.id = l.space_id "
+        "WHERE te.ended_at IS NOT NULL "
+        "GROUP BY te.user_id, te.task_id, DATE(COALESCE(te.started_at, te.created_at)), "
+        "s.workspace_id "
+        "HAVING SUM(te.minutes) > 0"
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_time_entry_daily_task_id"), table_name="time_entry_daily")
+    op.drop_index("ix_time_daily_user_day", table_name="time_entry_daily")
+    op.drop_index("ix_time_daily_workspace_day", table_name="time_entry_daily")
+    op.drop_table("time_entry_daily")
+    op.drop_index("ix_time_entry_user_ended", table_name="time_entry")
+    with op.batch_alter_table("time_entry") as batch:
+        batch.drop_column("note")
+        batch.drop_column("ended_at")
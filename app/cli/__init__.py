@@ -0,0 +1 @@
+# File: /app/cli/__init__.py | Version: 1.0 | Title: Command-line entry points (python -m app.cli.<name>)
@@ -0,0 +1,118 @@
+# File: /app/cli/import_tasks.py | Version: 1.0 | Title: Bulk task import from CSV/NDJSON
+"""
+Import tasks into a list from a CSV or NDJSON file.
+
+    python -m app.cli.import_tasks tasks.csv --list-id <uuid> --user owner@example.com
+    python -m app.cli.import_tasks tasks.csv --list-id <uuid> --user owner@example.com \\
+        --resume <import id> --errors errors.csv
+
+Same pipeline and column mapping as POST /lists/{id}/tasks/import; progress is
+checkpointed per chunk so an interrupted run resumes with --resume.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+from typing import List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.permissions import Role, has_min_role
+from app.crud import core_entities as crud_core
+from app.crud import task_import as crud_import
+from app.models.core_entities import User
+
+
+def _parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m app.cli.import_tasks")
+    p.add_argument("path", help="CSV or NDJSON file ('-' for stdin)")
+    p.add_argument("--list-id", required=True)
+    p.add_argument("--user", required=True, help="email of the importing member")
+    p.add_argument("--format", choices=crud_import.SUPPORTED_FORMATS)
+    p.add_argument("--chunk-size", type=int, default=settings.IMPORT_CHUNK_SIZE)
+    p.add_argument("--resume", metavar="IMPORT_ID")
+    p.add_argument("--errors", metavar="PATH", help="write the error report as CSV")
+    return p
+
+
+def run(args: argparse.Namespace, db: Session) -> int:
+    parent_list = crud_core.get_list(db, args.list_id)
+    if not parent_list:
+        print(f"list {args.list_id} not found", file=sys.stderr)
+        return 2
+    workspace_id = str(crud_core.get_space(db, parent_list.space_id).workspace_id)
+    user = db.scalar(
+        select(User).where(func.lower(User.email) == args.user.strip().lower())
+    )
+    if user is None or not has_min_role(
+        db, user_id=user.id, workspace_id=workspace_id, minimum=Role.MEMBER
+    ):
+        print(f"{args.user} is not a member of the list's workspace", file=sys.stderr)
+        return 2
+
+    if args.resume:
+        job = crud_import.get_import(db, import_id=args.resume)
+        if job is None or job.list_id != str(parent_list.id):
+            print(f"import {args.resume} not found for this list", file=sys.stderr)
+            return 2
+    else:
+        fmt = args.format or (
+            "ndjson" if args.path.lower().endswith((".ndjson", ".jsonl")) else "csv"
+        )
+        job = crud_import.create_import(
+            db,
+            workspace_id=workspace_id,
+            list_id=str(parent_list.id),
+            user_id=str(user.id),
+            fmt=fmt,
+            source=args.path,
+        )
+
+    stream = (
+        sys.stdin
+        if args.path == "-"
+        else open(args.path, encoding="utf-8-sig", newline="")
+    )
+    try:
+        crud_import.run_import(db, job=job, stream=stream, chunk_size=args.chunk_size)
+    except Exception as exc:  # noqa: BLE001 - already recorded on the job
+        print(f"import {job.id} failed: {exc}", file=sys.stderr)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+    db.refresh(job)
+    if args.errors:
+        with open(args.errors, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["row", "error"])
+            writer.writerows((e["row"], e["error"]) for e in job.errors or [])
+    print(
+        json.dumps(
+            {
+                "import_id": job.id,
+                "status": job.status,
+                "rows_processed": job.rows_processed,
+                "rows_imported": job.rows_imported,
+                "rows_failed": job.rows_failed,
+            }
+        )
+    )
+    return 0 if job.status == "completed" else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+    from app.db.session import SessionLocal
+
+    with SessionLocal() as db:
+        return run(args, db)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,199 @@
+# File: /app/core/cache.py | Version: 1.1 | Title: Result cache (local LRU / Redis) for version-keyed reads
+"""
+Caches computed read results under keys that embed the scope version they
+were computed at (see app.crud.changes.scope_version). A write bumps the
+version, so later lookups miss and the stale entry simply ages out; nothing
+has to be deleted on write.
+
+    local : per-process LRU with a TTL and an entry cap (default)
+    redis : shared across workers via the optional `redis` package; entries
+            expire by TTL and the server's maxmemory policy bounds size
+    off   : never stores anything
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+log = logging.getLogger(__name__)
+
+
+def cache_key(*parts: Any) -> str:
+    return hashlib.blake2b(
+        "\x1f".join(str(p) for p in parts).encode(), digest_size=16
+    ).hexdigest()
+
+
+class ResultCache(ABC):
+    """Backend interface; values must be JSON-serializable."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value; must not raise on backend errors."""
+
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Any]:
+        """Return the cached value or None; get() counts hits and misses."""
+
+    def __len__(self) -> int:
+        return 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self),
+        }
+
+
+class NullCache(ResultCache):
+    def _get(self, key: str) -> Optional[Any]:
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+class LocalCache(ResultCache):
+    """Thread-safe LRU; entries older than `ttl_seconds` count as misses."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= self._clock():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (self._clock() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCache(ResultCache):
+    """Shared cache; Redis errors degrade to misses instead of failing requests."""
+
+    def __init__(self, url: str, *, ttl_seconds: float, prefix: str = "rc:"):
+        super().__init__()
+        try:
+            import redis
+        except ImportError as e:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "cache backend `redis` requires the `redis` package"
+            ) from e
+        self._client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def _get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self._client.get(self.prefix + key)
+        except Exception:  # noqa: BLE001 - cache outage == miss
+            log.warning("redis cache get failed", exc_info=True)
+            return None
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            self._client.set(
+                self.prefix + key,
+                json.dumps(value, default=str),
+                ex=max(1, int(self.ttl_seconds)),
+            )
+        except Exception:  # noqa: BLE001
+            log.warning("redis cache set failed", exc_info=True)
+
+
+def make_cache(
+    name: str,
+    *,
+    max_entries: int = 1024,
+    ttl_seconds: float = 60.0,
+    redis_url: str = "",
+    prefix: str = "rc:",
+) -> ResultCache:
+    name = (name or "local").lower()
+    if name == "local":
+        return LocalCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+    if name == "redis":
+        return RedisCache(redis_url, ttl_seconds=ttl_seconds, prefix=prefix)
+    if name == "off":
+        return NullCache()
+    raise ValueError(f"Unknown cache backend {name!r} (local, redis, off)")
+
+
+_view_cache: Optional[ResultCache] = None
+
+
+def get_view_cache() -> ResultCache:
+    """Process-wide cache for GET /views/{id}/tasks results."""
+    global _view_cache
+    if _view_cache is None:
+        _view_cache = make_cache(
+            settings.VIEW_CACHE_BACKEND,
+            max_entries=settings.VIEW_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.VIEW_CACHE_TTL_SECONDS,
+            redis_url=settings.VIEW_CACHE_REDIS_URL,
+            prefix="view-tasks:",
+        )
+    return _view_cache
@@ -0,0 +1,91 @@
+# File: /app/core/change_notifier.py | Version: 1.1 | Title: In-process wakeups for change feed long-polls
+"""
+Wakes `GET /workspaces/{id}/changes?wait=` long-polls as soon as a
+transaction that recorded change events for the workspace commits.
+
+This only sees commits made by this process; waiters also re-check the DB
+every CHANGES_POLL_SECONDS so writes from other workers still arrive, just
+later.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Set
+
+log = logging.getLogger(__name__)
+
+
+class ChangeWaiter:
+    """One pending long-poll. Create inside the event loop that will await it."""
+
+    def __init__(self, notifier: "ChangeNotifier", workspace_id: str):
+        self._notifier = notifier
+        self.workspace_id = workspace_id
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def _wake(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:  # loop already closed
+            pass
+
+    async def wait(self, timeout: float) -> bool:
+        """True if woken by a commit, False on timeout."""
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def close(self) -> None:
+        self._notifier._discard(self)
+
+
+class ChangeNotifier:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: Dict[str, Set[ChangeWaiter]] = defaultdict(set)
+        self._listeners: List[Callable[[List[Dict[str, Any]]], None]] = []
+
+    def subscribe(self, workspace_id: str) -> ChangeWaiter:
+        waiter = ChangeWaiter(self, workspace_id)
+        with self._lock:
+            self._waiters[workspace_id].add(waiter)
+        return waiter
+
+    def _discard(self, waiter: ChangeWaiter) -> None:
+        with self._lock:
+            waiters = self._waiters.get(waiter.workspace_id)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._waiters[waiter.workspace_id]
+
+    def add_listener(self, fn: Callable[[List[Dict[str, Any]]], None]) -> None:
+        """Call fn(events) after every commit that recorded changes (in seq order)."""
+        if fn not in self._listeners:
+            self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[List[Dict[str, Any]]], None]) -> None:
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+
+    def notify(self, events: List[Dict[str, Any]]) -> None:
+        for ws in {e["workspace_id"] for e in events}:
+            with self._lock:
+                waiters = list(self._waiters.get(ws, ()))
+            for waiter in waiters:
+                waiter._wake()
+        for fn in list(self._listeners):
+            try:
+                fn(events)
+            except Exception:  # noqa: BLE001 - runs inside commit; never fail it
+                log.exception("change listener %r failed", fn)
+
+
+notifier = ChangeNotifier()
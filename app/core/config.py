@@ -1,10 +1,13 @@
-# File: /app/core/config.py | Version: 1.2 | Title: Central App Settings (Pydantic v2)
+# File: /app/core/config.py | Version: 1.19 | Title: Central App Settings (Pydantic v2)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     # --- Database ---
     DATABASE_URL: str = "sqlite:///./app.db"
+    # Optional override for the async stack; derived from DATABASE_URL when empty
+    # (sqlite -> sqlite+aiosqlite, postgresql -> postgresql+asyncpg)
+    ASYNC_DATABASE_URL: str = ""
 
     # --- Security / JWT ---
     SECRET_KEY: str = "CHANGE_ME_FOR_DEV_ONLY"
@@ -16,6 +19,97 @@ class Settings(BaseSettings):
     ENABLE_STD_ERRORS: bool = (
         False  # set True in .env to enable standardized error responses
     )
+    # Comma-separated router names from app.routers.registry to skip (never imported)
+    DISABLED_ROUTERS: str = ""
+    ASYNC_DB_ENABLED: bool = (
+        False  # serve hot read routes as `async def` on an AsyncSession
+    )
+    # Large list reads (tasks, comments, tags, watchers) skip per-row response-model
+    # validation and are written with orjson when installed (app.core.serialization)
+    FAST_JSON_ENABLED: bool = True
+    # Keyset-paginated list endpoints (app.core.pagination): rows per page when the
+    # client sends no ?limit=, and the most any page (or streamed chunk) may hold
+    PAGE_SIZE_DEFAULT: int = 200
+    PAGE_SIZE_MAX: int = 1000
+    # Per-request SQL stats as Server-Timing + log fields (app.observability.sql);
+    # statements slower than SLOW_QUERY_MS go to the app.sql.slow log, and that
+    # fraction of them with the database's EXPLAIN plan attached
+    SQL_TIMING_ENABLED: bool = True
+    SLOW_QUERY_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN_SAMPLE: float = 0.1
+    # GET /metrics (app.observability.metrics). Off by default: the endpoint is
+    # unauthenticated, so only enable it where just the scraper can reach the app.
+    # With several uvicorn workers, point METRICS_MULTIPROC_DIR at a shared directory:
+    # each worker writes a snapshot there every METRICS_FLUSH_SECONDS and a scrape of
+    # any worker sums them all
+    METRICS_ENABLED: bool = False
+    METRICS_MULTIPROC_DIR: str = ""
+    METRICS_FLUSH_SECONDS: float = 5.0
+    # One `app.access` record per request (app.middleware.request_context). Routes
+    # listed in ACCESS_LOG_ROUTE_SAMPLE_RATES ("<route template>=<rate>,...") are
+    # logged at that rate instead of ACCESS_LOG_SAMPLE_RATE; 5xx are always logged
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_SAMPLE_RATE: float = 1.0
+    ACCESS_LOG_ROUTE_SAMPLE_RATES: str = "/healthz=0,/readyz=0,/metrics=0"
+    # Profiling (app.observability.profiling). PROFILING_ENABLED lets Admins of
+    # PROFILING_WORKSPACE_ID add ?__profile=1 (or X-Profile: 1) to a request, which
+    # stores a collapsed-stack profile in PROFILING_DIR (?__profile=inline returns it).
+    # The continuous sampler writes hourly collapsed files for each worker there too
+    PROFILING_ENABLED: bool = False
+    PROFILING_WORKSPACE_ID: str = ""
+    PROFILING_DIR: str = "./var/profiles"
+    PROFILING_REQUEST_INTERVAL_MS: float = 1.0
+    PROFILING_SAMPLER_ENABLED: bool = False
+    PROFILING_SAMPLER_INTERVAL_MS: float = 50.0
+    PROFILING_SAMPLER_FLUSH_SECONDS: float = 60.0
+    # Task relationships not named in app.db.loaders.task_loaders() raise instead of
+    # lazy-loading (one query per row). The test suite turns this on.
+    STRICT_LOADING: bool = False
+    # Most task ids one POST /tasks:batchGet may ask for
+    TASK_BATCH_MAX: int = 500
+    # Rows fetched (and side-queried) per round trip by streaming exports
+    EXPORT_CHUNK_SIZE: int = 1000
+    # Rows per transaction (and checkpoint) for bulk task imports
+    IMPORT_CHUNK_SIZE: int = 5000
+
+    # --- Background jobs (app.jobs; DB-backed, no broker) ---
+    JOBS_ENABLED: bool = False  # run worker threads inside the API process
+    JOBS_WORKERS: int = 2
+    JOBS_POLL_SECONDS: float = 1.0
+    JOBS_MAX_ATTEMPTS: int = 3
+    JOBS_BACKOFF_SECONDS: float = 5.0  # first retry delay; doubles per attempt
+    JOBS_BACKOFF_MAX_SECONDS: float = 300.0
+    JOBS_LEASE_SECONDS: int = 900  # running jobs older than this are requeued
+    JOBS_DIR: str = "./var/jobs"  # staged uploads and finished exports
+
+    # --- Change feed (outbox behind GET /workspaces/{id}/changes) ---
+    CHANGES_PAGE_LIMIT: int = 1000  # max events per response
+    CHANGES_MAX_WAIT_SECONDS: int = 30  # long-poll cap
+    # Long-pollers re-check the DB this often (catches commits from other processes)
+    CHANGES_POLL_SECONDS: float = 2.0
+    CHANGES_RETENTION_DAYS: int = 7
+    CHANGES_PRUNE_SECONDS: float = 3600.0  # how often the worker trims old events
+
+    # --- Live push (SSE /workspaces/{id}/events, /lists/{id}/events) ---
+    # local: this process only | redis: fan out across workers (needs `redis`)
+    REALTIME_BACKEND: str = "local"
+    REALTIME_REDIS_URL: str = "redis://localhost:6379/0"
+    REALTIME_MAX_PENDING: int = 500  # undelivered events per connection before resync
+    REALTIME_COALESCE_MS: int = 50  # gather a burst before flushing it
+    REALTIME_HEARTBEAT_SECONDS: float = 15.0
+
+    # --- Watcher notifications (fanned out from change_event by the job worker) ---
+    NOTIFICATIONS_DISPATCH_SECONDS: float = 2.0  # how often the worker drains the feed
+    NOTIFICATIONS_BATCH_SIZE: int = 1000  # change events per dispatch transaction
+    # Unread activity on a task within this window is folded into one digest row
+    NOTIFICATIONS_DIGEST_SECONDS: int = 300
+    NOTIFICATIONS_PAGE_LIMIT: int = 100  # max rows per /me/notifications page
+
+    # --- Saved-view result cache (GET /views/{id}/tasks; keyed by scope version) ---
+    VIEW_CACHE_BACKEND: str = "local"  # local | redis (shared by workers) | off
+    VIEW_CACHE_MAX_ENTRIES: int = 2048  # local LRU cap
+    VIEW_CACHE_TTL_SECONDS: float = 300.0
+    VIEW_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
 
     # v2-style config
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
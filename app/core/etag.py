@@ -0,0 +1,58 @@
+# File: /app/core/etag.py | Version: 1.0 | Title: Weak ETags + If-None-Match for version-keyed GETs
+"""
+Conditional GET support. Handlers derive a weak ETag from cheap inputs
+(scope versions from app.crud.changes, query parameters) *before* running
+their real query, and return 304 when the client already holds it:
+
+    if (hit := not_modified(request, response, "task", task_id, version)):
+        return hit
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+# Clients may reuse a copy but must revalidate it first; never shared caches.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(
+        "\x1f".join(str(p) for p in parts).encode(), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison (RFC 9110 13.1.2) against an If-None-Match header."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = _opaque(etag)
+    return any(_opaque(tag) == wanted for tag in if_none_match.split(","))
+
+
+def not_modified(
+    request: Request, response: Response, *parts: Any
+) -> Optional[Response]:
+    """
+    Put the ETag for `parts` on `response`; if the request's If-None-Match
+    already names it, return the 304 to send instead of the body.
+    """
+    etag = make_etag(*parts)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        )
+    return None
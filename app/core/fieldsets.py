@@ -0,0 +1,74 @@
+# File: /app/core/fieldsets.py | Version: 1.2 | Title: Sparse fieldsets (?fields=) for list endpoints
+"""
+`?fields=id,name,status` on list endpoints. The handler selects only those
+columns and serializes the row tuples straight to JSON, skipping ORM objects
+and response-model validation:
+
+    cols = parse_fields(fields, TASK_COLUMNS)
+    if cols:
+        rows = db.execute(select(*(TASK_COLUMNS[c] for c in cols)).where(...))
+        return sparse_response(cols, rows, response)
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from fastapi import HTTPException, Response
+
+from app.core.serialization import FastJSONResponse, carried_headers
+
+FIELDS_DESCRIPTION = "Comma-separated fields to return, e.g. id,name,status"
+
+
+def parse_fields(
+    raw: Optional[str], allowed: Iterable[str], *, always: Sequence[str] = ("id",)
+) -> Optional[List[str]]:
+    """
+    Requested field names in order (`always` first, duplicates dropped), or
+    None when the parameter is absent so the caller keeps its full shape.
+    Unknown names are a 400 that lists the valid ones.
+    """
+    if raw is None or not raw.strip():
+        return None
+    allowed = list(allowed)
+    wanted = [f.strip() for f in raw.split(",") if f.strip()]
+    unknown = [f for f in wanted if f not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields {unknown}; choose from {sorted(allowed)}",
+        )
+    return list(dict.fromkeys([*always, *wanted]))
+
+
+def as_json(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def sparse_items(fields: Sequence[str], rows: Iterable[Sequence[Any]]) -> List[Dict]:
+    """
+    Plain dicts from row tuples whose columns are in `fields` order. Trailing
+    columns beyond `fields` (page keys added for the cursor) are left out.
+    """
+    return [{f: as_json(v) for f, v in zip(fields, row)} for row in rows]
+
+
+def sparse_serializer(fields: Sequence[str]) -> Callable[[Sequence[Any]], Dict]:
+    """One-row sparse_items(), for streamed responses."""
+    return lambda row: {f: as_json(v) for f, v in zip(fields, row)}
+
+
+def sparse_response(
+    fields: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    response: Optional[Response] = None,
+) -> FastJSONResponse:
+    """
+    The rows as a JSON array, bypassing the route's response_model. Headers
+    already put on the injected `response` (ETag, Cache-Control) are kept.
+    """
+    return FastJSONResponse(
+        sparse_items(fields, rows), headers=carried_headers(response)
+    )
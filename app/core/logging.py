@@ -1,8 +1,56 @@
-# File: /app/core/logging.py | Version: 1.1 | Title: App logging configuration (quiet httpx; JSON optional)
+# File: /app/core/logging.py | Version: 1.3 | Title: App logging configuration (quiet httpx; JSON optional + extra fields; queued I/O; request context)
+import atexit
 import json
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+# Per-request fields (request_id, user_id) stamped on every record. The dict is
+# shared, not copied: a dependency running in a worker thread can still bind
+# user_id for the middleware that opened the context.
+_log_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "app_log_context", default=None
+)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def open_log_context(**fields: Any):
+    """Start a request's context; returns the token for close_log_context()."""
+    return _log_context.set(dict(fields))
+
+
+def close_log_context(token) -> None:
+    _log_context.reset(token)
+
+
+def bind_log_context(**fields: Any) -> None:
+    """Add fields to the current request's records (no-op outside a request)."""
+    ctx = _log_context.get()
+    if ctx is not None:
+        ctx.update(fields)
+
+
+def log_context() -> Dict[str, Any]:
+    return _log_context.get() or {}
+
+
+class RequestContextFilter(logging.Filter):
+    """Copies the request context onto each record (attached to the handler)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):  # already stamped before queueing
+            ctx = _log_context.get() or {}
+            record.request_id = ctx.get("request_id", "-")
+            if "user_id" in ctx:
+                record.user_id = ctx["user_id"]
+        return True
 
 
 def _boolenv(name: str, default: bool = False) -> bool:
@@ -15,6 +63,8 @@ def _boolenv(name: str, default: bool = False) -> bool:
 def configure_logging() -> None:
     level = os.getenv("LOG_LEVEL", "INFO").upper()
     use_json = _boolenv("LOG_JSON", False)
+    # Handlers write from a listener thread; request code only enqueues
+    use_queue = _boolenv("LOG_QUEUE", True)
 
     if use_json:
         fmt = "%(message)s"
@@ -23,7 +73,7 @@ def configure_logging() -> None:
             "class": "logging.Formatter",
         }
     else:
-        fmt = "%(levelname)s %(asctime)s %(name)s: %(message)s"
+        fmt = "%(levelname)s %(asctime)s %(name)s [%(request_id)s]: %(message)s"
         formatter = {
             "format": fmt,
             "class": "logging.Formatter",
@@ -35,11 +85,15 @@ def configure_logging() -> None:
         "formatters": {
             "default": formatter,
         },
+        "filters": {
+            "request_context": {"()": RequestContextFilter},
+        },
         "handlers": {
             "console": {
                 "class": "logging.StreamHandler",
                 "formatter": "default",
                 "level": level,
+                "filters": ["request_context"],
             },
         },
         "root": {
@@ -57,6 +111,10 @@ def configure_logging() -> None:
         },
     }
 
+    global _listener
+    if _listener is not None:  # reconfiguring: drain and drop the old pipeline
+        _listener.stop()
+        _listener = None
     logging.config.dictConfig(config)
 
     if use_json:
@@ -64,14 +122,40 @@ def configure_logging() -> None:
         class JsonConsole(logging.Formatter):
             def format(self, record: logging.LogRecord) -> str:
                 base = {
+                    "ts": record.created,
                     "level": record.levelname,
                     "logger": record.name,
                     "message": record.getMessage(),
                 }
+                # structured fields, e.g. db_queries/db_ms from app.observability.sql
+                for key, value in vars(record).items():
+                    if key not in _RECORD_ATTRS:
+                        base[key] = value
                 if record.exc_info:
                     base["exc_info"] = self.formatException(record.exc_info)
-                return json.dumps(base, ensure_ascii=False)
+                return json.dumps(base, ensure_ascii=False, default=str)
 
         # Apply JSON formatter safely to all root handlers
         for h in logging.getLogger().handlers:
             h.setFormatter(JsonConsole())
+
+    if use_queue:
+        root = logging.getLogger()
+        handlers = list(root.handlers)
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        # Stamp request context while still on the request's thread/task
+        queue_handler.addFilter(RequestContextFilter())
+        for h in handlers:
+            root.removeHandler(h)
+        root.addHandler(queue_handler)
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+
+
+@atexit.register
+def _stop_listener() -> None:
+    if _listener is not None:
+        _listener.stop()  # flushes whatever is still queued
@@ -0,0 +1,295 @@
+# File: /app/core/pagination.py | Version: 1.2 | Title: Keyset (cursor) pagination + NDJSON streaming for list endpoints
+"""
+List endpoints page by keyset on a unique sort key, e.g. (Tag.name, Tag.id):
+
+    page: PageRequest = Depends(page_params)     # ?cursor=&limit=&stream=
+    fetch = lambda s, after, n: crud.get_x(s, ..., after=after, limit=n)
+    if page.stream:
+        return stream_rows(db, fetch, KEYS, row_serializer(XOut, X))
+    rows = finish_page(fetch(db, page.after, page.fetch_limit), page, KEYS, response)
+
+Crud functions apply the seek with keyset(), so a page costs one index range
+scan however deep the client is. Responses stay plain JSON arrays; the next
+page's cursor travels in the `X-Next-Cursor` header (absent on the last page).
+Clients that send no cursor get the first PAGE_SIZE_DEFAULT rows.
+
+Timelines (a task's comments) page both ways with `timeline_params`:
+`?order=desc` tails the newest rows, and `?after=<X-Latest-Cursor>` polls for
+rows newer than the last response without re-reading the thread.
+
+`?stream=true` returns every row as NDJSON instead. Rows are read
+PAGE_SIZE_MAX at a time by the same keyset query, on a session of its own.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+)
+
+from fastapi import HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import literal, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.serialization import dumps
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Position of the newest row a response holds, for polling with ?after=
+LATEST_CURSOR_HEADER = "X-Latest-Cursor"
+CURSOR_DESCRIPTION = f"Opaque cursor from a previous page's {NEXT_CURSOR_HEADER}"
+LIMIT_DESCRIPTION = "Page size (default PAGE_SIZE_DEFAULT, capped at PAGE_SIZE_MAX)"
+STREAM_DESCRIPTION = "Stream every row as NDJSON instead of one page"
+
+Fetch = Callable[[Session, Optional[list], int], Sequence[Any]]
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    after: Optional[list]
+    limit: int
+    stream: bool = False
+
+    @property
+    def fetch_limit(self) -> int:
+        """One look-ahead row tells whether another page exists."""
+        return self.limit + 1
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    parts = [{"dt": v.isoformat()} if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(parts, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        parts = json.loads(raw)
+        if not isinstance(parts, list):
+            raise ValueError(cursor)
+        return [
+            datetime.fromisoformat(p["dt"]) if isinstance(p, dict) else p for p in parts
+        ]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def page_request(
+    cursor: Optional[str], limit: Optional[int], stream: bool = False
+) -> PageRequest:
+    """Oversized limits are clamped to PAGE_SIZE_MAX rather than rejected."""
+    size = min(limit or settings.PAGE_SIZE_DEFAULT, settings.PAGE_SIZE_MAX)
+    after = decode_cursor(cursor) if cursor else None
+    return PageRequest(after=after, limit=size, stream=stream)
+
+
+def page_params(
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    limit: Optional[int] = Query(None, ge=1, description=LIMIT_DESCRIPTION),
+    stream: bool = Query(False, description=STREAM_DESCRIPTION),
+) -> PageRequest:
+    """Dependency for the cursor/limit/stream query parameters."""
+    return page_request(cursor, limit, stream)
+
+
+@dataclass(frozen=True)
+class TimelineRequest:
+    after: Optional[list]
+    limit: int
+    offset: int = 0
+    descending: bool = False
+    since: Optional[str] = None  # the raw ?after= cursor of a poll
+
+    @property
+    def fetch_limit(self) -> int:
+        return self.limit + 1
+
+
+def timeline_params(
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    order: Literal["asc", "desc"] = Query("asc", description="asc: oldest first"),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    after: Optional[str] = Query(
+        None,
+        description=f"Poll: rows newer than this {LATEST_CURSOR_HEADER}, oldest first",
+    ),
+) -> TimelineRequest:
+    """Dependency for time-ordered threads; `offset` stays for older clients."""
+    if cursor and after:
+        raise HTTPException(status_code=400, detail="Use either cursor or after")
+    if offset and (cursor or after):
+        raise HTTPException(status_code=400, detail="offset cannot follow a cursor")
+    if after:
+        return TimelineRequest(after=decode_cursor(after), limit=limit, since=after)
+    return TimelineRequest(
+        after=decode_cursor(cursor) if cursor else None,
+        limit=limit,
+        offset=offset,
+        descending=order == "desc",
+    )
+
+
+def _fits(key: Any, value: Any) -> bool:
+    # A cursor is client input: a value of the wrong type for its key column
+    # would otherwise fail at bind time as a 500.
+    try:
+        python_type = key.type.python_type
+    except NotImplementedError:
+        return True
+    return value is None or isinstance(value, python_type)
+
+
+def keyset(
+    q,
+    keys: Sequence[Any],
+    *,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+    descending: bool = False,
+):
+    """ORDER BY `keys`, seek past `after` and LIMIT (works on Query and Select)."""
+    if after is not None:
+        if len(after) != len(keys) or not all(map(_fits, keys, after)):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        bound = tuple_(*(literal(v, k.type) for k, v in zip(keys, after)))
+        q = q.filter(tuple_(*keys) < bound if descending else tuple_(*keys) > bound)
+    q = q.order_by(*(k.desc() if descending else k.asc() for k in keys))
+    if limit is not None:
+        q = q.limit(limit)
+    return q
+
+
+def with_keys(columns: Sequence[Any], keys: Sequence[Any]) -> List[Any]:
+    """`columns` plus any page key not among them, appended at the end."""
+    return [*columns, *(k for k in keys if not any(k is c for c in columns))]
+
+
+def row_key(row: Any, keys: Sequence[Any]) -> list:
+    # Column-tuple rows (?fields=) must select the key columns; callers append
+    # any the client did not ask for, and sparse_items() ignores the extras.
+    if isinstance(row, Row):
+        return [row._mapping[k] for k in keys]
+    return [getattr(row, k.key) for k in keys]
+
+
+def finish_page(
+    rows: Sequence[Any],
+    page: PageRequest | TimelineRequest,
+    keys: Sequence[Any],
+    response: Optional[Response] = None,
+) -> List[Any]:
+    """Drop the look-ahead row and advertise the next cursor when there is one."""
+    rows = list(rows)
+    if len(rows) <= page.limit:
+        return rows
+    rows = rows[: page.limit]
+    if response is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(row_key(rows[-1], keys))
+    return rows
+
+
+def mark_latest(
+    response: Response,
+    newest: Optional[Any],
+    keys: Sequence[Any],
+    fallback: Optional[str] = None,
+) -> None:
+    """
+    Put the cursor of `newest` (or, for an empty poll, the cursor the client
+    sent) in X-Latest-Cursor so the next poll asks only for rows after it.
+    """
+    cursor = encode_cursor(row_key(newest, keys)) if newest is not None else fallback
+    if cursor:
+        response.headers[LATEST_CURSOR_HEADER] = cursor
+
+
+def finish_timeline(
+    rows: Sequence[Any],
+    page: TimelineRequest,
+    keys: Sequence[Any],
+    response: Response,
+) -> List[Any]:
+    """finish_page() plus X-Latest-Cursor for the next poll."""
+    rows = finish_page(rows, page, keys, response)
+    newest = (rows[0] if page.descending else rows[-1]) if rows else None
+    mark_latest(response, newest, keys, page.since)
+    return rows
+
+
+def _ndjson(chunk: Sequence[Any], serialize: Callable[[Any], Any]) -> bytes:
+    return b"".join(dumps(serialize(r)) + b"\n" for r in chunk)
+
+
+def _iter_ndjson(
+    bind, fetch: Fetch, keys: Sequence[Any], serialize: Callable[[Any], Any]
+) -> Iterator[bytes]:
+    chunk_size = settings.PAGE_SIZE_MAX
+    after = None
+    with Session(bind=bind) as db:
+        while True:
+            rows = fetch(db, after, chunk_size)
+            if rows:
+                yield _ndjson(rows, serialize)
+            if len(rows) < chunk_size:
+                return
+            after = row_key(rows[-1], keys)
+            db.expunge_all()  # memory stays at one chunk
+
+
+def stream_rows(
+    db: Session,
+    fetch: Fetch,
+    keys: Sequence[Any],
+    serialize: Callable[[Any], Any],
+) -> StreamingResponse:
+    """
+    NDJSON of every row `fetch(db, after, limit)` pages through. The body is
+    read on a new Session, because the request's session is closed by then.
+    """
+    return StreamingResponse(
+        _iter_ndjson(db.get_bind(), fetch, keys, serialize),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _aiter_ndjson(
+    bind, fetch, keys: Sequence[Any], serialize: Callable[[Any], Any]
+) -> AsyncIterator[bytes]:
+    chunk_size = settings.PAGE_SIZE_MAX
+    after = None
+    async with AsyncSession(bind=bind) as db:
+        while True:
+            rows = await fetch(db, after, chunk_size)
+            if rows:
+                yield _ndjson(rows, serialize)
+            if len(rows) < chunk_size:
+                return
+            after = row_key(rows[-1], keys)
+            db.expunge_all()
+
+
+def stream_rows_async(
+    db: AsyncSession, fetch, keys: Sequence[Any], serialize: Callable[[Any], Any]
+) -> StreamingResponse:
+    """stream_rows() for the AsyncSession stack; `fetch` is a coroutine function."""
+    return StreamingResponse(
+        _aiter_ndjson(db.bind, fetch, keys, serialize),
+        media_type="application/x-ndjson",
+    )
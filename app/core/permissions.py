@@ -1,12 +1,15 @@
-# File: /app/core/permissions.py | Version: 1.1
+# File: /app/core/permissions.py | Version: 1.3
 from __future__ import annotations
 
 from enum import Enum
 from typing import Any, Callable, Optional
 
 from fastapi import Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.db.session import get_db
 from app.models.core_entities import User, WorkspaceMember  # type: ignore
 from app.security import get_current_user
@@ -56,6 +59,23 @@ def get_workspace_role(
     return _normalize_role(getattr(wm, "role", None))
 
 
+async def get_workspace_role_async(
+    db: AsyncSession, *, user_id: Any, workspace_id: Any
+) -> Optional[Role]:
+    """
+    AsyncSession twin of get_workspace_role() for the async router stack.
+    """
+    role = await db.scalar(
+        select(WorkspaceMember.role)
+        .where(
+            WorkspaceMember.user_id == user_id,
+            WorkspaceMember.workspace_id == workspace_id,
+        )
+        .limit(1)
+    )
+    return _normalize_role(role)
+
+
 def has_min_role(
     db: Session,
     *,
@@ -116,6 +136,27 @@ def can_view_workspace(db: Session, *, user_id: Any, workspace_id: Any) -> bool:
     return role is not None
 
 
+def can_profile(db: Session, *, user_id: Any) -> bool:
+    # Ops access (profiler): Admin+ in the PROFILING_WORKSPACE_ID workspace
+    workspace_id = settings.PROFILING_WORKSPACE_ID
+    return bool(workspace_id) and has_min_role(
+        db, user_id=user_id, workspace_id=workspace_id, minimum=Role.ADMIN
+    )
+
+
+def require_profiler(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """Dependency: 403 unless can_profile()."""
+    if not can_profile(db, user_id=current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Profiling requires Admin in the profiling workspace.",
+        )
+    return current_user
+
+
 # ----- FastAPI dependency factory -----
 def require_workspace_role_dependency(minimum: Role) -> Callable:
     """
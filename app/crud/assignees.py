@@ -1,10 +1,11 @@
-# File: /app/crud/assignees.py | Version: 1.0 | Title: Task Assignees Upsert Helper
+# File: /app/crud/assignees.py | Version: 1.1 | Title: Task Assignees Upsert Helper
 from __future__ import annotations
 
 from typing import Iterable, Optional
 
 from sqlalchemy.orm import Session
 
+from app.crud import changes
 from app.models.core_entities import TaskAssignee
 
 
@@ -31,4 +32,7 @@ def set_task_assignees(
     for uid in new_ids:
         db.add(TaskAssignee(task_id=str(task_id), user_id=str(uid)))
 
+    changes.record_task_event(
+        db, task_id=str(task_id), op="updated", data={"assignee_ids": sorted(new_ids)}
+    )
     db.commit()
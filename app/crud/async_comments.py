@@ -0,0 +1,32 @@
+# File: /app/crud/async_comments.py | Version: 1.1 | Path: /app/crud/async_comments.py
+# AsyncSession versions of the read paths in app/crud/comments.py.
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import keyset
+from app.crud.comments import COMMENT_PAGE_KEYS
+from app.models import core_entities as models
+
+
+async def get_comments_for_task(
+    db: AsyncSession,
+    *,
+    task_id: UUID,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    after: Optional[Sequence[Any]] = None,
+    descending: bool = False,
+) -> List[models.Comment]:
+    q = select(models.Comment).where(models.Comment.task_id == str(task_id))
+    q = keyset(q, COMMENT_PAGE_KEYS, after=after, descending=descending)
+    if offset:
+        q = q.offset(offset)
+    if limit:
+        q = q.limit(limit)
+    rows = await db.scalars(q)
+    return list(rows.all())
@@ -0,0 +1,66 @@
+# File: /app/crud/async_tags.py | Version: 1.2 | Path: /app/crud/async_tags.py
+# AsyncSession versions of the read paths in app/crud/tags.py.
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import keyset
+from app.crud.tags import TAG_PAGE_KEYS, TAG_TASK_PAGE_KEYS
+from app.models import core_entities as models
+
+
+async def get_tag(db: AsyncSession, *, tag_id: UUID | str) -> Optional[models.Tag]:
+    return await db.get(models.Tag, str(tag_id))
+
+
+async def get_workspace_tags(
+    db: AsyncSession,
+    *,
+    workspace_id: UUID,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+) -> List[models.Tag]:
+    stmt = select(models.Tag).where(models.Tag.workspace_id == str(workspace_id))
+    rows = await db.scalars(keyset(stmt, TAG_PAGE_KEYS, after=after, limit=limit))
+    return list(rows.all())
+
+
+async def get_tags_for_task(db: AsyncSession, *, task_id: UUID) -> List[models.Tag]:
+    rows = await db.scalars(
+        select(models.Tag)
+        .join(models.TaskTag, models.TaskTag.tag_id == models.Tag.id)
+        .where(models.TaskTag.task_id == str(task_id))
+        .order_by(models.Tag.name.asc())
+    )
+    return list(rows.all())
+
+
+async def get_tasks_for_tag(
+    db: AsyncSession,
+    *,
+    tag_id: UUID,
+    columns: Optional[Sequence[Any]] = None,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+) -> List[Any]:
+    """
+    Tasks carrying a tag, newest first; with `columns`, row tuples of just
+    those columns (which must include TAG_TASK_PAGE_KEYS when paging).
+    """
+    stmt = select(*columns).select_from(models.Task) if columns else select(models.Task)
+    stmt = keyset(
+        stmt.join(models.TaskTag, models.TaskTag.task_id == models.Task.id).where(
+            models.TaskTag.tag_id == str(tag_id)
+        ),
+        TAG_TASK_PAGE_KEYS,
+        after=after,
+        limit=limit,
+        descending=True,
+    )
+    if columns:
+        return list((await db.execute(stmt)).all())
+    return list((await db.scalars(stmt)).all())
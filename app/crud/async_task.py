@@ -0,0 +1,91 @@
+# File: /app/crud/async_task.py | Version: 1.5 | Path: /app/crud/async_task.py
+# AsyncSession versions of the hot read paths in app/crud/task.py.
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import keyset, with_keys
+from app.crud.task import TASK_PAGE_KEYS, task_columns
+from app.models import core_entities as models
+from app.models.scope_version import ScopeVersion
+
+
+async def get_task(db: AsyncSession, task_id: UUID) -> Optional[models.Task]:
+    return await db.get(models.Task, str(task_id))
+
+
+async def get_task_with_workspace_id(
+    db: AsyncSession, task_id: UUID
+) -> Tuple[Optional[models.Task], Optional[str]]:
+    """
+    Fetch a task together with its workspace id in one round trip
+    (Task -> List -> Space), instead of get_task + get_list + get_space.
+    """
+    row = (
+        await db.execute(
+            select(models.Task, models.Space.workspace_id)
+            .join(models.List, models.List.id == models.Task.list_id)
+            .join(models.Space, models.Space.id == models.List.space_id)
+            .where(models.Task.id == str(task_id))
+        )
+    ).first()
+    if row is None:
+        return None, None
+    return row[0], row[1]
+
+
+async def get_list_workspace_id(db: AsyncSession, list_id: UUID) -> Optional[str]:
+    return await db.scalar(
+        select(models.Space.workspace_id)
+        .join(models.List, models.List.space_id == models.Space.id)
+        .where(models.List.id == str(list_id))
+    )
+
+
+async def get_tasks_by_list(
+    db: AsyncSession,
+    list_id: UUID,
+    *,
+    fields: Optional[Sequence[str]] = None,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+) -> List[Any]:
+    """With `fields`, row tuples of those columns followed by the page keys."""
+    entities = (
+        with_keys(task_columns(fields), TASK_PAGE_KEYS) if fields else [models.Task]
+    )
+    stmt = keyset(
+        select(*entities).where(models.Task.list_id == str(list_id)),
+        TASK_PAGE_KEYS,
+        after=after,
+        limit=limit,
+    )
+    if fields:
+        return list((await db.execute(stmt)).all())
+    return list((await db.scalars(stmt)).all())
+
+
+async def get_subtasks(
+    db: AsyncSession,
+    parent_task_id: UUID,
+    *,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+) -> List[models.Task]:
+    stmt = select(models.Task).where(models.Task.parent_task_id == str(parent_task_id))
+    rows = await db.scalars(keyset(stmt, TASK_PAGE_KEYS, after=after, limit=limit))
+    return list(rows.all())
+
+
+async def get_scope_version(db: AsyncSession, *, scope: str, scope_id: str) -> int:
+    """AsyncSession twin of app.crud.changes.scope_version()."""
+    version = await db.scalar(
+        select(ScopeVersion.version).where(
+            ScopeVersion.scope == scope, ScopeVersion.scope_id == str(scope_id)
+        )
+    )
+    return version or 0
@@ -0,0 +1,280 @@
+# File: /app/crud/changes.py | Version: 1.4 | Title: Change feed outbox (record + read) + scope versions
+"""
+Every task-related write stages a ChangeEvent in its transaction; the commit
+inserts the staged rows last, so the event and the change land (or roll back)
+together. Readers page through a workspace's events by `seq`.
+
+A reader whose cursor has passed seq N must never see a commit below N later,
+so seq order has to be commit order. SQLite gets that from its single writer;
+on PostgreSQL the insert runs under a transaction-scoped advisory lock, held
+only from the insert to the commit.
+
+The same commit bumps the ScopeVersion counter of each task, list and
+workspace its events touch, which is what conditional GETs (ETags) compare.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.change_notifier import notifier
+from app.models.change_event import ChangeEvent
+from app.models.core_entities import List as ListModel
+from app.models.core_entities import Space, Task
+from app.models.scope_version import ScopeVersion
+
+# Session.info key: event rows recorded in the open transaction, inserted on commit
+_STAGED = "change_feed_staged"
+# Session.info key: events inserted by the committing transaction, published after it
+_PENDING = "change_feed_pending"
+# Session.info key: id of the user the session is writing on behalf of
+_ACTOR = "change_feed_actor"
+# pg_advisory_xact_lock key serializing seq assignment across writers
+_SEQ_LOCK = int.from_bytes(b"chgfeed", "big")
+
+
+def event_dict(ev: ChangeEvent) -> Dict[str, Any]:
+    return {
+        "seq": ev.seq,
+        "workspace_id": ev.workspace_id,
+        "entity": ev.entity,
+        "entity_id": ev.entity_id,
+        "op": ev.op,
+        "task_id": ev.task_id,
+        "list_id": ev.list_id,
+        "actor_id": ev.actor_id,
+        "data": ev.data,
+        "created_at": ev.created_at.isoformat() if ev.created_at else None,
+    }
+
+
+@event.listens_for(Session, "before_commit")
+def _insert_events_before_commit(session: Session) -> None:
+    # Flush the changes themselves first: their row locks are taken before the
+    # sequence lock, never while holding it.
+    session.flush()
+    staged = session.info.pop(_STAGED, None)
+    if staged:
+        pending = _insert_staged(session, staged)
+        session.info[_PENDING] = pending
+        bump_versions(session, scopes_for(pending))
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING, None)
+    if pending:
+        pending.sort(key=lambda e: e["seq"])
+        notifier.notify(pending)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_after_transaction_end(session: Session, transaction) -> None:
+    # rolled back or closed without committing: the staged events go with it
+    if transaction.parent is None:
+        session.info.pop(_STAGED, None)
+        session.info.pop(_PENDING, None)
+
+
+def set_actor(db: Session, user_id: Optional[str]) -> None:
+    """Attribute events recorded on this session to `user_id` (set on auth)."""
+    db.info[_ACTOR] = str(user_id) if user_id else None
+
+
+# -------- Scope lookups --------
+
+
+def scopes_for(events: Iterable[Dict[str, Any]]) -> Set[Tuple[str, str]]:
+    """The (scope, id) version keys a batch of event dicts invalidates."""
+    keys: Set[Tuple[str, str]] = set()
+    for ev in events:
+        keys.add(("workspace", ev["workspace_id"]))
+        if ev.get("list_id"):
+            keys.add(("list", ev["list_id"]))
+        if ev.get("task_id"):
+            keys.add(("task", ev["task_id"]))
+        moved_from = (ev.get("data") or {}).get("from_list_id")
+        if moved_from:
+            keys.add(("list", moved_from))
+    return keys
+
+
+def workspace_for_list(db: Session, *, list_id: str) -> Optional[str]:
+    return db.scalar(
+        select(Space.workspace_id)
+        .join(ListModel, ListModel.space_id == Space.id)
+        .where(ListModel.id == str(list_id))
+    )
+
+
+def scope_for_task(db: Session, *, task_id: str) -> Optional[Tuple[str, str]]:
+    """(workspace_id, list_id) of a task, or None if it doesn't exist."""
+    row = db.execute(
+        select(Space.workspace_id, Task.list_id)
+        .join(ListModel, ListModel.space_id == Space.id)
+        .join(Task, Task.list_id == ListModel.id)
+        .where(Task.id == str(task_id))
+    ).first()
+    return (row[0], row[1]) if row else None
+
+
+# -------- Writing --------
+
+
+def record_event(
+    db: Session,
+    *,
+    workspace_id: str,
+    entity: str,
+    entity_id: str,
+    op: str,
+    task_id: Optional[str] = None,
+    list_id: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Stage an event in the caller's transaction (the caller commits)."""
+    record_events(
+        db,
+        [
+            {
+                "workspace_id": str(workspace_id),
+                "entity": entity,
+                "entity_id": str(entity_id),
+                "op": op,
+                "task_id": str(task_id) if task_id else None,
+                "list_id": str(list_id) if list_id else None,
+                "data": data,
+            }
+        ],
+    )
+
+
+def record_task_event(
+    db: Session,
+    *,
+    task_id: str,
+    op: str,
+    entity: str = "task",
+    entity_id: Optional[str] = None,
+    data: Optional[Dict[str, Any]] = None,
+) -> None:
+    """record_event for something hanging off a task; resolves its workspace/list."""
+    scope = scope_for_task(db, task_id=str(task_id))
+    if scope is None:
+        return
+    record_event(
+        db,
+        workspace_id=scope[0],
+        entity=entity,
+        entity_id=entity_id or str(task_id),
+        op=op,
+        task_id=str(task_id),
+        list_id=scope[1],
+        data=data,
+    )
+
+
+def record_events(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """Bulk variant for imports; rows are ChangeEvent column dicts."""
+    if not rows:
+        return
+    actor = db.info.get(_ACTOR)
+    now = datetime.now(UTC)
+    db.info.setdefault(_STAGED, []).extend(
+        {
+            **dict.fromkeys(("task_id", "list_id", "data")),
+            "actor_id": actor,
+            "created_at": now,
+            **r,
+        }
+        for r in rows
+    )
+
+
+def _insert_staged(db: Session, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Insert the transaction's staged events (one executemany) and return
+    them as event dicts carrying their seq."""
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_advisory_xact_lock(_SEQ_LOCK)))
+    seqs = db.scalars(
+        insert(ChangeEvent).returning(ChangeEvent.seq, sort_by_parameter_order=True),
+        rows,
+    ).all()
+    return [
+        {**r, "seq": seq, "created_at": r["created_at"].isoformat()}
+        for seq, r in zip(seqs, rows)
+    ]
+
+
+def bump_versions(db: Session, keys: Iterable[Tuple[str, str]]) -> None:
+    """Increment each scope's version (one upsert executemany, sorted to keep
+    row-lock order stable across concurrent writers)."""
+    rows = [
+        {"scope": scope, "scope_id": str(scope_id), "version": 1}
+        for scope, scope_id in sorted(keys)
+    ]
+    if not rows:
+        return
+    table = ScopeVersion.__table__
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(table).on_conflict_do_update(
+        index_elements=[table.c.scope, table.c.scope_id],
+        set_={"version": table.c.version + 1},
+    )
+    db.execute(stmt, rows)
+
+
+# -------- Reading --------
+
+
+def scope_version(db: Session, *, scope: str, scope_id: str) -> int:
+    """Current version of a scope; 0 if nothing under it has changed yet."""
+    return (
+        db.scalar(
+            select(ScopeVersion.version).where(
+                ScopeVersion.scope == scope, ScopeVersion.scope_id == str(scope_id)
+            )
+        )
+        or 0
+    )
+
+
+def get_changes(
+    db: Session, *, workspace_id: str, since: int, limit: int
+) -> List[ChangeEvent]:
+    return list(
+        db.scalars(
+            select(ChangeEvent)
+            .where(ChangeEvent.workspace_id == str(workspace_id))
+            .where(ChangeEvent.seq > since)
+            .order_by(ChangeEvent.seq.asc())
+            .limit(limit)
+        )
+    )
+
+
+def head_seq(db: Session) -> int:
+    """Highest seq handed out so far (0 when the feed is empty)."""
+    return db.scalar(select(func.max(ChangeEvent.seq))) or 0
+
+
+def oldest_seq(db: Session) -> Optional[int]:
+    return db.scalar(select(func.min(ChangeEvent.seq)))
+
+
+def prune_changes(db: Session, *, before: datetime) -> int:
+    """Delete events older than `before`, always keeping the newest one so
+    oldest_seq() can tell clients their cursor has expired."""
+    head = head_seq(db)
+    result = db.execute(
+        delete(ChangeEvent).where(
+            ChangeEvent.created_at < before, ChangeEvent.seq < head
+        )
+    )
+    db.commit()
+    return result.rowcount or 0
@@ -1,14 +1,36 @@
-# File: /app/crud/comments.py | Version: 1.2 | Path: /app/crud/comments.py
+# File: /app/crud/comments.py | Version: 1.6 | Path: /app/crud/comments.py
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 from uuid import UUID
 
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
+from app.core.pagination import keyset
+from app.crud import changes
 from app.models import core_entities as models
 
 
+# Thread order; ix_comment_task_id_created_at serves both directions
+COMMENT_PAGE_KEYS = (models.Comment.created_at, models.Comment.id)
+
+
+def _bump_comment_count(db: Session, task_id: str, delta: int) -> None:
+    # One UPDATE in the writer's transaction, so the counter commits (or rolls
+    # back) with the comment itself and concurrent writers cannot lose a step.
+    # updated_at is pinned: a comment is not an edit of the task, and the
+    # column's onupdate would otherwise fire.
+    db.execute(
+        update(models.Task)
+        .where(models.Task.id == task_id)
+        .values(
+            comment_count=models.Task.comment_count + delta,
+            updated_at=models.Task.updated_at,
+        )
+    )
+
+
 def create_comment(
     db: Session, *, task_id: UUID, user_id: str, body: str
 ) -> models.Comment:
@@ -19,6 +41,16 @@ def create_comment(
             body=body,
         )
         db.add(comment)
+        db.flush()  # assigns the id the event refers to
+        _bump_comment_count(db, comment.task_id, 1)
+        changes.record_task_event(
+            db,
+            task_id=comment.task_id,
+            op="created",
+            entity="comment",
+            entity_id=comment.id,
+            data={"user_id": user_id, "body": body},
+        )
         db.commit()
         db.refresh(comment)
         return comment
@@ -38,12 +70,16 @@ def get_comments_for_task(
     task_id: UUID,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    after: Optional[Sequence[Any]] = None,
+    descending: bool = False,
 ) -> List[models.Comment]:
-    q = (
-        db.query(models.Comment)
-        .filter(models.Comment.task_id == str(task_id))
-        .order_by(models.Comment.created_at.asc())
-    )
+    """
+    A task's comments oldest first (newest first with `descending`). `after`
+    is a COMMENT_PAGE_KEYS position to seek past in that direction; `offset`
+    is kept for older clients.
+    """
+    q = db.query(models.Comment).filter(models.Comment.task_id == str(task_id))
+    q = keyset(q, COMMENT_PAGE_KEYS, after=after, descending=descending)
     if offset:
         q = q.offset(offset)
     if limit:
@@ -60,6 +96,14 @@ def update_comment(
     try:
         comment.body = body
         db.add(comment)
+        changes.record_task_event(
+            db,
+            task_id=comment.task_id,
+            op="updated",
+            entity="comment",
+            entity_id=comment.id,
+            data={"body": body},
+        )
         db.commit()
         db.refresh(comment)
         return comment
@@ -73,9 +117,51 @@ def delete_comment(db: Session, *, comment_id: UUID) -> bool:
     if not comment:
         return False
     try:
+        changes.record_task_event(
+            db,
+            task_id=comment.task_id,
+            op="deleted",
+            entity="comment",
+            entity_id=comment.id,
+        )
+        _bump_comment_count(db, comment.task_id, -1)
         db.delete(comment)
         db.commit()
         return True
     except Exception:
         db.rollback()
         raise
+
+
+def recount_comments(
+    db: Session,
+    *,
+    task_ids: Optional[Sequence[str]] = None,
+    workspace_id: Optional[str] = None,
+) -> int:
+    """
+    Reset task.comment_count from the comment table (the given tasks, the
+    workspace's tasks, or all of them) with one correlated UPDATE. Returns the
+    number of tasks touched.
+    """
+    counted = (
+        select(func.count(models.Comment.id))
+        .where(models.Comment.task_id == models.Task.id)
+        .scalar_subquery()
+    )
+    stmt = update(models.Task).values(
+        comment_count=counted, updated_at=models.Task.updated_at
+    )
+    if task_ids is not None:
+        stmt = stmt.where(models.Task.id.in_([str(t) for t in task_ids]))
+    if workspace_id is not None:
+        stmt = stmt.where(
+            models.Task.list_id.in_(
+                select(models.List.id)
+                .join(models.Space, models.Space.id == models.List.space_id)
+                .where(models.Space.workspace_id == str(workspace_id))
+            )
+        )
+    result = db.execute(stmt.execution_options(synchronize_session=False))
+    db.commit()
+    return result.rowcount or 0
@@ -1,8 +1,10 @@
-# File: /app/crud/core_entities.py | Version: 1.6 | Path: /app/crud/core_entities.py
+# File: /app/crud/core_entities.py | Version: 1.7 | Path: /app/crud/core_entities.py
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.core.pagination import keyset
 from app.models import core_entities as models
 from app.schemas import core_entities as schema
 
@@ -108,11 +110,22 @@ def get_space(db: Session, space_id: UUID):
     return q.first()
 
 
-def get_spaces_by_workspace(db: Session, workspace_id: str):
+# Page order for spaces of a workspace / lists of a space (app.core.pagination)
+SPACE_PAGE_KEYS = (models.Space.id,)
+LIST_PAGE_KEYS = (models.List.id,)
+
+
+def get_spaces_by_workspace(
+    db: Session,
+    workspace_id: str,
+    *,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+):
     q = db.query(models.Space).filter_by(workspace_id=workspace_id)
     if hasattr(models.Space, "is_deleted"):
         q = q.filter(models.Space.is_deleted == False)  # noqa: E712
-    return q.all()
+    return keyset(q, SPACE_PAGE_KEYS, after=after, limit=limit).all()
 
 
 def update_space(db: Session, space_id: UUID, data: schema.SpaceUpdate):
@@ -206,11 +219,17 @@ def get_list(db: Session, list_id: UUID):
     return q.first()
 
 
-def get_lists_by_space(db: Session, space_id: str):
+def get_lists_by_space(
+    db: Session,
+    space_id: str,
+    *,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+):
     q = db.query(models.List).filter_by(space_id=space_id)
     if hasattr(models.List, "is_deleted"):
         q = q.filter(models.List.is_deleted == False)  # noqa: E712
-    return q.all()
+    return keyset(q, LIST_PAGE_KEYS, after=after, limit=limit).all()
 
 
 def get_lists_by_folder(db: Session, folder_id: str):
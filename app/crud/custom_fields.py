@@ -1,11 +1,14 @@
-# File: /app/crud/custom_fields.py | Version: 1.1 | Title: Custom Fields CRUD (robust imports)
+# File: /app/crud/custom_fields.py | Version: 1.3 | Title: Custom Fields CRUD (robust imports)
 from __future__ import annotations
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.core.pagination import keyset
+from app.crud import changes
+
 # Try modern split-module layout first, then fallback to monolith core_entities
 try:
     from app.models.custom_fields import (
@@ -40,20 +43,34 @@ def create_definition(
         options=data.options or None,
     )
     db.add(obj)
+    db.flush()  # assigns the id the event refers to
+    changes.record_event(
+        db,
+        workspace_id=str(workspace_id),
+        entity="custom_field",
+        entity_id=obj.id,
+        op="created",
+        data={"name": obj.name, "field_type": obj.field_type},
+    )
     db.commit()
     db.refresh(obj)
     return obj
 
 
+DEFINITION_PAGE_KEYS = (CustomFieldDefinition.name, CustomFieldDefinition.id)
+
+
 def get_definitions_for_workspace(
-    db: Session, *, workspace_id: UUID | str
+    db: Session,
+    *,
+    workspace_id: UUID | str,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
 ) -> List[CustomFieldDefinition]:
-    return (
-        db.query(CustomFieldDefinition)
-        .filter(CustomFieldDefinition.workspace_id == str(workspace_id))
-        .order_by(CustomFieldDefinition.name.asc())
-        .all()
+    q = db.query(CustomFieldDefinition).filter(
+        CustomFieldDefinition.workspace_id == str(workspace_id)
     )
+    return keyset(q, DEFINITION_PAGE_KEYS, after=after, limit=limit).all()
 
 
 # ---- Enable on List ----
@@ -74,6 +91,16 @@ def enable_field_on_list(
         return existing
     rel = ListCustomField(list_id=str(list_id), field_definition_id=str(field_id))
     db.add(rel)
+    workspace_id = changes.workspace_for_list(db, list_id=str(list_id))
+    if workspace_id is not None:
+        changes.record_event(
+            db,
+            workspace_id=workspace_id,
+            entity="list_custom_field",
+            entity_id=str(field_id),
+            op="created",
+            list_id=str(list_id),
+        )
     db.commit()
     db.refresh(rel)
     return rel
@@ -82,6 +109,19 @@ def enable_field_on_list(
 # ---- Task Value (Upsert) ----
 
 
+def _record_value(
+    db: Session, task_id: UUID | str, field_id: UUID | str, value: Any
+) -> None:
+    changes.record_task_event(
+        db,
+        task_id=str(task_id),
+        op="updated",
+        entity="custom_field_value",
+        entity_id=str(field_id),
+        data={"value": value},
+    )
+
+
 def set_value_for_task(
     db: Session, *, task_id: UUID | str, field_id: UUID | str, value: Any
 ) -> CustomFieldValue:
@@ -98,6 +138,7 @@ def set_value_for_task(
     )
     if row:
         row.value = {"value": value}
+        _record_value(db, task_id, field_id, value)
         db.commit()
         db.refresh(row)
         return row
@@ -108,6 +149,7 @@ def set_value_for_task(
         value={"value": value},
     )
     db.add(row)
+    _record_value(db, task_id, field_id, value)
     db.commit()
     db.refresh(row)
     return row
@@ -0,0 +1,301 @@
+# File: /app/crud/notifications.py | Version: 1.0 | Title: Watcher notification fan-out + inbox reads
+"""
+Watchers are notified from the change_event outbox, not from the request that
+made the change: `dispatch_pending` (run periodically by the job worker) takes
+a batch of task events past its cursor and, for the whole batch,
+
+  1. resolves every (task, watcher) pair with one indexed query,
+  2. folds events into the watcher's open digest for that task, or
+  3. bulk-inserts new inbox rows and bumps the unread counters,
+
+then advances the cursor in the same transaction.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, bindparam, case, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.change_event import ChangeEvent
+from app.models.core_entities import List as ListModel
+from app.models.core_entities import Space, Task, TaskWatcher, WorkspaceMember
+from app.models.notification import (
+    Notification,
+    NotificationCounter,
+    NotificationCursor,
+)
+
+_CURSOR = "notifications"
+
+# Activity a watcher hears about; watcher/tag/field-definition churn is not.
+NOTIFY_ENTITIES = ("task", "comment", "task_tag", "custom_field_value")
+
+# Events kept in a digest's summary (event_count keeps the full tally).
+SUMMARY_LIMIT = 10
+
+
+def _summary_item(ev) -> Dict[str, Any]:
+    item = {"seq": ev.seq, "entity": ev.entity, "op": ev.op, "actor_id": ev.actor_id}
+    if ev.entity == "task" and ev.op == "updated" and ev.data:
+        item["fields"] = sorted(ev.data)
+    return item
+
+
+def _watchers(db: Session, task_ids: Iterable[str]) -> Dict[str, List[str]]:
+    """task_id -> watchers that are still members of the task's workspace."""
+    rows = db.execute(
+        select(TaskWatcher.task_id, TaskWatcher.user_id)
+        .join(Task, Task.id == TaskWatcher.task_id)
+        .join(ListModel, ListModel.id == Task.list_id)
+        .join(Space, Space.id == ListModel.space_id)
+        .join(
+            WorkspaceMember,
+            and_(
+                WorkspaceMember.workspace_id == Space.workspace_id,
+                WorkspaceMember.user_id == TaskWatcher.user_id,
+            ),
+        )
+        .where(TaskWatcher.task_id.in_(list(task_ids)))
+    ).all()
+    out: Dict[str, List[str]] = defaultdict(list)
+    for task_id, user_id in rows:
+        out[task_id].append(user_id)
+    return out
+
+
+def _open_digests(
+    db: Session, task_ids: Iterable[str], *, since: datetime
+) -> Dict[Tuple[str, str], Notification]:
+    """(user_id, task_id) -> newest unread notification touched after `since`."""
+    rows = db.scalars(
+        select(Notification)
+        .where(Notification.task_id.in_(list(task_ids)))
+        .where(Notification.updated_at >= since)
+        .where(Notification.read_at.is_(None))
+        .order_by(Notification.id.asc())
+    )
+    return {(n.user_id, n.task_id): n for n in rows}
+
+
+def _bump_counters(db: Session, increments: Dict[str, int]) -> None:
+    if not increments:
+        return
+    existing = set(
+        db.scalars(
+            select(NotificationCounter.user_id).where(
+                NotificationCounter.user_id.in_(list(increments))
+            )
+        )
+    )
+    table = NotificationCounter.__table__
+    bumps = [{"uid": u, "n": n} for u, n in increments.items() if u in existing]
+    if bumps:
+        db.execute(
+            update(table)
+            .where(table.c.user_id == bindparam("uid"))
+            .values(unread=table.c.unread + bindparam("n")),
+            bumps,
+        )
+    fresh = [
+        {"user_id": u, "unread": n} for u, n in increments.items() if u not in existing
+    ]
+    if fresh:
+        db.execute(insert(table), fresh)
+
+
+def _cursor(db: Session) -> NotificationCursor:
+    cursor = db.get(NotificationCursor, _CURSOR)
+    if cursor is None:
+        # Created by the migration at the feed head; only fresh schemas land here.
+        cursor = NotificationCursor(name=_CURSOR, seq=0)
+        db.add(cursor)
+        db.flush()
+    return cursor
+
+
+def dispatch_pending(
+    db: Session, *, batch_size: Optional[int] = None, now: Optional[datetime] = None
+) -> int:
+    """
+    Fan one batch of task events out to watcher inboxes and commit.
+    Returns the number of events consumed (0 when caught up).
+    """
+    batch_size = batch_size or settings.NOTIFICATIONS_BATCH_SIZE
+    now = now or datetime.now(UTC)
+    start = _cursor(db).seq
+
+    events = db.execute(
+        select(
+            ChangeEvent.seq,
+            ChangeEvent.workspace_id,
+            ChangeEvent.task_id,
+            ChangeEvent.entity,
+            ChangeEvent.op,
+            ChangeEvent.actor_id,
+            ChangeEvent.data,
+        )
+        .where(ChangeEvent.seq > start)
+        .where(ChangeEvent.task_id.is_not(None))
+        .where(ChangeEvent.entity.in_(NOTIFY_ENTITIES))
+        .order_by(ChangeEvent.seq.asc())
+        .limit(batch_size)
+    ).all()
+    if not events:
+        return 0
+
+    by_task: Dict[str, list] = defaultdict(list)
+    for ev in events:
+        by_task[ev.task_id].append(ev)
+    watchers = _watchers(db, by_task)
+    digests = _open_digests(
+        db,
+        watchers,
+        since=now - timedelta(seconds=settings.NOTIFICATIONS_DIGEST_SECONDS),
+    )
+
+    updates: List[Dict[str, Any]] = []
+    inserts: List[Dict[str, Any]] = []
+    increments: Dict[str, int] = defaultdict(int)
+    for task_id, user_ids in watchers.items():
+        task_events = by_task[task_id]
+        for user_id in user_ids:
+            # nobody is notified about their own changes
+            mine = [e for e in task_events if e.actor_id != user_id]
+            if not mine:
+                continue
+            items = [_summary_item(e) for e in mine]
+            open_row = digests.get((user_id, task_id))
+            if open_row is not None:
+                updates.append(
+                    {
+                        "id": open_row.id,
+                        "event_count": open_row.event_count + len(mine),
+                        "last_seq": mine[-1].seq,
+                        "summary": ((open_row.summary or []) + items)[-SUMMARY_LIMIT:],
+                        "updated_at": now,
+                    }
+                )
+            else:
+                inserts.append(
+                    {
+                        "user_id": user_id,
+                        "workspace_id": mine[0].workspace_id,
+                        "task_id": task_id,
+                        "event_count": len(mine),
+                        "first_seq": mine[0].seq,
+                        "last_seq": mine[-1].seq,
+                        "summary": items[-SUMMARY_LIMIT:],
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+                increments[user_id] += 1
+
+    if updates:
+        db.execute(update(Notification), updates)
+    if inserts:
+        # ids follow event order, so the newest-first inbox does too
+        inserts.sort(key=lambda row: row["first_seq"])
+        db.execute(insert(Notification), inserts)
+    _bump_counters(db, increments)
+
+    # Compare-and-set, so two dispatchers never deliver the same batch twice.
+    moved = db.execute(
+        update(NotificationCursor)
+        .where(NotificationCursor.name == _CURSOR, NotificationCursor.seq == start)
+        .values(seq=events[-1].seq)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if moved != 1:
+        db.rollback()
+        return 0
+    db.commit()
+    return len(events)
+
+
+def dispatch_all(db: Session, *, batch_size: Optional[int] = None) -> int:
+    """Drain the feed batch by batch; returns the number of events consumed."""
+    total = 0
+    while n := dispatch_pending(db, batch_size=batch_size):
+        total += n
+    return total
+
+
+# -------- Inbox --------
+
+
+def list_notifications(
+    db: Session,
+    *,
+    user_id: str,
+    limit: int,
+    before: Optional[int] = None,
+    unread_only: bool = False,
+) -> List[Notification]:
+    """Newest first; pass the last id back as `before` for the next page."""
+    stmt = select(Notification).where(Notification.user_id == str(user_id))
+    if before is not None:
+        stmt = stmt.where(Notification.id < before)
+    if unread_only:
+        stmt = stmt.where(Notification.read_at.is_(None))
+    return list(db.scalars(stmt.order_by(Notification.id.desc()).limit(limit)))
+
+
+def unread_count(db: Session, *, user_id: str) -> int:
+    return (
+        db.scalar(
+            select(NotificationCounter.unread).where(
+                NotificationCounter.user_id == str(user_id)
+            )
+        )
+        or 0
+    )
+
+
+def _mark(db: Session, *, user_id: str, ids: Optional[List[int]]) -> int:
+    stmt = (
+        update(Notification)
+        .where(Notification.user_id == str(user_id))
+        .where(Notification.read_at.is_(None))
+    )
+    if ids is not None:
+        stmt = stmt.where(Notification.id.in_(ids))
+    marked = (
+        db.execute(
+            stmt.values(read_at=datetime.now(UTC)).execution_options(
+                synchronize_session=False
+            )
+        ).rowcount
+        or 0
+    )
+    if marked:
+        db.execute(
+            update(NotificationCounter)
+            .where(NotificationCounter.user_id == str(user_id))
+            .values(
+                unread=case(
+                    (
+                        NotificationCounter.unread > marked,
+                        NotificationCounter.unread - marked,
+                    ),
+                    else_=0,
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+    db.commit()
+    return marked
+
+
+def mark_read(db: Session, *, user_id: str, ids: List[int]) -> int:
+    """Mark the caller's notifications read; returns how many were unread."""
+    return _mark(db, user_id=user_id, ids=ids) if ids else 0
+
+
+def mark_all_read(db: Session, *, user_id: str) -> int:
+    return _mark(db, user_id=user_id, ids=None)
@@ -1,12 +1,15 @@
-# File: /app/crud/tags.py | Version: 1.3 | Path: /app/crud/tags.py
+# File: /app/crud/tags.py | Version: 1.7 | Path: /app/crud/tags.py
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, func
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
+from app.core.pagination import keyset
+from app.crud import changes
+from app.db.loaders import task_loaders
 from app.models import core_entities as models
 
 # -------- Tags (workspace-scoped) --------
@@ -17,18 +20,34 @@ def create_tag(
 ) -> models.Tag:
     tag = models.Tag(workspace_id=str(workspace_id), name=name, color=color)
     db.add(tag)
+    db.flush()  # assigns the id the event refers to
+    changes.record_event(
+        db,
+        workspace_id=str(workspace_id),
+        entity="tag",
+        entity_id=tag.id,
+        op="created",
+        data={"name": name, "color": color},
+    )
     db.commit()
     db.refresh(tag)
     return tag
 
 
-def get_workspace_tags(db: Session, *, workspace_id: UUID) -> List[models.Tag]:
-    return (
-        db.query(models.Tag)
-        .filter(models.Tag.workspace_id == str(workspace_id))
-        .order_by(models.Tag.name.asc())
-        .all()
-    )
+# Page orders (app.core.pagination): tags by name, a tag's tasks newest first
+TAG_PAGE_KEYS = (models.Tag.name, models.Tag.id)
+TAG_TASK_PAGE_KEYS = (models.Task.created_at, models.Task.id)
+
+
+def get_workspace_tags(
+    db: Session,
+    *,
+    workspace_id: UUID,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+) -> List[models.Tag]:
+    q = db.query(models.Tag).filter(models.Tag.workspace_id == str(workspace_id))
+    return keyset(q, TAG_PAGE_KEYS, after=after, limit=limit).all()
 
 
 def get_tag(db: Session, *, tag_id: UUID | str) -> Optional[models.Tag]:
@@ -45,6 +64,24 @@ def get_tags_by_ids(db: Session, *, tag_ids: List[UUID]) -> List[models.Tag]:
 # -------- Task ↔ Tag assignment --------
 
 
+def _record_links(db: Session, task_id: UUID, tag_ids: List[str], op: str) -> None:
+    if not tag_ids:
+        return
+    scope = changes.scope_for_task(db, task_id=str(task_id))
+    if scope is None:
+        return
+    for tag_id in tag_ids:
+        changes.record_event(
+            db,
+            workspace_id=scope[0],
+            entity="task_tag",
+            entity_id=tag_id,
+            op=op,
+            task_id=str(task_id),
+            list_id=scope[1],
+        )
+
+
 def get_tags_for_task(db: Session, *, task_id: UUID) -> List[models.Tag]:
     return (
         db.query(models.Tag)
@@ -68,6 +105,7 @@ def assign_tag_to_task(db: Session, *, task_id: UUID, tag_id: UUID) -> bool:
         return False
     link = models.TaskTag(task_id=str(task_id), tag_id=str(tag_id))
     db.add(link)
+    _record_links(db, task_id, [str(tag_id)], "created")
     db.commit()
     return True
 
@@ -84,6 +122,7 @@ def unassign_tag_from_task(db: Session, *, task_id: UUID, tag_id: UUID) -> bool:
     if not link:
         return False
     db.delete(link)
+    _record_links(db, task_id, [str(tag_id)], "deleted")
     db.commit()
     return True
 
@@ -107,6 +146,7 @@ def assign_tags_to_task(db: Session, *, task_id: UUID, tag_ids: List[UUID]) -> i
 
     links = [models.TaskTag(task_id=str(task_id), tag_id=tid) for tid in to_create]
     db.add_all(links)
+    _record_links(db, task_id, to_create, "created")
     db.commit()
     return len(links)
 
@@ -116,24 +156,46 @@ def unassign_tags_from_task(db: Session, *, task_id: UUID, tag_ids: List[UUID])
     if not tag_ids:
         return 0
     ids = [str(t) for t in tag_ids]
+    linked = list(
+        db.scalars(
+            select(models.TaskTag.tag_id)
+            .where(models.TaskTag.task_id == str(task_id))
+            .where(models.TaskTag.tag_id.in_(ids))
+        )
+    )
     stmt = (
         delete(models.TaskTag)
         .where(models.TaskTag.task_id == str(task_id))
         .where(models.TaskTag.tag_id.in_(ids))
     )
     result = db.execute(stmt)
+    _record_links(db, task_id, linked, "deleted")
     db.commit()
     return result.rowcount or 0
 
 
-def get_tasks_for_tag(db: Session, *, tag_id: UUID) -> List[models.Task]:
-    return (
-        db.query(models.Task)
-        .join(models.TaskTag, models.TaskTag.task_id == models.Task.id)
-        .filter(models.TaskTag.tag_id == str(tag_id))
-        .order_by(models.Task.created_at.desc())
-        .all()
+def get_tasks_for_tag(
+    db: Session,
+    *,
+    tag_id: UUID,
+    columns: Optional[Sequence[Any]] = None,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+) -> List[Any]:
+    """
+    Tasks carrying a tag, newest first; with `columns`, row tuples of just
+    those columns (which must include TAG_TASK_PAGE_KEYS when paging).
+    """
+    if columns:
+        q = db.query(*columns).select_from(models.Task)
+    else:
+        q = db.query(models.Task).options(*task_loaders())
+    q = q.join(models.TaskTag, models.TaskTag.task_id == models.Task.id).filter(
+        models.TaskTag.tag_id == str(tag_id)
     )
+    return keyset(
+        q, TAG_TASK_PAGE_KEYS, after=after, limit=limit, descending=True
+    ).all()
 
 
 # -------- Multi-tag filtering (workspace-scoped) --------
@@ -147,11 +209,13 @@ def get_tasks_by_tags(
     match: str = "any",
     limit: Optional[int] = None,
     offset: Optional[int] = None,
-) -> List[models.Task]:
+    columns: Optional[Sequence[Any]] = None,
+) -> List[Any]:
     """
     Return tasks in a workspace that match multiple tags.
     match='any' -> task has at least one of the tags
     match='all' -> task has all of the tags
+    With `columns`, rows hold just those columns instead of Task objects.
     """
     if not tag_ids:
         return []
@@ -159,7 +223,8 @@ def get_tasks_by_tags(
     tag_id_strs = [str(t) for t in tag_ids]
 
     q = (
-        db.query(models.Task)
+        db.query(*(columns or (models.Task,)))
+        .select_from(models.Task)
         .join(models.List, models.Task.list_id == models.List.id)
         .join(models.Space, models.List.space_id == models.Space.id)
         .filter(models.Space.workspace_id == str(workspace_id))
@@ -1,14 +1,100 @@
-# File: /app/crud/task.py | Version: 1.5 | Path: /app/crud/task.py
+# File: /app/crud/task.py | Version: 1.11 | Path: /app/crud/task.py
 from __future__ import annotations
 
-from typing import List, Optional
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID, uuid4
 
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 
+from app.core.pagination import keyset, with_keys
+from app.crud import changes
+from app.db.loaders import task_loaders
 from app.models import core_entities as models
 from app.schemas import task as schema
 
+# ---------------------------
+# Change feed helpers
+# ---------------------------
+
+
+def _task_data(task: models.Task) -> Dict[str, Any]:
+    """Snapshot carried by task change events (enough to patch a board)."""
+    due = task.due_date
+    return {
+        "name": task.name,
+        "status": task.status,
+        "priority": task.priority,
+        "due_date": due.isoformat() if isinstance(due, date) else due,
+        "list_id": task.list_id,
+        "parent_task_id": task.parent_task_id,
+    }
+
+
+def _record(
+    db: Session, task: models.Task, op: str, data: Optional[Dict[str, Any]]
+) -> None:
+    # Uses the in-memory list_id: autoflush is off, and moves change it.
+    workspace_id = changes.workspace_for_list(db, list_id=str(task.list_id))
+    if workspace_id is None:
+        return
+    changes.record_event(
+        db,
+        workspace_id=workspace_id,
+        entity="task",
+        entity_id=task.id,
+        op=op,
+        task_id=task.id,
+        list_id=str(task.list_id),
+        data=data,
+    )
+
+
+# ---------------------------
+# Sparse fieldsets
+# ---------------------------
+
+# Fields a `?fields=` projection may ask for, by response key.
+TASK_COLUMNS = {
+    c.key: c
+    for c in (
+        models.Task.id,
+        models.Task.list_id,
+        models.Task.parent_task_id,
+        models.Task.name,
+        models.Task.description,
+        models.Task.status,
+        models.Task.priority,
+        models.Task.due_date,
+        models.Task.created_at,
+        models.Task.updated_at,
+        models.Task.comment_count,
+    )
+}
+
+
+def task_columns(fields: Sequence[str]) -> List[Any]:
+    return [TASK_COLUMNS[f] for f in fields]
+
+
+# Page order for tasks of a list / subtasks of a parent, oldest first
+# (ix_task_list_id_created_at_id, ix_task_parent_task_id_created_at_id)
+TASK_PAGE_KEYS = (models.Task.created_at, models.Task.id)
+
+
+# Related data POST /tasks:batchGet can add to each task
+TASK_BATCH_INCLUDES = (
+    "assignees",
+    "tags",
+    "custom_fields",
+    "watchers",
+    "subtask_counts",
+)
+# ...and the ones among them that are Task relationships (app.db.loaders)
+_BATCH_RELATIONS = ("assignees", "tags", "watchers")
+
+
 # ---------------------------
 # Core Task CRUD
 # ---------------------------
@@ -32,6 +118,7 @@ def create_task(db: Session, data: schema.TaskCreate) -> models.Task:
             # start_date / time_estimate not persisted in current model
         )
         db.add(task)
+        _record(db, task, "created", _task_data(task))
         db.commit()
         db.refresh(task)
         # Assignees handling can be added later when model supports it
@@ -45,8 +132,67 @@ def get_task(db: Session, task_id: UUID) -> Optional[models.Task]:
     return db.query(models.Task).filter_by(id=str(task_id)).first()
 
 
-def get_tasks_by_list(db: Session, list_id: UUID) -> List[models.Task]:
-    return db.query(models.Task).filter_by(list_id=str(list_id)).all()
+def get_tasks_by_list(
+    db: Session,
+    list_id: UUID,
+    *,
+    fields: Optional[Sequence[str]] = None,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+) -> List[Any]:
+    """
+    Tasks of a list in TASK_PAGE_KEYS order, from after `after` for at most
+    `limit` rows; with `fields`, row tuples of those columns followed by any
+    page key not among them.
+    """
+    if fields:
+        q = db.query(*with_keys(task_columns(fields), TASK_PAGE_KEYS))
+    else:
+        q = db.query(models.Task).options(*task_loaders())
+    q = q.filter(models.Task.list_id == str(list_id))
+    return keyset(q, TASK_PAGE_KEYS, after=after, limit=limit).all()
+
+
+def get_tasks_for_member(
+    db: Session,
+    *,
+    task_ids: Sequence[str],
+    user_id: str,
+    include: Sequence[str] = (),
+) -> List[models.Task]:
+    """
+    The tasks among `task_ids` that sit in a workspace `user_id` belongs to.
+    Membership is checked by a join in the same query, so ids from any number
+    of workspaces cost one round trip. Relations named in `include` are
+    loaded with one extra IN query each.
+    """
+    q = (
+        db.query(models.Task)
+        .join(models.List, models.List.id == models.Task.list_id)
+        .join(models.Space, models.Space.id == models.List.space_id)
+        .join(
+            models.WorkspaceMember,
+            and_(
+                models.WorkspaceMember.workspace_id == models.Space.workspace_id,
+                models.WorkspaceMember.user_id == str(user_id),
+            ),
+        )
+        .filter(models.Task.id.in_([str(t) for t in task_ids]))
+    )
+    relations = [i for i in include if i in _BATCH_RELATIONS]
+    return q.options(*task_loaders(*relations)).all()
+
+
+def count_subtasks(db: Session, *, parent_ids: Sequence[str]) -> Dict[str, int]:
+    """Direct subtask count per parent id (parents without any are left out)."""
+    if not parent_ids:
+        return {}
+    rows = (
+        db.query(models.Task.parent_task_id, func.count(models.Task.id))
+        .filter(models.Task.parent_task_id.in_(parent_ids))
+        .group_by(models.Task.parent_task_id)
+    )
+    return dict(rows.all())
 
 
 def update_task(
@@ -57,11 +203,22 @@ def update_task(
         return None
 
     patch = data.model_dump(exclude_unset=True)
+    old_list_id = task.list_id
     # Only set attrs that exist on the model
     for field, value in patch.items():
         if hasattr(task, field):
-            setattr(task, field, value)
-
+            # ids are String columns (e.g. list_id when moving a task)
+            setattr(task, field, str(value) if isinstance(value, UUID) else value)
+
+    changed = {
+        k: v
+        for k, v in data.model_dump(mode="json", exclude_unset=True).items()
+        if hasattr(task, k)
+    }
+    if str(task.list_id) != old_list_id:
+        _record(db, task, "moved", {**changed, "from_list_id": old_list_id})
+    else:
+        _record(db, task, "updated", changed)
     db.commit()
     db.refresh(task)
     return task
@@ -71,6 +228,14 @@ def delete_task(db: Session, task_id: UUID) -> bool:
     task = get_task(db, task_id)
     if not task:
         return False
+    # Subtasks go with it (delete-orphan cascade); announce them too.
+    doomed, stack = [], [task]
+    while stack:
+        t = stack.pop()
+        doomed.append(t)
+        stack.extend(t.children)
+    for t in doomed:
+        _record(db, t, "deleted", None)
     db.delete(task)  # hard delete (no is_deleted field on Task model)
     db.commit()
     return True
@@ -81,8 +246,19 @@ def delete_task(db: Session, task_id: UUID) -> bool:
 # ---------------------------
 
 
-def get_subtasks(db: Session, parent_task_id: UUID) -> List[models.Task]:
-    return db.query(models.Task).filter_by(parent_task_id=str(parent_task_id)).all()
+def get_subtasks(
+    db: Session,
+    parent_task_id: UUID,
+    *,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+) -> List[models.Task]:
+    q = (
+        db.query(models.Task)
+        .options(*task_loaders())
+        .filter_by(parent_task_id=str(parent_task_id))
+    )
+    return keyset(q, TASK_PAGE_KEYS, after=after, limit=limit).all()
 
 
 def create_subtask(
@@ -144,6 +320,7 @@ def move_subtask(
     # If detaching
     if new_parent_id_str is None:
         child.parent_task_id = None
+        _record(db, child, "updated", {"parent_task_id": None})
         db.commit()
         db.refresh(child)
         return child
@@ -162,6 +339,7 @@ def move_subtask(
         raise ValueError("Moving would create a cycle")
 
     child.parent_task_id = new_parent_id_str
+    _record(db, child, "updated", {"parent_task_id": new_parent_id_str})
     db.commit()
     db.refresh(child)
     return child
@@ -0,0 +1,455 @@
+# File: /app/crud/task_import.py | Version: 1.3 | Path: /app/crud/task_import.py
+from __future__ import annotations
+
+import csv
+import json
+from datetime import UTC, datetime
+from itertools import islice
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from uuid import uuid4
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.crud import changes
+from app.jobs.registry import JobCancelled, JobLeaseLost
+from app.models import core_entities as models
+from app.models.custom_fields import CustomFieldDefinition, CustomFieldValue
+from app.models.task_import import TaskImport
+
+SUPPORTED_FORMATS = ("csv", "ndjson")
+MAX_ERRORS = 1000  # per import; rows past the cap are still counted in rows_failed
+CF_PREFIX = "cf:"
+
+# Task columns an import row may set; anything else that isn't tags/assignees/cf:* is ignored
+# (so an export of another workspace can be fed back in as-is).
+_TASK_FIELDS = ("name", "description", "status", "priority", "due_date")
+_MAX_LEN = {"name": 255, "status": 50, "priority": 20}
+
+Record = Union[Dict[str, Any], ValueError]
+
+
+# -------- Parsing --------
+
+
+def iter_records(stream: IO[str], fmt: str) -> Iterator[Record]:
+    """
+    Yield one dict per data row (CSV after the header, NDJSON per non-blank line).
+    Unparseable rows come through as ValueError so they land in the error report
+    instead of aborting the import.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ValueError(f"invalid JSON: {e.msg}")
+            continue
+        yield obj if isinstance(obj, dict) else ValueError("row is not a JSON object")
+
+
+def _split(value: Any) -> List[str]:
+    # Lists come from NDJSON; CSV cells use ";" (the exporter's separator).
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        items = value
+    else:
+        items = str(value).split(";")
+    return [str(v).strip() for v in items if str(v).strip()]
+
+
+def _parse_due_date(value: Any) -> Optional[datetime]:
+    if value in (None, ""):
+        return None
+    dt = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    return dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
+
+
+def _parse_cf(field_type: str, value: Any) -> Any:
+    if isinstance(value, str) and (field_type or "").lower() == "number":
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+    return value
+
+
+# -------- Lookup caches --------
+
+
+class _Resolver:
+    """
+    Workspace-scoped name -> id caches, filled per chunk with one IN query
+    for whatever the chunk needs and the cache doesn't have yet.
+    """
+
+    def __init__(self, db: Session, workspace_id: str):
+        self.db = db
+        self.workspace_id = workspace_id
+        self.tags: Dict[str, str] = {}
+        self.users_by_email: Dict[str, Optional[str]] = {}
+        self.member_ids: Dict[str, bool] = {}
+        self.fields: Dict[str, Tuple[str, str]] = {
+            name: (fid, ftype)
+            for fid, name, ftype in db.execute(
+                select(
+                    CustomFieldDefinition.id,
+                    CustomFieldDefinition.name,
+                    CustomFieldDefinition.field_type,
+                ).where(CustomFieldDefinition.workspace_id == workspace_id)
+            )
+        }
+
+    def tag_ids(self, names: Set[str]) -> Dict[str, str]:
+        missing = sorted(names - self.tags.keys())
+        if missing:
+            self.tags.update(
+                {
+                    name: tid
+                    for tid, name in self.db.execute(
+                        select(models.Tag.id, models.Tag.name).where(
+                            models.Tag.workspace_id == self.workspace_id,
+                            models.Tag.name.in_(missing),
+                        )
+                    )
+                }
+            )
+            new = [n for n in missing if n not in self.tags]
+            if new:
+                rows = [
+                    {"id": str(uuid4()), "workspace_id": self.workspace_id, "name": n}
+                    for n in new
+                ]
+                self.db.execute(insert(models.Tag.__table__), rows)
+                self.tags.update({r["name"]: r["id"] for r in rows})
+        return self.tags
+
+    def users(self, emails: Set[str]) -> Dict[str, Optional[str]]:
+        missing = sorted(emails - self.users_by_email.keys())
+        if missing:
+            found = dict(
+                self.db.execute(
+                    select(func.lower(models.User.email), models.User.id)
+                    .join(
+                        models.WorkspaceMember,
+                        models.WorkspaceMember.user_id == models.User.id,
+                    )
+                    .where(
+                        models.WorkspaceMember.workspace_id == self.workspace_id,
+                        func.lower(models.User.email).in_(missing),
+                    )
+                ).all()
+            )
+            self.users_by_email.update({e: found.get(e) for e in missing})
+        return self.users_by_email
+
+    def members(self, user_ids: Set[str]) -> Dict[str, bool]:
+        missing = sorted(user_ids - self.member_ids.keys())
+        if missing:
+            found = set(
+                self.db.scalars(
+                    select(models.WorkspaceMember.user_id).where(
+                        models.WorkspaceMember.workspace_id == self.workspace_id,
+                        models.WorkspaceMember.user_id.in_(missing),
+                    )
+                )
+            )
+            self.member_ids.update({u: u in found for u in missing})
+        return self.member_ids
+
+
+# -------- Import bookkeeping --------
+
+
+def create_import(
+    db: Session,
+    *,
+    workspace_id: str,
+    list_id: str,
+    user_id: str,
+    fmt: str,
+    source: Optional[str] = None,
+) -> TaskImport:
+    job = TaskImport(
+        workspace_id=str(workspace_id),
+        list_id=str(list_id),
+        user_id=str(user_id),
+        format=fmt,
+        source=(source or "")[:255] or None,
+        status="pending",
+        rows_processed=0,
+        rows_imported=0,
+        rows_failed=0,
+        errors=[],
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def get_import(db: Session, *, import_id: str) -> Optional[TaskImport]:
+    return db.get(TaskImport, str(import_id))
+
+
+# -------- Pipeline --------
+
+
+def _import_chunk(
+    db: Session,
+    job: TaskImport,
+    chunk: List[Tuple[int, Record]],
+    resolver: _Resolver,
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Validate and insert one chunk (no commit). Returns (imported, errors)."""
+    errors: List[Dict[str, Any]] = []
+    parsed: List[Tuple[int, Dict[str, Any]]] = []
+    tag_names: Set[str] = set()
+    emails: Set[str] = set()
+    user_ids: Set[str] = set()
+
+    for row_no, rec in chunk:
+        if isinstance(rec, ValueError):
+            errors.append({"row": row_no, "error": str(rec)})
+            continue
+        cfs = rec.get("custom_fields") or {}
+        if not isinstance(cfs, dict):
+            errors.append({"row": row_no, "error": "custom_fields must be an object"})
+            continue
+        cfs = dict(cfs)
+        cfs.update(
+            {
+                k[len(CF_PREFIX) :]: v
+                for k, v in rec.items()
+                if k and k.startswith(CF_PREFIX) and v not in (None, "")
+            }
+        )
+        item = {
+            "fields": {f: rec.get(f) for f in _TASK_FIELDS},
+            "tags": _split(rec.get("tags")),
+            "emails": [e.lower() for e in _split(rec.get("assignees"))],
+            "assignee_ids": _split(rec.get("assignee_ids")),
+            "cfs": cfs,
+        }
+        tag_names.update(item["tags"])
+        emails.update(item["emails"])
+        user_ids.update(item["assignee_ids"])
+        parsed.append((row_no, item))
+
+    too_long = {n for n in tag_names if len(n) > 100}
+    tags = resolver.tag_ids(tag_names - too_long) if tag_names else {}
+    by_email = resolver.users(emails) if emails else {}
+    members = resolver.members(user_ids) if user_ids else {}
+
+    now = datetime.now(UTC)
+    task_rows: List[Dict[str, Any]] = []
+    tag_rows: List[Dict[str, Any]] = []
+    assignee_rows: List[Dict[str, Any]] = []
+    cf_rows: List[Dict[str, Any]] = []
+
+    for row_no, item in parsed:
+        try:
+            f = item["fields"]
+            name = str(f["name"]).strip() if f["name"] is not None else ""
+            if not name:
+                raise ValueError("name is required")
+            values = {
+                k: (str(f[k]) if f[k] not in (None, "") else None)
+                for k in ("description", "status", "priority")
+            }
+            values["name"] = name
+            for k, limit in _MAX_LEN.items():
+                if values[k] is not None and len(values[k]) > limit:
+                    raise ValueError(f"{k} longer than {limit} characters")
+            try:
+                due = _parse_due_date(f["due_date"])
+            except ValueError:
+                raise ValueError(f"invalid due_date {f['due_date']!r}")
+
+            bad_tags = [t for t in item["tags"] if t in too_long]
+            if bad_tags:
+                raise ValueError(f"tag name longer than 100 characters: {bad_tags[0]}")
+            assignees = set()
+            for email in item["emails"]:
+                if not by_email.get(email):
+                    raise ValueError(f"assignee {email} is not a workspace member")
+                assignees.add(by_email[email])
+            for uid in item["assignee_ids"]:
+                if not members.get(uid):
+                    raise ValueError(f"assignee {uid} is not a workspace member")
+                assignees.add(uid)
+
+            cf_values = []
+            for cf_name, raw in item["cfs"].items():
+                if cf_name not in resolver.fields:
+                    raise ValueError(f"unknown custom field {cf_name!r}")
+                fid, ftype = resolver.fields[cf_name]
+                try:
+                    cf_values.append((fid, _parse_cf(ftype, raw)))
+                except ValueError:
+                    raise ValueError(f"custom field {cf_name!r}: not a number")
+        except ValueError as e:
+            errors.append({"row": row_no, "error": str(e)})
+            continue
+
+        task_id = str(uuid4())
+        task_rows.append(
+            {
+                "id": task_id,
+                "list_id": job.list_id,
+                "parent_task_id": None,
+                "name": values["name"],
+                "description": values["description"],
+                "status": values["status"] or "to_do",
+                "priority": values["priority"],
+                "due_date": due,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+        tag_rows.extend(
+            {"id": str(uuid4()), "task_id": task_id, "tag_id": tags[t]}
+            for t in dict.fromkeys(item["tags"])
+        )
+        assignee_rows.extend(
+            {"id": str(uuid4()), "task_id": task_id, "user_id": u}
+            for u in sorted(assignees)
+        )
+        cf_rows.extend(
+            {
+                "id": str(uuid4()),
+                "task_id": task_id,
+                "field_definition_id": fid,
+                "value": {"value": v},
+            }
+            for fid, v in cf_values
+        )
+
+    for table, rows in (
+        (models.Task.__table__, task_rows),
+        (models.TaskTag.__table__, tag_rows),
+        (models.TaskAssignee.__table__, assignee_rows),
+        (CustomFieldValue.__table__, cf_rows),
+    ):
+        if rows:
+            db.execute(insert(table), rows)
+    changes.record_events(
+        db,
+        [
+            {
+                "workspace_id": job.workspace_id,
+                "entity": "task",
+                "entity_id": r["id"],
+                "op": "created",
+                "task_id": r["id"],
+                "list_id": job.list_id,
+                "data": {
+                    "name": r["name"],
+                    "status": r["status"],
+                    "priority": r["priority"],
+                    "due_date": r["due_date"].isoformat() if r["due_date"] else None,
+                    "list_id": job.list_id,
+                    "parent_task_id": None,
+                },
+                "created_at": now,
+            }
+            for r in task_rows
+        ],
+    )
+    return len(task_rows), errors
+
+
+def _chunked(
+    records: Iterable[Tuple[int, Record]], size: int
+) -> Iterator[List[Tuple[int, Record]]]:
+    it = iter(records)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_import(
+    db: Session,
+    *,
+    job: TaskImport,
+    stream: IO[str],
+    chunk_size: int,
+    on_chunk: Optional[Callable[[TaskImport], None]] = None,
+) -> TaskImport:
+    """
+    Stream `stream` into the job's list, one transaction per chunk.
+
+    Each commit also advances the job's checkpoint, so on a crash the last
+    partial chunk rolls back and a rerun with the same source skips exactly
+    the committed rows. Unexpected errors mark the job failed and re-raise;
+    that includes anything raised by `on_chunk`, called after every commit.
+    JobCancelled marks it cancelled instead; JobLeaseLost re-raises without
+    touching the row, which now belongs to whichever worker holds the lease.
+    """
+    job.status = "running"
+    job.finished_at = None
+    db.commit()
+
+    resolver = _Resolver(db, job.workspace_id)
+    records = islice(
+        enumerate(iter_records(stream, job.format), start=1), job.rows_processed, None
+    )
+    try:
+        for chunk in _chunked(records, max(1, chunk_size)):
+            imported, errors = _import_chunk(db, job, chunk, resolver)
+            job.rows_processed = chunk[-1][0]
+            job.rows_imported += imported
+            if errors:
+                job.rows_failed += len(errors)
+                room = MAX_ERRORS - len(job.errors or [])
+                if room > 0:
+                    job.errors = list(job.errors or []) + errors[:room]
+            db.commit()
+            if on_chunk is not None:
+                on_chunk(job)
+    except JobLeaseLost:
+        db.rollback()
+        raise
+    except JobCancelled:
+        db.rollback()
+        job.status = "cancelled"
+        job.finished_at = datetime.now(UTC)
+        db.commit()
+        raise
+    except Exception as exc:
+        db.rollback()
+        job.status = "failed"
+        job.errors = list(job.errors or []) + [
+            {
+                "row": job.rows_processed + 1,
+                "error": f"aborted: {str(exc) or type(exc).__name__}",
+            }
+        ]
+        job.finished_at = datetime.now(UTC)
+        db.commit()
+        raise
+
+    job.status = "completed"
+    job.finished_at = datetime.now(UTC)
+    db.commit()
+    db.refresh(job)
+    return job
@@ -0,0 +1,387 @@
+# File: /app/crud/time_tracking.py | Version: 1.1 | Path: /app/crud/time_tracking.py
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models import core_entities as models
+from app.models.core_entities import gen_uuid
+from app.models.time_tracking import TimeEntryDaily
+
+# Key of one rollup row: (user_id, task_id, day, workspace_id)
+RollupKey = Tuple[str, str, date, str]
+
+REPORT_GROUPS = ("user", "task", "list", "day")
+
+_IN_CHUNK = 500  # keeps IN (...) lists well under SQLite's bound-parameter limit
+
+
+class TimerAlreadyRunning(ValueError):
+    """The user already has an open timer (at most one per user)."""
+
+    def __init__(self, entry: models.TimeEntry):
+        super().__init__("A timer is already running")
+        self.entry = entry
+
+
+def _utc(dt: Optional[datetime]) -> Optional[datetime]:
+    # SQLite hands back naive datetimes; everything here is stored as UTC.
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=UTC)
+    return dt.astimezone(UTC)
+
+
+def _chunks(items: Sequence[Any], size: int = _IN_CHUNK) -> Iterable[Sequence[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+# -------- Lookups --------
+
+
+def get_task_workspace_ids(db: Session, *, task_ids: Iterable[str]) -> Dict[str, str]:
+    """task_id -> workspace_id for every task that exists, one join per chunk."""
+    ids = sorted({str(t) for t in task_ids})
+    out: Dict[str, str] = {}
+    for chunk in _chunks(ids):
+        rows = db.execute(
+            select(models.Task.id, models.Space.workspace_id)
+            .join(models.List, models.List.id == models.Task.list_id)
+            .join(models.Space, models.Space.id == models.List.space_id)
+            .where(models.Task.id.in_(chunk))
+        ).all()
+        out.update({task_id: ws_id for task_id, ws_id in rows})
+    return out
+
+
+def get_entry(db: Session, *, entry_id: str) -> Optional[models.TimeEntry]:
+    return db.get(models.TimeEntry, str(entry_id))
+
+
+def get_running_entry(db: Session, *, user_id: str) -> Optional[models.TimeEntry]:
+    return db.scalar(
+        select(models.TimeEntry)
+        .where(
+            models.TimeEntry.user_id == user_id,
+            models.TimeEntry.ended_at.is_(None),
+        )
+        .limit(1)
+    )
+
+
+def get_entries_for_task(db: Session, *, task_id: str) -> List[models.TimeEntry]:
+    return list(
+        db.scalars(
+            select(models.TimeEntry)
+            .where(models.TimeEntry.task_id == str(task_id))
+            .order_by(models.TimeEntry.started_at.desc())
+        )
+    )
+
+
+# -------- Rollup maintenance --------
+
+
+def _apply_rollup_deltas(db: Session, deltas: Dict[RollupKey, int]) -> None:
+    """
+    Add minute deltas to time_entry_daily without committing.
+
+    Existing keys are found with one SELECT per chunk, then updated and
+    inserted with one executemany each, so a bulk import costs a handful of
+    statements however many entries it carries.
+    """
+    deltas = {k: v for k, v in deltas.items() if v}
+    if not deltas:
+        return
+    table = TimeEntryDaily.__table__
+    task_ids = sorted({k[1] for k in deltas})
+    days = [k[2] for k in deltas]
+    existing = set()
+    for chunk in _chunks(task_ids):
+        existing.update(
+            db.execute(
+                select(table.c.user_id, table.c.task_id, table.c.day).where(
+                    table.c.task_id.in_(chunk),
+                    table.c.day.between(min(days), max(days)),
+                )
+            ).all()
+        )
+
+    to_update, to_insert = [], []
+    for (user_id, task_id, day, workspace_id), minutes in deltas.items():
+        if (user_id, task_id, day) in existing:
+            to_update.append(
+                {"k_user": user_id, "k_task": task_id, "k_day": day, "delta": minutes}
+            )
+        else:
+            to_insert.append(
+                {
+                    "user_id": user_id,
+                    "task_id": task_id,
+                    "day": day,
+                    "workspace_id": workspace_id,
+                    "minutes": minutes,
+                }
+            )
+
+    if to_update:
+        db.execute(
+            update(table)
+            .where(
+                table.c.user_id == bindparam("k_user"),
+                table.c.task_id == bindparam("k_task"),
+                table.c.day == bindparam("k_day"),
+            )
+            .values(minutes=table.c.minutes + bindparam("delta")),
+            to_update,
+        )
+    if to_insert:
+        db.execute(insert(table), to_insert)
+    # Deleting the last entry of a day leaves a zero row behind; drop it.
+    for chunk in _chunks(task_ids):
+        db.execute(
+            delete(table).where(table.c.task_id.in_(chunk), table.c.minutes <= 0)
+        )
+
+
+def utc_day(db: Session, column: Any) -> Any:
+    """
+    SQL for the UTC calendar day of a timestamp, matching _rollup_key's
+    `.date()` of the UTC value whatever the session's time zone is.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        # DATE(timestamptz) would use the session's TimeZone setting
+        return func.date(func.timezone("UTC", column))
+    # SQLite keeps the UTC wall-clock time as written (see _utc)
+    return func.date(column)
+
+
+def _rollup_key(entry: models.TimeEntry, workspace_id: str) -> RollupKey:
+    anchor = _utc(entry.started_at or entry.created_at) or datetime.now(UTC)
+    return (entry.user_id, entry.task_id, anchor.date(), workspace_id)
+
+
+def rebuild_daily_rollup(db: Session, *, workspace_id: Optional[str] = None) -> int:
+    """
+    Recompute time_entry_daily from time_entry (one workspace, or everything)
+    with a single INSERT ... SELECT SUM(...) GROUP BY. Returns rows written.
+    """
+    table = TimeEntryDaily.__table__
+    te = models.TimeEntry
+    day = utc_day(db, func.coalesce(te.started_at, te.created_at))
+    src = (
+        select(
+            te.user_id,
+            te.task_id,
+            day.label("day"),
+            models.Space.workspace_id,
+            func.sum(te.minutes).label("minutes"),
+        )
+        .join(models.Task, models.Task.id == te.task_id)
+        .join(models.List, models.List.id == models.Task.list_id)
+        .join(models.Space, models.Space.id == models.List.space_id)
+        .where(te.ended_at.is_not(None))
+        .group_by(te.user_id, te.task_id, day, models.Space.workspace_id)
+        .having(func.sum(te.minutes) > 0)
+    )
+    wipe = delete(table)
+    if workspace_id is not None:
+        src = src.where(models.Space.workspace_id == str(workspace_id))
+        wipe = wipe.where(table.c.workspace_id == str(workspace_id))
+
+    db.execute(wipe)
+    db.execute(
+        insert(table).from_select(
+            ["user_id", "task_id", "day", "workspace_id", "minutes"], src
+        )
+    )
+    db.commit()
+    count = select(func.count()).select_from(table)
+    if workspace_id is not None:
+        count = count.where(table.c.workspace_id == str(workspace_id))
+    return int(db.scalar(count) or 0)
+
+
+# -------- Writes --------
+
+
+def start_timer(
+    db: Session,
+    *,
+    task_id: str,
+    user_id: str,
+    note: Optional[str] = None,
+    now: Optional[datetime] = None,
+) -> models.TimeEntry:
+    running = get_running_entry(db, user_id=user_id)
+    if running is not None:
+        raise TimerAlreadyRunning(running)
+    entry = models.TimeEntry(
+        task_id=str(task_id),
+        user_id=user_id,
+        minutes=0,
+        started_at=_utc(now) or datetime.now(UTC),
+        ended_at=None,
+        note=note,
+    )
+    db.add(entry)
+    db.commit()
+    db.refresh(entry)
+    return entry
+
+
+def stop_timer(
+    db: Session,
+    *,
+    user_id: str,
+    now: Optional[datetime] = None,
+) -> Optional[models.TimeEntry]:
+    """Close the user's running timer (None if there is none) and roll it up."""
+    entry = get_running_entry(db, user_id=user_id)
+    if entry is None:
+        return None
+    ended = _utc(now) or datetime.now(UTC)
+    started = _utc(entry.started_at) or ended
+    entry.ended_at = ended
+    entry.minutes = max(0, int((ended - started).total_seconds() // 60))
+    ws_map = get_task_workspace_ids(db, task_ids=[entry.task_id])
+    if entry.task_id in ws_map:
+        _apply_rollup_deltas(
+            db, {_rollup_key(entry, ws_map[entry.task_id]): entry.minutes}
+        )
+    db.commit()
+    db.refresh(entry)
+    return entry
+
+
+def create_manual_entry(
+    db: Session,
+    *,
+    task_id: str,
+    user_id: str,
+    workspace_id: str,
+    minutes: int,
+    started_at: Optional[datetime] = None,
+    note: Optional[str] = None,
+) -> models.TimeEntry:
+    ended = None
+    started = _utc(started_at)
+    if started is None:
+        ended = datetime.now(UTC)
+        started = ended - timedelta(minutes=minutes)
+    entry = models.TimeEntry(
+        task_id=str(task_id),
+        user_id=user_id,
+        minutes=minutes,
+        started_at=started,
+        ended_at=ended or started + timedelta(minutes=minutes),
+        note=note,
+    )
+    db.add(entry)
+    db.flush()
+    _apply_rollup_deltas(db, {_rollup_key(entry, workspace_id): minutes})
+    db.commit()
+    db.refresh(entry)
+    return entry
+
+
+def delete_entry(db: Session, *, entry: models.TimeEntry, workspace_id: str) -> None:
+    if entry.ended_at is not None:
+        _apply_rollup_deltas(db, {_rollup_key(entry, workspace_id): -entry.minutes})
+    db.delete(entry)
+    db.commit()
+
+
+def bulk_import_entries(
+    db: Session,
+    *,
+    rows: Sequence[Dict[str, Any]],
+    task_workspaces: Dict[str, str],
+) -> int:
+    """
+    Insert finished entries in one executemany and fold them into the rollup.
+
+    rows carry task_id, user_id, minutes, started_at and optional note; the
+    caller has already checked that every task_id is in task_workspaces.
+    """
+    if not rows:
+        return 0
+    now = datetime.now(UTC)
+    payload: List[Dict[str, Any]] = []
+    deltas: Dict[RollupKey, int] = defaultdict(int)
+    for r in rows:
+        started = _utc(r["started_at"])
+        minutes = int(r["minutes"])
+        task_id, user_id = str(r["task_id"]), str(r["user_id"])
+        payload.append(
+            {
+                "id": gen_uuid(),
+                "task_id": task_id,
+                "user_id": user_id,
+                "minutes": minutes,
+                "started_at": started,
+                "ended_at": started + timedelta(minutes=minutes),
+                "note": r.get("note"),
+                "created_at": now,
+            }
+        )
+        deltas[(user_id, task_id, started.date(), task_workspaces[task_id])] += minutes
+
+    db.execute(insert(models.TimeEntry.__table__), payload)
+    _apply_rollup_deltas(db, deltas)
+    db.commit()
+    return len(payload)
+
+
+# -------- Reporting --------
+
+
+def time_report(
+    db: Session,
+    *,
+    workspace_id: str,
+    start: date,
+    end: date,
+    group_by: Sequence[str] = ("user",),
+    user_id: Optional[str] = None,
+    task_id: Optional[str] = None,
+    list_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    SUM(minutes) over the daily rollup for [start, end], grouped by any of
+    REPORT_GROUPS. Only grouping or filtering by list joins task.
+    """
+    t = TimeEntryDaily
+    columns = {
+        "user": t.user_id.label("user_id"),
+        "task": t.task_id.label("task_id"),
+        "list": models.Task.list_id.label("list_id"),
+        "day": t.day.label("day"),
+    }
+    keys = [columns[g] for g in group_by]
+    stmt = select(*keys, func.sum(t.minutes).label("minutes")).where(
+        t.workspace_id == str(workspace_id), t.day.between(start, end)
+    )
+    if "list" in group_by or list_id is not None:
+        stmt = stmt.join(models.Task, models.Task.id == t.task_id)
+    if user_id is not None:
+        stmt = stmt.where(t.user_id == str(user_id))
+    if task_id is not None:
+        stmt = stmt.where(t.task_id == str(task_id))
+    if list_id is not None:
+        stmt = stmt.where(models.Task.list_id == str(list_id))
+    if keys:
+        stmt = stmt.group_by(*keys).order_by(*keys)
+
+    out = []
+    for row in db.execute(stmt).mappings():
+        item = dict(row)
+        item["minutes"] = int(item["minutes"] or 0)
+        out.append(item)
+    return out
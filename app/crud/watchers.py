@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, List, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.core.pagination import keyset
+from app.crud import changes
 from app.models import core_entities as models
 
 
@@ -21,6 +23,9 @@ def follow_task(db: Session, *, task_id: UUID, user_id: str) -> models.TaskWatch
         return existing
     w = models.TaskWatcher(task_id=str(task_id), user_id=user_id)
     db.add(w)
+    changes.record_task_event(
+        db, task_id=str(task_id), op="created", entity="watcher", entity_id=user_id
+    )
     db.commit()
     db.refresh(w)
     return w
@@ -38,14 +43,22 @@ def unfollow_task(db: Session, *, task_id: UUID, user_id: str) -> bool:
     if not existing:
         return False
     db.delete(existing)
+    changes.record_task_event(
+        db, task_id=str(task_id), op="deleted", entity="watcher", entity_id=user_id
+    )
     db.commit()
     return True
 
 
-def get_watchers_for_task(db: Session, *, task_id: UUID) -> List[models.TaskWatcher]:
-    return (
-        db.query(models.TaskWatcher)
-        .filter(models.TaskWatcher.task_id == str(task_id))
-        .order_by(models.TaskWatcher.created_at.asc())
-        .all()
-    )
+WATCHER_PAGE_KEYS = (models.TaskWatcher.created_at, models.TaskWatcher.id)
+
+
+def get_watchers_for_task(
+    db: Session,
+    *,
+    task_id: UUID,
+    after: Optional[Sequence[Any]] = None,
+    limit: Optional[int] = None,
+) -> List[models.TaskWatcher]:
+    q = db.query(models.TaskWatcher).filter(models.TaskWatcher.task_id == str(task_id))
+    return keyset(q, WATCHER_PAGE_KEYS, after=after, limit=limit).all()
@@ -0,0 +1,58 @@
+# File: /app/db/async_session.py | Version: 1.0 | Title: Async SQLAlchemy Session (aiosqlite / asyncpg)
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.config import settings
+
+# sync dialect -> async driver used when ASYNC_DATABASE_URL is not set explicitly
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    Map a sync SQLAlchemy URL onto its async driver, e.g.
+    sqlite:///./app.db -> sqlite+aiosqlite:///./app.db
+    URLs that already name an async driver are returned unchanged.
+    """
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        raise ValueError(f"Not a database URL: {url!r}")
+    dialect, _, driver = scheme.partition("+")
+    if driver in {"aiosqlite", "asyncpg"}:
+        return url
+    async_scheme = _ASYNC_DRIVERS.get(dialect)
+    if not async_scheme:
+        raise ValueError(f"No async driver known for '{dialect}' URLs")
+    return f"{async_scheme}://{rest}"
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    # Created lazily so the sync-only deployment never imports aiosqlite/asyncpg.
+    url = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+    return create_async_engine(url, pool_pre_ping=True)
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=get_async_engine(), autoflush=False, expire_on_commit=False
+    )
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,42 @@
+# File: /app/db/loaders.py | Version: 1.0 | Title: Eager-loading presets for Task relationships (+ strict raiseload)
+"""
+Task relationships are lazy by default. Any serializer that touches one
+therefore costs a query per row. Endpoints that need related rows name
+them instead:
+
+    q = db.query(Task).options(*task_loaders("tags", "watchers"))
+
+Each named relation is loaded with one IN query for the whole result.
+With STRICT_LOADING (on in the test suite), every other relationship is
+raiseload, so a new lazy access fails a test instead of slipping into an
+N+1.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy.orm import raiseload, selectinload
+
+from app.core.config import settings
+from app.models import core_entities as models
+
+TASK_RELATIONS: Dict[str, Callable[[], Any]] = {
+    "assignees": lambda: selectinload(models.Task.assignees),
+    "tags": lambda: selectinload(models.Task.tags).joinedload(models.TaskTag.tag),
+    "watchers": lambda: selectinload(models.Task.watchers),
+    "comments": lambda: selectinload(models.Task.comments),
+    "time_entries": lambda: selectinload(models.Task.time_entries),
+    "children": lambda: selectinload(models.Task.children),
+}
+
+
+def task_loaders(*relations: str) -> List[Any]:
+    """Loader options for a Task entity query; unknown names are a ValueError."""
+    unknown = [r for r in relations if r not in TASK_RELATIONS]
+    if unknown:
+        raise ValueError(f"Unknown Task relations {unknown}")
+    options = [TASK_RELATIONS[r]() for r in dict.fromkeys(relations)]
+    if settings.STRICT_LOADING:
+        options.append(raiseload("*"))
+    return options
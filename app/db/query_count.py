@@ -0,0 +1,33 @@
+# File: /app/db/query_count.py | Version: 1.0 | Title: Count SQL statements run on an engine (N+1 detection)
+"""
+    with count_queries(engine) as statements:
+        client.get("/tasks/by-list/...")
+    assert len(statements) <= 3
+
+Counts every statement the engine sends to the DBAPI, from any thread or
+connection, while the block runs. tests/conftest.py builds its
+`query_budget` fixture on this.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+
+@contextmanager
+def count_queries(bind: Engine | Connection) -> Iterator[List[str]]:
+    engine = bind.engine
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
@@ -0,0 +1,12 @@
+# File: /app/jobs/__init__.py | Version: 1.0 | Title: DB-backed background jobs (no external broker)
+from app.jobs.queue import enqueue, get_job, request_cancel
+from app.jobs.registry import JobCancelled, JobContext, job_handler
+
+__all__ = [
+    "enqueue",
+    "get_job",
+    "request_cancel",
+    "job_handler",
+    "JobContext",
+    "JobCancelled",
+]
@@ -0,0 +1,130 @@
+# File: /app/jobs/handlers.py | Version: 1.4 | Title: Built-in background job handlers + periodic tasks
+"""
+Handlers for work too slow to hold an HTTP worker and a DB connection:
+task exports, bulk imports and counter/rollup repairs, plus the periodic
+notification fan-out and change-feed pruning.
+
+Each handler is `fn(ctx, payload) -> result dict`, registered by kind and
+imported lazily by app.jobs.registry.load_handlers().
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict
+
+from app.core.config import settings
+from app.jobs.registry import JobContext, job_handler, periodic_task
+
+
+def job_dir(*parts: str) -> Path:
+    path = Path(settings.JOBS_DIR, *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@job_handler("tasks.export")
+def export_tasks(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    from app.routers.tasks_filter import export_body
+    from app.schemas.filters import FilterPayload
+
+    fmt = payload.get("format", "ndjson")
+    target = job_dir("exports") / f"{ctx.job_id}.{fmt}"
+    partial = target.with_suffix(target.suffix + ".part")
+    body = export_body(
+        ctx.db,
+        workspace_id=payload["workspace_id"],
+        payload=FilterPayload.model_validate(payload["filter"]),
+        fmt=fmt,
+        sort=payload.get("sort"),
+        order=payload.get("order") or "desc",
+    )
+    size = 0
+    try:
+        with open(partial, "w", encoding="utf-8", newline="") as fh:
+            for piece in body:  # one piece per EXPORT_CHUNK_SIZE rows
+                ctx.check_cancelled()
+                size += fh.write(piece)
+        os.replace(partial, target)
+    finally:
+        body.close()
+        partial.unlink(missing_ok=True)
+    return {"path": str(target), "format": fmt, "bytes": size}
+
+
+@job_handler("tasks.import")
+def import_tasks(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs a staged upload through the import pipeline. A retry resumes from the
+    task_import checkpoint, so earlier chunks are never inserted twice.
+    """
+    from app.crud import task_import as crud_import
+
+    job = crud_import.get_import(ctx.db, import_id=payload["import_id"])
+    if job is None:
+        raise ValueError(f"Import {payload['import_id']} not found")
+    path = Path(payload["path"])
+    if job.status != "completed":
+        with open(path, encoding="utf-8-sig", newline="") as stream:
+            crud_import.run_import(
+                ctx.db,
+                job=job,
+                stream=stream,
+                chunk_size=int(payload.get("chunk_size") or settings.IMPORT_CHUNK_SIZE),
+                on_chunk=lambda _job: ctx.check_cancelled(),
+            )
+    path.unlink(missing_ok=True)
+    return {
+        "import_id": job.id,
+        "status": job.status,
+        "rows_imported": job.rows_imported,
+        "rows_failed": job.rows_failed,
+    }
+
+
+@job_handler("time.rebuild_rollup")
+def rebuild_time_rollup(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    from app.crud.time_tracking import rebuild_daily_rollup
+
+    return {
+        "rows": rebuild_daily_rollup(ctx.db, workspace_id=payload.get("workspace_id"))
+    }
+
+
+@job_handler("comments.recount")
+def recount_comments(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    from app.crud.comments import recount_comments
+
+    return {
+        "tasks": recount_comments(
+            ctx.db,
+            task_ids=payload.get("task_ids"),
+            workspace_id=payload.get("workspace_id"),
+        )
+    }
+
+
+@job_handler("changes.prune")
+def prune_change_feed(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    from app.crud.changes import prune_changes
+
+    days = payload.get("retention_days", settings.CHANGES_RETENTION_DAYS)
+    before = datetime.now(UTC) - timedelta(days=days)
+    return {"deleted": prune_changes(ctx.db, before=before)}
+
+
+@periodic_task("changes.prune", every=settings.CHANGES_PRUNE_SECONDS)
+def prune_change_feed_periodically(db) -> int:
+    from app.crud.changes import prune_changes
+
+    days = settings.CHANGES_RETENTION_DAYS
+    return prune_changes(db, before=datetime.now(UTC) - timedelta(days=days))
+
+
+@periodic_task("notifications.dispatch", every=settings.NOTIFICATIONS_DISPATCH_SECONDS)
+def dispatch_notifications(db) -> int:
+    from app.crud.notifications import dispatch_all
+
+    return dispatch_all(db)
@@ -0,0 +1,246 @@
+# File: /app/jobs/queue.py | Version: 1.1 | Title: DB-backed job queue operations
+from __future__ import annotations
+
+import random
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.jobs.registry import load_handlers
+from app.models.job import Job
+
+TERMINAL_STATUSES = ("succeeded", "failed", "cancelled")
+
+# Wakes in-process workers as soon as something is enqueued (they also poll).
+wakeup = threading.Condition()
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
+def notify_workers() -> None:
+    with wakeup:
+        wakeup.notify_all()
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Exponential backoff with up to 25% jitter: base * 2^(attempts-1), capped."""
+    delay = settings.JOBS_BACKOFF_SECONDS * (2 ** max(0, attempts - 1))
+    delay = min(delay, settings.JOBS_BACKOFF_MAX_SECONDS)
+    return delay * (1 + random.random() / 4)  # nosec B311 - jitter, not crypto
+
+
+def enqueue(
+    db: Session,
+    *,
+    kind: str,
+    payload: Optional[Dict[str, Any]] = None,
+    created_by: Optional[str] = None,
+    workspace_id: Optional[str] = None,
+    max_attempts: Optional[int] = None,
+) -> Job:
+    if kind not in load_handlers():
+        raise ValueError(f"Unknown job kind: {kind}")
+    job = Job(
+        kind=kind,
+        status="queued",
+        payload=payload or {},
+        attempts=0,
+        max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+        run_after=_now(),
+        cancel_requested=False,
+        created_by=created_by,
+        workspace_id=str(workspace_id) if workspace_id else None,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    notify_workers()
+    return job
+
+
+def get_job(db: Session, *, job_id: str) -> Optional[Job]:
+    return db.get(Job, str(job_id))
+
+
+def list_jobs(
+    db: Session,
+    *,
+    created_by: str,
+    status: Optional[str] = None,
+    limit: int = 50,
+) -> List[Job]:
+    stmt = select(Job).where(Job.created_by == created_by)
+    if status:
+        stmt = stmt.where(Job.status == status)
+    return list(db.scalars(stmt.order_by(Job.created_at.desc()).limit(limit)))
+
+
+def claim_next(
+    db: Session, *, worker_id: str, now: Optional[datetime] = None
+) -> Optional[Job]:
+    """
+    Atomically move the oldest due job from queued to running.
+
+    The UPDATE only matches while the row is still queued, so when two workers
+    pick the same candidate exactly one rowcount is 1; the loser tries again.
+    """
+    now = now or _now()
+    for _ in range(5):
+        candidate = db.scalar(
+            select(Job.id)
+            .where(Job.status == "queued", Job.run_after <= now)
+            .order_by(Job.run_after, Job.created_at)
+            .limit(1)
+        )
+        if candidate is None:
+            return None
+        claimed = db.execute(
+            update(Job)
+            .where(Job.id == candidate, Job.status == "queued")
+            .values(
+                status="running",
+                locked_by=worker_id,
+                locked_at=now,
+                attempts=Job.attempts + 1,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        if claimed == 1:
+            return db.get(Job, candidate, populate_existing=True)
+    return None
+
+
+def _owned(job: Job, worker_id: str) -> tuple:
+    # A worker may only move a job it still holds: once its lease expired and
+    # the job was requeued (maybe claimed again), every write below matches nothing.
+    return (Job.id == job.id, Job.status == "running", Job.locked_by == worker_id)
+
+
+def _finish(db: Session, job: Job, status: str, *, where: tuple, **values: Any) -> bool:
+    """Conditional terminal UPDATE; False when `where` no longer matched."""
+    done = db.execute(
+        update(Job)
+        .where(*where)
+        .values(status=status, locked_by=None, finished_at=_now(), **values)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    db.refresh(job)
+    return done == 1
+
+
+def renew_lease(
+    db: Session, *, job_id: str, worker_id: str, now: Optional[datetime] = None
+) -> bool:
+    """Push `locked_at` forward for a running job; False once the lease is lost."""
+    renewed = db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.status == "running", Job.locked_by == worker_id)
+        .values(locked_at=now or _now())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return renewed == 1
+
+
+def mark_succeeded(
+    db: Session, job: Job, result: Optional[Dict[str, Any]] = None, *, worker_id: str
+) -> bool:
+    return _finish(
+        db, job, "succeeded", where=_owned(job, worker_id), result=result, error=None
+    )
+
+
+def mark_cancelled(db: Session, job: Job, *, worker_id: str) -> bool:
+    return _finish(db, job, "cancelled", where=_owned(job, worker_id))
+
+
+def mark_failed(
+    db: Session,
+    job: Job,
+    *,
+    worker_id: str,
+    error: str,
+    retry: bool = True,
+    now: Optional[datetime] = None,
+) -> bool:
+    """Requeue with backoff while attempts remain, else fail for good."""
+    owned = _owned(job, worker_id)
+    if job.cancel_requested:
+        return _finish(db, job, "cancelled", where=owned, error=error)
+    if retry and job.attempts < job.max_attempts:
+        run_after = (now or _now()) + timedelta(seconds=backoff_seconds(job.attempts))
+        done = db.execute(
+            update(Job)
+            .where(*owned)
+            .values(
+                status="queued",
+                error=error,
+                locked_by=None,
+                locked_at=None,
+                run_after=run_after,
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        db.refresh(job)
+        return done == 1
+    return _finish(db, job, "failed", where=owned, error=error)
+
+
+def request_cancel(db: Session, *, job: Job) -> Job:
+    """Queued jobs are cancelled at once; running ones stop at their next check."""
+    if job.status in TERMINAL_STATUSES:
+        return job
+    if job.status == "queued":
+        queued = (Job.id == job.id, Job.status == "queued")
+        if _finish(db, job, "cancelled", where=queued, cancel_requested=True):
+            return job
+        # claimed in the meantime: fall through and flag the running job
+    db.execute(
+        update(Job)
+        .where(Job.id == job.id, Job.status.not_in(TERMINAL_STATUSES))
+        .values(cancel_requested=True)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def requeue_stale(
+    db: Session, *, lease_seconds: int, now: Optional[datetime] = None
+) -> int:
+    """
+    Return jobs whose worker died mid-run (lease expired) to the queue, or
+    fail them when they are out of attempts. Returns the number touched.
+    """
+    now = now or _now()
+    cutoff = now - timedelta(seconds=lease_seconds)
+    stale = (Job.status == "running", Job.locked_at < cutoff)
+    failed = db.execute(
+        update(Job)
+        .where(*stale, Job.attempts >= Job.max_attempts)
+        .values(
+            status="failed",
+            error="worker lease expired",
+            locked_by=None,
+            finished_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    requeued = db.execute(
+        update(Job)
+        .where(*stale)
+        .values(status="queued", locked_by=None, locked_at=None, run_after=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return int(failed or 0) + int(requeued or 0)
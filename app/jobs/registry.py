@@ -0,0 +1,124 @@
+# File: /app/jobs/registry.py | Version: 1.2 | Title: Job handler registry (+ periodic tasks) + per-run context
+from __future__ import annotations
+
+import importlib
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.changes import set_actor
+from app.models.job import Job
+
+Handler = Callable[["JobContext", Dict[str, Any]], Optional[Dict[str, Any]]]
+
+HANDLERS: Dict[str, Handler] = {}
+
+
+class Periodic(NamedTuple):
+    every: float  # seconds between runs (per worker process)
+    fn: Callable[[Session], Any]
+
+
+PERIODIC: Dict[str, Periodic] = {}
+
+# Modules whose import registers the built-in handlers.
+_HANDLER_MODULES = ("app.jobs.handlers",)
+
+
+class JobCancelled(Exception):
+    """Raised from JobContext.check_cancelled() to stop a running job."""
+
+
+class JobLeaseLost(Exception):
+    """Raised from JobContext.check_cancelled() once another worker owns the job."""
+
+
+def job_handler(kind: str) -> Callable[[Handler], Handler]:
+    """Register `fn(ctx, payload) -> result dict | None` for a job kind."""
+
+    def decorator(fn: Handler) -> Handler:
+        HANDLERS[kind] = fn
+        return fn
+
+    return decorator
+
+
+def periodic_task(name: str, *, every: float) -> Callable:
+    """Register `fn(db)` for the worker to run every `every` seconds.
+
+    Runs are not queued as jobs: they must be cheap when there's nothing to
+    do and safe to run concurrently from several worker processes.
+    """
+
+    def decorator(fn: Callable[[Session], Any]) -> Callable[[Session], Any]:
+        PERIODIC[name] = Periodic(every, fn)
+        return fn
+
+    return decorator
+
+
+def load_handlers() -> Dict[str, Handler]:
+    for module in _HANDLER_MODULES:
+        importlib.import_module(module)
+    return HANDLERS
+
+
+class JobContext:
+    """
+    What a handler gets besides its payload: a session, cancellation checks
+    and the lease heartbeat.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        job: Job,
+        *,
+        worker_id: Optional[str] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+        lease_seconds: Optional[float] = None,
+    ):
+        self.db = db
+        self.job_id = job.id
+        self.attempt = job.attempts
+        self.workspace_id = job.workspace_id
+        self.created_by = job.created_by
+        self.worker_id = worker_id or job.locked_by
+        self._session_factory = session_factory
+        # renew well before the sweeper's cutoff, without a write per chunk
+        self._renew_every = (lease_seconds or settings.JOBS_LEASE_SECONDS) / 3
+        self._renewed = time.monotonic()
+        # change events written by the job are attributed to whoever queued it
+        set_actor(db, job.created_by)
+
+    def check_cancelled(self) -> None:
+        """
+        Call between units of work. Raises JobCancelled once cancel was
+        requested, JobLeaseLost once the job was requeued away from this
+        worker, and renews the lease every lease/3 seconds.
+        """
+        row = self.db.execute(
+            select(Job.cancel_requested, Job.status, Job.locked_by).where(
+                Job.id == self.job_id
+            )
+        ).one_or_none()
+        if row is None or row.status != "running" or row.locked_by != self.worker_id:
+            raise JobLeaseLost()
+        if row.cancel_requested:
+            raise JobCancelled()
+        if time.monotonic() - self._renewed >= self._renew_every:
+            self.renew_lease()
+
+    def renew_lease(self) -> None:
+        from app.jobs.queue import renew_lease
+
+        # Own short transaction: the handler's session may be mid-stream
+        # (export) or mid-chunk (import), and must not be committed from here.
+        factory = self._session_factory or (lambda: Session(bind=self.db.get_bind()))
+        with factory() as hb:
+            if not renew_lease(hb, job_id=self.job_id, worker_id=self.worker_id):
+                raise JobLeaseLost()
+        self._renewed = time.monotonic()
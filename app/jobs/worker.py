@@ -0,0 +1,210 @@
+# File: /app/jobs/worker.py | Version: 1.2 | Title: In-process job worker pool
+"""
+Threads that claim and run jobs from the `job` table, and run the
+registered periodic tasks (e.g. notification fan-out) between jobs.
+
+Started from the app lifespan when JOBS_ENABLED=true, or standalone (no web
+server) with:
+
+    python -m app.jobs.worker
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.jobs import queue
+from app.jobs.registry import (
+    PERIODIC,
+    JobCancelled,
+    JobContext,
+    JobLeaseLost,
+    load_handlers,
+)
+
+log = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], Session]
+
+
+def _default_session_factory() -> Session:
+    from app.db.session import SessionLocal
+
+    return SessionLocal()
+
+
+def run_next(
+    session_factory: SessionFactory,
+    *,
+    worker_id: str,
+    lease_seconds: Optional[float] = None,
+) -> bool:
+    """Claim and run one due job. Returns False when the queue had nothing due."""
+    handlers = load_handlers()
+    with session_factory() as db:
+        job = queue.claim_next(db, worker_id=worker_id)
+        if job is None:
+            return False
+        handler = handlers.get(job.kind)
+        if handler is None:
+            queue.mark_failed(
+                db,
+                job,
+                worker_id=worker_id,
+                error=f"No handler for {job.kind}",
+                retry=False,
+            )
+            return True
+        ctx = JobContext(
+            db,
+            job,
+            worker_id=worker_id,
+            session_factory=session_factory,
+            lease_seconds=lease_seconds,
+        )
+        try:
+            result = handler(ctx, dict(job.payload or {}))
+        except JobLeaseLost:
+            db.rollback()
+            log.warning("job %s (%s): lease lost, dropped", job.id, job.kind)
+            return True
+        except JobCancelled:
+            db.rollback()
+            owned = queue.mark_cancelled(db, job, worker_id=worker_id)
+        except Exception as exc:  # noqa: BLE001 - recorded on the job, retried
+            db.rollback()
+            log.warning("job %s (%s) failed", job.id, job.kind, exc_info=True)
+            owned = queue.mark_failed(
+                db, job, worker_id=worker_id, error=f"{type(exc).__name__}: {exc}"
+            )
+        else:
+            owned = queue.mark_succeeded(db, job, result, worker_id=worker_id)
+        if not owned:
+            log.warning("job %s (%s): lease lost before finishing", job.id, job.kind)
+        return True
+
+
+class JobWorker:
+    """A pool of `concurrency` threads polling the queue (woken early on enqueue)."""
+
+    def __init__(
+        self,
+        session_factory: Optional[SessionFactory] = None,
+        *,
+        concurrency: Optional[int] = None,
+        poll_seconds: Optional[float] = None,
+        lease_seconds: Optional[int] = None,
+    ):
+        self.session_factory = session_factory or _default_session_factory
+        self.concurrency = concurrency or settings.JOBS_WORKERS
+        self.poll_seconds = (
+            settings.JOBS_POLL_SECONDS if poll_seconds is None else poll_seconds
+        )
+        self.lease_seconds = lease_seconds or settings.JOBS_LEASE_SECONDS
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._sweep_lock = threading.Lock()
+        self._last_sweep = 0.0
+        self._periodic_lock = threading.Lock()
+        self._last_periodic: Dict[str, float] = {}
+
+    def start(self) -> None:
+        load_handlers()
+        self._stop.clear()
+        self._sweep(force=True)
+        for i in range(self.concurrency):
+            t = threading.Thread(
+                target=self._loop,
+                args=(f"{self.name}/{i}",),
+                name=f"job-worker-{i}",
+                daemon=True,
+            )
+            t.start()
+            self._threads.append(t)
+        log.info("job worker started (%d threads)", self.concurrency)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop claiming new jobs and wait for running ones to finish."""
+        self._stop.set()
+        queue.notify_workers()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads.clear()
+
+    def _sweep(self, force: bool = False) -> None:
+        # Requeue jobs abandoned by crashed workers, at most every lease/2.
+        now = time.monotonic()
+        if not force and now - self._last_sweep < self.lease_seconds / 2:
+            return
+        if not self._sweep_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_sweep = now
+            with self.session_factory() as db:
+                n = queue.requeue_stale(db, lease_seconds=self.lease_seconds)
+            if n:
+                log.warning("requeued %d stale job(s)", n)
+        finally:
+            self._sweep_lock.release()
+
+    def _run_periodic(self) -> None:
+        # One thread at a time runs whatever is due; the others keep taking jobs.
+        if not self._periodic_lock.acquire(blocking=False):
+            return
+        try:
+            for name, task in PERIODIC.items():
+                now = time.monotonic()
+                if now - self._last_periodic.get(name, float("-inf")) < task.every:
+                    continue
+                self._last_periodic[name] = now
+                try:
+                    with self.session_factory() as db:
+                        task.fn(db)
+                except Exception:  # noqa: BLE001 - retried on the next tick
+                    log.exception("periodic task %s failed", name)
+        finally:
+            self._periodic_lock.release()
+
+    def _loop(self, worker_id: str) -> None:
+        while not self._stop.is_set():
+            try:
+                self._sweep()
+                self._run_periodic()
+                if run_next(
+                    self.session_factory,
+                    worker_id=worker_id,
+                    lease_seconds=self.lease_seconds,
+                ):
+                    continue
+            except Exception:  # noqa: BLE001 - e.g. DB briefly unavailable
+                log.exception("job worker loop error")
+            with queue.wakeup:
+                if not self._stop.is_set():
+                    queue.wakeup.wait(self.poll_seconds)
+
+
+def main() -> None:  # pragma: no cover - process entry point
+    from app.core.logging import configure_logging
+
+    configure_logging()
+    worker = JobWorker()
+    done = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: done.set())
+    worker.start()
+    done.wait()
+    worker.stop()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
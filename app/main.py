@@ -1,56 +1,106 @@
-# File: /app/main.py | Version: 1.10 | Title: FastAPI App (router includes + Saved Views Apply + quieter multipart logs)
+# File: /app/main.py | Version: 2.4 | Title: FastAPI App (declarative router registry + deferred Sentry init + job worker + realtime broker + SQL timing + metrics + request IDs/access log + profiling)
 from __future__ import annotations
 
-import importlib
-import importlib.util
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
 from app.core.config import settings
 from app.core.logging import configure_logging
+from app.middleware.profiling import ProfilingMiddleware
 from app.middleware.rate_limit import MemoryRateLimiter
-from app.observability.sentry import init_sentry_if_configured
+from app.middleware.request_context import RequestContextMiddleware
+from app.routers.registry import include_routers
 
-# Initialize logging & observability
+# Initialize logging
 configure_logging()
 # Silence very verbose multipart parser logs to avoid pytest "closed file" noise
 logging.getLogger("python_multipart.multipart").setLevel(logging.WARNING)
-init_sentry_if_configured()
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Deferred to startup: importing app.main (tests, alembic, CLIs) never
+    # pulls in sentry_sdk, and cold-start import time stays lean.
+    from app.observability.sentry import init_sentry_if_configured
+
+    init_sentry_if_configured()
+
+    worker = None
+    if settings.JOBS_ENABLED:
+        from app.jobs.worker import JobWorker
+
+        worker = JobWorker()
+        worker.start()
+
+    snapshots = None
+    if settings.METRICS_ENABLED:
+        import anyio.to_thread
+
+        from app.observability import metrics
+
+        metrics.bind_threadpool(anyio.to_thread.current_default_thread_limiter())
+        if settings.METRICS_MULTIPROC_DIR:
+            snapshots = metrics.SnapshotWriter(
+                settings.METRICS_MULTIPROC_DIR, settings.METRICS_FLUSH_SECONDS
+            )
+            snapshots.start()
+
+    sampler = None
+    if settings.PROFILING_SAMPLER_ENABLED:
+        from app.observability.profiling import ContinuousSampler
+
+        sampler = ContinuousSampler(
+            settings.PROFILING_DIR,
+            settings.PROFILING_SAMPLER_INTERVAL_MS / 1000,
+            settings.PROFILING_SAMPLER_FLUSH_SECONDS,
+        )
+        sampler.start()
+
+    broker = None
+    if "realtime" in mounted_routers:
+        from app.realtime import get_broker
+
+        broker = get_broker()
+        broker.start()
+    try:
+        yield
+    finally:
+        if broker is not None:
+            broker.stop()
+        if worker is not None:
+            worker.stop()
+        if snapshots is not None:
+            snapshots.stop()
+        if sampler is not None:
+            sampler.stop()
+
 
 # App
-app = FastAPI(title=f"Task Manager API ({settings.ALGORITHM})")
+app = FastAPI(title=f"Task Manager API ({settings.ALGORITHM})", lifespan=lifespan)
 app.add_middleware(MemoryRateLimiter)  # no-op unless RATE_LIMIT_ENABLED=true
+app.add_middleware(ProfilingMiddleware)  # no-op unless PROFILING_ENABLED=true
+if settings.SQL_TIMING_ENABLED:
+    from app.observability.sql import SQLTimingMiddleware, install_sql_instrumentation
+
+    install_sql_instrumentation()
+    app.add_middleware(SQLTimingMiddleware)
+if settings.METRICS_ENABLED:
+    from app.db.session import engine
+    from app.observability.metrics import MetricsMiddleware, instrument_pool
+
+    instrument_pool("sync", engine.pool)
+    if settings.ASYNC_DB_ENABLED:
+        from app.db.async_session import get_async_engine
 
+        instrument_pool("async", get_async_engine().sync_engine.pool)
+    # outermost, so requests the rate limiter turns away are counted too
+    app.add_middleware(MetricsMiddleware)
+# Outermost: the request ID is bound before any other middleware logs
+app.add_middleware(RequestContextMiddleware)
 
-def include_if_exists(module_path: str, attr_name: str = "router") -> bool:
-    spec = importlib.util.find_spec(module_path)
-    if not spec:
-        return False
-    mod = importlib.import_module(module_path)
-    router = getattr(mod, attr_name, None)
-    if router is not None:
-        app.include_router(router)
-        return True
-    return False
-
-
-# Required routers
-include_if_exists("app.routers.auth")
-include_if_exists("app.routers.core_entities")
-include_if_exists("app.routers.task")
-include_if_exists("app.routers.tags")
-include_if_exists("app.routers.tasks_filter")
-include_if_exists("app.routers.custom_fields")
-
-# Optional routers
-include_if_exists("app.routers.comments")
-include_if_exists("app.routers.watchers")
-include_if_exists("app.routers.time_tracking")
-include_if_exists("app.routers.auth_extras")
-include_if_exists("app.routers.health")
-include_if_exists("app.routers.views")  # Saved Views CRUD (collection: /views)
-include_if_exists("app.routers.views_apply")  # Apply a Saved View to tasks
+mounted_routers = include_routers(app)
 
 # Optional standardized error responses
 if getattr(settings, "ENABLE_STD_ERRORS", False):
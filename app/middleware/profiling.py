@@ -0,0 +1,131 @@
+# File: /app/middleware/profiling.py | Version: 1.1 | Title: On-demand per-request profiling (?__profile=1), Admin-gated
+import os
+import re
+import uuid
+from contextlib import contextmanager
+from typing import Optional
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import log_context
+from app.core.permissions import can_profile
+from app.db.session import get_db
+from app.observability.profiling import StackSampler, render_collapsed
+from app.security import user_from_token
+
+PROFILE_PARAM = "__profile"
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+_SAFE_ID = re.compile(r"[^A-Za-z0-9._-]")
+
+
+@contextmanager
+def _session(request: Request):
+    # The app's get_db, including test overrides; middleware can't use Depends
+    provider = request.app.dependency_overrides.get(get_db, get_db)
+    gen = provider()
+    try:
+        yield next(gen)
+    finally:
+        gen.close()
+
+
+def _denied(request: Request) -> Optional[str]:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return "Profiling requires a bearer token."
+    with _session(request) as db:
+        try:
+            user = user_from_token(db, token)
+        except HTTPException as exc:
+            return exc.detail
+        if not can_profile(db, user_id=user.id):
+            return "Profiling requires Admin in the profiling workspace."
+    return None
+
+
+class ProfilingMiddleware:
+    """
+    `?__profile=1` (or `X-Profile: 1`) samples every thread's stack while the
+    request runs, up to its last body chunk. The profile is saved as
+    PROFILING_DIR/<request id>.collapsed and named in `X-Profile-Id`;
+    `/admin/profiles` serves it. `?__profile=inline` returns the collapsed
+    stacks as the body instead. Only Admins of PROFILING_WORKSPACE_ID may do
+    this; with PROFILING_ENABLED off the flag is ignored.
+
+    Other requests running on the same worker at the same time show up in the
+    profile too.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.PROFILING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        request = Request(scope)
+        mode = request.query_params.get(PROFILE_PARAM) or request.headers.get(
+            PROFILE_HEADER
+        )
+        if not mode:
+            await self.app(scope, receive, send)
+            return
+        denied = await run_in_threadpool(_denied, request)
+        if denied:
+            await JSONResponse({"detail": denied}, status_code=403)(
+                scope, receive, send
+            )
+            return
+
+        sampler = StackSampler(settings.PROFILING_REQUEST_INTERVAL_MS / 1000)
+        if mode == "inline":
+            # The endpoint still runs in full; its response is replaced.
+            async def discard(message: Message) -> None:
+                pass
+
+            sampler.start()
+            try:
+                await self.app(scope, receive, discard)
+            finally:
+                counts = sampler.stop()
+            await Response(
+                render_collapsed(counts),
+                media_type="text/plain",
+                headers={"X-Profile-Samples": str(sum(counts.values()))},
+            )(scope, receive, send)
+            return
+
+        request_id = log_context().get("request_id") or uuid.uuid4().hex
+        name = f"{_SAFE_ID.sub('_', request_id)}.collapsed"
+        counts = None
+
+        async def send_with_profile(message: Message) -> None:
+            nonlocal counts
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[PROFILE_ID_HEADER] = name
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                counts = sampler.stop()
+
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            if counts is None:  # no complete response (error or disconnect)
+                counts = sampler.stop()
+        await run_in_threadpool(_store, name, render_collapsed(counts))
+
+
+def _store(name: str, text: str) -> None:
+    os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+    with open(os.path.join(settings.PROFILING_DIR, name), "w", encoding="utf-8") as fh:
+        fh.write(text)
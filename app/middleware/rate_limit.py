@@ -1,4 +1,4 @@
-# File: app/middleware/rate_limit.py | Version: 1.0 | Title: Lightweight in-memory rate limiting middleware
+# File: app/middleware/rate_limit.py | Version: 1.1 | Title: Lightweight in-memory rate limiting middleware
 import os
 import time
 from collections import deque
@@ -8,6 +8,8 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from app.observability.metrics import RATE_LIMITED
+
 
 def _boolenv(name: str, default: bool = False) -> bool:
     val = os.getenv(name)
@@ -50,6 +52,7 @@ class MemoryRateLimiter(BaseHTTPMiddleware):
             bucket.popleft()
 
         if len(bucket) >= self.max_req:
+            RATE_LIMITED.inc()
             retry_after = max(1, int(bucket[0] + self.window - now))
             return JSONResponse(
                 {"detail": "Rate limit exceeded"},
@@ -0,0 +1,119 @@
+# File: /app/middleware/request_context.py | Version: 1.1 | Title: Request IDs + sampled JSON-friendly access log
+import logging
+import random
+import re
+import time
+import uuid
+from functools import lru_cache
+from typing import Dict
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import close_log_context, log_context, open_log_context
+
+access_log = logging.getLogger("app.access")
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Accept a caller's (or proxy's) ID only if it is short and log-safe
+_VALID_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+
+@lru_cache(maxsize=8)
+def _route_rates(raw: str) -> Dict[str, float]:
+    """Parse ACCESS_LOG_ROUTE_SAMPLE_RATES ("/healthz=0,/tasks/{task_id}=0.1")."""
+    rates: Dict[str, float] = {}
+    for part in raw.split(","):
+        route, sep, rate = part.strip().rpartition("=")
+        if sep and route:
+            rates[route] = float(rate)
+    return rates
+
+
+def sample_rate(route: str) -> float:
+    rates = _route_rates(settings.ACCESS_LOG_ROUTE_SAMPLE_RATES)
+    return rates.get(route, settings.ACCESS_LOG_SAMPLE_RATE)
+
+
+class RequestContextMiddleware:
+    """
+    Gives every request an ID (the caller's X-Request-ID, or a new one), which
+    is echoed in the response and stamped on every log record the request
+    emits. When the last body chunk has been sent, one access-log record is
+    written to `app.access` with the route template, status, latency, DB time
+    and user. It is plain ASGI, so a streamed body is produced inside the log
+    context and counted in the latency.
+
+    High-volume routes can be sampled via ACCESS_LOG_ROUTE_SAMPLE_RATES. Server
+    errors are always logged, and each record carries the `sample_rate` it was
+    kept at, so counts can be scaled back up.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        incoming = Headers(scope=scope).get(REQUEST_ID_HEADER, "")
+        request_id = incoming if _VALID_ID.match(incoming) else uuid.uuid4().hex
+        token = open_log_context(request_id=request_id)
+        start = time.perf_counter()
+        status = 500
+        logged = False
+
+        def finish() -> None:
+            nonlocal logged
+            logged = True
+            if settings.ACCESS_LOG_ENABLED:
+                self._log(Request(scope), status, time.perf_counter() - start)
+
+        async def send_with_id(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                finish()
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            if not logged:  # no complete response (error or disconnect)
+                finish()
+            close_log_context(token)
+
+    @staticmethod
+    def _log(request: Request, status: int, elapsed: float) -> None:
+        route = getattr(request.scope.get("route"), "path", "<unmatched>")
+        rate = 1.0 if status >= 500 else sample_rate(route)
+        if rate <= 0:
+            return
+        if rate < 1 and random.random() >= rate:  # nosec B311 - sampling, not security
+            return
+        sql = getattr(request.state, "sql", None) or {}  # from SQLTimingMiddleware
+        duration_ms = round(elapsed * 1000, 2)
+        access_log.info(
+            "%s %s %d %.1fms",
+            request.method,
+            request.url.path,
+            status,
+            duration_ms,
+            extra={
+                "method": request.method,
+                "route": route,
+                "path": request.url.path,
+                "status": status,
+                "duration_ms": duration_ms,
+                "db_ms": sql.get("db_ms"),
+                "db_queries": sql.get("db_queries"),
+                "user_id": log_context().get("user_id"),
+                "sample_rate": rate,
+            },
+        )
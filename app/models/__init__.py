@@ -1,4 +1,4 @@
-# File: /app/models/__init__.py | Version: 1.2 | Title: Models Package Exports (unified CF exports)
+# File: /app/models/__init__.py | Version: 1.8 | Title: Models Package Exports (unified CF exports)
 from .core_entities import (
     Comment,
     Folder,
@@ -21,6 +21,13 @@ try:
 except ImportError:
     from .core_entities import CustomFieldDefinition, CustomFieldValue, ListCustomField
 
+from .change_event import ChangeEvent
+from .job import Job
+from .notification import Notification, NotificationCounter, NotificationCursor
+from .scope_version import ScopeVersion
+from .task_import import TaskImport
+from .time_tracking import TimeEntryDaily
+
 __all__ = [
     "User",
     "Workspace",
@@ -31,6 +38,7 @@ __all__ = [
     "Task",
     "Comment",
     "TimeEntry",
+    "TimeEntryDaily",
     "TaskAssignee",
     "Tag",
     "TaskTag",
@@ -38,4 +46,11 @@ __all__ = [
     "CustomFieldDefinition",
     "ListCustomField",
     "CustomFieldValue",
+    "TaskImport",
+    "Job",
+    "ChangeEvent",
+    "Notification",
+    "NotificationCounter",
+    "NotificationCursor",
+    "ScopeVersion",
 ]
@@ -0,0 +1,51 @@
+# File: app/models/change_event.py | Version: 1.1 | Path: app/models/change_event.py
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, BigInteger, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+
+
+class ChangeEvent(Base):
+    """
+    Transactional outbox row: one per task/comment/tag/watcher/custom-field write.
+
+    Written in the same transaction as the change it describes, so the feed
+    never shows a change that rolled back. `seq` is a never-reused
+    autoincrement, assigned at commit in commit order (see app.crud.changes),
+    and is the cursor for GET /workspaces/{id}/changes.
+    """
+
+    __tablename__ = "change_event"
+    __table_args__ = (
+        Index("ix_change_event_workspace_seq", "workspace_id", "seq"),
+        {"sqlite_autoincrement": True},
+    )
+
+    seq: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    workspace_id: Mapped[str] = mapped_column(
+        ForeignKey("workspace.id", ondelete="CASCADE"), nullable=False
+    )
+    # task | comment | tag | task_tag | watcher | custom_field | list_custom_field
+    # | custom_field_value
+    entity: Mapped[str] = mapped_column(String(40), nullable=False)
+    entity_id: Mapped[str] = mapped_column(String, nullable=False)
+    # created | updated | moved | deleted
+    op: Mapped[str] = mapped_column(String(20), nullable=False)
+    # No FKs: events must outlive the rows they describe.
+    task_id: Mapped[Optional[str]] = mapped_column(String)
+    list_id: Mapped[Optional[str]] = mapped_column(String)
+    # user whose request made the change (None for system writes)
+    actor_id: Mapped[Optional[str]] = mapped_column(String)
+    data: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), index=True
+    )
@@ -1,4 +1,4 @@
-# File: /app/models/core_entities.py | Version: 1.5 | Path: /app/models/core_entities.py
+# File: /app/models/core_entities.py | Version: 1.8 | Path: /app/models/core_entities.py
 from __future__ import annotations
 
 from datetime import UTC, datetime
@@ -164,6 +164,10 @@ class Task(Base):
         default=lambda: datetime.now(UTC),
         onupdate=lambda: datetime.now(UTC),
     )
+    # Kept by app.crud.comments on create/delete; repair with recount_comments()
+    comment_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     list: Mapped["List"] = relationship(back_populates="tasks")
     parent: Mapped[Optional["Task"]] = relationship(
@@ -219,10 +223,15 @@ class TimeEntry(Base):
     )
     minutes: Mapped[int] = mapped_column(Integer, default=0)
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    # NULL while a timer is running; set on stop (or equal to start + minutes for manual entries)
+    ended_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    note: Mapped[Optional[str]] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
     )
 
+    __table_args__ = (Index("ix_time_entry_user_ended", "user_id", "ended_at"),)
+
     user: Mapped["User"] = relationship(back_populates="time_entries")
     task: Mapped["Task"] = relationship(back_populates="time_entries")
 
@@ -293,3 +302,13 @@ class TaskWatcher(Base):
 
 # Helpful composite index for comment listing
 Index("ix_comment_task_id_created_at", Comment.task_id, Comment.created_at)
+# Keyset pagination seeks (app.core.pagination): tasks by list/parent in creation
+# order, workspace tags in name order
+Index("ix_task_list_id_created_at_id", Task.list_id, Task.created_at, Task.id)
+Index(
+    "ix_task_parent_task_id_created_at_id",
+    Task.parent_task_id,
+    Task.created_at,
+    Task.id,
+)
+Index("ix_tag_workspace_id_name", Tag.workspace_id, Tag.name)
@@ -0,0 +1,54 @@
+# File: app/models/job.py | Version: 1.0 | Path: app/models/job.py
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+from app.models.core_entities import gen_uuid
+
+
+class Job(Base):
+    """
+    A unit of background work in the DB-backed queue (app.jobs).
+
+    Workers claim `queued` rows whose run_after has passed with a
+    compare-and-set UPDATE, so several processes can share one table.
+    """
+
+    __tablename__ = "job"
+    __table_args__ = (Index("ix_job_status_run_after", "status", "run_after"),)
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=gen_uuid)
+    kind: Mapped[str] = mapped_column(String(100), nullable=False)
+    # queued | running | succeeded | failed | cancelled
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued")
+    payload: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON)
+    result: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON)
+    error: Mapped[Optional[str]] = mapped_column(Text)
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, default=False)
+    locked_by: Mapped[Optional[str]] = mapped_column(String(100))
+    locked_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    created_by: Mapped[Optional[str]] = mapped_column(ForeignKey("user.id"), index=True)
+    workspace_id: Mapped[Optional[str]] = mapped_column(
+        ForeignKey("workspace.id"), index=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
@@ -0,0 +1,83 @@
+# File: app/models/notification.py | Version: 1.0 | Path: app/models/notification.py
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+
+
+class Notification(Base):
+    """
+    One inbox row per (watcher, task) burst of activity.
+
+    Events on a task that arrive while the user's previous notification for it
+    is still unread and younger than NOTIFICATIONS_DIGEST_SECONDS are folded
+    into that row (`event_count`, `summary`) instead of adding another one.
+    """
+
+    __tablename__ = "notification"
+    __table_args__ = (
+        # inbox pages: WHERE user_id = ? AND id < ? ORDER BY id DESC
+        Index("ix_notification_user_id_id", "user_id", "id"),
+        # digest lookup: open rows for a batch of tasks
+        Index("ix_notification_task_updated", "task_id", "updated_at"),
+        {"sqlite_autoincrement": True},
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    user_id: Mapped[str] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
+    workspace_id: Mapped[str] = mapped_column(
+        ForeignKey("workspace.id", ondelete="CASCADE"), nullable=False
+    )
+    # No FK: the notification that a task was deleted outlives the task.
+    task_id: Mapped[str] = mapped_column(String, nullable=False)
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    first_seq: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    last_seq: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # most recent events, newest last: [{seq, entity, op, actor_id, fields?}]
+    summary: Mapped[Optional[list[dict[str, Any]]]] = mapped_column(JSON)
+    read_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+
+
+class NotificationCounter(Base):
+    """Unread notifications per user, kept in step with the inbox writes."""
+
+    __tablename__ = "notification_counter"
+
+    user_id: Mapped[str] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    unread: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class NotificationCursor(Base):
+    """Last change_event.seq the notification dispatcher has consumed."""
+
+    __tablename__ = "notification_cursor"
+
+    name: Mapped[str] = mapped_column(String(40), primary_key=True)
+    seq: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
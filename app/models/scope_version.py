@@ -0,0 +1,23 @@
+# File: app/models/scope_version.py | Version: 1.0 | Path: app/models/scope_version.py
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+
+
+class ScopeVersion(Base):
+    """
+    Monotonic per-scope write counter: ("task", id), ("list", id), ("workspace", id).
+
+    Bumped once per scope by every commit that records change events
+    (app.crud.changes), so a reader can tell whether anything under a scope
+    changed with a primary-key lookup instead of re-running its query.
+    """
+
+    __tablename__ = "scope_version"
+
+    scope: Mapped[str] = mapped_column(String(20), primary_key=True)
+    scope_id: Mapped[str] = mapped_column(String, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
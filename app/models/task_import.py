@@ -0,0 +1,47 @@
+# File: app/models/task_import.py | Version: 1.1 | Path: app/models/task_import.py
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+from app.models.core_entities import gen_uuid
+
+
+class TaskImport(Base):
+    """
+    One bulk task import and its checkpoint.
+
+    rows_processed counts source rows whose chunk has committed, so a failed or
+    interrupted import resumes by skipping exactly that many rows.
+    """
+
+    __tablename__ = "task_import"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=gen_uuid)
+    workspace_id: Mapped[str] = mapped_column(
+        ForeignKey("workspace.id"), index=True, nullable=False
+    )
+    list_id: Mapped[str] = mapped_column(ForeignKey("list.id"), nullable=False)
+    user_id: Mapped[str] = mapped_column(ForeignKey("user.id"), nullable=False)
+    source: Mapped[Optional[str]] = mapped_column(String(255))
+    format: Mapped[str] = mapped_column(String(10), nullable=False)
+    # pending | running | completed | failed | cancelled
+    status: Mapped[str] = mapped_column(String(20), default="pending")
+    rows_processed: Mapped[int] = mapped_column(Integer, default=0)
+    rows_imported: Mapped[int] = mapped_column(Integer, default=0)
+    rows_failed: Mapped[int] = mapped_column(Integer, default=0)
+    # [{"row": <1-based data row>, "error": "..."}], capped by the importer
+    errors: Mapped[Optional[list[dict[str, Any]]]] = mapped_column(JSON)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
@@ -0,0 +1,37 @@
+# File: app/models/time_tracking.py | Version: 1.0 | Path: app/models/time_tracking.py
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+
+
+class TimeEntryDaily(Base):
+    """
+    Per (user, task, UTC day) sum of finished time entries.
+
+    Maintained incrementally by app.crud.time_tracking on every write, and
+    rebuildable from time_entry with rebuild_daily_rollup(). Reports aggregate
+    this table instead of scanning raw entries. Rows go away with their task
+    through the ON DELETE CASCADE foreign key.
+    """
+
+    __tablename__ = "time_entry_daily"
+    __table_args__ = (
+        Index("ix_time_daily_workspace_day", "workspace_id", "day"),
+        Index("ix_time_daily_user_day", "user_id", "day"),
+    )
+
+    # Composite key so the rollup can be rebuilt with a plain INSERT ... SELECT
+    user_id: Mapped[str] = mapped_column(ForeignKey("user.id"), primary_key=True)
+    task_id: Mapped[str] = mapped_column(
+        ForeignKey("task.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    workspace_id: Mapped[str] = mapped_column(
+        ForeignKey("workspace.id", ondelete="CASCADE"), nullable=False
+    )
+    minutes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
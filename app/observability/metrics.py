@@ -0,0 +1,475 @@
+# File: /app/observability/metrics.py | Version: 1.2 | Title: Prometheus text metrics (per-thread shards, multi-worker merge)
+"""
+Prometheus metrics without the prometheus_client dependency. The scrape
+endpoint is `GET /metrics` (app.routers.metrics).
+
+Updates are lock-free. Each thread adds to its own dict, and only a scrape
+walks all of them. Under the GIL a thread's `d[k] = d.get(k, 0) + n` cannot
+interleave with another thread's, because no other thread writes to that dict.
+
+Most values are sampled when a scrape asks for them (`collect=` callbacks): DB
+pool checkouts and overflow, the view cache counters and the threadpool that
+runs sync endpoints and bcrypt.
+
+Under several uvicorn workers, set METRICS_MULTIPROC_DIR. Each worker then
+writes a snapshot to `<dir>/<pid>-<start>.json` every METRICS_FLUSH_SECONDS
+(the start time keeps a reused pid from overwriting a dead worker's file), and
+whichever worker serves the scrape sums all of the snapshots:
+  - Counters and histograms from workers that have exited stay in the sum, so
+    totals never go backwards.
+  - Gauges only count workers that are still alive.
+Empty the directory when the whole deployment restarts, as with
+prometheus_client's multiprocess mode.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+log = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[str, ...]
+Samples = Dict[Tuple[str, Labels], Any]  # float, or histogram bucket counts + sum
+
+_registry: Dict[str, "_Metric"] = {}
+_shards: List[Dict] = []
+
+
+class _Shard(threading.local):
+    def __init__(self) -> None:
+        self.values: Dict = {}
+        _shards.append(self.values)  # list.append is atomic under the GIL
+
+
+_local = _Shard()
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        doc: str,
+        labels: Iterable[str] = (),
+        *,
+        collect: Optional[Callable[[], Dict[Labels, float]]] = None,
+    ) -> None:
+        self.name, self.doc, self.labels = name, doc, tuple(labels)
+        self.collect = collect  # sampled at scrape time instead of updated inline
+        _registry[name] = self
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        values, key = _local.values, (self.name, labels)
+        values[key] = values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        values, key = _local.values, (self.name, labels)
+        values[key] = values.get(key, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        doc: str,
+        labels: Iterable[str] = (),
+        *,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, doc, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        values, key = _local.values, (self.name, labels)
+        counts = values.get(key)
+        if counts is None:
+            # one slot per bucket, then +Inf, then the running sum
+            counts = values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+
+# --- what the app reports ---------------------------------------------------
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Requests served, by route template and status.",
+    ("method", "route", "status"),
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time to the last body chunk, by route template.",
+    ("method", "route"),
+)
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "Requests being handled now.")
+RATE_LIMITED = Counter(
+    "rate_limit_rejections_total", "Requests answered 429 by MemoryRateLimiter."
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled DB connection.",
+    ("engine",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+PASSWORD_HASHES_IN_FLIGHT = Gauge(
+    "password_hashes_in_flight", "bcrypt hash/verify calls running now.", ("op",)
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "bcrypt hash/verify duration.",
+    ("op",),
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.0),
+)
+
+_pools: Dict[str, Any] = {}
+
+
+def _pool_stat(method: str) -> Callable[[], Dict[Labels, float]]:
+    def collect() -> Dict[Labels, float]:
+        out = {}
+        for name, pool in _pools.items():
+            fn = getattr(pool, method, None)  # SingletonThreadPool/NullPool lack them
+            if fn is not None:
+                out[(name,)] = float(fn())
+        return out
+
+    return collect
+
+
+Gauge(
+    "db_pool_checked_out",
+    "Connections lent out.",
+    ("engine",),
+    collect=_pool_stat("checkedout"),
+)
+Gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size.",
+    ("engine",),
+    collect=_pool_stat("overflow"),
+)
+Gauge("db_pool_size", "Configured pool_size.", ("engine",), collect=_pool_stat("size"))
+
+
+def _view_cache_stat(key: str) -> Callable[[], Dict[Labels, float]]:
+    def collect() -> Dict[Labels, float]:
+        from app.core import cache
+
+        view_cache = cache._view_cache  # don't create it just to report on it
+        return {} if view_cache is None else {("views",): view_cache.stats()[key]}
+
+    return collect
+
+
+for _key, _cls in (
+    ("hits", Counter),
+    ("misses", Counter),
+    ("evictions", Counter),
+    ("entries", Gauge),
+):
+    _cls(
+        f"cache_{_key}" + ("_total" if _cls is Counter else ""),
+        f"Result cache {_key}.",
+        ("cache",),
+        collect=_view_cache_stat(_key),
+    )
+
+_threadpool = None
+
+
+def _threadpool_stat(read: Callable[[Any], float]) -> Callable[[], Dict[Labels, float]]:
+    def collect() -> Dict[Labels, float]:
+        return {} if _threadpool is None else {(): float(read(_threadpool))}
+
+    return collect
+
+
+Gauge(
+    "threadpool_busy",
+    "Worker threads running sync endpoints, bcrypt and other blocking calls.",
+    collect=_threadpool_stat(lambda pool: pool.borrowed_tokens),
+)
+Gauge(
+    "threadpool_waiting",
+    "Blocking calls queued for a free worker thread.",
+    collect=_threadpool_stat(lambda pool: pool.statistics().tasks_waiting),
+)
+Gauge(
+    "threadpool_size",
+    "Worker thread limit.",
+    collect=_threadpool_stat(lambda pool: pool.total_tokens),
+)
+
+
+# --- wiring -----------------------------------------------------------------
+
+
+def instrument_pool(name: str, pool) -> None:
+    """Report `pool` as engine=<name> and time every checkout wait."""
+    _pools[name] = pool
+    if getattr(pool, "_metrics_timed", False):
+        return
+    do_get = pool._do_get  # where every pool class blocks for a connection
+
+    def timed_do_get():
+        start = time.perf_counter()
+        try:
+            return do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - start, name)
+
+    pool._do_get = timed_do_get
+    pool._metrics_timed = True
+
+
+def bind_threadpool(limiter) -> None:
+    """Report this anyio CapacityLimiter (call from the event loop at startup)."""
+    global _threadpool
+    _threadpool = limiter
+
+
+class MetricsMiddleware:
+    """
+    Request count, latency and in-flight gauge, labelled by route template.
+    Plain ASGI: a request is done when its last body chunk is sent, so a
+    streamed response stays in flight (and is timed) until it is complete.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        status = "500"
+        done = False
+
+        def finish() -> None:
+            nonlocal done
+            done = True
+            HTTP_IN_FLIGHT.dec()
+            # the template, not the path, so ids don't turn into label values
+            route = getattr(scope.get("route"), "path", "<unmatched>")
+            HTTP_LATENCY.observe(time.perf_counter() - start, scope["method"], route)
+            HTTP_REQUESTS.inc(scope["method"], route, status)
+
+        async def send_and_count(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                finish()
+
+        try:
+            await self.app(scope, receive, send_and_count)
+        finally:
+            if not done:  # no complete response (error or disconnect)
+                finish()
+
+
+# --- collection and exposition -------------------------------------------------
+
+
+def _add(samples: Samples, key, value) -> None:
+    current = samples.get(key)
+    if current is None:
+        samples[key] = list(value) if isinstance(value, list) else value
+    elif isinstance(value, list):
+        samples[key] = [a + b for a, b in zip(current, value)]
+    else:
+        samples[key] = current + value
+
+
+def collect_local() -> Samples:
+    """This process's values: every thread's shard plus the scrape-time callbacks."""
+    samples: Samples = {}
+    for shard in list(_shards):
+        for key, value in list(shard.items()):  # a C-level copy; no lock needed
+            _add(samples, key, value)
+    for metric in _registry.values():
+        if metric.collect is not None:
+            try:
+                collected = metric.collect()
+            except Exception:  # a broken probe must not take the scrape down
+                log.warning("metric %s collect failed", metric.name, exc_info=True)
+                continue
+            for labels, value in collected.items():
+                samples[(metric.name, labels)] = value
+    return samples
+
+
+# (pid, start time in ms) of this process; re-taken after a fork
+_process: Tuple[int, int] = (0, 0)
+
+
+def _process_key() -> Tuple[int, int]:
+    global _process
+    pid = os.getpid()
+    if _process[0] != pid:
+        _process = (pid, time.time_ns() // 1_000_000)
+    return _process
+
+
+def _snapshot_path(directory: str, key: Tuple[int, int]) -> str:
+    return os.path.join(directory, "{}-{}.json".format(*key))
+
+
+def write_snapshot(directory: str) -> None:
+    """Atomically replace this worker's snapshot file."""
+    rows = [
+        [name, list(labels), value] for (name, labels), value in collect_local().items()
+    ]
+    pid, started = key = _process_key()
+    path = _snapshot_path(directory, key)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump({"pid": pid, "started": started, "samples": rows}, fh)
+    os.replace(tmp, path)
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def collect_all(directory: str = "") -> Samples:
+    """This process's samples, summed with every other worker's snapshot."""
+    samples = collect_local()
+    if not directory:
+        return samples
+    me = _process_key()
+    for path in glob.glob(os.path.join(directory, "*.json")):
+        try:
+            with open(path, encoding="utf-8") as fh:
+                snapshot = json.load(fh)
+        except (OSError, ValueError):  # being replaced, or truncated by a crash
+            continue
+        pid = snapshot.get("pid")
+        if (pid, snapshot.get("started")) == me:
+            continue  # collect_local() is fresher
+        # same pid, other start: an earlier process whose pid we were handed
+        alive = pid != me[0] and _alive(pid)
+        for name, labels, value in snapshot.get("samples", []):
+            metric = _registry.get(name)
+            if metric is None or (metric.kind == "gauge" and not alive):
+                continue
+            _add(samples, (name, tuple(labels)), value)
+    return samples
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def render(samples: Samples) -> str:
+    """Prometheus text exposition format 0.0.4."""
+    by_metric: Dict[str, List[Tuple[Labels, Any]]] = {}
+    for (name, labels), value in samples.items():
+        by_metric.setdefault(name, []).append((labels, value))
+    lines: List[str] = []
+    for name, metric in _registry.items():
+        rows = by_metric.get(name)
+        if not rows:
+            continue
+        lines.append(f"# HELP {name} {metric.doc}")
+        lines.append(f"# TYPE {name} {metric.kind}")
+        for labels, value in sorted(rows):
+            if metric.kind != "histogram":
+                lines.append(f"{name}{_labels(metric.labels, labels)} {_number(value)}")
+                continue
+            cumulative = 0
+            bounds = [_number(b) for b in metric.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, value[:-1]):
+                cumulative += count
+                le = _labels(metric.labels, labels, f'le="{bound}"')
+                lines.append(f"{name}_bucket{le} {cumulative}")
+            plain = _labels(metric.labels, labels)
+            lines.append(f"{name}_sum{plain} {_number(value[-1])}")
+            lines.append(f"{name}_count{plain} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+class SnapshotWriter:
+    """Daemon thread that flushes this worker's snapshot for the others to merge."""
+
+    def __init__(self, directory: str, interval: float) -> None:
+        self.directory, self.interval = directory, interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-snapshot", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval)
+        self._flush()  # final counters survive this worker
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._flush()
+
+    def _flush(self) -> None:
+        try:
+            write_snapshot(self.directory)
+        except OSError:
+            log.warning("metrics snapshot to %s failed", self.directory, exc_info=True)
+
+
+def metrics_text() -> str:
+    return render(collect_all(settings.METRICS_MULTIPROC_DIR))
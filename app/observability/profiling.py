@@ -0,0 +1,154 @@
+# File: /app/observability/profiling.py | Version: 1.0 | Title: Stack sampler (collapsed stacks for flamegraphs), on-demand + continuous
+"""
+A sampling profiler that needs no extra dependencies. A daemon thread reads
+sys._current_frames() every `interval` seconds and counts each thread's
+stack in the "collapsed" format:
+
+    <thread>;<file>:<func>;<file>:<func>... <samples>
+
+flamegraph.pl, speedscope and inferno all read this format.
+
+Sampling sees every thread, including the event loop and the anyio worker
+that runs a sync endpoint, which a per-thread profiler like cProfile would
+miss. Threads parked in a selector, a queue or a lock wait are skipped, so
+idle workers add no noise.
+
+Two users:
+  - app.middleware.profiling: one request, sampled at PROFILING_REQUEST_INTERVAL_MS.
+  - ContinuousSampler: low-rate, always-on sampling for each worker
+    (PROFILING_SAMPLER_ENABLED). It appends to
+    PROFILING_DIR/continuous-<pid>-<YYYYmmddHH>.collapsed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+# (file, function) of a thread's innermost Python frame while it blocks in C
+_IDLE = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),  # concurrent.futures worker waiting for work
+    ("_asyncio.py", "run"),  # anyio WorkerThread waiting for work
+}
+
+
+def _short(filename: str) -> str:
+    for marker in ("site-packages" + os.sep, os.sep + "app" + os.sep):
+        cut = filename.rfind(marker)
+        if cut != -1:
+            start = cut + (len(marker) if marker.startswith("site") else 1)
+            return filename[start:]
+    return os.path.basename(filename)
+
+
+def collapse(frame) -> Optional[str]:
+    """Root-first `file:function` frames joined by ';' (None for idle threads)."""
+    code = frame.f_code
+    if (os.path.basename(code.co_filename), code.co_name) in _IDLE:
+        return None
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f"{_short(code.co_filename)}:{code.co_qualname}")
+        frame = frame.f_back
+    frames.reverse()
+    return ";".join(frames)
+
+
+def render_collapsed(counts: Counter) -> str:
+    return "".join(f"{stack} {n}\n" for stack, n in sorted(counts.items()))
+
+
+class StackSampler:
+    """Samples every other thread's stack until stop()."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.counts
+
+    def sample(self) -> None:
+        me = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == me:
+                continue
+            stack = collapse(frame)
+            if stack:
+                thread = names.get(ident, str(ident)).replace(";", ":")
+                self.counts[f"{thread};{stack}"] += 1
+
+    def drain(self) -> Counter:
+        """Hand over what has been sampled so far and start a fresh count."""
+        counts, self.counts = self.counts, Counter()
+        return counts
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+class ContinuousSampler(StackSampler):
+    """Low-rate sampler that appends to an hourly file every `flush_seconds`."""
+
+    def __init__(self, directory: str, interval: float, flush_seconds: float) -> None:
+        super().__init__(interval)
+        self.directory, self.flush_seconds = directory, flush_seconds
+
+    def start(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        super().start()
+
+    def stop(self) -> Counter:
+        counts = super().stop()
+        self.flush()
+        return counts
+
+    def path(self) -> str:
+        hour = time.strftime("%Y%m%d%H")
+        return os.path.join(
+            self.directory, f"continuous-{os.getpid()}-{hour}.collapsed"
+        )
+
+    def flush(self) -> None:
+        counts = self.drain()
+        if not counts:
+            return
+        try:
+            # flamegraph tools sum repeated stacks, so appending is enough
+            with open(self.path(), "a", encoding="utf-8") as fh:
+                fh.write(render_collapsed(counts))
+        except OSError:
+            log.warning("profile flush to %s failed", self.directory, exc_info=True)
+
+    def _run(self) -> None:
+        next_flush = time.monotonic() + self.flush_seconds
+        while not self._stop.wait(self.interval):
+            self.sample()
+            if time.monotonic() >= next_flush:
+                self.flush()
+                next_flush = time.monotonic() + self.flush_seconds
@@ -0,0 +1,196 @@
+# File: app/observability/sql.py | Version: 1.1 | Title: Per-request SQL stats (count, DB time, slowest) + slow-query log
+"""
+Engine-wide cursor hooks. While a request runs (see SQLTimingMiddleware) they
+add up how many statements it sent, the total DB time and the slowest
+statement. The results go out as a `Server-Timing` header, so browser
+devtools show them, and as fields on the `app.sql` log record:
+
+    Server-Timing: db;dur=12.4;desc="7 queries", db-slowest;dur=5.1
+
+The header can only cover the statements run before the response started;
+the log record is written after the last body chunk, so for streamed
+responses (NDJSON, exports) it also counts the queries that built the body.
+
+Statements slower than SLOW_QUERY_MS are logged to `app.sql.slow` with a
+fingerprint, i.e. the SQL with literals and IN-lists stripped so that one
+query shape is one log key. A SLOW_QUERY_EXPLAIN_SAMPLE fraction of them also
+carries the database's plan.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+log = logging.getLogger("app.sql")
+slow_log = logging.getLogger("app.sql.slow")
+
+_STARTS = "app_sql_starts"
+_SAVEPOINT = "app_sql_explain"
+
+
+@dataclass
+class SQLStats:
+    queries: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_sql: str = ""  # raw; fingerprinted once, on the way out
+
+    def fields(self) -> Dict[str, Any]:
+        """Structured log fields (also kept on request.state.sql)."""
+        return {
+            "db_queries": self.queries,
+            "db_ms": round(self.total_ms, 2),
+            "db_slowest_ms": round(self.slowest_ms, 2),
+            "db_slowest": fingerprint(self.slowest_sql) if self.slowest_sql else None,
+        }
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.total_ms:.1f};desc="{self.queries} queries", '
+            f"db-slowest;dur={self.slowest_ms:.1f}"
+        )
+
+
+_current: ContextVar[Optional[SQLStats]] = ContextVar("app_sql_stats", default=None)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"\?|%\(\w+\)s|%s|:\w+|\$\d+")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """The statement with literals, bind markers and IN-lists replaced by `?`."""
+    sql = _STRING.sub("?", statement)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PARAM.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def _explain(conn, statement: str, parameters) -> Optional[str]:
+    if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return None
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    # A raw DBAPI cursor, so the EXPLAIN itself is not timed or counted. It is
+    # on the request's own connection, so it runs inside a savepoint: a failed
+    # EXPLAIN must not abort the transaction (PostgreSQL) or leave anything
+    # behind in it.
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(f"SAVEPOINT {_SAVEPOINT}")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            plan = "\n".join(" ".join(str(c) for c in row) for row in cursor.fetchall())
+        except Exception as exc:  # the plan is best-effort diagnostics
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {_SAVEPOINT}")
+            plan = f"EXPLAIN failed: {exc}"
+        cursor.execute(f"RELEASE SAVEPOINT {_SAVEPOINT}")
+        return plan
+    except Exception as exc:
+        return f"EXPLAIN failed: {exc}"
+    finally:
+        cursor.close()
+
+
+def _before(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_STARTS, []).append(time.perf_counter())
+
+
+def _after(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info[_STARTS].pop()) * 1000
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.total_ms += elapsed_ms
+        if elapsed_ms > stats.slowest_ms:
+            stats.slowest_ms, stats.slowest_sql = elapsed_ms, statement
+    if elapsed_ms < settings.SLOW_QUERY_MS:
+        return
+    extra: Dict[str, Any] = {
+        "db_ms": round(elapsed_ms, 2),
+        "sql": fingerprint(statement),
+    }
+    sample = random.random()  # nosec B311 - sampling, not security
+    if not executemany and sample < settings.SLOW_QUERY_EXPLAIN_SAMPLE:
+        extra["plan"] = _explain(conn, statement, parameters)
+    slow_log.warning("slow query %.1fms: %s", elapsed_ms, extra["sql"], extra=extra)
+
+
+def _failed(exception_context) -> None:
+    # after_cursor_execute never runs for a statement that raised
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_STARTS):
+        conn.info[_STARTS].pop()
+
+
+def install_sql_instrumentation() -> None:
+    """Hook every Engine (sync, the async engines' sync side, tests'); idempotent."""
+    if not event.contains(Engine, "before_cursor_execute", _before):
+        event.listen(Engine, "before_cursor_execute", _before)
+        event.listen(Engine, "after_cursor_execute", _after)
+        event.listen(Engine, "handle_error", _failed)
+
+
+class SQLTimingMiddleware:
+    """
+    Collects SQLStats for each request (plain ASGI, so streamed bodies run
+    inside it). Server-Timing goes on the response start; request.state.sql
+    and the log record are written when the last body chunk is sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = SQLStats()
+        finished = False
+
+        def finish() -> None:
+            nonlocal finished
+            finished = True
+            fields = stats.fields()
+            scope.setdefault("state", {})["sql"] = fields  # request.state.sql
+            log.debug(
+                "%s %s: %d queries, %.1fms in DB",
+                scope["method"],
+                scope["path"],
+                stats.queries,
+                stats.total_ms,
+                extra=fields,
+            )
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", stats.server_timing())
+            elif message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                finish()  # before passing it on, so outer layers can log it
+            await send(message)
+
+        token = _current.set(stats)  # copied into the endpoint's task/thread
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current.reset(token)
+            if not finished:  # no complete response (error or disconnect)
+                finish()
@@ -0,0 +1,4 @@
+# File: /app/realtime/__init__.py | Version: 1.0 | Title: Live push (SSE) for board updates
+from app.realtime.broker import Broker, Subscription, channels_for, get_broker
+
+__all__ = ["Broker", "Subscription", "channels_for", "get_broker"]
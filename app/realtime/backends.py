@@ -0,0 +1,115 @@
+# File: /app/realtime/backends.py | Version: 1.1 | Title: Cross-worker fan-out backends for the realtime broker
+"""
+A backend carries committed change events from the process that wrote them
+to every process holding subscribers (including itself).
+
+    local : in-process only; fine for a single worker
+    redis : Redis pub/sub; every worker publishes its commits and delivers
+            everything it receives (needs the optional `redis` package)
+
+`publish` runs inside the writer's after_commit hook, so it must not block:
+the redis backend queues events for its own publisher thread.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+Events = List[Dict[str, Any]]
+Deliver = Callable[[Events], None]
+
+
+class Backend(ABC):
+    def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    @abstractmethod
+    def publish(self, events: Events) -> None:
+        """Hand committed events on; called from request threads, must not block."""
+
+    def stop(self) -> None:
+        pass
+
+
+class LocalBackend(Backend):
+    def publish(self, events: Events) -> None:
+        self._deliver(events)
+
+
+class RedisBackend(Backend):
+    def __init__(
+        self, url: str, channel: str = "taskmanager:changes", *, max_queue: int = 10_000
+    ):
+        self.url = url
+        self.channel = channel
+        self._client: Any = None
+        self._pubsub: Any = None
+        self._thread: Any = None
+        self._outbox: "queue.Queue[Optional[Events]]" = queue.Queue(maxsize=max_queue)
+        self._publisher: Optional[threading.Thread] = None
+
+    def start(self, deliver: Deliver) -> None:
+        try:
+            import redis
+        except ImportError as e:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "REALTIME_BACKEND=redis requires the `redis` package"
+            ) from e
+        super().start(deliver)
+        self._client = redis.Redis.from_url(self.url)
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.channel: self._on_message})
+        self._thread = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+        self._start_publisher()
+
+    def _start_publisher(self) -> None:
+        self._publisher = threading.Thread(
+            target=self._publish_loop, name="realtime-redis-publish", daemon=True
+        )
+        self._publisher.start()
+
+    def _publish_loop(self) -> None:
+        while (events := self._outbox.get()) is not None:
+            try:
+                self._client.publish(self.channel, json.dumps(events, default=str))
+            except Exception:  # noqa: BLE001 - subscribers resync on reconnect
+                log.exception("realtime publish to %s failed", self.channel)
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        try:
+            self._deliver(json.loads(message["data"]))
+        except Exception:  # noqa: BLE001 - one bad message mustn't kill the reader
+            log.exception("bad realtime message on %s", self.channel)
+
+    def publish(self, events: Events) -> None:
+        try:
+            self._outbox.put_nowait(events)
+        except queue.Full:
+            log.warning("realtime outbox full; dropped %d event(s)", len(events))
+
+    def stop(self) -> None:
+        if self._publisher is not None:
+            self._outbox.put(None)  # drains what was queued before it
+            self._publisher.join(timeout=5)
+            self._publisher = None
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+
+def make_backend(name: str, *, redis_url: Optional[str] = None) -> Backend:
+    if name == "local":
+        return LocalBackend()
+    if name == "redis":
+        return RedisBackend(redis_url or "redis://localhost:6379/0")
+    raise ValueError(f"Unknown REALTIME_BACKEND {name!r} (expected local or redis)")
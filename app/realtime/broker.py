@@ -0,0 +1,185 @@
+# File: /app/realtime/broker.py | Version: 1.0 | Title: In-process pub/sub for live board updates
+"""
+Fans committed change events out to SSE connections.
+
+Commits publish from whatever thread ran them; the broker hops onto the
+event loop once per batch and hands each event to the subscriptions on its
+channels (`workspace:<id>`, `list:<id>`; a move also goes to the list it
+left). Subscriptions coalesce instead of queueing: a burst of updates to one
+task becomes a single merged event, and a connection that falls more than
+REALTIME_MAX_PENDING entities behind is told to resync rather than buffered
+without bound.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.core.change_notifier import notifier
+from app.core.config import settings
+from app.realtime.backends import Backend, Events, make_backend
+
+log = logging.getLogger(__name__)
+
+Event = Dict[str, Any]
+
+
+def channels_for(event: Event) -> Set[str]:
+    chans = {f"workspace:{event['workspace_id']}"}
+    if event.get("list_id"):
+        chans.add(f"list:{event['list_id']}")
+    left = (event.get("data") or {}).get("from_list_id")
+    if left:
+        chans.add(f"list:{left}")
+    return chans
+
+
+def _merge(current: Event, new: Event) -> Event:
+    """Fold a later partial update into a pending event for the same entity."""
+    # Clients treat created/updated/moved as upserts, so the merged event only
+    # has to say where the task ended up (and, for moves, where it came from).
+    if "moved" in (current["op"], new["op"]):
+        op = "moved"
+    elif current["op"] == "created":
+        op = "created"
+    else:
+        op = "updated"
+    data = {**(current.get("data") or {}), **(new.get("data") or {})}
+    if "from_list_id" in (current.get("data") or {}):
+        data["from_list_id"] = current["data"]["from_list_id"]
+    # "_"-keys are per-object caches (e.g. the formatted SSE frame); drop them.
+    fresh = {k: v for k, v in new.items() if not k.startswith("_")}
+    return {**fresh, "op": op, "data": data}
+
+
+class Subscription:
+    """One connection's view of a channel. Lives on the broker's event loop."""
+
+    def __init__(self, channel: str, *, max_pending: int):
+        self.channel = channel
+        self.max_pending = max_pending
+        # Events at or below this seq were already sent (e.g. by a replay).
+        self.min_seq = 0
+        self._pending: "OrderedDict[Tuple[str, str], Event]" = OrderedDict()
+        self._overflowed = False
+        self._ready = asyncio.Event()
+
+    def offer(self, event: Event) -> None:
+        if event["seq"] <= self.min_seq:
+            return
+        key = (event["entity"], event["entity_id"])
+        current = self._pending.pop(key, None)
+        if (
+            current is not None
+            and current["op"] != "deleted"
+            and event["op"] in ("updated", "moved")
+        ):
+            event = _merge(current, event)
+        self._pending[key] = event
+        if len(self._pending) > self.max_pending:
+            self._pending.clear()
+            self._overflowed = True
+        self._ready.set()
+
+    async def next_batch(
+        self, timeout: float, coalesce: float = 0.0
+    ) -> Tuple[Optional[List[Event]], bool]:
+        """
+        Wait up to `timeout` for events. Returns (None, False) on timeout,
+        ([], True) after an overflow, else (events in seq order, False).
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None, False
+        if coalesce:
+            await asyncio.sleep(coalesce)  # let the rest of a burst arrive
+        self._ready.clear()
+        if self._overflowed:
+            self._overflowed = False
+            self._pending.clear()
+            return [], True
+        batch = sorted(self._pending.values(), key=lambda e: e["seq"])
+        self._pending.clear()
+        return batch, False
+
+
+class Broker:
+    def __init__(
+        self, backend: Optional[Backend] = None, *, max_pending: Optional[int] = None
+    ):
+        self.backend = backend or make_backend(
+            settings.REALTIME_BACKEND, redis_url=settings.REALTIME_REDIS_URL
+        )
+        self.max_pending = max_pending or settings.REALTIME_MAX_PENDING
+        self._subs: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ---- lifecycle (call from the serving event loop) ----
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self.backend.start(self._deliver)
+        notifier.add_listener(self.publish)
+
+    def stop(self) -> None:
+        notifier.remove_listener(self.publish)
+        self.backend.stop()
+        self._loop = None
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    # ---- publishing (any thread) ----
+
+    def publish(self, events: Events) -> None:
+        self.backend.publish(events)
+
+    def _deliver(self, events: Events) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._fanout, events)
+        except RuntimeError:  # loop closed during shutdown
+            pass
+
+    def _fanout(self, events: Events) -> None:
+        for event in events:
+            for channel in channels_for(event):
+                for sub in self._subs.get(channel, ()):
+                    sub.offer(event)
+
+    # ---- subscribers (event loop only) ----
+
+    def subscribe(self, channel: str) -> Subscription:
+        sub = Subscription(channel, max_pending=self.max_pending)
+        self._subs[channel].add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subs.get(sub.channel)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._subs[sub.channel]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "channels": len(self._subs),
+            "connections": sum(len(s) for s in self._subs.values()),
+        }
+
+
+_broker: Optional[Broker] = None
+
+
+def get_broker() -> Broker:
+    global _broker
+    if _broker is None:
+        _broker = Broker()
+    return _broker
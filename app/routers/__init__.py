@@ -1,4 +1,4 @@
-# File: /app/routers/__init__.py | Version: 1.0 | Title: Routers Package (minimal, no side-imports)
-# Keep this minimal to avoid ImportError on missing optional routers.
-# Routers are imported explicitly in app.main.
+# File: /app/routers/__init__.py | Version: 1.1 | Title: Routers Package (minimal, no side-imports)
+# Keep this minimal so importing one router never drags in the others.
+# Routers are declared in app.routers.registry and mounted by app.main.
 __all__ = []
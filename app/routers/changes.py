@@ -0,0 +1,113 @@
+# File: /app/routers/changes.py | Version: 1.1 | Path: /app/routers/changes.py
+"""
+Incremental sync over the change_event outbox.
+
+    GET /workspaces/{id}/changes/cursor          -> {"seq": N}   (take before a full load)
+    GET /workspaces/{id}/changes?since=N&wait=25 -> events with seq > N
+
+With `wait`, an empty result is held open until a change commits or the wait
+runs out. The handler is `async` so a waiting client costs a coroutine, not a
+threadpool thread, and the DB session is closed between checks so it doesn't
+pin a pooled connection either. For the same reason it authenticates itself
+(instead of depending on get_me): a connection checked out by one threadpool
+hop and released by a later one deadlocks the pool once enough clients wait.
+"""
+
+from __future__ import annotations
+
+import time
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.core.change_notifier import notifier
+from app.core.config import settings
+from app.core.permissions import get_workspace_role
+from app.crud import changes as crud_changes
+from app.db.session import get_db
+from app.routers.auth_dependencies import get_me
+from app.schemas.changes import ChangeCursor, ChangeOut, ChangesPage
+from app.security import oauth2_scheme, user_from_token
+
+router = APIRouter(tags=["Changes"])
+
+
+def _require_member(db: Session, workspace_id: str, user_id: str) -> None:
+    if get_workspace_role(db, user_id=user_id, workspace_id=workspace_id) is None:
+        raise HTTPException(status_code=403, detail="No access to this workspace")
+
+
+def _authorize(db: Session, token: str, workspace_id: str) -> None:
+    try:
+        user = user_from_token(db, token)
+        _require_member(db, workspace_id, str(user.id))
+    finally:
+        db.close()
+
+
+def _read_page(db: Session, workspace_id: str, since: int, limit: int) -> dict:
+    try:
+        oldest = crud_changes.oldest_seq(db)
+        if oldest is not None and since < oldest - 1:
+            raise HTTPException(
+                status_code=410,
+                detail="Change feed position expired; reload and restart from "
+                "/changes/cursor",
+            )
+        # one extra row tells us whether another page is waiting
+        events = crud_changes.get_changes(
+            db, workspace_id=workspace_id, since=since, limit=limit + 1
+        )
+        changes = [ChangeOut.model_validate(e) for e in events[:limit]]
+    finally:
+        db.close()  # hand the connection back while we wait
+    return {
+        "workspace_id": workspace_id,
+        "since": since,
+        "next_since": changes[-1].seq if changes else since,
+        "has_more": len(events) > limit,
+        "changes": changes,
+    }
+
+
+@router.get("/workspaces/{workspace_id}/changes/cursor", response_model=ChangeCursor)
+def change_cursor(
+    workspace_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    _require_member(db, str(workspace_id), str(current_user.id))
+    return {"seq": crud_changes.head_seq(db)}
+
+
+@router.get("/workspaces/{workspace_id}/changes", response_model=ChangesPage)
+async def list_changes(
+    workspace_id: UUID,
+    since: int = Query(0, ge=0, description="Last seq the client has applied"),
+    limit: int = Query(500, ge=1, le=settings.CHANGES_PAGE_LIMIT),
+    wait: float = Query(
+        0,
+        ge=0,
+        le=settings.CHANGES_MAX_WAIT_SECONDS,
+        description="Seconds to hold an empty response open for new changes",
+    ),
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme),
+):
+    ws = str(workspace_id)
+    await run_in_threadpool(_authorize, db, token, ws)
+
+    deadline = time.monotonic() + wait
+    while True:
+        # Subscribe before reading so a commit between the two isn't missed.
+        waiter = notifier.subscribe(ws)
+        try:
+            page = await run_in_threadpool(_read_page, db, ws, since, limit)
+            remaining = deadline - time.monotonic()
+            if page["changes"] or remaining <= 0:
+                return page
+            await waiter.wait(min(remaining, settings.CHANGES_POLL_SECONDS))
+        finally:
+            waiter.close()
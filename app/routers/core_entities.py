@@ -1,13 +1,16 @@
-# File: /app/routers/core_entities.py | Version: 1.6 | Path: /app/routers/core_entities.py
+# File: /app/routers/core_entities.py | Version: 1.7 | Path: /app/routers/core_entities.py
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
+from app.core.pagination import PageRequest, finish_page, page_params, stream_rows
 from app.core.permissions import Role, get_workspace_role, require_role
+from app.core.serialization import row_serializer
 from app.crud import core_entities as crud_core
 from app.db.session import get_db
+from app.models import core_entities as models
 from app.routers.auth_dependencies import get_me  # Authenticated user from token
 from app.schemas import core_entities as schema
 
@@ -75,6 +78,8 @@ def create_space(
 @router.get("/spaces/by-workspace/{workspace_id}", response_model=List[schema.SpaceOut])
 def get_spaces(
     workspace_id: UUID,
+    response: Response,
+    page: PageRequest = Depends(page_params),
     db: Session = Depends(get_db),
     current_user=Depends(get_me),
 ):
@@ -83,7 +88,18 @@ def get_spaces(
     )
     if role is None:
         raise HTTPException(status_code=403, detail="No access to this workspace")
-    return crud_core.get_spaces_by_workspace(db, str(workspace_id))
+
+    def fetch(s: Session, after, limit: int):
+        return crud_core.get_spaces_by_workspace(
+            s, str(workspace_id), after=after, limit=limit
+        )
+
+    keys = crud_core.SPACE_PAGE_KEYS
+    if page.stream:
+        return stream_rows(
+            db, fetch, keys, row_serializer(schema.SpaceOut, models.Space)
+        )
+    return finish_page(fetch(db, page.after, page.fetch_limit), page, keys, response)
 
 
 # ----- FOLDER ROUTES -----
@@ -150,6 +166,8 @@ def create_list(
 @router.get("/lists/by-space/{space_id}", response_model=List[schema.ListOut])
 def get_lists_by_space(
     space_id: UUID,
+    response: Response,
+    page: PageRequest = Depends(page_params),
     db: Session = Depends(get_db),
     current_user=Depends(get_me),
 ):
@@ -161,7 +179,14 @@ def get_lists_by_space(
     )
     if role is None:
         raise HTTPException(status_code=403, detail="No access to this space")
-    return crud_core.get_lists_by_space(db, str(space_id))
+
+    def fetch(s: Session, after, limit: int):
+        return crud_core.get_lists_by_space(s, str(space_id), after=after, limit=limit)
+
+    keys = crud_core.LIST_PAGE_KEYS
+    if page.stream:
+        return stream_rows(db, fetch, keys, row_serializer(schema.ListOut, models.List))
+    return finish_page(fetch(db, page.after, page.fetch_limit), page, keys, response)
 
 
 @router.get("/lists/by-folder/{folder_id}", response_model=List[schema.ListOut])
@@ -3,10 +3,12 @@ from __future__ import annotations
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
+from app.core.pagination import PageRequest, finish_page, page_params, stream_rows
 from app.core.permissions import Role, require_role
+from app.core.serialization import row_serializer
 
 # FIX: Import 'task' from crud as well to get access to crud_task.get_task
 from app.crud import core_entities as crud_core
@@ -42,13 +44,27 @@ def create_custom_field_definition(
 )
 def list_custom_field_definitions(
     workspace_id: UUID,
+    response: Response,
+    page: PageRequest = Depends(page_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     require_role(
         db, user_id=current_user.id, workspace_id=str(workspace_id), minimum=Role.MEMBER
     )
-    return crud_cf.get_definitions_for_workspace(db, workspace_id=workspace_id)
+
+    def fetch(s: Session, after, limit: int):
+        return crud_cf.get_definitions_for_workspace(
+            s, workspace_id=workspace_id, after=after, limit=limit
+        )
+
+    keys = crud_cf.DEFINITION_PAGE_KEYS
+    if page.stream:
+        serialize = row_serializer(
+            schema_cf.CustomFieldDefinitionOut, crud_cf.CustomFieldDefinition
+        )
+        return stream_rows(db, fetch, keys, serialize)
+    return finish_page(fetch(db, page.after, page.fetch_limit), page, keys, response)
 
 
 @router.post("/lists/{list_id}/custom-fields/{field_id}/enable")
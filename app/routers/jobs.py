@@ -0,0 +1,90 @@
+# File: /app/routers/jobs.py | Version: 1.0 | Path: /app/routers/jobs.py
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from app.core.permissions import Role, has_min_role
+from app.db.session import get_db
+from app.jobs import queue
+from app.models.job import Job
+from app.routers.auth_dependencies import get_me
+from app.schemas.job import JobOut
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+_MEDIA = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _visible_job(db: Session, job_id: UUID, current_user) -> Job:
+    """Creators see their jobs; workspace Admins see the workspace's jobs."""
+    job = queue.get_job(db, job_id=str(job_id))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    me = str(current_user.id)
+    if job.created_by != me and not (
+        job.workspace_id
+        and has_min_role(
+            db, user_id=me, workspace_id=job.workspace_id, minimum=Role.ADMIN
+        )
+    ):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("", response_model=List[JobOut])
+def list_my_jobs(
+    status: Optional[str] = Query(
+        None, pattern="^(queued|running|succeeded|failed|cancelled)$"
+    ),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    return queue.list_jobs(
+        db, created_by=str(current_user.id), status=status, limit=limit
+    )
+
+
+@router.get("/{job_id}", response_model=JobOut)
+def get_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    return _visible_job(db, job_id, current_user)
+
+
+@router.post("/{job_id}/cancel", response_model=JobOut)
+def cancel_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    job = _visible_job(db, job_id, current_user)
+    if job.status in queue.TERMINAL_STATUSES:
+        raise HTTPException(status_code=409, detail=f"Job already {job.status}")
+    return queue.request_cancel(db, job=job)
+
+
+@router.get("/{job_id}/download")
+def download_job_result(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    job = _visible_job(db, job_id, current_user)
+    path = (job.result or {}).get("path")
+    if job.status != "succeeded" or not path or not Path(path).is_file():
+        raise HTTPException(status_code=404, detail="No downloadable result")
+    fmt = (job.result or {}).get("format", "")
+    return FileResponse(
+        path,
+        media_type=_MEDIA.get(fmt, "application/octet-stream"),
+        filename=Path(path).name,
+    )
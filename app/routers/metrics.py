@@ -0,0 +1,16 @@
+# File: /app/routers/metrics.py | Version: 1.0 | Title: Prometheus scrape endpoint
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.observability.metrics import CONTENT_TYPE, metrics_text
+
+router = APIRouter(tags=["Health"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """
+    Prometheus text format: HTTP latency per route template, in-flight requests,
+    DB pool, view cache, rate limiter and threadpool (bcrypt) saturation.
+    """
+    return Response(metrics_text(), media_type=CONTENT_TYPE)
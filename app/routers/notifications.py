@@ -0,0 +1,67 @@
+# File: /app/routers/notifications.py | Version: 1.0 | Path: /app/routers/notifications.py
+"""
+The caller's watcher inbox. Rows are written by the job worker's
+`notifications.dispatch` periodic task (app.crud.notifications), never by the
+request that changed the task, so nothing here fans out.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud import notifications as crud_notify
+from app.db.session import get_db
+from app.routers.auth_dependencies import get_me
+from app.schemas import notification as schema
+
+router = APIRouter(prefix="/me/notifications", tags=["Notifications"])
+
+
+@router.get("", response_model=schema.NotificationPage)
+def list_notifications(
+    limit: int = Query(20, ge=1, le=settings.NOTIFICATIONS_PAGE_LIMIT),
+    before: Optional[int] = Query(
+        None, ge=1, description="`next_before` of the previous page"
+    ),
+    unread_only: bool = Query(False),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    me = str(current_user.id)
+    # one extra row tells us whether an older page exists
+    rows = crud_notify.list_notifications(
+        db, user_id=me, limit=limit + 1, before=before, unread_only=unread_only
+    )
+    page = rows[:limit]
+    return {
+        "notifications": page,
+        "next_before": page[-1].id if len(rows) > limit else None,
+        "unread": crud_notify.unread_count(db, user_id=me),
+    }
+
+
+@router.get("/unread-count", response_model=schema.UnreadCount)
+def unread_count(db: Session = Depends(get_db), current_user=Depends(get_me)):
+    return {"unread": crud_notify.unread_count(db, user_id=str(current_user.id))}
+
+
+@router.post("/read", response_model=schema.MarkReadResult)
+def mark_read(
+    payload: schema.NotificationMarkRead,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    me = str(current_user.id)
+    marked = crud_notify.mark_read(db, user_id=me, ids=payload.ids)
+    return {"marked": marked, "unread": crud_notify.unread_count(db, user_id=me)}
+
+
+@router.post("/read-all", response_model=schema.MarkReadResult)
+def mark_all_read(db: Session = Depends(get_db), current_user=Depends(get_me)):
+    me = str(current_user.id)
+    marked = crud_notify.mark_all_read(db, user_id=me)
+    return {"marked": marked, "unread": crud_notify.unread_count(db, user_id=me)}
@@ -0,0 +1,43 @@
+# File: /app/routers/profiling.py | Version: 1.0 | Title: Download stored profiles (collapsed stacks), Admin-gated
+from __future__ import annotations
+
+import os
+import re
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+
+from app.core.config import settings
+from app.core.permissions import require_profiler
+
+router = APIRouter(
+    prefix="/admin/profiles",
+    tags=["Profiling"],
+    dependencies=[Depends(require_profiler)],
+)
+
+_NAME = re.compile(r"^[A-Za-z0-9._-]+\.collapsed$")
+
+
+@router.get("")
+def list_profiles() -> List[dict]:
+    """Per-request and continuous profiles, newest first."""
+    try:
+        entries = [e for e in os.scandir(settings.PROFILING_DIR) if _NAME.match(e.name)]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [
+        {"name": e.name, "bytes": e.stat().st_size, "modified": e.stat().st_mtime}
+        for e in entries
+    ]
+
+
+@router.get("/{name}")
+def get_profile(name: str):
+    """Collapsed stacks; feed to flamegraph.pl, speedscope or inferno."""
+    path = os.path.join(settings.PROFILING_DIR, name)
+    if not _NAME.match(name) or not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="text/plain", filename=name)
@@ -0,0 +1,199 @@
+# File: /app/routers/realtime.py | Version: 1.0 | Path: /app/routers/realtime.py
+"""
+Server-Sent Events for live boards, replacing per-tab polling of
+/tasks/by-list/{id}:
+
+    GET /workspaces/{id}/events
+    GET /lists/{id}/events
+
+Each frame is one change-feed event (`id:` is its seq, `event:` is
+`<entity>.<op>`). Reconnecting clients send Last-Event-ID (or ?since=) and
+first get what they missed from the outbox. `event: resync` means the
+connection fell too far behind: reload the board, then keep listening.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.permissions import get_workspace_role
+from app.crud import changes as crud_changes
+from app.db.session import get_db
+from app.realtime.broker import Broker, Subscription, channels_for, get_broker
+from app.security import oauth2_scheme, user_from_token
+
+router = APIRouter(tags=["Realtime"])
+
+RESYNC = "event: resync\ndata: {}\n\n"
+_FRAME = "_sse_frame"
+
+
+def format_event(event: Dict[str, Any]) -> str:
+    # Fan-out hands the same dict to every subscriber; serialize it once.
+    frame = event.get(_FRAME)
+    if frame is None:
+        frame = (
+            f"id: {event['seq']}\n"
+            f"event: {event['entity']}.{event['op']}\n"
+            f"data: {json.dumps(event, separators=(',', ':'), default=str)}\n\n"
+        )
+        event[_FRAME] = frame
+    return frame
+
+
+def _authorize(
+    db: Session, token: str, *, workspace_id: Optional[str], list_id: Optional[str]
+) -> str:
+    # Auth runs here, not via get_me, so the connection it checks out is
+    # released in the same threadpool hop (see app/routers/changes.py).
+    user_id = str(user_from_token(db, token).id)
+    if list_id is not None:
+        workspace_id = crud_changes.workspace_for_list(db, list_id=list_id)
+        if workspace_id is None:
+            raise HTTPException(status_code=404, detail="List not found")
+    if get_workspace_role(db, user_id=user_id, workspace_id=workspace_id) is None:
+        raise HTTPException(status_code=403, detail="No access to this workspace")
+    return workspace_id
+
+
+def _replay(
+    db: Session, workspace_id: str, channel: str, since: int
+) -> Optional[List[Dict[str, Any]]]:
+    """Events missed since `since` on this channel, or None if the client must resync."""
+    oldest = crud_changes.oldest_seq(db)
+    if oldest is not None and since < oldest - 1:
+        return None
+    limit = settings.CHANGES_PAGE_LIMIT
+    rows = crud_changes.get_changes(
+        db, workspace_id=workspace_id, since=since, limit=limit + 1
+    )
+    if len(rows) > limit:
+        return None
+    events = [crud_changes.event_dict(r) for r in rows]
+    return [e for e in events if channel in channels_for(e)]
+
+
+async def event_frames(
+    broker: Broker,
+    sub: Subscription,
+    replay: Optional[List[Dict[str, Any]]],
+    *,
+    heartbeat: float,
+    coalesce: float,
+) -> AsyncIterator[str]:
+    try:
+        yield "retry: 3000\n\n"
+        if replay is None:
+            yield RESYNC
+        else:
+            for event in replay:
+                yield format_event(event)
+        while True:
+            batch, overflowed = await sub.next_batch(heartbeat, coalesce)
+            if overflowed:
+                yield RESYNC
+            elif batch is None:
+                yield ": ping\n\n"  # keeps proxies from idling the stream out
+            else:
+                yield "".join(format_event(e) for e in batch)
+    finally:
+        broker.unsubscribe(sub)
+
+
+async def _open_stream(
+    db: Session,
+    token: str,
+    *,
+    workspace_id: Optional[str] = None,
+    list_id: Optional[str] = None,
+    since: Optional[int],
+) -> StreamingResponse:
+    broker = get_broker()
+    if not broker.running:
+        raise HTTPException(status_code=503, detail="Live updates are not running")
+
+    def _prepare():
+        try:
+            ws = _authorize(db, token, workspace_id=workspace_id, list_id=list_id)
+            channel = f"list:{list_id}" if list_id else f"workspace:{ws}"
+            return channel, ws
+        finally:
+            db.close()
+
+    channel, ws = await run_in_threadpool(_prepare)
+    # Subscribe before reading the backlog so nothing falls between the two.
+    sub = broker.subscribe(channel)
+    replay: Optional[List[Dict[str, Any]]] = []
+    try:
+        if since is not None:
+
+            def _load():
+                try:
+                    return _replay(db, ws, channel, since)
+                finally:
+                    db.close()
+
+            replay = await run_in_threadpool(_load)
+            sub.min_seq = replay[-1]["seq"] if replay else since
+    except BaseException:
+        broker.unsubscribe(sub)
+        raise
+    return StreamingResponse(
+        event_frames(
+            broker,
+            sub,
+            replay,
+            heartbeat=settings.REALTIME_HEARTBEAT_SECONDS,
+            coalesce=settings.REALTIME_COALESCE_MS / 1000,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _resume_point(since: Optional[int], last_event_id: Optional[str]) -> Optional[int]:
+    if since is not None:
+        return since
+    if last_event_id and last_event_id.isdigit():
+        return int(last_event_id)
+    return None
+
+
+@router.get("/workspaces/{workspace_id}/events")
+async def workspace_events(
+    workspace_id: UUID,
+    since: Optional[int] = Query(None, ge=0, description="Replay events after seq"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme),
+):
+    return await _open_stream(
+        db,
+        token,
+        workspace_id=str(workspace_id),
+        since=_resume_point(since, last_event_id),
+    )
+
+
+@router.get("/lists/{list_id}/events")
+async def list_events(
+    list_id: UUID,
+    since: Optional[int] = Query(None, ge=0, description="Replay events after seq"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme),
+):
+    return await _open_stream(
+        db,
+        token,
+        list_id=str(list_id),
+        since=_resume_point(since, last_event_id),
+    )
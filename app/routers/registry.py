@@ -0,0 +1,84 @@
+# File: /app/routers/registry.py | Version: 1.8 | Title: Declarative router registry (no find_spec probing)
+from __future__ import annotations
+
+import importlib
+from typing import Iterable, List, NamedTuple, Optional, Set
+
+from fastapi import FastAPI
+
+from app.core.config import Settings, settings
+
+
+class RouterSpec(NamedTuple):
+    """
+    One router mounted by the app.
+
+    name       : short key used by DISABLED_ROUTERS (e.g. "views")
+    module     : dotted module path holding the APIRouter
+    enabled_by : optional Settings flag; the module is only imported when it is truthy
+    """
+
+    name: str
+    module: str
+    enabled_by: Optional[str] = None
+    attr: str = "router"
+
+
+# Order matters: the first matching route wins, so async shadows come first.
+ROUTERS: tuple[RouterSpec, ...] = (
+    RouterSpec("task_async", "app.routers.task_async", enabled_by="ASYNC_DB_ENABLED"),
+    # core API
+    RouterSpec("auth", "app.routers.auth"),
+    RouterSpec("core_entities", "app.routers.core_entities"),
+    RouterSpec("task", "app.routers.task"),  # includes task comments
+    RouterSpec("tags", "app.routers.tags"),
+    RouterSpec("tasks_filter", "app.routers.tasks_filter"),
+    RouterSpec("custom_fields", "app.routers.custom_fields"),
+    # optional subsystems (can be switched off via DISABLED_ROUTERS)
+    RouterSpec("watchers", "app.routers.watchers"),
+    RouterSpec("auth_extras", "app.routers.auth_extras"),
+    RouterSpec("health", "app.routers.health"),
+    RouterSpec("metrics", "app.routers.metrics", enabled_by="METRICS_ENABLED"),
+    RouterSpec("profiling", "app.routers.profiling"),  # Admin-only profile downloads
+    RouterSpec("views", "app.routers.views"),  # Saved Views CRUD + apply
+    RouterSpec("time_tracking", "app.routers.time_tracking"),
+    RouterSpec("task_import", "app.routers.task_import"),
+    RouterSpec("jobs", "app.routers.jobs"),  # background job status/cancel/download
+    RouterSpec("changes", "app.routers.changes"),  # outbox change feed (long-poll)
+    RouterSpec("realtime", "app.routers.realtime"),  # SSE push for live boards
+    RouterSpec("notifications", "app.routers.notifications"),  # watcher inbox
+)
+
+
+def _disabled(config: Settings) -> Set[str]:
+    raw = getattr(config, "DISABLED_ROUTERS", "") or ""
+    return {part.strip() for part in raw.split(",") if part.strip()}
+
+
+def enabled_specs(
+    specs: Iterable[RouterSpec] = ROUTERS, *, config: Settings = settings
+) -> List[RouterSpec]:
+    disabled = _disabled(config)
+    return [
+        s
+        for s in specs
+        if s.name not in disabled
+        and (s.enabled_by is None or bool(getattr(config, s.enabled_by, False)))
+    ]
+
+
+def include_routers(
+    app: FastAPI, specs: Iterable[RouterSpec] = ROUTERS, *, config: Settings = settings
+) -> List[str]:
+    """
+    Import and mount every enabled router; returns the names mounted.
+    Enabled routers are imported eagerly, when app.main is imported; only
+    disabled or flag-gated ones are never loaded. A listed module that fails
+    to import is a real error, not something to skip.
+    """
+    mounted: List[str] = []
+    for spec in enabled_specs(specs, config=config):
+        module = importlib.import_module(spec.module)
+        app.include_router(getattr(module, spec.attr))
+        mounted.append(spec.name)
+    return mounted
@@ -1,15 +1,30 @@
-# File: /app/routers/tags.py | Version: 1.5 | Path: /app/routers/tags.py
-from typing import List, Literal
+# File: /app/routers/tags.py | Version: 1.8 | Path: /app/routers/tags.py
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
+from app.core.fieldsets import (
+    FIELDS_DESCRIPTION,
+    parse_fields,
+    sparse_response,
+    sparse_serializer,
+)
+from app.core.pagination import (
+    PageRequest,
+    finish_page,
+    page_params,
+    stream_rows,
+    with_keys,
+)
 from app.core.permissions import Role, get_workspace_role, require_role
+from app.core.serialization import list_response, row_serializer
 from app.crud import core_entities as crud_core
 from app.crud import tags as crud_tags
 from app.crud import task as crud_task
 from app.db.session import get_db
+from app.models.core_entities import Tag, Task
 from app.routers.auth_dependencies import get_me
 from app.schemas import tags as tag_schema
 from app.schemas import task as task_schema
@@ -47,6 +62,8 @@ def create_tag(
 @router.get("/workspaces/{workspace_id}/tags", response_model=List[tag_schema.TagOut])
 def list_workspace_tags(
     workspace_id: UUID,
+    response: Response,
+    page: PageRequest = Depends(page_params),
     db: Session = Depends(get_db),
     current_user=Depends(get_me),
 ):
@@ -55,7 +72,17 @@ def list_workspace_tags(
     )
     if role is None:
         raise HTTPException(status_code=403, detail="No access to this workspace")
-    return crud_tags.get_workspace_tags(db, workspace_id=workspace_id)
+
+    def fetch(s: Session, after, limit: int):
+        return crud_tags.get_workspace_tags(
+            s, workspace_id=workspace_id, after=after, limit=limit
+        )
+
+    keys = crud_tags.TAG_PAGE_KEYS
+    if page.stream:
+        return stream_rows(db, fetch, keys, row_serializer(tag_schema.TagOut, Tag))
+    rows = finish_page(fetch(db, page.after, page.fetch_limit), page, keys, response)
+    return list_response(rows, tag_schema.TagOut, Tag, response)
 
 
 # ---------- Task ↔ tag (single) ----------
@@ -77,7 +104,8 @@ def list_task_tags(
     )
     if role is None:
         raise HTTPException(status_code=403, detail="No access to this task")
-    return crud_tags.get_tags_for_task(db, task_id=task_id)
+    rows = crud_tags.get_tags_for_task(db, task_id=task_id)
+    return list_response(rows, tag_schema.TagOut, Tag)
 
 
 @router.post("/tasks/{task_id}/tags/{tag_id}")
@@ -209,9 +237,13 @@ def bulk_unassign_tags(
 @router.get("/tags/{tag_id}/tasks", response_model=List[task_schema.TaskOut])
 def list_tasks_for_tag(
     tag_id: UUID,
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    page: PageRequest = Depends(page_params),
     db: Session = Depends(get_db),
     current_user=Depends(get_me),
 ):
+    cols = parse_fields(fields, crud_task.TASK_COLUMNS)
     tag = crud_tags.get_tag(db, tag_id=tag_id)
     if not tag:
         raise HTTPException(status_code=404, detail="Tag not found")
@@ -223,7 +255,25 @@ def list_tasks_for_tag(
     if role is None:
         raise HTTPException(status_code=403, detail="No access to this workspace")
 
-    return crud_tags.get_tasks_for_tag(db, tag_id=tag_id)
+    keys = crud_tags.TAG_TASK_PAGE_KEYS
+    columns = with_keys(crud_task.task_columns(cols), keys) if cols else None
+
+    def fetch(s: Session, after, limit: int):
+        return crud_tags.get_tasks_for_tag(
+            s, tag_id=tag_id, columns=columns, after=after, limit=limit
+        )
+
+    if page.stream:
+        serialize = (
+            sparse_serializer(cols)
+            if cols
+            else row_serializer(task_schema.TaskOut, Task)
+        )
+        return stream_rows(db, fetch, keys, serialize)
+    rows = finish_page(fetch(db, page.after, page.fetch_limit), page, keys, response)
+    if cols:
+        return sparse_response(cols, rows, response)
+    return list_response(rows, task_schema.TaskOut, Task, response)
 
 
 @router.get(
@@ -237,20 +287,26 @@ def list_tasks_by_tags(
     match: Literal["any", "all"] = Query("any"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     db: Session = Depends(get_db),
     current_user=Depends(get_me),
 ):
+    cols = parse_fields(fields, crud_task.TASK_COLUMNS)
     role = get_workspace_role(
         db, user_id=str(current_user.id), workspace_id=str(workspace_id)
     )
     if role is None:
         raise HTTPException(status_code=403, detail="No access to this workspace")
 
-    return crud_tags.get_tasks_by_tags(
+    rows = crud_tags.get_tasks_by_tags(
         db,
         workspace_id=workspace_id,
         tag_ids=tag_ids,
         match=match,
         limit=limit,
         offset=offset,
+        columns=crud_task.task_columns(cols) if cols else None,
     )
+    if cols:
+        return sparse_response(cols, rows)
+    return list_response(rows, task_schema.TaskOut, Task)
@@ -1,23 +1,47 @@
-# File: /app/routers/task.py | Version: 2.2 | Title: Tasks, Subtasks, Comments Router (+assignees upsert + list search)
+# File: /app/routers/task.py | Version: 3.0 | Title: Tasks, Subtasks, Comments Router (+assignees upsert + list search + ETags + sparse fields + fast JSON + keyset pages + batch get)
 from __future__ import annotations
 
 import logging
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.core.etag import not_modified
+from app.core.fieldsets import (
+    FIELDS_DESCRIPTION,
+    parse_fields,
+    sparse_items,
+    sparse_response,
+    sparse_serializer,
+)
+from app.core.pagination import (
+    PageRequest,
+    TimelineRequest,
+    finish_page,
+    finish_timeline,
+    page_params,
+    stream_rows,
+    timeline_params,
+)
+from app.core.config import settings
 from app.core.permissions import Role, get_workspace_role, has_min_role, require_role
+from app.core.serialization import FastJSONResponse, list_response, row_serializer
+from app.crud import changes as crud_changes
 from app.crud import comments as crud_comments
 from app.crud import core_entities as crud_core
 from app.crud import task as crud_task
 from app.crud import watchers as crud_watchers
 from app.crud.assignees import set_task_assignees
 from app.db.session import get_db
-from app.models.core_entities import Task, User
+from app.jobs import enqueue
+from app.models.core_entities import Comment, Tag, Task, User
+from app.routers.tasks_filter import task_side_data
 from app.schemas import comments as comment_schema
+from app.schemas.job import JobOut
+from app.schemas import tags as tag_schema
 from app.schemas import task as schema
 from app.security import get_current_user
 
@@ -61,43 +85,136 @@ def create_task(
     return created
 
 
+def _authorize_task_read(db: Session, task_id: UUID, user: User) -> None:
+    """404/403 for a task read from one join, without loading the task."""
+    scope = crud_changes.scope_for_task(db, task_id=str(task_id))
+    if scope is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if get_workspace_role(db, user_id=str(user.id), workspace_id=scope[0]) is None:
+        raise HTTPException(status_code=403, detail="No access to this task")
+
+
+# Reads below answer If-None-Match from the scope's version counter before
+# loading anything, so a polling client that is up to date costs two lookups.
+
+
 @router.get("/tasks/{task_id}", response_model=schema.TaskOut)
 def get_task(
     task_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    task = crud_task.get_task(db, task_id)
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-    parent_list = crud_core.get_list(db, task.list_id)
-    if not parent_list:
-        raise HTTPException(status_code=404, detail="List not found")
-    space = crud_core.get_space(db, parent_list.space_id)
-    role = get_workspace_role(
-        db, user_id=str(current_user.id), workspace_id=str(space.workspace_id)
-    )
-    if role is None:
-        raise HTTPException(status_code=403, detail="No access to this task")
-    return task
+    _authorize_task_read(db, task_id, current_user)
+    version = crud_changes.scope_version(db, scope="task", scope_id=str(task_id))
+    if hit := not_modified(request, response, "task", task_id, version):
+        return hit
+    return crud_task.get_task(db, task_id)
 
 
 @router.get("/tasks/by-list/{list_id}", response_model=List[schema.TaskOut])
 def get_tasks_by_list(
     list_id: UUID,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    page: PageRequest = Depends(page_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    parent_list = crud_core.get_list(db, list_id)
-    if not parent_list:
+    cols = parse_fields(fields, crud_task.TASK_COLUMNS)
+    workspace_id = crud_changes.workspace_for_list(db, list_id=str(list_id))
+    if workspace_id is None:
         raise HTTPException(status_code=404, detail="List not found")
-    space = crud_core.get_space(db, parent_list.space_id)
     role = get_workspace_role(
-        db, user_id=str(current_user.id), workspace_id=str(space.workspace_id)
+        db, user_id=str(current_user.id), workspace_id=workspace_id
     )
     if role is None:
         raise HTTPException(status_code=403, detail="No access to this list")
-    return crud_task.get_tasks_by_list(db, list_id)
+
+    def fetch(s: Session, after, limit: int):
+        return crud_task.get_tasks_by_list(
+            s, list_id, fields=cols, after=after, limit=limit
+        )
+
+    keys = crud_task.TASK_PAGE_KEYS
+    if page.stream:
+        serialize = (
+            sparse_serializer(cols) if cols else row_serializer(schema.TaskOut, Task)
+        )
+        return stream_rows(db, fetch, keys, serialize)
+    version = crud_changes.scope_version(db, scope="list", scope_id=str(list_id))
+    if hit := not_modified(
+        request, response, "list-tasks", list_id, version, cols, page.after, page.limit
+    ):
+        return hit
+    rows = finish_page(fetch(db, page.after, page.fetch_limit), page, keys, response)
+    if cols:
+        return sparse_response(cols, rows, response)
+    return list_response(rows, schema.TaskOut, Task, response)
+
+
+@router.post("/tasks:batchGet", response_model=schema.TaskBatchOut)
+def batch_get_tasks(
+    body: schema.TaskBatchGet,
+    include: Optional[str] = Query(
+        None,
+        description="Comma-separated: " + ",".join(crud_task.TASK_BATCH_INCLUDES),
+    ),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Many tasks in one call, in request order: one query for the tasks and the
+    caller's access to them, plus one per `include`. Ids that do not exist or
+    that the caller cannot read are listed in `missing` (not told apart).
+    """
+    if len(body.ids) > settings.TASK_BATCH_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.TASK_BATCH_MAX} ids per batch",
+        )
+    wanted = parse_fields(include, crud_task.TASK_BATCH_INCLUDES, always=()) or []
+    ids = list(dict.fromkeys(str(i) for i in body.ids))
+    found = {
+        t.id: t
+        for t in crud_task.get_tasks_for_member(
+            db, task_ids=ids, user_id=str(current_user.id), include=wanted
+        )
+    }
+    readable = [i for i in ids if i in found]
+    custom = (
+        task_side_data(db, readable, ("custom_fields",))
+        if "custom_fields" in wanted
+        else {}
+    )
+    subtasks = (
+        crud_task.count_subtasks(db, parent_ids=readable)
+        if "subtask_counts" in wanted
+        else {}
+    )
+
+    serialize = row_serializer(schema.TaskOut, Task)
+    serialize_tag = row_serializer(tag_schema.TagOut, Tag)
+    items = []
+    for task_id in readable:
+        task = found[task_id]
+        item = serialize(task)
+        if "assignees" in wanted:
+            item["assignee_ids"] = sorted(a.user_id for a in task.assignees)
+        if "tags" in wanted:
+            tags = sorted((link.tag for link in task.tags), key=lambda t: t.name)
+            item["tags"] = [serialize_tag(t) for t in tags]
+        if "custom_fields" in wanted:
+            item["custom_fields"] = custom[task_id]["custom_fields"]
+        if "watchers" in wanted:
+            item["watcher_ids"] = [w.user_id for w in task.watchers]
+        if "subtask_counts" in wanted:
+            item["subtask_count"] = subtasks.get(task_id, 0)
+        items.append(item)
+    missing = [i for i in ids if i not in found]
+    return FastJSONResponse({"tasks": items, "missing": missing})
 
 
 @router.get("/tasks/by-list/{list_id}/search")
@@ -111,7 +228,9 @@ def search_tasks_by_list(
     order: str = Query("desc", pattern="^(asc|desc)$"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
 ):
+    cols = parse_fields(fields, crud_task.TASK_COLUMNS)
     parent_list = crud_core.get_list(db, list_id)
     if not parent_list:
         raise HTTPException(status_code=404, detail="List not found")
@@ -131,7 +250,8 @@ def search_tasks_by_list(
     }
     col = sort_map.get(sort or "created_at", Task.created_at)
 
-    base = db.query(Task).filter(Task.list_id == str(list_id))
+    entities = crud_task.task_columns(cols) if cols else [Task]
+    base = db.query(*entities).filter(Task.list_id == str(list_id))
     total = (
         db.query(func.count(Task.id)).filter(Task.list_id == str(list_id)).scalar() or 0
     )
@@ -153,7 +273,11 @@ def search_tasks_by_list(
         }
 
     return {
-        "items": [_row_to_minimal_dict(t) for t in rows],
+        "items": (
+            sparse_items(cols, rows)
+            if cols
+            else [_row_to_minimal_dict(t) for t in rows]
+        ),
         "total": int(total),
         "limit": limit,
         "offset": offset,
@@ -321,6 +445,8 @@ def create_subtask(
 @router.get("/tasks/{task_id}/subtasks", response_model=List[schema.TaskOut])
 def list_subtasks(
     task_id: UUID,
+    response: Response,
+    page: PageRequest = Depends(page_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -342,7 +468,14 @@ def list_subtasks(
     if role is None:
         raise HTTPException(status_code=403, detail="No access to this task")
 
-    return crud_task.get_subtasks(db, task_id)
+    def fetch(s: Session, after, limit: int):
+        return crud_task.get_subtasks(s, task_id, after=after, limit=limit)
+
+    keys = crud_task.TASK_PAGE_KEYS
+    if page.stream:
+        return stream_rows(db, fetch, keys, row_serializer(schema.TaskOut, Task))
+    rows = finish_page(fetch(db, page.after, page.fetch_limit), page, keys, response)
+    return list_response(rows, schema.TaskOut, Task, response)
 
 
 @router.post("/tasks/{task_id}/move", response_model=schema.TaskOut)
@@ -422,6 +555,9 @@ def create_comment(
     )
 
     # best-effort follow; log on failure (avoid bare pass for Bandit B110)
+    # Stays inline rather than in app.jobs: it is one idempotent indexed write,
+    # cheaper than the job row that would defer it, and callers expect to be
+    # watching the task as soon as their comment is returned.
     try:
         crud_watchers.follow_task(db, task_id=task_id, user_id=str(current_user.id))
     except Exception:  # noqa: BLE001
@@ -433,33 +569,27 @@ def create_comment(
 @router.get("/tasks/{task_id}/comments", response_model=List[comment_schema.CommentOut])
 def list_comments(
     task_id: UUID,
+    request: Request,
+    response: Response,
+    page: TimelineRequest = Depends(timeline_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
-    limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
 ):
-    task = crud_task.get_task(db, task_id)
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+    _authorize_task_read(db, task_id, current_user)
+    version = crud_changes.scope_version(db, scope="task", scope_id=str(task_id))
+    if hit := not_modified(request, response, "task-comments", task_id, version, page):
+        return hit
 
-    parent_list = crud_core.get_list(db, task.list_id)
-    if not parent_list:
-        raise HTTPException(status_code=404, detail="List not found")
-    space = crud_core.get_space(db, parent_list.space_id)
-    if not space:
-        raise HTTPException(status_code=404, detail="Space not found")
-
-    role = get_workspace_role(
+    rows = crud_comments.get_comments_for_task(
         db,
-        user_id=str(current_user.id),
-        workspace_id=str(space.workspace_id),
-    )
-    if role is None:
-        raise HTTPException(status_code=403, detail="No access to this task")
-
-    return crud_comments.get_comments_for_task(
-        db, task_id=task_id, limit=limit, offset=offset
+        task_id=task_id,
+        limit=page.fetch_limit,
+        offset=page.offset,
+        after=page.after,
+        descending=page.descending,
     )
+    rows = finish_timeline(rows, page, crud_comments.COMMENT_PAGE_KEYS, response)
+    return list_response(rows, comment_schema.CommentOut, Comment, response)
 
 
 @router.put(
@@ -543,3 +673,29 @@ def delete_comment(
     if not ok:
         raise HTTPException(status_code=404, detail="Comment not found")
     return {"detail": "Comment deleted"}
+
+
+@router.post(
+    "/workspaces/{workspace_id}/comments:recount-job",
+    status_code=202,
+    response_model=JobOut,
+)
+def recount_comments_job(
+    workspace_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Queue a repair of task.comment_count for every task in the workspace (Admin+)."""
+    require_role(
+        db,
+        user_id=str(current_user.id),
+        workspace_id=str(workspace_id),
+        minimum=Role.ADMIN,
+    )
+    return enqueue(
+        db,
+        kind="comments.recount",
+        payload={"workspace_id": str(workspace_id)},
+        created_by=str(current_user.id),
+        workspace_id=str(workspace_id),
+    )
@@ -0,0 +1,289 @@
+# File: /app/routers/task_async.py | Version: 1.5 | Title: Async hot-path routes (tasks, comments, tags) on AsyncSession
+# Mounted ahead of the sync routers only when settings.ASYNC_DB_ENABLED is true.
+# Paths and response shapes mirror app/routers/task.py and app/routers/tags.py,
+# so these handlers shadow the sync ones without clients noticing.
+from __future__ import annotations
+
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.etag import not_modified
+from app.core.fieldsets import (
+    FIELDS_DESCRIPTION,
+    parse_fields,
+    sparse_response,
+    sparse_serializer,
+)
+from app.core.pagination import (
+    PageRequest,
+    TimelineRequest,
+    finish_page,
+    finish_timeline,
+    page_params,
+    stream_rows_async,
+    timeline_params,
+    with_keys,
+)
+from app.core.permissions import get_workspace_role_async
+from app.core.serialization import list_response, row_serializer
+from app.crud import async_comments as crud_comments
+from app.crud import async_tags as crud_tags
+from app.crud import async_task as crud_task
+from app.crud.task import TASK_COLUMNS, TASK_PAGE_KEYS, task_columns
+from app.db.async_session import get_async_db
+from app.models.core_entities import Comment, Tag, Task, User
+from app.schemas import comments as comment_schema
+from app.schemas import tags as tag_schema
+from app.schemas import task as schema
+from app.security import get_current_user_async
+
+router = APIRouter(tags=["Tasks (async)"])
+
+
+async def _require_member(
+    db: AsyncSession, *, user: User, workspace_id: str, detail: str
+) -> None:
+    role = await get_workspace_role_async(
+        db, user_id=str(user.id), workspace_id=str(workspace_id)
+    )
+    if role is None:
+        raise HTTPException(status_code=403, detail=detail)
+
+
+# =========================
+# TASKS
+# =========================
+
+
+@router.get("/tasks/{task_id}", response_model=schema.TaskOut)
+async def get_task(
+    task_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    task, workspace_id = await crud_task.get_task_with_workspace_id(db, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    await _require_member(
+        db,
+        user=current_user,
+        workspace_id=workspace_id,
+        detail="No access to this task",
+    )
+    version = await crud_task.get_scope_version(db, scope="task", scope_id=str(task_id))
+    if hit := not_modified(request, response, "task", task_id, version):
+        return hit
+    return task
+
+
+@router.get("/tasks/by-list/{list_id}", response_model=List[schema.TaskOut])
+async def get_tasks_by_list(
+    list_id: UUID,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    page: PageRequest = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    cols = parse_fields(fields, TASK_COLUMNS)
+    workspace_id = await crud_task.get_list_workspace_id(db, list_id)
+    if not workspace_id:
+        raise HTTPException(status_code=404, detail="List not found")
+    await _require_member(
+        db,
+        user=current_user,
+        workspace_id=workspace_id,
+        detail="No access to this list",
+    )
+
+    async def fetch(s: AsyncSession, after, limit: int):
+        return await crud_task.get_tasks_by_list(
+            s, list_id, fields=cols, after=after, limit=limit
+        )
+
+    keys = TASK_PAGE_KEYS
+    if page.stream:
+        serialize = (
+            sparse_serializer(cols) if cols else row_serializer(schema.TaskOut, Task)
+        )
+        return stream_rows_async(db, fetch, keys, serialize)
+    version = await crud_task.get_scope_version(db, scope="list", scope_id=str(list_id))
+    if hit := not_modified(
+        request, response, "list-tasks", list_id, version, cols, page.after, page.limit
+    ):
+        return hit
+    rows = await fetch(db, page.after, page.fetch_limit)
+    rows = finish_page(rows, page, keys, response)
+    if cols:
+        return sparse_response(cols, rows, response)
+    return list_response(rows, schema.TaskOut, Task, response)
+
+
+@router.get("/tasks/{task_id}/subtasks", response_model=List[schema.TaskOut])
+async def list_subtasks(
+    task_id: UUID,
+    response: Response,
+    page: PageRequest = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    parent, workspace_id = await crud_task.get_task_with_workspace_id(db, task_id)
+    if not parent:
+        raise HTTPException(status_code=404, detail="Parent task not found")
+    await _require_member(
+        db,
+        user=current_user,
+        workspace_id=workspace_id,
+        detail="No access to this task",
+    )
+
+    async def fetch(s: AsyncSession, after, limit: int):
+        return await crud_task.get_subtasks(s, task_id, after=after, limit=limit)
+
+    keys = TASK_PAGE_KEYS
+    if page.stream:
+        return stream_rows_async(db, fetch, keys, row_serializer(schema.TaskOut, Task))
+    rows = finish_page(
+        await fetch(db, page.after, page.fetch_limit), page, keys, response
+    )
+    return list_response(rows, schema.TaskOut, Task, response)
+
+
+# =========================
+# COMMENTS
+# =========================
+
+
+@router.get("/tasks/{task_id}/comments", response_model=List[comment_schema.CommentOut])
+async def list_comments(
+    task_id: UUID,
+    request: Request,
+    response: Response,
+    page: TimelineRequest = Depends(timeline_params),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    task, workspace_id = await crud_task.get_task_with_workspace_id(db, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    await _require_member(
+        db,
+        user=current_user,
+        workspace_id=workspace_id,
+        detail="No access to this task",
+    )
+    version = await crud_task.get_scope_version(db, scope="task", scope_id=str(task_id))
+    if hit := not_modified(request, response, "task-comments", task_id, version, page):
+        return hit
+    rows = await crud_comments.get_comments_for_task(
+        db,
+        task_id=task_id,
+        limit=page.fetch_limit,
+        offset=page.offset,
+        after=page.after,
+        descending=page.descending,
+    )
+    rows = finish_timeline(rows, page, crud_comments.COMMENT_PAGE_KEYS, response)
+    return list_response(rows, comment_schema.CommentOut, Comment, response)
+
+
+# =========================
+# TAGS
+# =========================
+
+
+@router.get("/workspaces/{workspace_id}/tags", response_model=List[tag_schema.TagOut])
+async def list_workspace_tags(
+    workspace_id: UUID,
+    response: Response,
+    page: PageRequest = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    await _require_member(
+        db,
+        user=current_user,
+        workspace_id=str(workspace_id),
+        detail="No access to this workspace",
+    )
+
+    async def fetch(s: AsyncSession, after, limit: int):
+        return await crud_tags.get_workspace_tags(
+            s, workspace_id=workspace_id, after=after, limit=limit
+        )
+
+    keys = crud_tags.TAG_PAGE_KEYS
+    if page.stream:
+        return stream_rows_async(
+            db, fetch, keys, row_serializer(tag_schema.TagOut, Tag)
+        )
+    rows = finish_page(
+        await fetch(db, page.after, page.fetch_limit), page, keys, response
+    )
+    return list_response(rows, tag_schema.TagOut, Tag, response)
+
+
+@router.get("/tasks/{task_id}/tags", response_model=List[tag_schema.TagOut])
+async def list_task_tags(
+    task_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    task, workspace_id = await crud_task.get_task_with_workspace_id(db, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    await _require_member(
+        db,
+        user=current_user,
+        workspace_id=workspace_id,
+        detail="No access to this task",
+    )
+    rows = await crud_tags.get_tags_for_task(db, task_id=task_id)
+    return list_response(rows, tag_schema.TagOut, Tag)
+
+
+@router.get("/tags/{tag_id}/tasks", response_model=List[schema.TaskOut])
+async def list_tasks_for_tag(
+    tag_id: UUID,
+    response: Response,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    page: PageRequest = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    cols = parse_fields(fields, TASK_COLUMNS)
+    tag = await crud_tags.get_tag(db, tag_id=tag_id)
+    if not tag:
+        raise HTTPException(status_code=404, detail="Tag not found")
+    await _require_member(
+        db,
+        user=current_user,
+        workspace_id=tag.workspace_id,
+        detail="No access to this workspace",
+    )
+
+    keys = crud_tags.TAG_TASK_PAGE_KEYS
+    columns = with_keys(task_columns(cols), keys) if cols else None
+
+    async def fetch(s: AsyncSession, after, limit: int):
+        return await crud_tags.get_tasks_for_tag(
+            s, tag_id=tag_id, columns=columns, after=after, limit=limit
+        )
+
+    if page.stream:
+        serialize = (
+            sparse_serializer(cols) if cols else row_serializer(schema.TaskOut, Task)
+        )
+        return stream_rows_async(db, fetch, keys, serialize)
+    rows = finish_page(
+        await fetch(db, page.after, page.fetch_limit), page, keys, response
+    )
+    if cols:
+        return sparse_response(cols, rows, response)
+    return list_response(rows, schema.TaskOut, Task, response)
@@ -0,0 +1,151 @@
+# File: /app/routers/task_import.py | Version: 1.1 | Path: /app/routers/task_import.py
+from __future__ import annotations
+
+import csv
+import io
+import shutil
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.permissions import Role, get_workspace_role, require_role
+from app.crud import core_entities as crud_core
+from app.crud import task_import as crud_import
+from app.db.session import get_db
+from app.jobs import enqueue
+from app.jobs.handlers import job_dir
+from app.routers.auth_dependencies import get_me
+from app.schemas import task_import as schema
+from app.schemas.job import JobOut
+
+router = APIRouter(tags=["Task Import"])
+
+
+def _guess_format(filename: Optional[str]) -> str:
+    name = (filename or "").lower()
+    return "ndjson" if name.endswith((".ndjson", ".jsonl")) else "csv"
+
+
+def _list_workspace(db: Session, list_id: UUID, current_user) -> str:
+    parent_list = crud_core.get_list(db, list_id)
+    if not parent_list:
+        raise HTTPException(status_code=404, detail="List not found")
+    space = crud_core.get_space(db, parent_list.space_id)
+    workspace_id = str(space.workspace_id)
+    require_role(
+        db,
+        user_id=str(current_user.id),
+        workspace_id=workspace_id,
+        minimum=Role.MEMBER,
+    )
+    return workspace_id
+
+
+@router.post("/lists/{list_id}/tasks/import", response_model=schema.TaskImportOut)
+def import_tasks(
+    list_id: UUID,
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    chunk_size: Optional[int] = Query(None, ge=1, le=50_000),
+    import_id: Optional[UUID] = Query(
+        None, description="Resume this import from its last checkpoint"
+    ),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    """
+    Create tasks in a list from a CSV or NDJSON upload.
+
+    Columns: name (required), description, status, priority, due_date, tags
+    (names, created when missing), assignees (emails) or assignee_ids, and
+    `cf:<field name>` for custom fields. Bad rows are skipped and reported.
+    """
+    workspace_id = _list_workspace(db, list_id, current_user)
+
+    if import_id is not None:
+        job = crud_import.get_import(db, import_id=str(import_id))
+        if job is None or job.list_id != str(list_id):
+            raise HTTPException(status_code=404, detail="Import not found")
+        if job.status == "completed":
+            raise HTTPException(status_code=409, detail="Import already completed")
+    else:
+        job = crud_import.create_import(
+            db,
+            workspace_id=workspace_id,
+            list_id=str(list_id),
+            user_id=str(current_user.id),
+            fmt=format or _guess_format(file.filename),
+            source=file.filename,
+        )
+
+    # The upload is spooled to disk by Starlette; read it as a text stream.
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        crud_import.run_import(
+            db,
+            job=job,
+            stream=text,
+            chunk_size=chunk_size or settings.IMPORT_CHUNK_SIZE,
+        )
+    except (UnicodeDecodeError, csv.Error):
+        pass  # recorded on the job as a failed import
+    finally:
+        text.detach()
+    db.refresh(job)
+    return job
+
+
+@router.post(
+    "/lists/{list_id}/tasks/import-jobs", status_code=202, response_model=JobOut
+)
+def import_tasks_job(
+    list_id: UUID,
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    chunk_size: Optional[int] = Query(None, ge=1, le=50_000),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    """
+    Stage the upload on disk and import it in a background job (tasks.import).
+    The job result carries the import_id for GET /imports/{id}.
+    """
+    workspace_id = _list_workspace(db, list_id, current_user)
+    job = crud_import.create_import(
+        db,
+        workspace_id=workspace_id,
+        list_id=str(list_id),
+        user_id=str(current_user.id),
+        fmt=format or _guess_format(file.filename),
+        source=file.filename,
+    )
+    staged = job_dir("uploads") / f"{job.id}.{job.format}"
+    with open(staged, "wb") as out:
+        shutil.copyfileobj(file.file, out)
+    return enqueue(
+        db,
+        kind="tasks.import",
+        payload={"import_id": job.id, "path": str(staged), "chunk_size": chunk_size},
+        created_by=str(current_user.id),
+        workspace_id=workspace_id,
+    )
+
+
+@router.get("/imports/{import_id}", response_model=schema.TaskImportOut)
+def get_import(
+    import_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    job = crud_import.get_import(db, import_id=str(import_id))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import not found")
+    role = get_workspace_role(
+        db, user_id=str(current_user.id), workspace_id=job.workspace_id
+    )
+    if role is None:
+        raise HTTPException(status_code=403, detail="No access to this import")
+    return job
@@ -1,17 +1,34 @@
-# File: /app/routers/tasks_filter.py | Version: 2.6 | Title: Tasks Filter Router (sort+order + correct tags ANY/ALL)
+# File: /app/routers/tasks_filter.py | Version: 3.0 | Title: Tasks Filter Router (sort+order + correct tags ANY/ALL + streaming export + sparse fields)
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy import String, and_, cast, exists, func, not_, or_, select
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.fieldsets import FIELDS_DESCRIPTION, as_json, parse_fields
 from app.core.permissions import Role, require_role
+from app.crud.task import TASK_COLUMNS, task_columns
 from app.db.session import get_db
+from app.jobs import enqueue
 from app.models.core_entities import List as ListModel
-from app.models.core_entities import Space, Task, TaskAssignee, TaskTag, User, Workspace
+from app.models.core_entities import (
+    Space,
+    Tag,
+    Task,
+    TaskAssignee,
+    TaskTag,
+    User,
+    Workspace,
+)
 from app.schemas.filters import (
     FilterOperator,
     FilterPayload,
@@ -19,13 +36,17 @@ from app.schemas.filters import (
     TagsMatch,
     TaskField,
 )
+from app.schemas.job import JobOut
 from app.security import get_current_user
 
 # Custom Field value may live in different module names depending on layout
 try:
-    from app.models.custom_fields import CustomFieldValue
+    from app.models.custom_fields import CustomFieldDefinition, CustomFieldValue
 except ImportError:  # pragma: no cover
-    from app.models.core_entities import CustomFieldValue  # type: ignore
+    from app.models.core_entities import (  # type: ignore
+        CustomFieldDefinition,
+        CustomFieldValue,
+    )
 
 router = APIRouter(prefix="/workspaces", tags=["tasks-filter"])
 
@@ -238,14 +259,31 @@ def _apply_tags_block(q, payload: FilterPayload):
 # -----------------------------
 # Query + response shaping
 # -----------------------------
-def _build_filtered_query(
-    db: Session, payload: FilterPayload, sort: Optional[str], order: str
-):
-    q = select(Task).distinct()
+def build_filter_query(payload: FilterPayload, *entities):
+    """
+    Scope + rules + tags as a SELECT of `entities` (default: Task), unsorted
+    and unpaginated. Shared by /tasks/filter, the export and saved views.
+    """
+    q = select(*(entities or (Task,)))
     q = _apply_scope(q, payload)
     q = _apply_rules(q, payload)
     q = _apply_tags_block(q, payload)  # <- NEW
+    return q
+
+
+def _build_filtered_base(
+    payload: FilterPayload, sort: Optional[str], order: str, *entities
+):
+    """Scope + rules + tags + sort, without pagination (shared by filter and export)."""
+    q = build_filter_query(payload, *entities).distinct()
     q = _apply_sort(q, sort, order)
+    return q
+
+
+def _build_filtered_query(
+    db: Session, payload: FilterPayload, sort: Optional[str], order: str, *entities
+):
+    q = _build_filtered_base(payload, sort, order, *entities)
     q = q.offset(payload.offset).limit(payload.limit)
     return q
 
@@ -262,15 +300,30 @@ def _row_to_minimal_dict(t: Task) -> Dict[str, Any]:
 
 
 def _fetch_tasks(
-    db: Session, payload: FilterPayload, sort: Optional[str], order: str
-) -> List[Task]:
-    rows = db.execute(_build_filtered_query(db, payload, sort, order))
-    return list(rows.scalars().all())
-
-
-def _group_tasks(db: Session, rows: List[Task], group_by: Optional[str]) -> List[dict]:
+    db: Session,
+    payload: FilterPayload,
+    sort: Optional[str],
+    order: str,
+    fields: Optional[List[str]] = None,
+) -> List[Any]:
+    """Task objects, or (with `fields`) rows of those columns plus the group key."""
+    if not fields:
+        rows = db.execute(_build_filtered_query(db, payload, sort, order))
+        return list(rows.scalars().all())
+    gb = getattr(payload.group_by, "value", payload.group_by)
+    keys = list(dict.fromkeys([*fields, *([gb] if gb in TASK_COLUMNS else [])]))
+    stmt = _build_filtered_query(db, payload, sort, order, *task_columns(keys))
+    return list(db.execute(stmt).all())
+
+
+def _group_tasks(
+    db: Session,
+    rows: List[Any],
+    group_by: Optional[str],
+    to_dict: Callable[[Any], Dict[str, Any]] = _row_to_minimal_dict,
+) -> List[dict]:
     if not group_by:
-        return [{"group": None, "tasks": [_row_to_minimal_dict(t) for t in rows]}]
+        return [{"group": None, "tasks": [to_dict(t) for t in rows]}]
 
     # Group by Custom Field
     if isinstance(group_by, str) and group_by.startswith("cf_"):
@@ -289,7 +342,7 @@ def _group_tasks(db: Session, rows: List[Task], group_by: Optional[str]) -> List
             )
             cf_value = db.execute(val_expr).scalar()
             key = str(cf_value) if cf_value not in (None, "") else "No Value"
-            buckets.setdefault(key, []).append(_row_to_minimal_dict(t))
+            buckets.setdefault(key, []).append(to_dict(t))
         return [{"group": k, "tasks": v} for k, v in buckets.items()]
 
     # Group by native fields
@@ -305,10 +358,141 @@ def _group_tasks(db: Session, rows: List[Task], group_by: Optional[str]) -> List
             key = "Assignee"
         else:
             key = "Other"
-        buckets.setdefault(str(key), []).append(_row_to_minimal_dict(t))
+        buckets.setdefault(str(key), []).append(to_dict(t))
     return [{"group": k, "tasks": v} for k, v in buckets.items()]
 
 
+# -----------------------------
+# Streaming export
+# -----------------------------
+# Plain columns only: rows stream as tuples, never as ORM objects.
+_EXPORT_COLUMNS = (
+    Task.id,
+    Task.list_id,
+    Task.parent_task_id,
+    Task.name,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.due_date,
+    Task.created_at,
+    Task.updated_at,
+)
+_EXPORT_FIELDS = tuple(c.key for c in _EXPORT_COLUMNS)
+_EXPORT_MEDIA = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _cf_plain(value: Any) -> Any:
+    # JSON shape assumed {"value": <actual>}, as in _json_value_expr()
+    if isinstance(value, dict) and set(value) == {"value"}:
+        return value["value"]
+    return value
+
+
+TASK_SIDE_FIELDS = ("assignee_ids", "tags", "custom_fields")
+
+
+def task_side_data(
+    session: Session,
+    task_ids: Sequence[str],
+    fields: Sequence[str] = TASK_SIDE_FIELDS,
+) -> Dict[str, Dict]:
+    """
+    Assignees, tag names and/or custom field values for a batch of tasks:
+    one query per requested field, none for the ones left out.
+    """
+    side: Dict[str, Dict] = {
+        tid: {f: {} if f == "custom_fields" else [] for f in fields} for tid in task_ids
+    }
+    if not task_ids:
+        return side
+    if "assignee_ids" in fields:
+        for task_id, user_id in session.execute(
+            select(TaskAssignee.task_id, TaskAssignee.user_id)
+            .where(TaskAssignee.task_id.in_(task_ids))
+            .order_by(TaskAssignee.task_id, TaskAssignee.user_id)
+        ):
+            side[task_id]["assignee_ids"].append(user_id)
+    if "tags" in fields:
+        for task_id, name in session.execute(
+            select(TaskTag.task_id, Tag.name)
+            .join(Tag, Tag.id == TaskTag.tag_id)
+            .where(TaskTag.task_id.in_(task_ids))
+            .order_by(TaskTag.task_id, Tag.name)
+        ):
+            side[task_id]["tags"].append(name)
+    if "custom_fields" not in fields:
+        return side
+    for task_id, name, value in session.execute(
+        select(
+            CustomFieldValue.task_id,
+            CustomFieldDefinition.name,
+            CustomFieldValue.value,
+        )
+        .join(
+            CustomFieldDefinition,
+            CustomFieldDefinition.id == CustomFieldValue.field_definition_id,
+        )
+        .where(CustomFieldValue.task_id.in_(task_ids))
+    ):
+        side[task_id]["custom_fields"][name] = _cf_plain(value)
+    return side
+
+
+def _iter_export_chunks(bind, stmt, chunk_size: int) -> Iterator[List[Dict]]:
+    """
+    Stream the filtered rows chunk by chunk with yield_per (server-side cursor
+    where the driver has one), enriching each chunk with batched side queries.
+
+    Runs on its own Session: the request-scoped one is closed by the time a
+    StreamingResponse body is iterated.
+    """
+    with Session(bind=bind) as session:
+        result = session.execute(stmt.execution_options(yield_per=chunk_size))
+        for rows in result.partitions():
+            chunk = [dict(zip(_EXPORT_FIELDS, row)) for row in rows]
+            side = task_side_data(session, [r["id"] for r in chunk])
+            for r in chunk:
+                r.update(side[r["id"]])
+            yield chunk
+
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _ndjson_body(chunks: Iterator[List[Dict]]) -> Iterator[str]:
+    for chunk in chunks:
+        yield "".join(
+            json.dumps(r, default=_export_value, ensure_ascii=False) + "\n"
+            for r in chunk
+        )
+
+
+def _csv_body(chunks: Iterator[List[Dict]], cf_names: List[str]) -> Iterator[str]:
+    # Custom fields become `cf:<name>` columns (the format the importer reads back).
+    header = list(_EXPORT_FIELDS) + ["assignee_ids", "tags"]
+    header += [f"cf:{n}" for n in cf_names]
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(header)
+    yield buf.getvalue()
+    for chunk in chunks:
+        buf.seek(0)
+        buf.truncate()
+        for r in chunk:
+            cfs = r["custom_fields"]
+            line = [_export_value(r[f]) for f in _EXPORT_FIELDS]
+            line += [";".join(r["assignee_ids"]), ";".join(r["tags"])]
+            for n in cf_names:
+                v = cfs.get(n)
+                line.append(json.dumps(v) if isinstance(v, (dict, list)) else v)
+            writer.writerow(line)
+        yield buf.getvalue()
+
+
 # -----------------------------
 # Endpoint
 # -----------------------------
@@ -322,7 +506,9 @@ def filter_tasks(
         None, pattern="^(created_at|due_date|priority|name|status)$"
     ),
     order: str = Query("desc", pattern="^(asc|desc)$"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
 ):
+    cols = parse_fields(fields, TASK_COLUMNS)
     # guard: requester must be a member of this workspace
     require_role(
         db,
@@ -344,15 +530,144 @@ def filter_tasks(
     ):
         payload.scope.workspace_id = str(workspace_id)
 
-    rows = _fetch_tasks(db, payload, sort, order)
+    rows = _fetch_tasks(db, payload, sort, order, cols)
     gb = (
         payload.group_by.value
         if isinstance(payload.group_by, GroupBy)
         else payload.group_by
     )
-    grouped = _group_tasks(db, rows, gb)
+    if cols:
+        grouped = _group_tasks(
+            db, rows, gb, lambda r: {f: as_json(getattr(r, f)) for f in cols}
+        )
+    else:
+        grouped = _group_tasks(db, rows, gb)
 
     return {
         "count": sum(len(g["tasks"]) for g in grouped),
         "groups": grouped,
     }
+
+
+def _export_scope(workspace_id: UUID | str, payload: FilterPayload) -> None:
+    if payload.scope.workspace_id and str(payload.scope.workspace_id) != str(
+        workspace_id
+    ):
+        raise HTTPException(status_code=400, detail="Workspace scope mismatch.")
+    if not any(
+        [payload.scope.list_id, payload.scope.folder_id, payload.scope.space_id]
+    ):
+        payload.scope.workspace_id = str(workspace_id)
+
+
+def export_body(
+    db: Session,
+    *,
+    workspace_id: str,
+    payload: FilterPayload,
+    fmt: str,
+    sort: Optional[str] = None,
+    order: str = "desc",
+) -> Iterator[str]:
+    """
+    The export as an iterator of text chunks (also used by the tasks.export job).
+    `db` is only used up front; rows are read on a Session of their own.
+    """
+    # Narrower scopes must still sit inside this workspace.
+    stmt = _build_filtered_base(payload, sort, order, *_EXPORT_COLUMNS).where(
+        Space.workspace_id == str(workspace_id)
+    )
+    chunks = _iter_export_chunks(db.get_bind(), stmt, settings.EXPORT_CHUNK_SIZE)
+    if fmt != "csv":
+        return _ndjson_body(chunks)
+    cf_names = list(
+        db.scalars(
+            select(CustomFieldDefinition.name)
+            .where(CustomFieldDefinition.workspace_id == str(workspace_id))
+            .order_by(CustomFieldDefinition.name)
+        )
+    )
+    return _csv_body(chunks, cf_names)
+
+
+@router.post("/{workspace_id}/tasks/export")
+def export_tasks(
+    workspace_id: UUID,
+    payload: FilterPayload,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    sort: Optional[str] = Query(
+        None, pattern="^(created_at|due_date|priority|name|status)$"
+    ),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+):
+    """
+    Stream every task matching the filter (limit/offset are ignored) as NDJSON
+    or CSV, with assignees, tags and custom field values. Memory stays flat:
+    rows are read EXPORT_CHUNK_SIZE at a time and written out per chunk.
+    """
+    require_role(
+        db,
+        user_id=str(current_user.id),
+        workspace_id=str(workspace_id),
+        minimum=Role.MEMBER,
+        message="Not allowed in this workspace.",
+    )
+    _export_scope(workspace_id, payload)
+    body = export_body(
+        db,
+        workspace_id=str(workspace_id),
+        payload=payload,
+        fmt=format,
+        sort=sort,
+        order=order,
+    )
+    return StreamingResponse(
+        body,
+        media_type=_EXPORT_MEDIA[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks-{workspace_id}.{format}"'
+        },
+    )
+
+
+@router.post(
+    "/{workspace_id}/tasks/export-jobs", status_code=202, response_model=JobOut
+)
+def export_tasks_job(
+    workspace_id: UUID,
+    payload: FilterPayload,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    sort: Optional[str] = Query(
+        None, pattern="^(created_at|due_date|priority|name|status)$"
+    ),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+):
+    """
+    Queue the same export as a background job; fetch the file from
+    GET /jobs/{id}/download once the job has succeeded.
+    """
+    require_role(
+        db,
+        user_id=str(current_user.id),
+        workspace_id=str(workspace_id),
+        minimum=Role.MEMBER,
+        message="Not allowed in this workspace.",
+    )
+    _export_scope(workspace_id, payload)
+    return enqueue(
+        db,
+        kind="tasks.export",
+        payload={
+            "workspace_id": str(workspace_id),
+            "filter": payload.model_dump(mode="json"),
+            "format": format,
+            "sort": sort,
+            "order": order,
+        },
+        created_by=str(current_user.id),
+        workspace_id=str(workspace_id),
+    )
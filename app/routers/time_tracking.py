@@ -0,0 +1,290 @@
+# File: /app/routers/time_tracking.py | Version: 1.1 | Path: /app/routers/time_tracking.py
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.permissions import Role, get_workspace_role, require_role
+from app.crud import time_tracking as crud_time
+from app.db.session import get_db
+from app.jobs import enqueue
+from app.models.core_entities import WorkspaceMember
+from app.routers.auth_dependencies import get_me
+from app.schemas import time_tracking as schema
+from app.schemas.job import JobOut
+
+router = APIRouter(tags=["Time Tracking"])
+
+
+def _task_workspace(db: Session, task_id: UUID | str) -> str:
+    ws = crud_time.get_task_workspace_ids(db, task_ids=[str(task_id)])
+    if str(task_id) not in ws:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return ws[str(task_id)]
+
+
+def _parse_group_by(raw: str) -> List[str]:
+    groups = [g.strip() for g in raw.split(",") if g.strip()]
+    unknown = [g for g in groups if g not in crud_time.REPORT_GROUPS]
+    if unknown or len(set(groups)) != len(groups):
+        raise HTTPException(
+            status_code=422,
+            detail=f"group_by must be a comma list of {', '.join(crud_time.REPORT_GROUPS)}",
+        )
+    return groups
+
+
+# -------- Timers --------
+
+
+@router.post("/tasks/{task_id}/time/start", response_model=schema.TimeEntryOut)
+def start_timer(
+    task_id: UUID,
+    payload: Optional[schema.TimerStart] = None,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    workspace_id = _task_workspace(db, task_id)
+    require_role(
+        db,
+        user_id=str(current_user.id),
+        workspace_id=workspace_id,
+        minimum=Role.MEMBER,
+    )
+    try:
+        return crud_time.start_timer(
+            db,
+            task_id=str(task_id),
+            user_id=str(current_user.id),
+            note=payload.note if payload else None,
+        )
+    except crud_time.TimerAlreadyRunning as e:
+        raise HTTPException(
+            status_code=409,
+            detail=f"A timer is already running on task {e.entry.task_id}",
+        )
+
+
+@router.post("/time/stop", response_model=schema.TimeEntryOut)
+def stop_timer(db: Session = Depends(get_db), current_user=Depends(get_me)):
+    entry = crud_time.stop_timer(db, user_id=str(current_user.id))
+    if entry is None:
+        raise HTTPException(status_code=404, detail="No running timer")
+    return entry
+
+
+@router.get("/time/running", response_model=Optional[schema.TimeEntryOut])
+def running_timer(db: Session = Depends(get_db), current_user=Depends(get_me)):
+    return crud_time.get_running_entry(db, user_id=str(current_user.id))
+
+
+# -------- Entries --------
+
+
+@router.post("/tasks/{task_id}/time", response_model=schema.TimeEntryOut)
+def add_entry(
+    task_id: UUID,
+    payload: schema.TimeEntryCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    workspace_id = _task_workspace(db, task_id)
+    require_role(
+        db,
+        user_id=str(current_user.id),
+        workspace_id=workspace_id,
+        minimum=Role.MEMBER,
+    )
+    return crud_time.create_manual_entry(
+        db,
+        task_id=str(task_id),
+        user_id=str(current_user.id),
+        workspace_id=workspace_id,
+        minutes=payload.minutes,
+        started_at=payload.started_at,
+        note=payload.note,
+    )
+
+
+@router.get("/tasks/{task_id}/time", response_model=List[schema.TimeEntryOut])
+def list_entries(
+    task_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    workspace_id = _task_workspace(db, task_id)
+    role = get_workspace_role(
+        db, user_id=str(current_user.id), workspace_id=workspace_id
+    )
+    if role is None:
+        raise HTTPException(status_code=403, detail="No access to this task")
+    return crud_time.get_entries_for_task(db, task_id=str(task_id))
+
+
+@router.delete("/time/{entry_id}")
+def delete_entry(
+    entry_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    entry = crud_time.get_entry(db, entry_id=str(entry_id))
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Time entry not found")
+    workspace_id = _task_workspace(db, entry.task_id)
+    # Own entries need membership; anyone else's need Admin.
+    require_role(
+        db,
+        user_id=str(current_user.id),
+        workspace_id=workspace_id,
+        minimum=Role.MEMBER if entry.user_id == str(current_user.id) else Role.ADMIN,
+    )
+    crud_time.delete_entry(db, entry=entry, workspace_id=workspace_id)
+    return {"detail": "Time entry deleted"}
+
+
+@router.post(
+    "/workspaces/{workspace_id}/time/import",
+    response_model=schema.TimeEntryImportResult,
+)
+def import_entries(
+    workspace_id: UUID,
+    payload: schema.TimeEntryImportIn,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    me = str(current_user.id)
+    ws = str(workspace_id)
+    role = require_role(db, user_id=me, workspace_id=ws, minimum=Role.MEMBER)
+
+    rows = [
+        {**e.model_dump(), "task_id": str(e.task_id), "user_id": e.user_id or me}
+        for e in payload.entries
+    ]
+
+    task_ws = crud_time.get_task_workspace_ids(
+        db, task_ids=(r["task_id"] for r in rows)
+    )
+    foreign = sorted({r["task_id"] for r in rows if task_ws.get(r["task_id"]) != ws})
+    if foreign:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Tasks not found in workspace: {', '.join(foreign[:10])}",
+        )
+
+    others = {r["user_id"] for r in rows} - {me}
+    if others:
+        if role not in (Role.ADMIN, Role.OWNER):
+            raise HTTPException(
+                status_code=403,
+                detail="Importing time for other users requires Admin",
+            )
+        members = set(
+            db.scalars(
+                select(WorkspaceMember.user_id).where(
+                    WorkspaceMember.workspace_id == ws,
+                    WorkspaceMember.user_id.in_(others),
+                )
+            )
+        )
+        missing = sorted(others - members)
+        if missing:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Users are not workspace members: {', '.join(missing[:10])}",
+            )
+
+    imported = crud_time.bulk_import_entries(db, rows=rows, task_workspaces=task_ws)
+    return {"imported": imported}
+
+
+# -------- Reporting --------
+
+
+@router.get(
+    "/workspaces/{workspace_id}/time/report", response_model=schema.TimeReportOut
+)
+def time_report(
+    workspace_id: UUID,
+    start: date = Query(...),
+    end: date = Query(...),
+    group_by: str = Query("user", description="Comma list of user,task,list,day"),
+    user_id: Optional[str] = Query(None),
+    task_id: Optional[UUID] = Query(None),
+    list_id: Optional[UUID] = Query(None),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    ws = str(workspace_id)
+    role = get_workspace_role(db, user_id=str(current_user.id), workspace_id=ws)
+    if role is None:
+        raise HTTPException(status_code=403, detail="No access to this workspace")
+    if start > end:
+        raise HTTPException(status_code=422, detail="start must be on or before end")
+    groups = _parse_group_by(group_by)
+
+    rows = crud_time.time_report(
+        db,
+        workspace_id=ws,
+        start=start,
+        end=end,
+        group_by=groups,
+        user_id=user_id,
+        task_id=str(task_id) if task_id else None,
+        list_id=str(list_id) if list_id else None,
+    )
+    return {
+        "workspace_id": ws,
+        "start": start,
+        "end": end,
+        "group_by": groups,
+        "total_minutes": sum(r["minutes"] for r in rows),
+        "rows": rows,
+    }
+
+
+@router.post(
+    "/workspaces/{workspace_id}/time/rollup:rebuild",
+    response_model=schema.RollupRebuildResult,
+)
+def rebuild_rollup(
+    workspace_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    require_role(
+        db,
+        user_id=str(current_user.id),
+        workspace_id=str(workspace_id),
+        minimum=Role.ADMIN,
+    )
+    return {"rows": crud_time.rebuild_daily_rollup(db, workspace_id=str(workspace_id))}
+
+
+@router.post(
+    "/workspaces/{workspace_id}/time/rollup:rebuild-job",
+    status_code=202,
+    response_model=JobOut,
+)
+def rebuild_rollup_job(
+    workspace_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_me),
+):
+    require_role(
+        db,
+        user_id=str(current_user.id),
+        workspace_id=str(workspace_id),
+        minimum=Role.ADMIN,
+    )
+    return enqueue(
+        db,
+        kind="time.rebuild_rollup",
+        payload={"workspace_id": str(workspace_id)},
+        created_by=str(current_user.id),
+        workspace_id=str(workspace_id),
+    )
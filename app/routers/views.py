@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import json
 from math import ceil
-from typing import List, Optional, Tuple
+from typing import Annotated, List, NamedTuple, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import asc, desc
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import ValidationError
+from sqlalchemy import asc, desc, func, select
 from sqlalchemy.orm import Session
 
+from app.core.cache import cache_key, get_view_cache
+from app.core.etag import not_modified
+from app.core.fieldsets import FIELDS_DESCRIPTION, as_json, parse_fields
+from app.core.permissions import Role, require_profiler, require_role
+from app.crud.changes import scope_version, workspace_for_list
+from app.crud.task import TASK_COLUMNS
 from app.dependencies import get_db
-from app.models.core_entities import Task, User
+from app.models.core_entities import Space, Task, User, Workspace
+from app.routers.tasks_filter import (
+    TASK_SIDE_FIELDS,
+    build_filter_query,
+    task_side_data,
+)
+from app.schemas.filters import FilterPayload
 from app.schemas.view import ViewCreate, ViewOut, ViewUpdate
 from app.security import get_current_user
 from app.crud.view import (
@@ -25,6 +39,9 @@ router = APIRouter(prefix="/views", tags=["Views"])
 # ----------------------------
 # Helpers
 # ----------------------------
+_VIEW_SCOPES = ("workspace", "space", "list")
+
+
 def _scope_type_to_str(scope_type: Optional[object]) -> Optional[str]:
     if scope_type is None:
         return None
@@ -48,6 +65,96 @@ def _parse_sort(spec: Optional[str]) -> List[Tuple[str, str]]:
     return pairs
 
 
+# Columns a view may project (always alongside `id`); the relation-backed
+# TASK_SIDE_FIELDS are only queried when a view asks for them.
+_VIEW_COLUMNS = {k: c for k, c in TASK_COLUMNS.items() if k != "id"}
+_DEFAULT_COLUMNS = ["name"]
+
+
+def _projection(columns: Optional[List[str]]) -> Tuple[List[str], List[str]]:
+    """Split columns_json into plain columns and side fields; unknown names are ignored."""
+    wanted = columns or _DEFAULT_COLUMNS
+    plain = [c for c in dict.fromkeys(wanted) if c in _VIEW_COLUMNS]
+    side = [c for c in dict.fromkeys(wanted) if c in TASK_SIDE_FIELDS]
+    return plain, side
+
+
+def _view_payload(v, scope_type: str, scope_id: str) -> FilterPayload:
+    """
+    Compile filters_json into the /tasks/filter payload, scoped to the view.
+    Accepts the engine's own shape ({"filters": [...], "tags": {...}}) and the
+    shorthand {"<field>": value | [values]} (eq / in).
+    """
+    raw = dict(getattr(v, "filters_json", None) or {})
+    body = {k: raw.pop(k) for k in ("filters", "tags") if k in raw}
+    body["filters"] = list(body.get("filters") or []) + [
+        {"field": f, "op": "in" if isinstance(val, list) else "eq", "value": val}
+        for f, val in raw.items()
+    ]
+    body["scope"] = {f"{scope_type}_id": scope_id}
+    try:
+        return FilterPayload.model_validate(body)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid filters_json: {e.errors(include_url=False)}",
+        )
+
+
+def _view_workspace_id(db: Session, scope_type: str, scope_id: str) -> Optional[str]:
+    if scope_type == "workspace":
+        return db.scalar(select(Workspace.id).where(Workspace.id == scope_id))
+    if scope_type == "space":
+        return db.scalar(select(Space.workspace_id).where(Space.id == scope_id))
+    return workspace_for_list(db, list_id=scope_id)
+
+
+def _run_view(
+    db: Session,
+    v,
+    payload: FilterPayload,
+    *,
+    columns: Optional[List[str]],
+    sort: Optional[str],
+    page: int,
+    per_page: int,
+) -> dict:
+    # Count BEFORE pagination
+    total = db.scalar(
+        select(func.count()).select_from(
+            build_filter_query(payload, Task.id).subquery()
+        )
+    )
+    if not total:
+        return {"total": 0, "pages": 0, "items": []}
+
+    # Sorting (plain columns only), id last for a stable order
+    orders = []
+    for field, direction in _parse_sort(sort or getattr(v, "sort_spec", None)):
+        col = Task.__table__.columns.get(field)
+        if col is not None:
+            orders.append(desc(col) if direction == "desc" else asc(col))
+    orders.append(asc(Task.id))
+
+    # Only the projected columns are selected; no Task objects, no relationships.
+    plain, side = _projection(columns)
+    stmt = (
+        build_filter_query(payload, Task.id, *(_VIEW_COLUMNS[c] for c in plain))
+        .order_by(*orders)
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    )
+    items = [
+        {"id": row[0], **{c: as_json(x) for c, x in zip(plain, row[1:])}}
+        for row in db.execute(stmt)
+    ]
+    if side:
+        extra = task_side_data(db, [it["id"] for it in items], side)
+        for it in items:
+            it.update(extra[it["id"]])
+    return {"total": total, "pages": ceil(total / per_page), "items": items}
+
+
 # ----------------------------
 # CRUD endpoints (unchanged)
 # ----------------------------
@@ -79,6 +186,15 @@ def create_view_endpoint(
     return create_view(db, owner_id=str(current_user.id), data=data)
 
 
+@router.get(
+    "/cache/stats",
+    summary="Hit/miss counters of the view result cache (ops only)",
+    dependencies=[Depends(require_profiler)],
+)
+def view_cache_stats():
+    return get_view_cache().stats()
+
+
 @router.get(
     "/{view_id}", response_model=ViewOut, summary="Get a saved view (owner-only)"
 )
@@ -124,60 +240,147 @@ def delete_view_endpoint(
 # ----------------------------
 # APPLY: /views/{id}/tasks
 # ----------------------------
-@router.get("/{view_id}/tasks", summary="Apply a saved view to tasks (list-scope only)")
-def apply_view_to_tasks(
-    view_id: str,
-    sort: Optional[str] = Query(
-        default=None, description="Override view.sort_spec, e.g. name:desc"
-    ),
-    page: int = Query(default=1, ge=1),
-    per_page: int = Query(default=20, ge=1, le=200),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    # Authorize
+class _PreparedView(NamedTuple):
+    view: object
+    payload: FilterPayload
+    columns: Optional[List[str]]
+    # The view definition is part of the tag, so editing the view invalidates it too.
+    definition: str
+    version: int
+
+
+def _prepare_view(
+    db: Session, view_id: str, current_user: User, fields: Optional[str]
+) -> Optional[_PreparedView]:
+    """Authorize and compile a view; None when it has no scope to apply to."""
+    requested = parse_fields(fields, [*_VIEW_COLUMNS, *TASK_SIDE_FIELDS], always=())
     v = get_view(db, view_id)
     if not v or str(v.owner_id) != str(current_user.id):
         raise HTTPException(status_code=404, detail="View not found")
 
-    if _scope_type_to_str(getattr(v, "scope_type", None)) != "list":
+    scope_type = _scope_type_to_str(getattr(v, "scope_type", None))
+    if scope_type not in _VIEW_SCOPES:
         raise HTTPException(
-            status_code=400, detail="Only list-scoped views can be applied to tasks"
+            status_code=400,
+            detail="Views can be applied to workspace, space or list scopes only",
         )
 
     scope_id = str(getattr(v, "scope_id", "") or "").strip()
     if not scope_id:
-        return {"total": 0, "pages": 0, "items": []}
+        return None
 
-    # Build a simple, direct query using the defined relationship.
-    q = db.query(Task).filter(Task.list_id == scope_id)
+    payload = _view_payload(v, scope_type, scope_id)
+    # Owning the view is not enough: its scope is read like /tasks/filter,
+    # members only, whatever the scope type.
+    workspace_id = _view_workspace_id(db, scope_type, scope_id)
+    if workspace_id is None:
+        raise HTTPException(status_code=404, detail="View scope not found")
+    require_role(
+        db,
+        user_id=str(current_user.id),
+        workspace_id=workspace_id,
+        minimum=Role.MEMBER,
+        message="Not allowed in this workspace.",
+    )
+    if scope_type == "list":
+        version_key = ("list", scope_id)
+    else:
+        version_key = ("workspace", workspace_id)
 
-    # Count BEFORE pagination
-    total = q.count()
-    if total == 0:
-        return {"total": 0, "pages": 0, "items": []}
+    columns = requested or v.columns_json
+    definition = json.dumps(
+        [v.sort_spec, v.filters_json, columns], sort_keys=True, default=str
+    )
+    version = scope_version(db, scope=version_key[0], scope_id=version_key[1])
+    return _PreparedView(v, payload, columns, definition, version)
 
-    # Sorting
-    pairs = _parse_sort(sort or getattr(v, "sort_spec", None))
-    orders = []
-    for field, direction in pairs:
-        col = getattr(Task, field, None)
-        if col is None and field == "name":
-            col = getattr(Task, "title", None)
-        if col is not None:
-            orders.append(desc(col) if direction == "desc" else asc(col))
-    if getattr(Task, "id", None) is not None:
-        orders.append(asc(getattr(Task, "id")))
 
-    # Page slice
-    start = (page - 1) * per_page
-    rows = q.order_by(*orders).offset(start).limit(per_page).all()
+def _view_page(
+    db: Session,
+    view_id: str,
+    prepared: _PreparedView,
+    *,
+    sort: Optional[str],
+    page: int,
+    per_page: int,
+) -> Tuple[dict, bool]:
+    """Return one page of the view and whether it came from the result cache."""
+    # Results are cached under the same inputs as the ETag, so a task write
+    # (which bumps the list and workspace versions) makes every cached page of
+    # the view miss.
+    cache = get_view_cache()
+    key = cache_key(
+        view_id, prepared.definition, prepared.version, sort, page, per_page
+    )
+    result = cache.get(key)
+    if result is not None:
+        return result, True
+    result = _run_view(
+        db,
+        prepared.view,
+        prepared.payload,
+        columns=prepared.columns,
+        sort=sort,
+        page=page,
+        per_page=per_page,
+    )
+    cache.set(key, result)
+    return result, False
 
-    items = [
-        {
-            "id": str(getattr(t, "id", "")),
-            "name": getattr(t, "name", None) or getattr(t, "title", None),
-        }
-        for t in rows
-    ]
-    return {"total": total, "pages": ceil(total / per_page), "items": items}
+
+def apply_view_to_tasks(
+    view_id: str,
+    *,
+    db: Session,
+    current_user: User,
+    sort: Optional[str] = None,
+    page: int = 1,
+    per_page: int = 20,
+    fields: Optional[str] = None,
+) -> dict:
+    """Apply a saved view outside a request (no ETag, no cache headers)."""
+    prepared = _prepare_view(db, view_id, current_user, fields)
+    if prepared is None:
+        return {"total": 0, "pages": 0, "items": []}
+    result, _ = _view_page(
+        db, view_id, prepared, sort=sort, page=page, per_page=per_page
+    )
+    return result
+
+
+@router.get("/{view_id}/tasks", summary="Apply a saved view to tasks")
+def apply_view_to_tasks_endpoint(
+    view_id: str,
+    request: Request,
+    response: Response,
+    sort: Optional[str] = Query(
+        default=None, description="Override view.sort_spec, e.g. name:desc"
+    ),
+    page: int = Query(default=1, ge=1),
+    per_page: int = Query(default=20, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    fields: Annotated[
+        Optional[str], Query(description=f"Override columns_json. {FIELDS_DESCRIPTION}")
+    ] = None,
+):
+    prepared = _prepare_view(db, view_id, current_user, fields)
+    if prepared is None:
+        return {"total": 0, "pages": 0, "items": []}
+    if hit := not_modified(
+        request,
+        response,
+        "view-tasks",
+        view_id,
+        prepared.definition,
+        prepared.version,
+        sort,
+        page,
+        per_page,
+    ):
+        return hit
+    result, cached = _view_page(
+        db, view_id, prepared, sort=sort, page=page, per_page=per_page
+    )
+    response.headers["X-Cache"] = "HIT" if cached else "MISS"
+    return result
@@ -1,14 +1,17 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
+from app.core.pagination import PageRequest, finish_page, page_params, stream_rows
 from app.core.permissions import Role, get_workspace_role, require_role
+from app.core.serialization import list_response, row_serializer
 from app.crud import core_entities as crud_core
 from app.crud import task as crud_task
 from app.crud import watchers as crud_watch
 from app.db.session import get_db
+from app.models.core_entities import TaskWatcher
 from app.routers.auth_dependencies import get_me
 from app.schemas import watchers as schema
 
@@ -18,6 +21,8 @@ router = APIRouter(tags=["Watchers"])
 @router.get("/tasks/{task_id}/watchers", response_model=List[schema.WatcherOut])
 def list_watchers(
     task_id: UUID,
+    response: Response,
+    page: PageRequest = Depends(page_params),
     db: Session = Depends(get_db),
     current_user=Depends(get_me),
 ):
@@ -31,7 +36,18 @@ def list_watchers(
     )
     if role is None:
         raise HTTPException(status_code=403, detail="No access to this task")
-    return crud_watch.get_watchers_for_task(db, task_id=task_id)
+
+    def fetch(s: Session, after, limit: int):
+        return crud_watch.get_watchers_for_task(
+            s, task_id=task_id, after=after, limit=limit
+        )
+
+    keys = crud_watch.WATCHER_PAGE_KEYS
+    if page.stream:
+        serialize = row_serializer(schema.WatcherOut, TaskWatcher)
+        return stream_rows(db, fetch, keys, serialize)
+    rows = finish_page(fetch(db, page.after, page.fetch_limit), page, keys, response)
+    return list_response(rows, schema.WatcherOut, TaskWatcher, response)
 
 
 @router.post("/tasks/{task_id}/watch", response_model=schema.WatcherOut)
@@ -0,0 +1,33 @@
+# File: /app/schemas/changes.py | Version: 1.0 | Path: /app/schemas/changes.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ChangeOut(BaseModel):
+    seq: int
+    entity: str
+    entity_id: str
+    op: str
+    task_id: Optional[str] = None
+    list_id: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+    created_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ChangesPage(BaseModel):
+    workspace_id: str
+    since: int
+    # Pass back as `since` on the next call.
+    next_since: int
+    has_more: bool
+    changes: List[ChangeOut]
+
+
+class ChangeCursor(BaseModel):
+    seq: int
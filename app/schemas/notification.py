@@ -0,0 +1,43 @@
+# File: /app/schemas/notification.py | Version: 1.0 | Path: /app/schemas/notification.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class NotificationOut(BaseModel):
+    id: int
+    workspace_id: str
+    task_id: str
+    # events folded into this row; `summary` holds the most recent ones
+    event_count: int
+    first_seq: int
+    last_seq: int
+    summary: List[Dict[str, Any]] = []
+    read_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class NotificationPage(BaseModel):
+    notifications: List[NotificationOut]
+    # Pass back as `before` for the next (older) page; null on the last page.
+    next_before: Optional[int] = None
+    unread: int
+
+
+class NotificationMarkRead(BaseModel):
+    ids: List[int] = Field(..., max_length=500)
+
+
+class UnreadCount(BaseModel):
+    unread: int
+
+
+class MarkReadResult(BaseModel):
+    marked: int
+    unread: int
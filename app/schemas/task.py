@@ -1,10 +1,13 @@
-# File: /app/schemas/task.py | Version: 1.0 | Title: Task Schemas (Pydantic v2, BaseSchema)
+# File: /app/schemas/task.py | Version: 1.1 | Title: Task Schemas (Pydantic v2, BaseSchema)
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+from pydantic import Field
+
 from app.schemas._base import BaseSchema
+from app.schemas.tags import TagOut
 
 # ---- Core Task payloads ----
 
@@ -49,6 +52,28 @@ class TaskOut(BaseSchema):
     start_date: Optional[str] = None
     time_estimate: Optional[int] = None
     parent_task_id: Optional[str] = None
+    comment_count: int = 0
+
+
+# ---- Batch reads ----
+
+
+class TaskBatchGet(BaseSchema):
+    ids: List[UUID] = Field(min_length=1)
+
+
+class TaskBatchItem(TaskOut):
+    # Present only when named in ?include=
+    assignee_ids: Optional[List[str]] = None
+    tags: Optional[List[TagOut]] = None
+    custom_fields: Optional[Dict[str, Any]] = None
+    watcher_ids: Optional[List[str]] = None
+    subtask_count: Optional[int] = None
+
+
+class TaskBatchOut(BaseSchema):
+    tasks: List[TaskBatchItem]
+    missing: List[str]  # unknown ids and tasks outside the caller's workspaces
 
 
 # ---- Dependencies ----
@@ -0,0 +1,30 @@
+# File: /app/schemas/task_import.py | Version: 1.0 | Path: /app/schemas/task_import.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+
+class TaskImportOut(BaseModel):
+    id: str
+    workspace_id: str
+    list_id: str
+    user_id: str
+    source: Optional[str] = None
+    format: str
+    status: str
+    rows_processed: int
+    rows_imported: int
+    rows_failed: int
+    errors: List[ImportRowError] = []
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,77 @@
+# File: /app/schemas/time_tracking.py | Version: 1.0 | Path: /app/schemas/time_tracking.py
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Upper bound for a single entry (24h); longer spans should be split per day.
+MAX_ENTRY_MINUTES = 24 * 60
+
+
+class TimerStart(BaseModel):
+    note: Optional[str] = None
+
+
+class TimeEntryCreate(BaseModel):
+    minutes: int = Field(gt=0, le=MAX_ENTRY_MINUTES)
+    started_at: Optional[datetime] = None
+    note: Optional[str] = None
+
+
+class TimeEntryOut(BaseModel):
+    id: str
+    task_id: str
+    user_id: str
+    minutes: int
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+    note: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# -------- Bulk import --------
+
+
+class TimeEntryImportRow(BaseModel):
+    task_id: UUID
+    user_id: Optional[str] = None  # defaults to the caller
+    minutes: int = Field(gt=0, le=MAX_ENTRY_MINUTES)
+    started_at: datetime
+    note: Optional[str] = None
+
+
+class TimeEntryImportIn(BaseModel):
+    entries: List[TimeEntryImportRow] = Field(min_length=1, max_length=10_000)
+
+
+class TimeEntryImportResult(BaseModel):
+    imported: int
+
+
+# -------- Reporting --------
+
+
+class TimeReportRow(BaseModel):
+    user_id: Optional[str] = None
+    task_id: Optional[str] = None
+    list_id: Optional[str] = None
+    day: Optional[date] = None
+    minutes: int
+
+
+class TimeReportOut(BaseModel):
+    workspace_id: str
+    start: date
+    end: date
+    group_by: List[str]
+    total_minutes: int
+    rows: List[TimeReportRow]
+
+
+class RollupRebuildResult(BaseModel):
+    rows: int
@@ -1,37 +1,79 @@
-# File: /app/security.py | Version: 1.3 | Title: JWT Security (access + refresh) — OAuth2 tokenUrl=/auth/token
+# File: /app/security.py | Version: 1.9 | Title: JWT Security (access + refresh, lazy jose/passlib, bcrypt metrics, user in log context) — OAuth2 tokenUrl=/auth/token
+import time
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.logging import bind_log_context
+from app.crud.changes import set_actor
+from app.db.async_session import get_async_db
 from app.db.session import get_db
 from app.models import User  # re-exported in models/__init__.py
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.observability.metrics import PASSWORD_HASH_SECONDS, PASSWORD_HASHES_IN_FLIGHT
 
 # Point to the form-based token endpoint
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
 
+class TokenError(Exception):
+    """Any invalid, expired or undecodable JWT (wraps jose.JWTError)."""
+
+
+# passlib/bcrypt and jose (+cryptography) are imported on first use rather than
+# at app import, which keeps them off the cold-start path.
+@lru_cache(maxsize=1)
+def _pwd_context():
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+@lru_cache(maxsize=1)
+def _jose():
+    from jose import JWTError, jwt
+
+    return jwt, JWTError
+
+
+def _timed_bcrypt(op: str, fn, *args):
+    # bcrypt is deliberately slow and holds a threadpool worker while it runs
+    PASSWORD_HASHES_IN_FLIGHT.inc(op)
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        PASSWORD_HASHES_IN_FLIGHT.dec(op)
+        PASSWORD_HASH_SECONDS.observe(time.perf_counter() - start, op)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return _timed_bcrypt(
+        "verify", _pwd_context().verify, plain_password, hashed_password
+    )
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return _timed_bcrypt("hash", _pwd_context().hash, password)
 
 
 def _jwt_encode(claims: dict) -> str:
+    jwt, _ = _jose()
     return jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
 def _jwt_decode(token: str) -> dict:
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    jwt, jwt_error = _jose()
+    try:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except jwt_error as exc:
+        raise TokenError(str(exc)) from exc
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -57,31 +99,60 @@ def decode_refresh_token(token: str) -> dict:
         if payload.get("type") != "refresh":
             raise HTTPException(status_code=401, detail="Invalid token type")
         return payload
-    except JWTError:
+    except TokenError:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _user_id_from_access_token(token: str) -> str:
     try:
         payload = _jwt_decode(token)
         token_type = payload.get("type")
         if token_type not in (None, "access"):
-            raise credentials_exception
+            raise _credentials_exception()
         user_id: Optional[str] = payload.get("sub")
         if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
+            raise _credentials_exception()
+    except TokenError:
+        raise _credentials_exception()
+    return user_id
 
+
+def user_from_token(db: Session, token: str) -> User:
+    """Resolve an access token to an active user (401 otherwise)."""
+    user_id = _user_id_from_access_token(token)
     user = db.query(User).filter(User.id == user_id).first()
     if not user or not getattr(user, "is_active", True):
-        raise credentials_exception
+        raise _credentials_exception()
+    bind_log_context(user_id=str(user.id))
+    return user
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    user = user_from_token(db, token)
+    # Writes made on this request's session are attributed to the caller.
+    set_actor(db, user.id)
+    return user
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """Same contract as get_current_user, resolved on the AsyncSession."""
+    user_id = _user_id_from_access_token(token)
+    user = await db.scalar(select(User).where(User.id == user_id))
+    if not user or not getattr(user, "is_active", True):
+        raise _credentials_exception()
+    bind_log_context(user_id=str(user.id))
     return user
@@ -0,0 +1,7 @@
+# File: /benchmarks/__init__.py | Version: 1.2 | Title: Benchmarks package (not shipped with the app)
+# Run individual benchmarks as modules, e.g.:
+#   python -m benchmarks.async_vs_sync --clients 500
+#   python -m benchmarks.datagen --preset medium        (synthetic workspace DB)
+#   python -m benchmarks.scenarios --preset small --json var/bench/head.json
+#   python -m benchmarks.compare var/bench/base.json var/bench/head.json
+#   python -m benchmarks.load --preset small --vus 50 --mode ramp   (mixed traffic)
@@ -0,0 +1,210 @@
+# File: /benchmarks/async_vs_sync.py | Version: 1.0 | Title: Concurrency benchmark — sync threadpool vs AsyncSession stack
+"""
+Fires N concurrent clients at GET /tasks/by-list/{id} and GET /tasks/{id}
+against two in-process apps that share one seeded SQLite file:
+
+  sync  : app.routers.task        (def handlers on Starlette's threadpool)
+  async : app.routers.task_async  (async def handlers on AsyncSession)
+
+Usage:
+  python -m benchmarks.async_vs_sync --clients 500 --requests 5000
+  python -m benchmarks.async_vs_sync --json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.db.async_session import get_async_db
+from app.db.base_class import Base
+from app.db.session import get_db
+from app.models.core_entities import List as ListModel
+from app.models.core_entities import Space, Task, User, Workspace, WorkspaceMember
+from app.routers import task as task_sync
+from app.routers import task_async
+from app.security import create_access_token
+
+
+def _seed(db_path: Path, tasks: int) -> Dict[str, str]:
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        user = User(email="bench@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        ws = Workspace(name="Bench", owner_id=user.id)
+        db.add(ws)
+        db.flush()
+        db.add(WorkspaceMember(workspace_id=ws.id, user_id=user.id, role="Owner"))
+        sp = Space(name="S", workspace_id=ws.id)
+        db.add(sp)
+        db.flush()
+        lst = ListModel(name="L", space_id=sp.id)
+        db.add(lst)
+        db.flush()
+        rows = [Task(name=f"Task {i}", list_id=lst.id) for i in range(tasks)]
+        db.add_all(rows)
+        db.commit()
+        ids = {"user": user.id, "list": lst.id, "task": rows[0].id}
+    engine.dispose()
+    return ids
+
+
+def _sync_app(db_path: Path, pool_size: int) -> FastAPI:
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    factory = sessionmaker(bind=engine, autoflush=False)
+    app = FastAPI()
+    app.include_router(task_sync.router)
+
+    def _db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _db
+    return app
+
+
+def _async_app(db_path: Path, pool_size: int) -> FastAPI:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    app = FastAPI()
+    app.include_router(task_async.router)
+
+    async def _db():
+        async with factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = _db
+    return app
+
+
+async def _drive(
+    app: FastAPI, paths: List[str], headers: Dict[str, str], clients: int, total: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(total))
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", headers=headers
+    ) as client:
+
+        async def _worker() -> None:
+            nonlocal errors
+            for i in remaining:
+                start = time.perf_counter()
+                try:
+                    r = await client.get(paths[i % len(paths)])
+                    ok = r.status_code == 200
+                except Exception:  # noqa: BLE001 — count pool timeouts etc.
+                    ok = False
+                latencies.append(time.perf_counter() - start)
+                if not ok:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def pct(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(pct(0.50), 2),
+        "p95_ms": round(pct(0.95), 2),
+        "p99_ms": round(pct(0.99), 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--tasks", type=int, default=50, help="tasks in the list")
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        help="connection pool size per stack (default: --clients). Both stacks hold a "
+        "connection for the whole request, so a smaller pool measures pool waits",
+    )
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args()
+    pool_size = args.pool_size or args.clients
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        ids = _seed(db_path, args.tasks)
+        headers = {
+            "Authorization": f"Bearer {create_access_token({'sub': ids['user']})}"
+        }
+        paths = [f"/tasks/by-list/{ids['list']}", f"/tasks/{ids['task']}"]
+
+        results = {
+            "clients": args.clients,
+            "sync": asyncio.run(
+                _drive(
+                    _sync_app(db_path, pool_size),
+                    paths,
+                    headers,
+                    args.clients,
+                    args.requests,
+                )
+            ),
+            "async": asyncio.run(
+                _drive(
+                    _async_app(db_path, pool_size),
+                    paths,
+                    headers,
+                    args.clients,
+                    args.requests,
+                )
+            ),
+        }
+
+    for stack in ("sync", "async"):
+        r = results[stack]
+        print(
+            f"{stack:>5}: {r['rps']:>8} req/s  p50={r['p50_ms']}ms "
+            f"p95={r['p95_ms']}ms p99={r['p99_ms']}ms errors={r['errors']}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# File: /benchmarks/compare.py | Version: 1.0 | Title: Compare two benchmark result files and flag regressions
+"""
+Diffs two JSON reports written by benchmarks.scenarios (or any harness using
+the same {"shape", "results": {name: {...}}} layout). A scenario regresses
+when:
+  - its latency metric grows by more than --threshold (default 10%), or
+  - it issues more SQL statements. Query counts are deterministic, so any
+    increase counts.
+Exits 1 on a regression. Exits 2 when the reports were taken on different
+data shapes, because their numbers can't be compared.
+
+Usage:
+  python -m benchmarks.compare var/bench/base.json var/bench/head.json
+  python -m benchmarks.compare base.json head.json --metric p95_ms --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def compare(
+    base: Dict[str, Any], head: Dict[str, Any], *, metric: str, threshold: float
+) -> Tuple[List[str], List[str]]:
+    """Returns (table lines, names of regressed scenarios)."""
+    lines = [f"{'scenario':>14} {'base':>10} {'head':>10} {'change':>8}  queries"]
+    regressed: List[str] = []
+    for name, new in head["results"].items():
+        old = base["results"].get(name)
+        if old is None:
+            lines.append(f"{name:>14} {'-':>10} {new[metric]:>10.2f}      new")
+            continue
+        change = (new[metric] - old[metric]) / old[metric] if old[metric] else 0.0
+        queries = f"{old.get('queries')} -> {new.get('queries')}"
+        flags = []
+        if change > threshold:
+            flags.append("SLOWER")
+        if (new.get("queries") or 0) > (old.get("queries") or 0):
+            flags.append("MORE QUERIES")
+        if flags:
+            regressed.append(name)
+        lines.append(
+            f"{name:>14} {old[metric]:>10.2f} {new[metric]:>10.2f} "
+            f"{change:>+8.1%}  {queries}  {' '.join(flags)}".rstrip()
+        )
+    return lines, regressed
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--metric", default="p50_ms")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    base, head = (json.loads(p.read_text()) for p in (args.base, args.head))
+    if base.get("shape") != head.get("shape"):
+        print("reports were taken on different data shapes; not comparable")
+        sys.exit(2)
+    for who, report in (("base", base), ("head", head)):
+        env = report.get("env", {})
+        print(
+            f"{who}: {env.get('commit') or '?'}{' (dirty)' if env.get('dirty') else ''}"
+        )
+    lines, regressed = compare(base, head, metric=args.metric, threshold=args.threshold)
+    print("\n".join(lines))
+    if regressed:
+        print(f"regressed: {', '.join(regressed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
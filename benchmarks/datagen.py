@@ -0,0 +1,481 @@
+# File: /benchmarks/datagen.py | Version: 1.0 | Title: Deterministic synthetic workspace generator (up to ~1M tasks)
+"""
+Builds a SQLite database shaped like a real tenant. It has workspaces with
+members, spaces, folders and lists, and tasks with nested subtasks. Tasks
+carry tags, assignees, watchers, comments and custom field values, and each
+list has saved views.
+
+The same shape and seed always produce the same ids, names and timestamps,
+so two runs (or two commits) query identical data. Rows go in through Core
+executemany in chunks, which keeps 1M tasks to a few minutes.
+
+A `<db>.json` sidecar records the shape and the ids scenarios need: the
+benchmark user, the hottest list, tags, a view, a subtask and two parents.
+generate() reuses an existing database whose sidecar matches.
+
+Usage:
+  python -m benchmarks.datagen --preset medium --db var/bench/medium.db
+  python -m benchmarks.datagen --tasks 1000000 --workspaces 4 --db var/bench/1m.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+import uuid
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import create_engine, event, insert
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.db.base_class import Base
+from app.models.core_entities import Comment, Folder
+from app.models.core_entities import List as ListModel
+from app.models.core_entities import (
+    Space,
+    Tag,
+    Task,
+    TaskAssignee,
+    TaskTag,
+    TaskWatcher,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+from app.models.custom_fields import (
+    CustomFieldDefinition,
+    CustomFieldValue,
+    ListCustomField,
+)
+from app.models.view import View
+
+PASSWORD = "BenchPassw0rd!"
+EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
+CHUNK = 10_000
+
+STATUSES = ("to_do", "in_progress", "review", "done")
+PRIORITIES = (None, "low", "normal", "high", "urgent")
+FIELD_TYPES = ("Text", "Number", "Dropdown")
+
+
+@dataclass(frozen=True)
+class Shape:
+    """How much of everything to build. Counts are per parent unless noted."""
+
+    workspaces: int = 1
+    # members of each workspace; user 0 of workspace 0 is the one scenarios log in as
+    users: int = 25
+    spaces: int = 3
+    folders: int = 2  # per space; every space also has one list outside folders
+    lists: int = 3  # per folder
+    tasks: int = 10_000  # total, spread over all lists with a long tail
+    subtask_ratio: float = 0.3  # share of tasks that hang under another task
+    subtask_depth: int = 3  # deepest nesting level below a root task
+    tags: int = 40  # per workspace
+    tags_per_task: int = 3  # up to
+    custom_fields: int = 6  # per workspace, enabled on every list
+    fields_per_task: int = 3  # values set, up to
+    comments_per_task: float = 2.0  # average
+    watchers_per_task: int = 3  # up to
+    assignees_per_task: int = 2  # up to
+    views: int = 3  # per list
+    seed: int = 42
+
+
+PRESETS: Dict[str, Shape] = {
+    "tiny": Shape(users=5, spaces=1, folders=1, lists=2, tasks=500, tags=10),
+    "small": Shape(tasks=10_000),
+    "medium": Shape(workspaces=2, tasks=100_000),
+    "large": Shape(workspaces=4, users=100, spaces=5, tasks=1_000_000, views=1),
+}
+
+
+class _Ids:
+    """Deterministic UUID4-shaped ids from the seeded RNG."""
+
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+
+    def __call__(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+
+def _chunks(rows: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    for start in range(0, len(rows), CHUNK):
+        yield rows[start : start + CHUNK]
+
+
+def _list_sizes(rng: random.Random, lists: int, tasks: int) -> List[int]:
+    # Long tail: a few big lists, many small ones (weights ~ 1/rank)
+    weights = [1.0 / (rank + 1) for rank in range(lists)]
+    rng.shuffle(weights)
+    total = sum(weights)
+    sizes = [int(tasks * w / total) for w in weights]
+    sizes[weights.index(max(weights))] += tasks - sum(sizes)
+    return sizes
+
+
+def _password_hash() -> str:
+    from app.security import get_password_hash
+
+    return get_password_hash(PASSWORD)  # hashed once; every user shares it
+
+
+def build(db_path: Path, shape: Shape, *, log=print) -> Dict[str, Any]:
+    """Create the schema and rows; returns the manifest written to the sidecar."""
+    rng = random.Random(shape.seed)
+    new_id = _Ids(rng)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    if db_path.exists():
+        db_path.unlink()
+    engine = create_engine(f"sqlite:///{db_path}")
+
+    @event.listens_for(engine, "connect")
+    def _fast_load(dbapi_conn, _record):  # bulk-load pragmas; the file is disposable
+        dbapi_conn.execute("PRAGMA journal_mode=WAL")
+        dbapi_conn.execute("PRAGMA synchronous=OFF")
+
+    Base.metadata.create_all(bind=engine)
+    hashed = _password_hash()
+    tasks_per_ws = shape.tasks // shape.workspaces
+    manifest: Dict[str, Any] = {"shape": asdict(shape), "password": PASSWORD}
+    started = time.perf_counter()
+
+    with engine.begin() as conn:
+
+        def put(model, rows: List[Dict[str, Any]]) -> None:
+            for chunk in _chunks(rows):
+                conn.execute(insert(model), chunk)
+
+        for w in range(shape.workspaces):
+            users = [
+                {
+                    "id": new_id(),
+                    "email": f"bench{w}-{u}@example.com",
+                    "full_name": f"Bench User {w}-{u}",
+                    "hashed_password": hashed,
+                    "is_active": True,
+                    "created_at": EPOCH,
+                    "updated_at": EPOCH,
+                }
+                for u in range(shape.users)
+            ]
+            put(User, users)
+            user_ids = [u["id"] for u in users]
+            ws_id = new_id()
+            put(
+                Workspace,
+                [{"id": ws_id, "name": f"Workspace {w}", "owner_id": user_ids[0]}],
+            )
+            put(
+                WorkspaceMember,
+                [
+                    {
+                        "id": new_id(),
+                        "workspace_id": ws_id,
+                        "user_id": uid,
+                        "role": "Owner" if i == 0 else ("Admin" if i < 3 else "Member"),
+                        "is_active": True,
+                    }
+                    for i, uid in enumerate(user_ids)
+                ],
+            )
+
+            spaces, folders, lists = [], [], []
+            for s in range(shape.spaces):
+                space_id = new_id()
+                spaces.append(
+                    {
+                        "id": space_id,
+                        "name": f"Space {s}",
+                        "workspace_id": ws_id,
+                        "is_private": False,
+                    }
+                )
+                for f in range(shape.folders):
+                    folder_id = new_id()
+                    folders.append(
+                        {
+                            "id": folder_id,
+                            "name": f"Folder {s}.{f}",
+                            "space_id": space_id,
+                        }
+                    )
+                    for n in range(shape.lists):
+                        lists.append(
+                            {
+                                "id": new_id(),
+                                "name": f"List {s}.{f}.{n}",
+                                "space_id": space_id,
+                                "folder_id": folder_id,
+                            }
+                        )
+                lists.append(
+                    {
+                        "id": new_id(),
+                        "name": f"List {s}.inbox",
+                        "space_id": space_id,
+                        "folder_id": None,
+                    }
+                )
+            put(Space, spaces)
+            put(Folder, folders)
+            put(ListModel, lists)
+
+            tags = [
+                {
+                    "id": new_id(),
+                    "workspace_id": ws_id,
+                    "name": f"tag-{t:03d}",
+                    "color": f"#{rng.randrange(0x1000000):06x}",
+                }
+                for t in range(shape.tags)
+            ]
+            put(Tag, tags)
+            fields = [
+                {
+                    "id": new_id(),
+                    "workspace_id": ws_id,
+                    "name": f"Field {c}",
+                    "field_type": FIELD_TYPES[c % len(FIELD_TYPES)],
+                    "options": (
+                        {"choices": ["a", "b", "c", "d"]}
+                        if c % len(FIELD_TYPES) == 2
+                        else None
+                    ),
+                }
+                for c in range(shape.custom_fields)
+            ]
+            put(CustomFieldDefinition, fields)
+            put(
+                ListCustomField,
+                [
+                    {
+                        "id": new_id(),
+                        "list_id": lst["id"],
+                        "field_definition_id": fd["id"],
+                    }
+                    for lst in lists
+                    for fd in fields
+                ],
+            )
+
+            sizes = _list_sizes(rng, len(lists), tasks_per_ws)
+            hottest = lists[sizes.index(max(sizes))]["id"]
+            sample: Dict[str, Any] = {}
+            for lst, size in zip(lists, sizes):
+                rows, depth = [], []
+                assignees, links, watchers, values, comments = [], [], [], [], []
+                for i in range(size):
+                    task_id = new_id()
+                    parent, level = None, 0
+                    if i and rng.random() < shape.subtask_ratio:
+                        p = rng.randrange(i)
+                        if depth[p] < shape.subtask_depth:
+                            parent, level = rows[p]["id"], depth[p] + 1
+                    created = EPOCH + timedelta(
+                        minutes=7 * i, seconds=rng.randrange(60)
+                    )
+                    n_comments = rng.randint(0, int(2 * shape.comments_per_task))
+                    rows.append(
+                        {
+                            "id": task_id,
+                            "list_id": lst["id"],
+                            "parent_task_id": parent,
+                            "name": f"Task {i} in {lst['name']}",
+                            "description": f"Generated task {i}. " * rng.randint(0, 6)
+                            or None,
+                            "status": rng.choice(STATUSES),
+                            "priority": rng.choice(PRIORITIES),
+                            "due_date": (
+                                created + timedelta(days=rng.randint(1, 60))
+                                if rng.random() < 0.6
+                                else None
+                            ),
+                            "created_at": created,
+                            "updated_at": created,
+                            "comment_count": n_comments,
+                        }
+                    )
+                    depth.append(level)
+                    for uid in rng.sample(
+                        user_ids,
+                        rng.randint(0, min(shape.assignees_per_task, len(user_ids))),
+                    ):
+                        assignees.append(
+                            {"id": new_id(), "task_id": task_id, "user_id": uid}
+                        )
+                    for tag in rng.sample(
+                        tags, rng.randint(0, min(shape.tags_per_task, len(tags)))
+                    ):
+                        links.append(
+                            {"id": new_id(), "task_id": task_id, "tag_id": tag["id"]}
+                        )
+                    for uid in rng.sample(
+                        user_ids,
+                        rng.randint(0, min(shape.watchers_per_task, len(user_ids))),
+                    ):
+                        watchers.append(
+                            {
+                                "id": new_id(),
+                                "task_id": task_id,
+                                "user_id": uid,
+                                "created_at": created,
+                            }
+                        )
+                    for fd in rng.sample(
+                        fields, rng.randint(0, min(shape.fields_per_task, len(fields)))
+                    ):
+                        raw = (
+                            rng.randrange(1000)
+                            if fd["field_type"] == "Number"
+                            else (
+                                rng.choice("abcd")
+                                if fd["field_type"] == "Dropdown"
+                                else f"note {i}"
+                            )
+                        )
+                        values.append(
+                            {
+                                "id": new_id(),
+                                "task_id": task_id,
+                                "field_definition_id": fd["id"],
+                                "value": {"value": raw},
+                            }
+                        )
+                    for c in range(n_comments):
+                        comments.append(
+                            {
+                                "id": new_id(),
+                                "task_id": task_id,
+                                "user_id": rng.choice(user_ids),
+                                "body": f"Comment {c} on task {i}",
+                                "created_at": created + timedelta(hours=c + 1),
+                            }
+                        )
+                put(Task, rows)
+                put(TaskAssignee, assignees)
+                put(TaskTag, links)
+                put(TaskWatcher, watchers)
+                put(CustomFieldValue, values)
+                put(Comment, comments)
+                if w == 0 and lst["id"] == hottest:
+                    sample = _sample(rows, depth)
+
+            views = [
+                {
+                    "id": new_id(),
+                    "owner_id": user_ids[0],
+                    "scope_type": "list",
+                    "scope_id": lst["id"],
+                    "name": f"View {v}",
+                    "filters_json": (
+                        {"status": list(STATUSES[: v + 1])}
+                        if v % 2 == 0
+                        else {"priority": ["high", "urgent"]}
+                    ),
+                    "sort_spec": ("due_date:asc", "created_at:desc", "priority:desc")[
+                        v % 3
+                    ],
+                    "columns_json": None,
+                    "is_default": v == 0,
+                    "created_at": EPOCH,
+                }
+                for lst in lists
+                for v in range(shape.views)
+            ]
+            put(View, views)
+            if w == 0:
+                manifest.update(
+                    email=users[0]["email"],
+                    user_id=user_ids[0],
+                    workspace_id=ws_id,
+                    list_id=hottest,
+                    tag_ids=[t["id"] for t in tags[:3]],
+                    view_id=next(
+                        (v["id"] for v in views if v["scope_id"] == hottest), None
+                    ),
+                    **sample,
+                )
+            log(
+                f"workspace {w}: {tasks_per_ws} tasks, {len(lists)} lists ({time.perf_counter() - started:.1f}s)"
+            )
+
+    engine.dispose()
+    manifest["build_seconds"] = round(time.perf_counter() - started, 1)
+    return manifest
+
+
+def _sample(rows: List[Dict], depth: List[int]) -> Dict[str, Any]:
+    """Ids in the hottest list that scenarios need."""
+    parents = {r["parent_task_id"] for r in rows}
+    # a subtask with no children of its own moves between two roots cycle-free
+    leaf = next(
+        (r["id"] for r, d in zip(rows, depth) if d and r["id"] not in parents),
+        rows[-1]["id"],
+    )
+    roots = [r["id"] for r, d in zip(rows, depth) if d == 0 and r["id"] != leaf]
+    return {
+        "comment_task_id": max(rows, key=lambda r: r["comment_count"])["id"],
+        "subtask_id": leaf,
+        "parent_ids": roots[:2],
+    }
+
+
+def sidecar(db_path: Path) -> Path:
+    return db_path.with_suffix(db_path.suffix + ".json")
+
+
+def generate(
+    db_path: Path, shape: Shape, *, force: bool = False, log=print
+) -> Dict[str, Any]:
+    """Build (or reuse) the database for `shape`; returns its manifest."""
+    meta = sidecar(db_path)
+    if not force and db_path.exists() and meta.exists():
+        manifest = json.loads(meta.read_text())
+        if manifest.get("shape") == asdict(shape):
+            return manifest
+    manifest = build(db_path, shape, log=log)
+    meta.write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def shape_from_args(args: argparse.Namespace) -> Shape:
+    shape = PRESETS[args.preset]
+    overrides = {
+        k: getattr(args, k) for k in asdict(shape) if getattr(args, k, None) is not None
+    }
+    return replace(shape, **overrides)
+
+
+def add_shape_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    for name, default in asdict(Shape()).items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            dest=name,
+            type=type(default),
+            default=None,
+            help=f"override the preset (default shape: {default})",
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_shape_args(parser)
+    parser.add_argument("--db", type=Path, default=Path("var/bench/bench.db"))
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild even if it matches"
+    )
+    args = parser.parse_args(argv)
+    manifest = generate(args.db, shape_from_args(args), force=args.force)
+    print(json.dumps({k: v for k, v in manifest.items() if k != "password"}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
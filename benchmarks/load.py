@@ -0,0 +1,477 @@
+# File: /benchmarks/load.py | Version: 1.0 | Title: Load generator — mixed traffic against a locally launched app (steady / ramp / soak)
+"""
+How many concurrent users does one worker sustain? This launches uvicorn on
+a database from benchmarks.datagen and starts N virtual users (asyncio tasks,
+each with its own httpx keep-alive connection). Each user replays a weighted traffic mix with an
+optional think time:
+
+  list     60%  GET  /tasks/by-list/{id}         (random list of the workspace)
+  filter   20%  POST /workspaces/{id}/tasks/filter (random status)
+  write    10%  POST /tasks/ or PUT /tasks/{id}  (create / status change)
+  comment   5%  POST /tasks/{id}/comments
+  login     5%  POST /auth/login                 (bcrypt)
+
+Modes:
+  steady  --vus N for --duration seconds
+  ramp    start at --step-vus and add that many every --step-seconds up
+          to --vus; one report row per step shows where latency bends
+  soak    --vus N for --duration (default 10 min), one row every
+          --report-every seconds, to catch drift and leaks
+
+Each row reports throughput and error rate, with p50/p95/p99 per route.
+Everything runs locally: SQLite via DATABASE_URL, or `--url` for a server
+that is already running.
+
+Usage:
+  python -m benchmarks.load --preset small --vus 50 --duration 30
+  python -m benchmarks.load --mode ramp --vus 200 --step-vus 25 --step-seconds 20
+  python -m benchmarks.load --mode soak --vus 40 --mix list=80,filter=20 --json soak.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sqlite3
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.datagen import PASSWORD, add_shape_args, generate, shape_from_args
+from benchmarks.scenarios import environment
+
+DEFAULT_MIX = "list=60,filter=20,write=10,comment=5,login=5"
+STATUSES = ("to_do", "in_progress", "review", "done")
+
+
+# --- target data ---------------------------------------------------------------
+
+
+@dataclass
+class Target:
+    workspace_id: str
+    lists: List[Tuple[str, str]]  # (list_id, space_id)
+    task_ids: List[str]
+    members: List[Tuple[str, str]]  # (user_id, email)
+
+
+def load_target(db_path: Path, workspace_id: str, *, sample: int = 5000) -> Target:
+    """Ids the traffic picks from, read straight from the generated file."""
+    with sqlite3.connect(db_path) as conn:
+        lists = conn.execute(
+            "SELECT l.id, l.space_id FROM list l JOIN space s ON s.id = l.space_id "
+            "WHERE s.workspace_id = ?",
+            (workspace_id,),
+        ).fetchall()
+        tasks = conn.execute(
+            "SELECT t.id FROM task t JOIN list l ON l.id = t.list_id "
+            "JOIN space s ON s.id = l.space_id WHERE s.workspace_id = ? "
+            "ORDER BY t.id LIMIT ?",
+            (workspace_id, sample),
+        ).fetchall()
+        members = conn.execute(
+            "SELECT u.id, u.email FROM workspace_member m JOIN user u "
+            "ON u.id = m.user_id WHERE m.workspace_id = ?",
+            (workspace_id,),
+        ).fetchall()
+    return Target(workspace_id, lists, [t for (t,) in tasks], members)
+
+
+# --- traffic ---------------------------------------------------------------------
+
+
+async def op_list(
+    client: httpx.AsyncClient, t: Target, rng: random.Random, own: List[str]
+):
+    list_id, _ = rng.choice(t.lists)
+    return "GET /tasks/by-list/{id}", await client.get(f"/tasks/by-list/{list_id}")
+
+
+async def op_filter(
+    client: httpx.AsyncClient, t: Target, rng: random.Random, own: List[str]
+):
+    payload = {
+        "scope": {"workspace_id": t.workspace_id},
+        "filters": [{"field": "status", "op": "eq", "value": rng.choice(STATUSES)}],
+        "limit": 100,
+    }
+    return "POST /workspaces/{id}/tasks/filter", await client.post(
+        f"/workspaces/{t.workspace_id}/tasks/filter", json=payload
+    )
+
+
+async def op_write(
+    client: httpx.AsyncClient, t: Target, rng: random.Random, own: List[str]
+):
+    # Edits only touch tasks this user created, so the seeded data stays as
+    # datagen left it for benchmarks.scenarios
+    if own and rng.random() < 0.5:
+        return "PUT /tasks/{id}", await client.put(
+            f"/tasks/{rng.choice(own)}", json={"status": rng.choice(STATUSES)}
+        )
+    list_id, space_id = rng.choice(t.lists)
+    body = {
+        "name": f"load {rng.random():.6f}",
+        "list_id": list_id,
+        "space_id": space_id,
+    }
+    response = await client.post("/tasks/", json=body)
+    if response.status_code < 400:
+        own.append(response.json()["id"])
+    return "POST /tasks/", response
+
+
+async def op_comment(
+    client: httpx.AsyncClient, t: Target, rng: random.Random, own: List[str]
+):
+    task_id = rng.choice(t.task_ids)
+    return "POST /tasks/{id}/comments", await client.post(
+        f"/tasks/{task_id}/comments", json={"body": "load test comment"}
+    )
+
+
+async def op_login(
+    client: httpx.AsyncClient, t: Target, rng: random.Random, own: List[str]
+):
+    _, email = rng.choice(t.members)
+    return "POST /auth/login", await client.post(
+        "/auth/login",
+        json={"email": email, "password": PASSWORD},
+        headers={"Authorization": ""},
+    )
+
+
+OPS = {
+    "list": op_list,
+    "filter": op_filter,
+    "write": op_write,
+    "comment": op_comment,
+    "login": op_login,
+}
+
+
+def parse_mix(raw: str) -> Dict[str, float]:
+    mix: Dict[str, float] = {}
+    for part in raw.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in OPS:
+            raise SystemExit(f"unknown op {name!r} in --mix (known: {', '.join(OPS)})")
+        mix[name] = float(weight)
+    return mix
+
+
+# --- measurement ---------------------------------------------------------------
+
+
+@dataclass
+class Sample:
+    at: float  # seconds since start, when the response finished
+    route: str
+    ms: float
+    ok: bool
+
+
+@dataclass
+class Recorder:
+    started: float = field(default_factory=time.perf_counter)
+    samples: List[Sample] = field(default_factory=list)
+
+    def add(self, route: str, ms: float, ok: bool) -> None:
+        self.samples.append(Sample(time.perf_counter() - self.started, route, ms, ok))
+
+
+def _pct(sorted_ms: List[float], q: float) -> float:
+    if not sorted_ms:
+        return 0.0
+    return sorted_ms[min(len(sorted_ms) - 1, int(q * len(sorted_ms)))]
+
+
+def _stats(samples: List[Sample], seconds: float) -> Dict[str, Any]:
+    ms = sorted(s.ms for s in samples)
+    errors = sum(not s.ok for s in samples)
+    return {
+        "requests": len(ms),
+        "rps": round(len(ms) / seconds, 1) if seconds else 0.0,
+        "error_rate": round(errors / len(ms), 4) if ms else 0.0,
+        "p50_ms": round(_pct(ms, 0.50), 2),
+        "p95_ms": round(_pct(ms, 0.95), 2),
+        "p99_ms": round(_pct(ms, 0.99), 2),
+    }
+
+
+def window(
+    samples: List[Sample], start: float, end: float, users: int
+) -> Dict[str, Any]:
+    inside = [s for s in samples if start <= s.at < end]
+    routes: Dict[str, List[Sample]] = {}
+    for s in inside:
+        routes.setdefault(s.route, []).append(s)
+    return {
+        "users": users,
+        "from_s": round(start, 1),
+        "to_s": round(end, 1),
+        "total": _stats(inside, end - start),
+        "routes": {r: _stats(v, end - start) for r, v in sorted(routes.items())},
+    }
+
+
+# --- virtual users ---------------------------------------------------------------
+
+
+async def virtual_user(
+    base_url: str,
+    target: Target,
+    mix: Dict[str, float],
+    recorder: Recorder,
+    stop: asyncio.Event,
+    *,
+    seed: int,
+    think: float,
+) -> None:
+    """One signed-in member on its own keep-alive connection, like a browser tab."""
+    from app.security import create_access_token  # same SECRET_KEY as the server
+
+    rng = random.Random(seed)
+    user_id, _ = rng.choice(target.members)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': user_id})}"}
+    names, weights = list(mix), list(mix.values())
+    own: List[str] = []
+    async with httpx.AsyncClient(
+        base_url=base_url, headers=headers, timeout=60
+    ) as client:
+        while not stop.is_set():
+            op = OPS[rng.choices(names, weights)[0]]
+            start = time.perf_counter()
+            try:
+                route, response = await op(client, target, rng, own)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                route, ok = f"{op.__name__} (transport error)", False
+            recorder.add(route, (time.perf_counter() - start) * 1000, ok)
+            if think:
+                await asyncio.sleep(rng.expovariate(1 / think))
+
+
+async def drive(
+    base_url: str,
+    target: Target,
+    mix: Dict[str, float],
+    plan: List[Tuple[int, float]],
+    *,
+    think: float,
+    report_every: Optional[float],
+) -> Tuple[Recorder, List[Dict[str, Any]]]:
+    """Run `plan` [(users, seconds), ...]; users carry over between stages."""
+    recorder = Recorder()
+    stop = asyncio.Event()
+    rows: List[Dict[str, Any]] = []
+    users: List[asyncio.Task] = []
+    for users_wanted, seconds in plan:
+        while len(users) < users_wanted:
+            users.append(
+                asyncio.create_task(
+                    virtual_user(
+                        base_url,
+                        target,
+                        mix,
+                        recorder,
+                        stop,
+                        seed=len(users),
+                        think=think,
+                    )
+                )
+            )
+        stage_start = time.perf_counter() - recorder.started
+        step = report_every or seconds
+        elapsed = 0.0
+        while elapsed < seconds:
+            chunk = min(step, seconds - elapsed)
+            await asyncio.sleep(chunk)
+            row = window(
+                recorder.samples,
+                stage_start + elapsed,
+                stage_start + elapsed + chunk,
+                len(users),
+            )
+            rows.append(row)
+            _print_row(row)
+            elapsed += chunk
+    stop.set()
+    await asyncio.gather(*users, return_exceptions=True)
+    return recorder, rows
+
+
+def _print_row(row: Dict[str, Any]) -> None:
+    t = row["total"]
+    print(
+        f"[{row['from_s']:>7.1f}s] users {row['users']:>4}  {t['rps']:>7.1f} req/s  "
+        f"p50 {t['p50_ms']:>7.1f}  p95 {t['p95_ms']:>7.1f}  p99 {t['p99_ms']:>7.1f} ms  "
+        f"errors {t['error_rate']:.2%}",
+        flush=True,
+    )
+
+
+def print_routes(summary: Dict[str, Any]) -> None:
+    print(
+        f"\n{'route':<36} {'req':>7} {'req/s':>7} {'err':>7} {'p50':>8} {'p95':>8} {'p99':>8}"
+    )
+    for route, s in summary["routes"].items():
+        print(
+            f"{route:<36} {s['requests']:>7} {s['rps']:>7.1f} {s['error_rate']:>7.2%} "
+            f"{s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f} {s['p99_ms']:>8.1f}"
+        )
+
+
+# --- local server --------------------------------------------------------------
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def launch_app(db_path: Path, *, workers: int, env: Dict[str, str]) -> Iterator[str]:
+    """uvicorn app.main:app on a free port against `db_path`; yields the base URL."""
+    port = _free_port()
+    child_env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{db_path.resolve()}",
+        "LOG_LEVEL": "WARNING",
+        **env,
+    }
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        env=child_env,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                if httpx.get(f"{url}/healthz", timeout=1).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if proc.poll() is not None or time.monotonic() > deadline:
+                raise SystemExit("app did not start (see output above)")
+            time.sleep(0.2)
+        yield url
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def build_plan(args: argparse.Namespace) -> List[Tuple[int, float]]:
+    if args.mode == "ramp":
+        steps = range(args.step_vus, args.vus + args.step_vus, args.step_vus)
+        return [(min(u, args.vus), args.step_seconds) for u in steps]
+    duration = args.duration or (600.0 if args.mode == "soak" else 30.0)
+    return [(args.vus, duration)]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_shape_args(parser)
+    parser.add_argument("--db", type=Path, help="default: var/bench/<preset>.db")
+    parser.add_argument(
+        "--url", help="target a running server instead of launching one"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers")
+    parser.add_argument("--mode", choices=("steady", "ramp", "soak"), default="steady")
+    parser.add_argument("--vus", type=int, default=50, help="(peak) virtual users")
+    parser.add_argument("--duration", type=float, help="steady/soak seconds (30 / 600)")
+    parser.add_argument("--step-vus", type=int, default=10, help="ramp increment")
+    parser.add_argument("--step-seconds", type=float, default=15.0)
+    parser.add_argument(
+        "--report-every", type=float, help="soak row interval (default 30)"
+    )
+    parser.add_argument(
+        "--think-ms", type=float, default=0.0, help="mean pause per user"
+    )
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument(
+        "--env",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="extra settings for the launched app, e.g. FAST_JSON_ENABLED=false",
+    )
+    parser.add_argument("--json", type=Path, help="write the report to this file")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    db_path = args.db or Path("var/bench") / f"{args.preset}.db"
+    manifest = generate(db_path, shape_from_args(args))
+    target = load_target(db_path, manifest["workspace_id"])
+    plan = build_plan(args)
+    report_every = args.report_every or (30.0 if args.mode == "soak" else None)
+    extra_env = dict(kv.split("=", 1) for kv in args.env)
+
+    @contextmanager
+    def server() -> Iterator[str]:
+        if args.url:
+            yield args.url
+        else:
+            with launch_app(db_path, workers=args.workers, env=extra_env) as url:
+                yield url
+
+    with server() as url:
+        print(f"{args.mode}: {plan} against {url} ({args.mix})")
+        recorder, rows = asyncio.run(
+            drive(
+                url,
+                target,
+                mix,
+                plan,
+                think=args.think_ms / 1000,
+                report_every=report_every,
+            )
+        )
+    total_seconds = sum(seconds for _, seconds in plan)
+    summary = window(recorder.samples, 0.0, total_seconds, plan[-1][0])
+    print_routes(summary)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "env": environment(),
+            "shape": manifest["shape"],
+            "mode": args.mode,
+            "mix": mix,
+            "workers": args.workers,
+            "think_ms": args.think_ms,
+            "rows": rows,
+            "summary": summary,
+        }
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+# File: /benchmarks/scenarios.py | Version: 1.0 | Title: Hot-endpoint benchmark scenarios against a generated workspace
+"""
+Times the hot endpoints against a database from benchmarks.datagen. Each
+request goes through the full app: every middleware, auth and the real
+routers.
+
+  filter         POST /workspaces/{id}/tasks/filter (status IN + priority, 200 rows)
+  by_list        GET  /tasks/by-list/{id} (hottest list, first page)
+  by_tags        GET  /workspaces/{id}/tasks/by-tags (3 tags, match=any)
+  view_apply     GET  /views/{id}/tasks, result cache cleared before each call
+  view_cached    GET  /views/{id}/tasks, served from the result cache
+  comments       GET  /tasks/{id}/comments (task with the most comments)
+  login          POST /auth/login (bcrypt verify + token)
+  subtask_move   POST /tasks/{id}/move, alternating between two parents
+
+Results are JSON: per-scenario latency percentiles plus the SQL statement
+count from Server-Timing. They are tagged with the git commit and the data
+shape, so `python -m benchmarks.compare old.json new.json` can flag
+regressions between commits.
+
+Usage:
+  python -m benchmarks.scenarios --preset small --json var/bench/$(git rev-parse --short HEAD).json
+  python -m benchmarks.scenarios --db var/bench/1m.db --preset large --only by_list,filter
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import logging
+import platform
+import re
+import sqlite3
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.datagen import add_shape_args, generate, shape_from_args
+
+RESULTS_SCHEMA = 1
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+Call = Callable[[TestClient, Dict[str, Any]], Any]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    call: Call
+    setup: Optional[Callable[[], None]] = None  # untimed, before every call
+
+
+def _filter(client: TestClient, m: Dict[str, Any]):
+    return client.post(
+        f"/workspaces/{m['workspace_id']}/tasks/filter",
+        json={
+            "scope": {"workspace_id": m["workspace_id"]},
+            "filters": [
+                {"field": "status", "op": "in", "value": ["to_do", "in_progress"]},
+                {"field": "priority", "op": "in", "value": ["high", "urgent"]},
+            ],
+            "limit": 200,
+        },
+    )
+
+
+def _by_list(client: TestClient, m: Dict[str, Any]):
+    return client.get(f"/tasks/by-list/{m['list_id']}")
+
+
+def _by_tags(client: TestClient, m: Dict[str, Any]):
+    return client.get(
+        f"/workspaces/{m['workspace_id']}/tasks/by-tags",
+        params={"tag_ids": m["tag_ids"], "match": "any", "limit": 100},
+    )
+
+
+def _view(client: TestClient, m: Dict[str, Any]):
+    return client.get(f"/views/{m['view_id']}/tasks", params={"per_page": 100})
+
+
+def _clear_view_cache() -> None:
+    from app.core.cache import get_view_cache
+
+    get_view_cache().clear()
+
+
+def _comments(client: TestClient, m: Dict[str, Any]):
+    return client.get(f"/tasks/{m['comment_task_id']}/comments", params={"limit": 50})
+
+
+def _login(client: TestClient, m: Dict[str, Any]):
+    return client.post(
+        "/auth/login",
+        json={"email": m["email"], "password": m["password"]},
+        headers={"Authorization": ""},
+    )
+
+
+def _subtask_move() -> Call:
+    parents = itertools.count()
+
+    def call(client: TestClient, m: Dict[str, Any]):
+        target = m["parent_ids"][next(parents) % 2]
+        return client.post(
+            f"/tasks/{m['subtask_id']}/move", json={"new_parent_task_id": target}
+        )
+
+    return call
+
+
+def scenarios() -> List[Scenario]:
+    return [
+        Scenario("filter", _filter),
+        Scenario("by_list", _by_list),
+        Scenario("by_tags", _by_tags),
+        Scenario("view_apply", _view, setup=_clear_view_cache),
+        Scenario("view_cached", _view),
+        Scenario("comments", _comments),
+        Scenario("login", _login),
+        Scenario("subtask_move", _subtask_move()),
+    ]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency stats in ms; shared by the other benchmark harnesses."""
+    ms = sorted(s * 1000 for s in samples)
+    p95 = statistics.quantiles(ms, n=20)[18] if len(ms) > 1 else ms[0]
+    return {
+        "rounds": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "p50_ms": round(statistics.median(ms), 3),
+        "p95_ms": round(p95, 3),
+        "min_ms": round(ms[0], 3),
+        "max_ms": round(ms[-1], 3),
+    }
+
+
+def run_scenario(
+    client: TestClient,
+    manifest: Dict[str, Any],
+    scenario: Scenario,
+    *,
+    rounds: int,
+    warmup: int,
+) -> Dict[str, Any]:
+    samples: List[float] = []
+    response = None
+    for i in range(warmup + rounds):
+        if scenario.setup is not None:
+            scenario.setup()
+        start = time.perf_counter()
+        response = scenario.call(client, manifest)
+        elapsed = time.perf_counter() - start
+        if response.status_code >= 400:
+            raise RuntimeError(
+                f"{scenario.name}: HTTP {response.status_code} {response.text[:200]}"
+            )
+        if i >= warmup:
+            samples.append(elapsed)
+    result = summarize(samples)
+    match = _QUERIES.search(response.headers.get("server-timing", ""))
+    result["queries"] = int(match.group(1)) if match else None
+    result["bytes"] = len(response.content)
+    return result
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip()
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+
+
+def bench_client(db_path: Path) -> TestClient:
+    """The real app, with get_db pointed at the generated database."""
+    from app.db.session import get_db
+    from app.dependencies import get_db as views_get_db
+    from app.main import app
+
+    # One line per request would dominate the timings
+    logging.getLogger("app.access").setLevel(logging.WARNING)
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    factory = sessionmaker(bind=engine, autoflush=False)
+
+    def _db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _db
+    app.dependency_overrides[views_get_db] = _db  # the views router has its own
+    return TestClient(app)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    add_shape_args(parser)
+    parser.add_argument("--db", type=Path, help="default: var/bench/<preset>.db")
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--only", help="comma-separated scenario names")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args(argv)
+
+    shape = shape_from_args(args)
+    db_path = args.db or Path("var/bench") / f"{args.preset}.db"
+    manifest = generate(db_path, shape)
+    from app.security import create_access_token
+
+    wanted = set(args.only.split(",")) if args.only else None
+    results: Dict[str, Any] = {}
+    with bench_client(db_path) as client:
+        token = create_access_token({"sub": manifest["user_id"]})
+        client.headers["Authorization"] = f"Bearer {token}"
+        for scenario in scenarios():
+            if wanted and scenario.name not in wanted:
+                continue
+            results[scenario.name] = r = run_scenario(
+                client, manifest, scenario, rounds=args.rounds, warmup=args.warmup
+            )
+            print(
+                f"{scenario.name:>14}: p50 {r['p50_ms']:>9.2f}ms  "
+                f"p95 {r['p95_ms']:>9.2f}ms  {r['queries']} queries"
+            )
+
+    report = {
+        "schema": RESULTS_SCHEMA,
+        "env": environment(),
+        "shape": manifest["shape"],
+        "rounds": args.rounds,
+        "results": results,
+    }
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# File: /benchmarks/serialization.py | Version: 1.0 | Title: Serialization benchmark — validated response_model path vs row serializer + orjson
+"""
+Times turning N loaded Task rows into a JSON body two ways:
+
+  validated : what FastAPI does for response_model=List[TaskOut]:
+              from_attributes validation, dump to JSON-able python, stdlib json
+  fast      : app.core.serialization (compiled row serializer + orjson/stdlib)
+
+then times the whole GET /tasks/by-list/{id} request with FAST_JSON_ENABLED off and on.
+
+Usage:
+  python -m benchmarks.serialization --tasks 5000 --rounds 20
+  python -m benchmarks.serialization --json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import serialization
+from app.core.config import settings
+from app.db.base_class import Base
+from app.db.session import get_db
+from app.models.core_entities import List as ListModel
+from app.models.core_entities import Space, Task, User, Workspace, WorkspaceMember
+from app.routers import task as task_router
+from app.schemas.task import TaskOut
+from app.security import create_access_token
+
+
+def _seed(db_path: Path, tasks: int) -> Dict[str, str]:
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        user = User(email="bench@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        ws = Workspace(name="Bench", owner_id=user.id)
+        db.add(ws)
+        db.flush()
+        db.add(WorkspaceMember(workspace_id=ws.id, user_id=user.id, role="Owner"))
+        sp = Space(name="S", workspace_id=ws.id)
+        db.add(sp)
+        db.flush()
+        lst = ListModel(name="L", space_id=sp.id)
+        db.add(lst)
+        db.flush()
+        db.add_all(
+            Task(
+                name=f"Task {i}",
+                list_id=lst.id,
+                description=f"Description of task {i} " * 4,
+                priority=("low", "normal", "high")[i % 3],
+            )
+            for i in range(tasks)
+        )
+        db.commit()
+        ids = {"user": user.id, "list": lst.id}
+    engine.dispose()
+    return ids
+
+
+def _time(fn: Callable[[], object], rounds: int) -> Dict[str, float]:
+    samples: List[float] = []
+    size = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        body = fn()
+        samples.append(time.perf_counter() - start)
+        size = len(body)
+    return {
+        "rounds": rounds,
+        "bytes": size,
+        "mean_ms": round(statistics.fmean(samples) * 1000, 2),
+        "min_ms": round(min(samples) * 1000, 2),
+    }
+
+
+def _encode(db_path: Path, list_id: str, rounds: int) -> Dict[str, Dict]:
+    engine = create_engine(f"sqlite:///{db_path}")
+    with sessionmaker(bind=engine)() as db:
+        rows = db.query(Task).filter(Task.list_id == list_id).all()
+        adapter = TypeAdapter(List[TaskOut])
+
+        def validated() -> bytes:
+            data = adapter.dump_python(
+                adapter.validate_python(rows, from_attributes=True), mode="json"
+            )
+            return json.dumps(data).encode()
+
+        serialize = serialization.row_serializer(TaskOut, Task)
+
+        def fast() -> bytes:
+            return serialization.dumps([serialize(r) for r in rows])
+
+        assert json.loads(validated()) == json.loads(fast())
+        results = {"validated": _time(validated, rounds), "fast": _time(fast, rounds)}
+    engine.dispose()
+    return results
+
+
+def _endpoint(
+    db_path: Path, ids: Dict[str, str], rounds: int, fast: bool
+) -> Dict[str, float]:
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    factory = sessionmaker(bind=engine, autoflush=False)
+    app = FastAPI()
+    app.include_router(task_router.router)
+
+    def _db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _db
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': ids['user']})}"}
+    previous = settings.FAST_JSON_ENABLED
+    settings.FAST_JSON_ENABLED = fast
+    try:
+        with TestClient(app, headers=headers) as client:
+
+            def call() -> bytes:
+                r = client.get(f"/tasks/by-list/{ids['list']}")
+                r.raise_for_status()
+                return r.content
+
+            return _time(call, rounds)
+    finally:
+        settings.FAST_JSON_ENABLED = previous
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=5000, help="tasks in the list")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        ids = _seed(db_path, args.tasks)
+        results = {
+            "tasks": args.tasks,
+            "encoder": "orjson" if serialization.orjson is not None else "json",
+            "encode": _encode(db_path, ids["list"], args.rounds),
+            "endpoint": {
+                "validated": _endpoint(db_path, ids, args.rounds, fast=False),
+                "fast": _endpoint(db_path, ids, args.rounds, fast=True),
+            },
+        }
+
+    for stage in ("encode", "endpoint"):
+        base, fast = results[stage]["validated"], results[stage]["fast"]
+        print(
+            f"{stage:>8}: validated {base['mean_ms']}ms  fast {fast['mean_ms']}ms  "
+            f"x{round(base['mean_ms'] / max(fast['mean_ms'], 1e-6), 1)} "
+            f"({fast['bytes']} bytes, {results['encoder']})"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
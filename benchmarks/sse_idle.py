@@ -0,0 +1,267 @@
+# File: /benchmarks/sse_idle.py | Version: 1.0 | Title: Idle SSE connection load test (one uvicorn worker)
+"""
+Holds N idle SSE streams open against a single uvicorn worker, reports what
+they cost, then times how long one change takes to reach all of them.
+
+  1. seeds a temp SQLite DB and starts `uvicorn app.main:app` (1 worker) on it
+  2. opens --connections streams to /lists/{id}/events, --ramp at a time
+  3. samples the server's RSS and open fds once every stream is idle
+  4. creates one task over HTTP and times delivery to every stream
+
+Usage:
+  python -m benchmarks.sse_idle --connections 10000
+  python -m benchmarks.sse_idle --connections 2000 --json sse.json
+
+The client and the server each hold one socket per stream, so the fd hard
+limit must exceed --connections (the script raises its soft limit to the
+hard one, and the server inherits it).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess  # nosec B404 - launches the server under test
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base_class import Base
+from app.models.core_entities import List as ListModel
+from app.models.core_entities import Space, User, Workspace, WorkspaceMember
+from app.security import create_access_token
+
+
+def _raise_fd_limit() -> int:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return hard
+
+
+def _seed(db_path: Path) -> Dict[str, str]:
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        user = User(email="sse@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        ws = Workspace(name="SSE", owner_id=user.id)
+        db.add(ws)
+        db.flush()
+        db.add(WorkspaceMember(workspace_id=ws.id, user_id=user.id, role="Owner"))
+        sp = Space(name="S", workspace_id=ws.id)
+        db.add(sp)
+        db.flush()
+        lst = ListModel(name="L", space_id=sp.id)
+        db.add(lst)
+        db.commit()
+        ids = {"user": user.id, "space": sp.id, "list": lst.id}
+    engine.dispose()
+    return ids
+
+
+def _proc_stats(pid: int) -> Dict[str, float]:
+    rss_kb = 0
+    with open(f"/proc/{pid}/status") as fh:
+        for line in fh:
+            if line.startswith("VmRSS:"):
+                rss_kb = int(line.split()[1])
+    return {
+        "rss_mb": round(rss_kb / 1024, 1),
+        "fds": len(os.listdir(f"/proc/{pid}/fd")),
+    }
+
+
+async def _wait_ready(base: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base) as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get("/healthz")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+class Stream:
+    def __init__(self) -> None:
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.received_at: Optional[float] = None
+
+    async def open(self, host: str, port: int, path: str, token: str) -> None:
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.writer.write(
+            (
+                f"GET {path} HTTP/1.1\r\nHost: {host}\r\n"
+                f"Authorization: Bearer {token}\r\n"
+                "Accept: text/event-stream\r\n\r\n"
+            ).encode()
+        )
+        await self.writer.drain()
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        if b" 200 " not in head.split(b"\r\n", 1)[0]:
+            raise RuntimeError(head.split(b"\r\n", 1)[0].decode())
+
+    async def wait_for(self, marker: bytes) -> None:
+        assert self.reader is not None
+        buf = b""
+        while marker not in buf:
+            chunk = await self.reader.read(65536)
+            if not chunk:
+                raise ConnectionError("stream closed")
+            buf = buf[-len(marker) :] + chunk
+        self.received_at = time.perf_counter()
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def _run(args: argparse.Namespace, ids: Dict[str, str], port: int) -> Dict:
+    base = f"http://127.0.0.1:{port}"
+    token = create_access_token({"sub": ids["user"]})
+    await _wait_ready(base)
+    server_pid = args.server_pid
+
+    baseline = _proc_stats(server_pid)
+    path = f"/lists/{ids['list']}/events"
+    streams: List[Stream] = []
+    failures = 0
+    started = time.perf_counter()
+    for i in range(0, args.connections, args.ramp):
+        batch = [Stream() for _ in range(min(args.ramp, args.connections - i))]
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(s.open("127.0.0.1", port, path, token), 60)
+                for s in batch
+            ),
+            return_exceptions=True,
+        )
+        for s, r in zip(batch, results):
+            if isinstance(r, BaseException):
+                failures += 1
+                s.close()
+            else:
+                streams.append(s)
+        print(f"  {len(streams)} open, {failures} failed", file=sys.stderr)
+    connect_seconds = time.perf_counter() - started
+
+    await asyncio.sleep(args.idle)  # let everything settle into the idle state
+    idle = _proc_stats(server_pid)
+
+    waiters = [asyncio.ensure_future(s.wait_for(b"task.created")) for s in streams]
+    async with httpx.AsyncClient(
+        base_url=base, headers={"Authorization": f"Bearer {token}"}
+    ) as client:
+        sent = time.perf_counter()
+        r = await client.post(
+            "/tasks/",
+            json={"name": "ping", "list_id": ids["list"], "space_id": ids["space"]},
+        )
+        r.raise_for_status()
+    done, pending = await asyncio.wait(waiters, timeout=args.deliver_timeout)
+    for w in pending:
+        w.cancel()
+    delays = sorted(
+        (s.received_at - sent) * 1000 for s in streams if s.received_at is not None
+    )
+    for s in streams:
+        s.close()
+
+    def pct(p: float) -> Optional[float]:
+        if not delays:
+            return None
+        return round(delays[min(len(delays) - 1, int(p * len(delays)))], 1)
+
+    held = len(streams)
+    return {
+        "connections": held,
+        "connect_failures": failures,
+        "connect_seconds": round(connect_seconds, 2),
+        "server_baseline": baseline,
+        "server_idle": idle,
+        "kb_per_connection": (
+            round((idle["rss_mb"] - baseline["rss_mb"]) * 1024 / held, 1)
+            if held
+            else None
+        ),
+        "delivered": len(delays),
+        "fanout_p50_ms": pct(0.50),
+        "fanout_p99_ms": pct(0.99),
+        "fanout_max_ms": round(delays[-1], 1) if delays else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--ramp", type=int, default=500, help="streams opened at once")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--idle", type=float, default=2.0, help="settle time (s)")
+    parser.add_argument("--deliver-timeout", type=float, default=30.0)
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args()
+
+    hard = _raise_fd_limit()
+    if hard < args.connections + 100:
+        sys.exit(f"fd hard limit {hard} is too low for {args.connections} streams")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "sse.db"
+        ids = _seed(db_path)
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{db_path}",
+            "JOBS_ENABLED": "false",
+            "REALTIME_BACKEND": "local",
+        }
+        server = subprocess.Popen(  # nosec B603 - fixed argv
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "app.main:app",
+                "--port",
+                str(args.port),
+                "--workers",
+                "1",
+                "--backlog",
+                "4096",
+                "--no-access-log",
+                "--log-level",
+                "warning",
+                # open streams never finish on their own
+                "--timeout-graceful-shutdown",
+                "5",
+            ],
+            env=env,
+        )
+        args.server_pid = server.pid
+        try:
+            results = asyncio.run(_run(args, ids, args.port))
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+    print(json.dumps(results, indent=2))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,30 @@
 # ruff: noqa: E402
 # File: /tests/conftest.py
+import os
 import pathlib
 import sys
+from contextlib import contextmanager
 
 # Make repo root importable as "app"
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+# Unplanned lazy loads of Task relationships raise (see app/db/loaders.py)
+os.environ.setdefault("STRICT_LOADING", "true")
+# pytest swaps stderr per test; a log listener thread would outlive the capture
+# it was bound to (tests/test_request_logging.py turns the queue on itself)
+os.environ.setdefault("LOG_QUEUE", "false")
+# /metrics is off by default; the suite covers it
+os.environ.setdefault("METRICS_ENABLED", "true")
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.db.base_class import Base
+from app.db.query_count import count_queries
 from app.main import app
 
 TEST_DATABASE_URL = "sqlite:///./test.db"
@@ -46,6 +57,7 @@ def db_session():
 @pytest.fixture()
 def client(db_session):
     from app.db.session import get_db  # late import to avoid circulars
+    from app.dependencies import get_db as views_get_db
 
     def _override_get_db():
         try:
@@ -54,6 +66,31 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[views_get_db] = _override_get_db  # the views router's own
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def query_budget(db_session):
+    """
+    N+1 guard: `with query_budget(4):` fails the test when the block runs
+    more than 4 SQL statements, and lists them. `exact=True` also fails on
+    fewer, for budgets that should be updated when a query goes away.
+    """
+
+    @contextmanager
+    def _budget(limit: int, *, exact: bool = False, label: str = ""):
+        with count_queries(db_session.get_bind()) as statements:
+            yield statements
+        over = len(statements) != limit if exact else len(statements) > limit
+        if over:
+            numbered = "\n".join(f"  {i}. {s}" for i, s in enumerate(statements, 1))
+            pytest.fail(
+                f"{label + ': ' if label else ''}{len(statements)} queries, "
+                f"budget {'==' if exact else '<='} {limit}:\n{numbered}",
+                pytrace=False,
+            )
+
+    return _budget
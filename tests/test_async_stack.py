@@ -0,0 +1,254 @@
+# File: /tests/test_async_stack.py
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.core.permissions import Role, get_workspace_role_async
+from app.crud import async_comments, async_tags, async_task
+from app.db.async_session import get_async_db, to_async_url
+from app.db.base_class import Base
+from app.models.core_entities import (
+    Comment,
+    List,
+    Space,
+    Tag,
+    Task,
+    TaskTag,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+from app.routers import task_async
+from app.security import create_access_token
+
+
+def test_to_async_url_maps_known_dialects():
+    assert to_async_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    assert to_async_url("postgresql://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+    assert (
+        to_async_url("postgresql+psycopg2://u:p@h/db")
+        == "postgresql+asyncpg://u:p@h/db"
+    )
+    # already async -> unchanged
+    assert to_async_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+    with pytest.raises(ValueError):
+        to_async_url("mysql://h/db")
+    with pytest.raises(ValueError):
+        to_async_url("not-a-url")
+
+
+@pytest.fixture()
+def async_env(tmp_path):
+    """Seed a file DB with the sync engine; hand back an async sessionmaker on it."""
+    path = tmp_path / "async_stack.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=sync_engine)
+    with sessionmaker(bind=sync_engine)() as db:
+        owner = User(email="async-owner@example.com", hashed_password="x")
+        outsider = User(email="async-out@example.com", hashed_password="x")
+        db.add_all([owner, outsider])
+        db.flush()
+        ws = Workspace(name="W", owner_id=owner.id)
+        db.add(ws)
+        db.flush()
+        db.add(WorkspaceMember(workspace_id=ws.id, user_id=owner.id, role="Owner"))
+        sp = Space(name="S", workspace_id=ws.id)
+        db.add(sp)
+        db.flush()
+        lst = List(name="L", space_id=sp.id)
+        db.add(lst)
+        db.flush()
+        parent = Task(name="Parent", list_id=lst.id)
+        db.add(parent)
+        db.flush()
+        child = Task(name="Child", list_id=lst.id, parent_task_id=parent.id)
+        tag = Tag(name="urgent", workspace_id=ws.id)
+        db.add_all([child, tag])
+        db.flush()
+        db.add(TaskTag(task_id=parent.id, tag_id=tag.id))
+        db.add(Comment(task_id=parent.id, user_id=owner.id, body="first"))
+        db.commit()
+        ids = {
+            "owner": owner.id,
+            "outsider": outsider.id,
+            "ws": ws.id,
+            "list": lst.id,
+            "parent": parent.id,
+            "child": child.id,
+            "tag": tag.id,
+        }
+    sync_engine.dispose()
+
+    # NullPool: every session opens its connection on the loop that uses it
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    yield async_sessionmaker(bind=engine, expire_on_commit=False), ids
+    asyncio.run(engine.dispose())
+
+
+def test_async_crud_reads(async_env):
+    factory, ids = async_env
+
+    async def _run():
+        async with factory() as db:
+            task, ws_id = await async_task.get_task_with_workspace_id(db, ids["parent"])
+            assert task.name == "Parent" and ws_id == ids["ws"]
+            missing, none_ws = await async_task.get_task_with_workspace_id(
+                db, "00000000-0000-0000-0000-000000000000"
+            )
+            assert missing is None and none_ws is None
+            assert (await async_task.get_task(db, ids["child"])).name == "Child"
+            assert await async_task.get_list_workspace_id(db, ids["list"]) == ids["ws"]
+            assert len(await async_task.get_tasks_by_list(db, ids["list"])) == 2
+            subs = await async_task.get_subtasks(db, ids["parent"])
+            assert [t.id for t in subs] == [ids["child"]]
+
+            comments = await async_comments.get_comments_for_task(
+                db, task_id=ids["parent"], limit=10, offset=0
+            )
+            assert [c.body for c in comments] == ["first"]
+            assert (
+                await async_comments.get_comments_for_task(
+                    db, task_id=ids["parent"], limit=10, offset=1
+                )
+                == []
+            )
+
+            assert [
+                t.name
+                for t in await async_tags.get_workspace_tags(db, workspace_id=ids["ws"])
+            ] == ["urgent"]
+            assert [
+                t.name
+                for t in await async_tags.get_tags_for_task(db, task_id=ids["parent"])
+            ] == ["urgent"]
+            tagged = await async_tags.get_tasks_for_tag(db, tag_id=ids["tag"])
+            assert [t.id for t in tagged] == [ids["parent"]]
+
+            role = await get_workspace_role_async(
+                db, user_id=ids["owner"], workspace_id=ids["ws"]
+            )
+            assert role == Role.OWNER
+            assert (
+                await get_workspace_role_async(
+                    db, user_id=ids["outsider"], workspace_id=ids["ws"]
+                )
+                is None
+            )
+
+    asyncio.run(_run())
+
+
+def test_async_router_serves_hot_paths(async_env):
+    factory, ids = async_env
+    app = FastAPI()
+    app.include_router(task_async.router)
+
+    async def _override():
+        async with factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = _override
+    owner = {"Authorization": f"Bearer {create_access_token({'sub': ids['owner']})}"}
+    outsider = {
+        "Authorization": f"Bearer {create_access_token({'sub': ids['outsider']})}"
+    }
+
+    with TestClient(app) as c:
+        r = c.get(f"/tasks/{ids['parent']}", headers=owner)
+        assert r.status_code == 200 and r.json()["name"] == "Parent", r.text
+        # same ETags as the sync routes: revalidation is a 304 with no body
+        etag = r.headers["etag"]
+        r = c.get(f"/tasks/{ids['parent']}", headers={**owner, "If-None-Match": etag})
+        assert r.status_code == 304 and r.content == b""
+        r = c.get(f"/tasks/by-list/{ids['list']}", headers=owner)
+        r = c.get(
+            f"/tasks/by-list/{ids['list']}",
+            headers={**owner, "If-None-Match": r.headers["etag"]},
+        )
+        assert r.status_code == 304
+        r = c.get(f"/tasks/by-list/{ids['list']}", headers=owner)
+        assert sorted(t["name"] for t in r.json()) == ["Child", "Parent"]
+        r = c.get(f"/tasks/{ids['parent']}/subtasks", headers=owner)
+        assert [t["id"] for t in r.json()] == [ids["child"]]
+        r = c.get(f"/tasks/{ids['parent']}/comments", headers=owner)
+        assert [cm["body"] for cm in r.json()] == ["first"]
+        r = c.get(f"/tasks/{ids['parent']}/tags", headers=owner)
+        assert [t["name"] for t in r.json()] == ["urgent"]
+        r = c.get(f"/workspaces/{ids['ws']}/tags", headers=owner)
+        assert [t["name"] for t in r.json()] == ["urgent"]
+        r = c.get(f"/tags/{ids['tag']}/tasks", headers=owner)
+        assert [t["id"] for t in r.json()] == [ids["parent"]]
+
+        # ?fields= behaves like the sync routes: sparse rows, 400 on unknown names
+        list_url = f"/tasks/by-list/{ids['list']}"
+        full_tag = c.get(list_url, headers=owner).headers["etag"]
+        r = c.get(f"{list_url}?fields=name", headers=owner)
+        assert sorted(r.json(), key=lambda t: t["name"]) == [
+            {"id": ids["child"], "name": "Child"},
+            {"id": ids["parent"], "name": "Parent"},
+        ]
+        assert r.headers["etag"] != full_tag  # the field set is part of the tag
+        r = c.get(f"{list_url}?fields=name&stream=true", headers=owner)
+        assert sorted(json.loads(line)["name"] for line in r.text.splitlines()) == [
+            "Child",
+            "Parent",
+        ]
+        r = c.get(f"/tags/{ids['tag']}/tasks?fields=name", headers=owner)
+        assert r.json() == [{"id": ids["parent"], "name": "Parent"}]
+        for path in (list_url, f"/tags/{ids['tag']}/tasks"):
+            assert c.get(f"{path}?fields=nosuch", headers=owner).status_code == 400
+
+        # non-members are rejected on every path
+        for path in (
+            f"/tasks/{ids['parent']}",
+            f"/tasks/by-list/{ids['list']}",
+            f"/tasks/{ids['parent']}/subtasks",
+            f"/tasks/{ids['parent']}/comments",
+            f"/tasks/{ids['parent']}/tags",
+            f"/workspaces/{ids['ws']}/tags",
+            f"/tags/{ids['tag']}/tasks",
+        ):
+            assert c.get(path, headers=outsider).status_code == 403, path
+
+        missing = "00000000-0000-0000-0000-000000000000"
+        for path in (
+            f"/tasks/{missing}",
+            f"/tasks/by-list/{missing}",
+            f"/tasks/{missing}/subtasks",
+            f"/tasks/{missing}/comments",
+            f"/tasks/{missing}/tags",
+            f"/tags/{missing}/tasks",
+        ):
+            assert c.get(path, headers=owner).status_code == 404, path
+
+        # bad / unknown tokens
+        assert c.get(f"/tasks/{ids['parent']}").status_code == 401
+        ghost = {"Authorization": f"Bearer {create_access_token({'sub': 'ghost'})}"}
+        assert c.get(f"/tasks/{ids['parent']}", headers=ghost).status_code == 401
+        assert (
+            c.get(
+                f"/tasks/{ids['parent']}", headers={"Authorization": "Bearer junk"}
+            ).status_code
+            == 401
+        )
+
+
+def test_default_async_session_factory_uses_async_driver():
+    from app.db.async_session import get_async_engine
+
+    assert get_async_engine().dialect.is_async
+
+    async def _run():
+        agen = get_async_db()
+        db = await agen.__anext__()
+        assert db.bind is get_async_engine()
+        await agen.aclose()
+
+    asyncio.run(_run())
@@ -0,0 +1,303 @@
+# File: /tests/test_changes.py | Version: 1.1 | Title: Outbox change feed + long-poll
+from __future__ import annotations
+
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.crud import changes as crud_changes
+from app.crud import comments as crud_comments
+from app.db.base_class import Base
+from app.jobs.registry import PERIODIC, Periodic, load_handlers
+from app.jobs.worker import JobWorker
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def _seed(client: TestClient, headers) -> Dict[str, str]:
+    wid = client.post("/workspaces/", json={"name": "C"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    return {"wid": wid, "sid": sid, "lid": lid}
+
+
+def test_task_writes_land_in_the_feed(client: TestClient):
+    me = _register_and_login(client, "feed@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+    base = f"/workspaces/{seed['wid']}/changes"
+    cursor = client.get(f"{base}/cursor", headers=headers).json()["seq"]
+
+    tid = client.post(
+        "/tasks/",
+        json={"name": "Feed", "list_id": seed["lid"], "space_id": seed["sid"]},
+        headers=headers,
+    ).json()["id"]
+    client.put(f"/tasks/{tid}", json={"status": "done"}, headers=headers)
+    tag_id = client.post(
+        f"/workspaces/{seed['wid']}/tags", json={"name": "hot"}, headers=headers
+    ).json()["id"]
+    client.post(f"/tasks/{tid}/tags/{tag_id}", headers=headers)
+    client.post(f"/tasks/{tid}/comments", json={"body": "hi"}, headers=headers)
+    field_id = client.post(
+        f"/workspaces/{seed['wid']}/custom-fields",
+        json={"name": "Points", "field_type": "Number"},
+        headers=headers,
+    ).json()["id"]
+    client.put(
+        f"/tasks/{tid}/custom-fields/{field_id}", json={"value": 3}, headers=headers
+    )
+    client.post(
+        f"/lists/{seed['lid']}/tasks/import",
+        files={"file": ("t.csv", "name\nImported\n", "text/csv")},
+        headers=headers,
+    )
+    assert client.delete(f"/tasks/{tid}", headers=headers).status_code == 200
+
+    r = client.get(f"{base}?since={cursor}", headers=headers)
+    assert r.status_code == 200, r.text
+    page = r.json()
+    got = [(c["entity"], c["op"]) for c in page["changes"]]
+    assert got == [
+        ("task", "created"),
+        ("task", "updated"),
+        ("tag", "created"),
+        ("task_tag", "created"),
+        ("comment", "created"),
+        ("watcher", "created"),  # commenting auto-follows
+        ("custom_field", "created"),
+        ("custom_field_value", "updated"),
+        ("task", "created"),  # bulk import
+        ("task", "deleted"),
+    ]
+    seqs = [c["seq"] for c in page["changes"]]
+    assert seqs == sorted(seqs) and page["next_since"] == seqs[-1]
+    first, update = page["changes"][:2]
+    assert first["data"]["name"] == "Feed" and first["list_id"] == seed["lid"]
+    assert update["data"] == {"status": "done"} and update["task_id"] == tid
+    assert page["changes"][7]["data"] == {"value": 3}
+    assert page["changes"][8]["data"]["name"] == "Imported"
+    assert page["has_more"] is False
+
+    # paging: small pages walk the same sequence
+    r = client.get(f"{base}?since={cursor}&limit=4", headers=headers).json()
+    assert r["has_more"] is True and [c["seq"] for c in r["changes"]] == seqs[:4]
+    r = client.get(f"{base}?since={r['next_since']}&limit=4", headers=headers).json()
+    assert [c["seq"] for c in r["changes"]] == seqs[4:8]
+
+    # caught up: empty page, cursor unchanged
+    r = client.get(f"{base}?since={seqs[-1]}", headers=headers).json()
+    assert r["changes"] == [] and r["next_since"] == seqs[-1]
+
+    # other workspaces' events are never visible; non-members are refused
+    other = _auth_headers(
+        _register_and_login(client, "feed-other@example.com")["token"]
+    )
+    assert client.get(f"{base}?since=0", headers=other).status_code == 403
+    other_ws = client.post("/workspaces/", json={"name": "O"}, headers=other).json()
+    r = client.get(f"/workspaces/{other_ws['id']}/changes?since=0", headers=other)
+    assert r.json()["changes"] == []
+
+
+def test_long_poll_wakes_on_commit(client: TestClient, db_session, monkeypatch):
+    monkeypatch.setattr(settings, "CHANGES_POLL_SECONDS", 20.0)
+    me = _register_and_login(client, "feed-poll@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+    tid = client.post(
+        "/tasks/",
+        json={"name": "P", "list_id": seed["lid"], "space_id": seed["sid"]},
+        headers=headers,
+    ).json()["id"]
+    url = f"/workspaces/{seed['wid']}/changes"
+    head = client.get(f"{url}/cursor", headers=headers).json()["seq"]
+
+    # nothing new: waits out the (short) timeout and returns empty
+    started = time.monotonic()
+    r = client.get(f"{url}?since={head}&wait=0.3", headers=headers)
+    assert r.json()["changes"] == [] and time.monotonic() - started >= 0.3
+
+    # a commit while the request is parked wakes it well before `wait` expires
+    def _comment():
+        with Session(bind=db_session.get_bind()) as writer:
+            crud_comments.create_comment(
+                writer, task_id=tid, user_id=me["id"], body="ping"
+            )
+
+    timer = threading.Timer(0.3, _comment)
+    timer.start()
+    started = time.monotonic()
+    r = client.get(f"{url}?since={head}&wait=10", headers=headers)
+    timer.join()
+    assert time.monotonic() - started < 5
+    assert [c["entity"] for c in r.json()["changes"]] == ["comment"]
+
+
+def test_expired_cursor_is_gone(client: TestClient, db_session):
+    me = _register_and_login(client, "feed-prune@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+    for name in ("a", "b", "c"):
+        client.post(
+            "/tasks/",
+            json={"name": name, "list_id": seed["lid"], "space_id": seed["sid"]},
+            headers=headers,
+        )
+    head = crud_changes.head_seq(db_session)
+
+    deleted = crud_changes.prune_changes(
+        db_session, before=datetime.now(UTC) + timedelta(days=1)
+    )
+    assert deleted >= 2
+    assert crud_changes.oldest_seq(db_session) == head  # newest row survives
+
+    url = f"/workspaces/{seed['wid']}/changes"
+    assert client.get(f"{url}?since={head - 2}", headers=headers).status_code == 410
+    r = client.get(f"{url}?since={head - 1}", headers=headers)
+    assert r.status_code == 200 and [c["seq"] for c in r.json()["changes"]] == [head]
+
+
+def _feed_db(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'feed.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def _record(db: Session, entity_id: str) -> None:
+    crud_changes.record_event(
+        db, workspace_id="ws", entity="task", entity_id=entity_id, op="updated"
+    )
+
+
+def test_seq_follows_commit_order_across_writers(tmp_path):
+    engine = _feed_db(tmp_path)
+    factory = sessionmaker(bind=engine)
+    slow, fast = factory(), factory()
+    try:
+        # `slow` writes first but commits last
+        _record(slow, "slow")
+        slow.flush()
+        _record(fast, "fast")
+        fast.commit()
+
+        with factory() as reader:
+            seen = crud_changes.get_changes(
+                reader, workspace_id="ws", since=0, limit=10
+            )
+        assert [e.entity_id for e in seen] == ["fast"]
+        cursor = seen[-1].seq
+
+        slow.commit()
+        with factory() as reader:
+            rest = crud_changes.get_changes(
+                reader, workspace_id="ws", since=cursor, limit=10
+            )
+        # a cursor that moved past `fast` still picks up `slow`
+        assert [e.entity_id for e in rest] == ["slow"]
+    finally:
+        slow.close()
+        fast.close()
+        engine.dispose()
+
+
+def test_postgres_assigns_seq_under_the_feed_lock(tmp_path, monkeypatch):
+    engine = _feed_db(tmp_path)
+    statements = []
+
+    @event.listens_for(engine, "connect")
+    def _fake_advisory_lock(dbapi_connection, _record):
+        dbapi_connection.create_function("pg_advisory_xact_lock", 1, lambda key: None)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _log(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine.dispose()  # pooled connections predate the fake function
+    try:
+        with Session(bind=engine) as db:
+            monkeypatch.setattr(engine.dialect, "name", "postgresql")
+            crud_changes._insert_staged(
+                db,
+                [
+                    {
+                        "workspace_id": "ws",
+                        "entity": "task",
+                        "entity_id": "t",
+                        "op": "updated",
+                        "task_id": None,
+                        "list_id": None,
+                        "actor_id": None,
+                        "data": None,
+                        "created_at": datetime.now(UTC),
+                    }
+                ],
+            )
+            monkeypatch.undo()
+        assert statements[0].startswith("SELECT pg_advisory_xact_lock(")
+        assert statements[1].startswith("INSERT INTO change_event")
+    finally:
+        engine.dispose()
+
+
+def test_worker_prunes_the_feed_on_schedule(
+    client: TestClient, db_session, monkeypatch
+):
+    me = _register_and_login(client, "feed-schedule@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+    for name in ("a", "b"):
+        client.post(
+            "/tasks/",
+            json={"name": name, "list_id": seed["lid"], "space_id": seed["sid"]},
+            headers=headers,
+        )
+    head = crud_changes.head_seq(db_session)
+    monkeypatch.setattr(settings, "CHANGES_RETENTION_DAYS", -1)
+
+    load_handlers()
+    prune = PERIODIC["changes.prune"]
+    assert prune.every == settings.CHANGES_PRUNE_SECONDS
+    pruned = threading.Event()
+
+    def _prune_and_signal(db):
+        prune.fn(db)
+        pruned.set()
+
+    monkeypatch.setitem(PERIODIC, "changes.prune", Periodic(60, _prune_and_signal))
+    worker = JobWorker(
+        lambda: Session(bind=db_session.get_bind()),
+        concurrency=1,
+        poll_seconds=0.02,
+        lease_seconds=60,
+    )
+    worker.start()
+    try:
+        assert pruned.wait(5)
+    finally:
+        worker.stop()
+    assert crud_changes.oldest_seq(db_session) == head
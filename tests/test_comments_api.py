@@ -1,6 +1,9 @@
-# File: /tests/test_comments_api.py | Version: 1.1 | Path: /tests/test_comments_api.py
+# File: /tests/test_comments_api.py | Version: 1.3 | Path: /tests/test_comments_api.py
 from typing import Dict, Tuple
 
+from app.crud.comments import recount_comments
+from app.models.core_entities import Task
+
 
 def _register(
     client, email: str, password: str = "Passw0rd!", full_name: str = "Test User"
@@ -143,3 +146,60 @@ def test_comments_pagination_and_edit_delete(client):
     assert r.status_code == 200
     bodies_after = [c["body"] for c in r.json()]
     assert "edited by author" not in bodies_after
+
+
+def test_comment_cursors_tail_and_poll(client, db_session):
+    _register(client, "tail@example.com")
+    headers = _auth_headers(_login_token(client, "tail@example.com"))
+    _, _, _, task_id = _create_workspace_space_list_task(client, headers)
+    url = f"/tasks/{task_id}/comments"
+    updated_at = db_session.get(Task, task_id).updated_at
+    for i in range(5):
+        client.post(url, json={"body": f"c{i}"}, headers=headers)
+
+    # latest two, newest first, then the page before them
+    r = client.get(url, params={"order": "desc", "limit": 2}, headers=headers)
+    assert [c["body"] for c in r.json()] == ["c4", "c3"]
+    latest = r.headers["X-Latest-Cursor"]
+    r = client.get(
+        url,
+        params={"order": "desc", "limit": 2, "cursor": r.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    assert [c["body"] for c in r.json()] == ["c2", "c1"]
+
+    # oldest first by cursor, no offset needed
+    r = client.get(url, params={"limit": 3}, headers=headers)
+    r = client.get(
+        url, params={"limit": 3, "cursor": r.headers["X-Next-Cursor"]}, headers=headers
+    )
+    assert [c["body"] for c in r.json()] == ["c3", "c4"]
+    assert "X-Next-Cursor" not in r.headers
+
+    # polling: nothing new keeps the cursor, a new comment moves it
+    r = client.get(url, params={"after": latest}, headers=headers)
+    assert r.json() == [] and r.headers["X-Latest-Cursor"] == latest
+    client.post(url, json={"body": "c5"}, headers=headers)
+    r = client.get(url, params={"after": latest}, headers=headers)
+    assert [c["body"] for c in r.json()] == ["c5"]
+    assert r.headers["X-Latest-Cursor"] != latest
+
+    r = client.get(url, params={"after": latest, "offset": 1}, headers=headers)
+    assert r.status_code == 400
+
+    # counters follow creates and deletes, and recount repairs drift
+    r = client.get(f"/tasks/{task_id}", headers=headers)
+    assert r.json()["comment_count"] == 6
+    first = client.get(url, params={"limit": 1}, headers=headers).json()[0]
+    client.delete(f"{url}/{first['id']}", headers=headers)
+    db_session.expire_all()
+    task = db_session.get(Task, task_id)
+    assert task.comment_count == 5
+    assert task.updated_at == updated_at  # commenting is not a task edit
+    db_session.query(Task).filter(Task.id == task_id).update(
+        {"comment_count": 42, "updated_at": Task.updated_at}
+    )
+    assert recount_comments(db_session, task_ids=[task_id]) == 1
+    db_session.expire_all()
+    task = db_session.get(Task, task_id)
+    assert task.comment_count == 5 and task.updated_at == updated_at
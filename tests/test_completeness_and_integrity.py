@@ -4,7 +4,14 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 from app.routers.views import apply_view_to_tasks
-from app.models.core_entities import User, Workspace, Space, List as ListModel, Task
+from app.models.core_entities import (
+    User,
+    Workspace,
+    WorkspaceMember,
+    Space,
+    List as ListModel,
+    Task,
+)
 from app.models.view import View as ViewModel
 
 
@@ -21,6 +28,9 @@ def _bootstrap_scope(db: Session, owner: User):
     ws = Workspace(name="WS", owner_id=str(owner.id))
     db.add(ws)
     db.flush()
+    db.add(
+        WorkspaceMember(workspace_id=str(ws.id), user_id=str(owner.id), role="Owner")
+    )
     sp = Space(name="SP", workspace_id=str(ws.id))
     db.add(sp)
     db.flush()
@@ -84,11 +94,11 @@ def test_apply_view_owner_only_and_scope_validation_and_stability(db_session: Se
     tied_ids = [it["id"] for it in res["items"] if it["name"] == "Same"]
     assert tied_ids == sorted(tied_ids)
 
-    # 3) A non-list-scoped view must be rejected with 400
+    # 3) A view with an unsupported scope type must be rejected with 400
     bad_view = ViewModel(
         name="VBad",
         owner_id=str(owner.id),
-        scope_type="workspace",
+        scope_type="folder",
         scope_id=str(ws.id),
         sort_spec="name:asc",
     )
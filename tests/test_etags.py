@@ -0,0 +1,152 @@
+# File: /tests/test_etags.py | Version: 1.1 | Title: Conditional GETs (ETag / If-None-Match) on task, list, comment and view reads
+from __future__ import annotations
+
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.etag import etag_matches, make_etag
+from app.crud import changes as crud_changes
+from app.crud.view import create_view, update_view
+from app.schemas.view import ViewCreate, ViewUpdate
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def _seed(client: TestClient, headers) -> Dict[str, str]:
+    wid = client.post("/workspaces/", json={"name": "E"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lids = [
+        client.post(
+            "/lists/", json={"name": name, "space_id": sid}, headers=headers
+        ).json()["id"]
+        for name in ("A", "B")
+    ]
+    tids = [
+        client.post(
+            "/tasks/",
+            json={"name": name, "list_id": lids[0], "space_id": sid},
+            headers=headers,
+        ).json()["id"]
+        for name in ("one", "two")
+    ]
+    return {"wid": wid, "sid": sid, "lid": lids[0], "other_lid": lids[1], "tids": tids}
+
+
+def _revalidate(client: TestClient, url: str, headers, etag: str):
+    return client.get(url, headers={**headers, "If-None-Match": etag})
+
+
+def test_etag_matching_rules():
+    tag = make_etag("task", "abc", 3)
+    assert tag.startswith('W/"') and tag == make_etag("task", "abc", 3)
+    assert tag != make_etag("task", "abc", 4)
+    assert etag_matches(tag, tag)
+    assert etag_matches(f'"x", {tag[2:]}', tag)  # weak comparison ignores W/
+    assert etag_matches("*", tag)
+    assert not etag_matches(None, tag) and not etag_matches('"nope"', tag)
+
+
+def test_task_and_list_reads_revalidate(client: TestClient, db_session: Session):
+    me = _register_and_login(client, "etag-owner@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+    one, two = seed["tids"]
+
+    task_url = f"/tasks/{one}"
+    list_url = f"/tasks/by-list/{seed['lid']}"
+    r = client.get(task_url, headers=headers)
+    assert r.status_code == 200 and r.headers["cache-control"] == "private, no-cache"
+    task_tag = r.headers["etag"]
+    list_tag = client.get(list_url, headers=headers).headers["etag"]
+
+    r = _revalidate(client, task_url, headers, task_tag)
+    assert r.status_code == 304 and r.content == b"" and r.headers["etag"] == task_tag
+    assert _revalidate(client, list_url, headers, list_tag).status_code == 304
+
+    # a write to the sibling leaves task one's tag alone but changes the list's
+    client.put(f"/tasks/{two}", json={"status": "done"}, headers=headers)
+    assert _revalidate(client, task_url, headers, task_tag).status_code == 304
+    r = _revalidate(client, list_url, headers, list_tag)
+    assert r.status_code == 200 and r.headers["etag"] != list_tag
+    list_tag = r.headers["etag"]
+
+    client.put(task_url, json={"name": "renamed"}, headers=headers)
+    r = _revalidate(client, task_url, headers, task_tag)
+    assert r.status_code == 200 and r.json()["name"] == "renamed"
+
+    # moving a task out invalidates the list it left as well as the one it joined
+    other_url = f"/tasks/by-list/{seed['other_lid']}"
+    other_tag = client.get(other_url, headers=headers).headers["etag"]
+    list_tag = client.get(list_url, headers=headers).headers["etag"]
+    r = client.put(
+        f"/tasks/{two}", json={"list_id": seed["other_lid"]}, headers=headers
+    )
+    assert r.status_code == 200, r.text
+    assert _revalidate(client, list_url, headers, list_tag).status_code == 200
+    assert _revalidate(client, other_url, headers, other_tag).status_code == 200
+
+    # authorization still runs before the 304
+    outsider = _auth_headers(
+        _register_and_login(client, "etag-out@example.com")["token"]
+    )
+    assert _revalidate(client, task_url, outsider, "*").status_code == 403
+    missing = "00000000-0000-0000-0000-000000000000"
+    assert _revalidate(client, f"/tasks/{missing}", headers, "*").status_code == 404
+    assert crud_changes.scope_version(db_session, scope="task", scope_id=missing) == 0
+
+
+def test_comment_and_view_reads_revalidate(client: TestClient, db_session: Session):
+    me = _register_and_login(client, "etag-views@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+    one = seed["tids"][0]
+
+    url = f"/tasks/{one}/comments"
+    tag = client.get(url, headers=headers).headers["etag"]
+    assert _revalidate(client, url, headers, tag).status_code == 304
+    # the page window is part of the tag
+    assert _revalidate(client, f"{url}?limit=5", headers, tag).status_code == 200
+    client.post(url, json={"body": "hello"}, headers=headers)
+    r = _revalidate(client, url, headers, tag)
+    assert r.status_code == 200 and [c["body"] for c in r.json()] == ["hello"]
+
+    view = create_view(
+        db_session,
+        owner_id=me["id"],
+        data=ViewCreate(scope_type="list", scope_id=seed["lid"], name="Mine"),
+    )
+    view_url = f"/views/{view.id}/tasks"
+
+    def apply(etag=None, page=1):
+        r = _revalidate(client, f"{view_url}?page={page}", headers, etag or "")
+        return (r if r.status_code == 304 else r.json()), r.headers.get("etag")
+
+    result, tag = apply()
+    assert result["total"] == 2
+    assert apply(tag)[0].status_code == 304
+    assert apply(tag, page=2)[0]["total"] == 2
+
+    # editing the view, or any task in its list, yields a fresh result
+    update_view(db_session, view, ViewUpdate(sort_spec="name:desc"))
+    result, tag = apply(tag)
+    assert result["items"][0]["name"] == "two"
+    client.put(f"/tasks/{one}", json={"name": "zzz"}, headers=headers)
+    result, _ = apply(tag)
+    assert result["items"][0]["name"] == "zzz"
@@ -0,0 +1,96 @@
+# File: /tests/test_fast_json.py | Version: 1.0 | Title: Precompiled row serializers + fast JSON list responses
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.serialization import FastJSONResponse, dumps, row_serializer
+from app.models.core_entities import Comment, Tag, Task, TaskWatcher
+from app.schemas.comments import CommentOut
+from app.schemas.tags import TagOut
+from app.schemas.task import TaskOut
+from app.schemas.watchers import WatcherOut
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def test_row_serializers_match_the_response_models(
+    client: TestClient, db_session: Session, monkeypatch
+):
+    me = _register_and_login(client, "fastjson@example.com")
+    headers = _auth_headers(me["token"])
+    wid = client.post("/workspaces/", json={"name": "J"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    tid = client.post(
+        "/tasks/",
+        json={"name": "é", "list_id": lid, "space_id": sid, "description": "d"},
+        headers=headers,
+    ).json()["id"]
+    client.post(f"/tasks/{tid}/comments", json={"body": "hi"}, headers=headers)
+    tag_id = client.post(
+        f"/workspaces/{wid}/tags", json={"name": "t"}, headers=headers
+    ).json()["id"]
+    client.post(f"/tasks/{tid}/tags/{tag_id}", headers=headers)
+
+    for schema, model in (
+        (TaskOut, Task),
+        (CommentOut, Comment),
+        (TagOut, Tag),
+        (WatcherOut, TaskWatcher),
+    ):
+        obj = db_session.query(model).first()
+        expected = schema.model_validate(obj).model_dump(mode="json")
+        serialize = row_serializer(schema, model)
+        assert serialize is row_serializer(schema, model)  # compiled once
+        assert json.loads(dumps(serialize(obj))) == expected
+    # TaskOut fields the model has no column for fall back to their defaults
+    assert (
+        row_serializer(TaskOut, Task)(db_session.get(Task, tid))["start_date"] is None
+    )
+
+    # the fast path and the validated path produce the same bodies
+    urls = [
+        f"/tasks/by-list/{lid}",
+        f"/tasks/{tid}/comments",
+        f"/tasks/{tid}/watchers",
+        f"/tasks/{tid}/tags",
+        f"/workspaces/{wid}/tags",
+        f"/tags/{tag_id}/tasks",
+    ]
+    fast = [client.get(u, headers=headers) for u in urls]
+    assert all(r.status_code == 200 for r in fast), [r.text for r in fast]
+    assert fast[0].headers["etag"] and fast[0].headers["content-type"] == (
+        "application/json"
+    )
+    monkeypatch.setattr(settings, "FAST_JSON_ENABLED", False)
+    slow = [client.get(u, headers=headers).json() for u in urls]
+    assert [r.json() for r in fast] == slow
+
+
+def test_fast_json_response_renders_dates_like_pydantic():
+    stamp = datetime(2026, 10, 19, 12, 30, tzinfo=UTC)
+    body = FastJSONResponse({"at": stamp, "n": None}).body
+    assert json.loads(body) == {"at": "2026-10-19T12:30:00Z", "n": None}
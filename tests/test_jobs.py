@@ -0,0 +1,358 @@
+# File: /tests/test_jobs.py | Version: 1.4 | Title: DB-backed job queue, worker pool and job endpoints
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Dict
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.db.base_class import Base
+from app.jobs import queue
+from app.jobs.registry import (
+    HANDLERS,
+    PERIODIC,
+    JobContext,
+    JobLeaseLost,
+    job_handler,
+    periodic_task,
+)
+from app.jobs.worker import JobWorker, run_next
+from app.models.core_entities import Task
+from app.models.job import Job
+
+# ---------- queue + worker against an isolated file DB ----------
+
+
+@pytest.fixture()
+def job_db(tmp_path, monkeypatch):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(settings, "JOBS_BACKOFF_SECONDS", 0.0)
+    calls: Dict[str, int] = {}
+
+    @job_handler("test.ok")
+    def _ok(ctx, payload):
+        return {"echo": payload.get("n")}
+
+    @job_handler("test.flaky")
+    def _flaky(ctx, payload):
+        calls["flaky"] = calls.get("flaky", 0) + 1
+        if calls["flaky"] < 3:
+            raise RuntimeError(f"try {calls['flaky']}")
+        return {"tries": calls["flaky"]}
+
+    @job_handler("test.boom")
+    def _boom(ctx, payload):
+        raise ValueError("always")
+
+    @job_handler("test.self_cancel")
+    def _self_cancel(ctx, payload):
+        with factory() as other:
+            queue.request_cancel(other, job=queue.get_job(other, job_id=ctx.job_id))
+        ctx.check_cancelled()
+        return {"unreachable": True}
+
+    factory = sessionmaker(bind=engine, autoflush=False)
+    try:
+        yield factory
+    finally:
+        for kind in ("test.ok", "test.flaky", "test.boom", "test.self_cancel"):
+            HANDLERS.pop(kind, None)
+        engine.dispose()
+
+
+def _job(factory, job_id) -> Job:
+    with factory() as db:
+        return queue.get_job(db, job_id=job_id)
+
+
+def test_enqueue_run_and_result(job_db):
+    with job_db() as db:
+        job = queue.enqueue(db, kind="test.ok", payload={"n": 7})
+        assert job.status == "queued" and job.attempts == 0
+        with pytest.raises(ValueError):
+            queue.enqueue(db, kind="no.such.kind")
+
+    assert run_next(job_db, worker_id="w1") is True
+    assert run_next(job_db, worker_id="w1") is False  # queue drained
+
+    done = _job(job_db, job.id)
+    assert done.status == "succeeded" and done.result == {"echo": 7}
+    assert done.attempts == 1 and done.finished_at is not None
+
+
+def test_retries_with_backoff_then_fails(job_db, monkeypatch):
+    with job_db() as db:
+        flaky = queue.enqueue(db, kind="test.flaky").id
+        boom = queue.enqueue(db, kind="test.boom", max_attempts=2).id
+
+    while run_next(job_db, worker_id="w1"):
+        pass
+    assert _job(job_db, flaky).status == "succeeded"
+    assert _job(job_db, flaky).attempts == 3
+    failed = _job(job_db, boom)
+    assert failed.status == "failed" and failed.attempts == 2
+    assert failed.error == "ValueError: always"
+
+    # with a real backoff the retry is scheduled in the future, not run now
+    monkeypatch.setattr(settings, "JOBS_BACKOFF_SECONDS", 60.0)
+    assert 60 <= queue.backoff_seconds(1) <= 75
+    assert 120 <= queue.backoff_seconds(2) <= 150
+    assert queue.backoff_seconds(30) <= settings.JOBS_BACKOFF_MAX_SECONDS * 1.25
+    with job_db() as db:
+        retry = queue.enqueue(db, kind="test.boom").id
+    assert run_next(job_db, worker_id="w1") is True
+    assert run_next(job_db, worker_id="w1") is False
+    job = _job(job_db, retry)
+    assert job.status == "queued" and job.attempts == 1
+    assert job.run_after.replace(tzinfo=UTC) > datetime.now(UTC) + timedelta(seconds=50)
+
+
+def test_cancel_queued_and_running(job_db):
+    with job_db() as db:
+        queued = queue.enqueue(db, kind="test.ok")
+        queue.request_cancel(db, job=queued)
+        assert queued.status == "cancelled"
+        running = queue.enqueue(db, kind="test.self_cancel").id
+
+    assert run_next(job_db, worker_id="w1") is True
+    job = _job(job_db, running)
+    assert job.status == "cancelled" and job.result is None
+
+
+def test_stale_running_jobs_are_requeued_or_failed(job_db):
+    old = datetime.now(UTC) - timedelta(hours=2)
+    with job_db() as db:
+        a = queue.enqueue(db, kind="test.ok")
+        b = queue.enqueue(db, kind="test.ok", max_attempts=1)
+        unknown = Job(kind="gone.kind", status="queued", attempts=0, max_attempts=3)
+        db.add(unknown)
+        for job in (a, b):
+            job.status, job.locked_at, job.locked_by, job.attempts = (
+                "running",
+                old,
+                "dead-worker",
+                1,
+            )
+        db.commit()
+        assert queue.requeue_stale(db, lease_seconds=60) == 2
+        ids = (a.id, b.id, unknown.id)
+
+    assert _job(job_db, ids[0]).status == "queued"
+    assert _job(job_db, ids[1]).status == "failed"
+    while run_next(job_db, worker_id="w1"):
+        pass
+    assert _job(job_db, ids[0]).status == "succeeded"
+    # no handler for the kind: failed immediately, no retries
+    gone = _job(job_db, ids[2])
+    assert gone.status == "failed" and gone.attempts == 1
+
+
+def test_lease_renewal_and_lost_leases_cannot_finish(job_db):
+    old = datetime.now(UTC) - timedelta(hours=2)
+    with job_db() as db:
+        job_id = queue.enqueue(db, kind="test.ok").id
+        job = queue.claim_next(db, worker_id="w1")
+        ctx = JobContext(db, job, worker_id="w1", session_factory=job_db)
+        ctx.check_cancelled()  # still ours
+        db.query(Job).filter_by(id=job_id).update({"locked_at": old})
+        db.commit()
+        ctx.renew_lease()  # a long-running job's heartbeat
+        assert queue.requeue_stale(db, lease_seconds=60) == 0
+
+        # the heartbeat stopped: swept, then claimed by another worker
+        db.query(Job).filter_by(id=job_id).update({"locked_at": old})
+        db.commit()
+        assert queue.requeue_stale(db, lease_seconds=60) == 1
+        assert queue.claim_next(db, worker_id="w2").id == job_id
+        with pytest.raises(JobLeaseLost):
+            ctx.check_cancelled()
+        assert queue.mark_succeeded(db, job, {"late": True}, worker_id="w1") is False
+        assert queue.mark_failed(db, job, worker_id="w1", error="late") is False
+
+    job = _job(job_db, job_id)
+    assert (job.status, job.locked_by, job.result) == ("running", "w2", None)
+
+
+def test_worker_pool_drains_queue(job_db):
+    worker = JobWorker(job_db, concurrency=2, poll_seconds=0.05, lease_seconds=60)
+    worker.start()
+    try:
+        with job_db() as db:
+            ids = [
+                queue.enqueue(db, kind="test.ok", payload={"n": i}).id for i in range(6)
+            ]
+        deadline = time.monotonic() + 15
+        while time.monotonic() < deadline:
+            if all(_job(job_db, i).status == "succeeded" for i in ids):
+                break
+            time.sleep(0.05)
+    finally:
+        worker.stop()
+    jobs = [_job(job_db, i) for i in ids]
+    assert [j.status for j in jobs] == ["succeeded"] * 6
+    assert [j.result["echo"] for j in jobs] == list(range(6))
+
+
+def test_worker_runs_periodic_tasks(job_db):
+    runs = []
+
+    @periodic_task("test.tick", every=0.1)
+    def _tick(db):
+        runs.append(db.get_bind() is not None)
+        raise RuntimeError("logged, not fatal")
+
+    worker = JobWorker(job_db, concurrency=2, poll_seconds=0.02, lease_seconds=60)
+    worker.start()
+    try:
+        deadline = time.monotonic() + 5
+        while len(runs) < 3 and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        worker.stop()
+        PERIODIC.pop("test.tick", None)
+    # rate-limited per worker (not once per thread per poll) and survives errors
+    assert 3 <= len(runs) <= 10 and all(runs)
+
+
+# ---------- HTTP endpoints (same transaction as the client fixture) ----------
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def _seed(client: TestClient, headers) -> Dict[str, str]:
+    wid = client.post("/workspaces/", json={"name": "J"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    for name in ("one", "two"):
+        client.post(
+            "/tasks/",
+            json={"name": name, "list_id": lid, "space_id": sid},
+            headers=headers,
+        )
+    return {"wid": wid, "lid": lid}
+
+
+def test_export_and_import_jobs_over_http(client, db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "JOBS_DIR", str(tmp_path / "jobs"))
+    me = _register_and_login(client, "jobs-owner@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+
+    def same_tx() -> Session:
+        return Session(bind=db_session.get_bind())
+
+    def run_one() -> bool:
+        ran = run_next(same_tx, worker_id="test")
+        # the worker wrote through its own Session; don't serve cached Job rows
+        db_session.expire_all()
+        return ran
+
+    r = client.post(
+        f"/workspaces/{seed['wid']}/tasks/export-jobs?format=csv&sort=name&order=asc",
+        json={"scope": {"workspace_id": seed["wid"]}},
+        headers=headers,
+    )
+    assert r.status_code == 202, r.text
+    export_id = r.json()["id"]
+    assert r.json()["status"] == "queued" and r.json()["kind"] == "tasks.export"
+    assert client.get(f"/jobs/{export_id}/download", headers=headers).status_code == 404
+
+    assert run_one() is True
+    r = client.get(f"/jobs/{export_id}", headers=headers)
+    assert r.json()["status"] == "succeeded", r.json()
+    r = client.get(f"/jobs/{export_id}/download", headers=headers)
+    assert r.status_code == 200 and r.headers["content-type"].startswith("text/csv")
+    assert [line.split(",")[3] for line in r.text.splitlines()[1:]] == ["one", "two"]
+
+    r = client.post(
+        f"/lists/{seed['lid']}/tasks/import-jobs",
+        files={"file": ("more.csv", "name\nthree\nfour\n", "text/csv")},
+        headers=headers,
+    )
+    assert r.status_code == 202, r.text
+    import_job = r.json()["id"]
+    assert run_one() is True
+    result = client.get(f"/jobs/{import_job}", headers=headers).json()["result"]
+    assert result["status"] == "completed" and result["rows_imported"] == 2
+    r = client.get(f"/imports/{result['import_id']}", headers=headers)
+    assert r.json()["rows_imported"] == 2
+    assert not list((tmp_path / "jobs" / "uploads").iterdir())  # staged file removed
+
+    r = client.post(
+        f"/workspaces/{seed['wid']}/time/rollup:rebuild-job", headers=headers
+    )
+    assert r.status_code == 202
+    rollup_job = r.json()["id"]
+
+    listed = client.get("/jobs", headers=headers).json()
+    assert {j["id"] for j in listed} == {export_id, import_job, rollup_job}
+    assert [
+        j["id"] for j in client.get("/jobs?status=queued", headers=headers).json()
+    ] == [rollup_job]
+
+    # cancel: queued -> cancelled; finished jobs can't be cancelled
+    r = client.post(f"/jobs/{rollup_job}/cancel", headers=headers)
+    assert r.status_code == 200 and r.json()["status"] == "cancelled"
+    assert client.post(f"/jobs/{export_id}/cancel", headers=headers).status_code == 409
+
+    # other users can't see the jobs at all
+    other = _auth_headers(
+        _register_and_login(client, "jobs-other@example.com")["token"]
+    )
+    assert client.get(f"/jobs/{export_id}", headers=other).status_code == 404
+    assert client.get("/jobs", headers=other).json() == []
+
+
+def test_comment_recount_job_repairs_workspace_counters(client, db_session):
+    me = _register_and_login(client, "jobs-recount@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+    task = db_session.query(Task).filter_by(list_id=seed["lid"], name="one").one()
+    r = client.post(f"/tasks/{task.id}/comments", json={"body": "hi"}, headers=headers)
+    assert r.status_code == 200, r.text
+    db_session.query(Task).filter_by(list_id=seed["lid"]).update({"comment_count": 7})
+    db_session.flush()
+
+    other = _auth_headers(
+        _register_and_login(client, "jobs-recount-other@example.com")["token"]
+    )
+    url = f"/workspaces/{seed['wid']}/comments:recount-job"
+    assert client.post(url, headers=other).status_code == 403
+    r = client.post(url, headers=headers)
+    assert r.status_code == 202 and r.json()["kind"] == "comments.recount"
+
+    assert run_next(lambda: Session(bind=db_session.get_bind()), worker_id="test")
+    db_session.expire_all()
+    assert client.get(f"/jobs/{r.json()['id']}", headers=headers).json()["result"] == {
+        "tasks": 2
+    }
+    counts = {
+        t.name: t.comment_count
+        for t in db_session.query(Task).filter_by(list_id=seed["lid"])
+    }
+    assert counts == {"one": 1, "two": 0}
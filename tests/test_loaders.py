@@ -0,0 +1,91 @@
+# File: /tests/test_loaders.py | Version: 1.0 | Title: Eager-loading presets, strict raiseload and the N+1 query budget
+from __future__ import annotations
+
+from typing import Dict
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from app.db.loaders import task_loaders
+from app.models.core_entities import Task
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def _seed(client: TestClient, headers, tasks: int) -> Dict:
+    wid = client.post("/workspaces/", json={"name": "Q"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    tag_id = client.post(
+        f"/workspaces/{wid}/tags", json={"name": "t"}, headers=headers
+    ).json()["id"]
+    tids = []
+    for i in range(tasks):
+        tid = client.post(
+            "/tasks/",
+            json={"name": f"t{i}", "list_id": lid, "space_id": sid},
+            headers=headers,
+        ).json()["id"]
+        client.post(f"/tasks/{tid}/tags/{tag_id}", headers=headers)
+        client.post(f"/tasks/{tid}/watch", headers=headers)
+        tids.append(tid)
+    return {"lid": lid, "tids": tids}
+
+
+def test_strict_loading_raises_on_unplanned_lazy_loads(
+    client: TestClient, db_session: Session
+):
+    me = _register_and_login(client, "strict@example.com")
+    ids = _seed(client, _auth_headers(me["token"]), 1)
+    db_session.expunge_all()
+
+    task = db_session.query(Task).options(*task_loaders("tags")).one()
+    assert [link.tag.name for link in task.tags] == ["t"]  # planned: loaded
+    with pytest.raises(InvalidRequestError):
+        task.watchers  # not planned: raises instead of one query per row
+    assert task.id == ids["tids"][0]
+    with pytest.raises(ValueError):
+        task_loaders("nope")
+
+
+def test_query_counts_do_not_grow_with_rows(client: TestClient, query_budget):
+    me = _register_and_login(client, "budget@example.com")
+    headers = _auth_headers(me["token"])
+    small, large = _seed(client, headers, 2), _seed(client, headers, 8)
+
+    def _counts(ids):
+        counts = []
+        for call in (
+            lambda: client.get(f"/tasks/by-list/{ids['lid']}", headers=headers),
+            lambda: client.post(
+                "/tasks:batchGet",
+                params={"include": "assignees,tags,watchers,subtask_counts"},
+                json={"ids": ids["tids"]},
+                headers=headers,
+            ),
+        ):
+            with query_budget(8) as statements:
+                assert call().status_code == 200
+            counts.append(len(statements))
+        return counts
+
+    assert _counts(small) == _counts(large)
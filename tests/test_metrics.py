@@ -0,0 +1,111 @@
+# File: /tests/test_metrics.py | Version: 1.2 | Title: /metrics exposition + multi-worker snapshot merge
+from __future__ import annotations
+
+import json
+import os
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.observability import metrics
+
+
+def test_metrics_endpoint_reports_routes_and_bcrypt(client: TestClient):
+    r = client.post(
+        "/auth/register",
+        json={"email": "metrics@example.com", "password": "Passw0rd!"},
+    )
+    assert r.status_code in (200, 201), r.text
+    tid = "00000000-0000-0000-0000-000000000000"
+    client.get(f"/tasks/{tid}")  # 401, labelled by template rather than the id
+
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = r.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'route="/auth/register"' in body
+    assert (
+        'http_requests_total{method="GET",route="/tasks/{task_id}",status="401"}'
+        in body
+    )
+    assert tid not in body
+    assert (
+        'http_request_duration_seconds_bucket{method="GET",route="/tasks/{task_id}",le="+Inf"}'
+        in body
+    )
+    assert 'password_hash_seconds_count{op="hash"}' in body
+    assert "http_requests_in_flight 1" in body  # the scrape itself
+
+
+def test_streamed_responses_stay_in_flight_until_the_last_chunk():
+    app = FastAPI()
+    app.add_middleware(metrics.MetricsMiddleware)
+    seen = []
+
+    def _in_flight() -> float:
+        return metrics.collect_local()[("http_requests_in_flight", ())]
+
+    @app.get("/rows")
+    def rows():
+        def body():
+            for n in range(2):
+                seen.append(_in_flight())
+                yield f"{n}\n"
+
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    before = _in_flight()
+    with TestClient(app) as c:
+        assert c.get("/rows").text == "0\n1\n"
+    assert seen == [before + 1, before + 1] and _in_flight() == before
+    total = metrics.collect_local()[("http_requests_total", ("GET", "/rows", "200"))]
+    assert total == 1
+
+
+def test_snapshots_from_other_workers_are_summed(tmp_path, monkeypatch):
+    metrics.RATE_LIMITED.inc(amount=3)
+    dead_pid = 2**22 + 12345  # above pid_max on Linux, so never a live process
+    monkeypatch.setattr(os, "getpid", lambda: dead_pid)
+    metrics.write_snapshot(str(tmp_path))  # as if written by another worker
+    monkeypatch.undo()
+    metrics.write_snapshot(str(tmp_path))  # ours; skipped for the live values
+    (path,) = tmp_path.glob(f"{dead_pid}-*.json")
+    snapshot = json.loads(path.read_text())
+    snapshot["samples"].append(["http_requests_in_flight", [], 7])
+    path.write_text(json.dumps(snapshot))
+
+    local, merged = metrics.collect_local(), metrics.collect_all(str(tmp_path))
+    counter, gauge = (
+        ("rate_limit_rejections_total", ()),
+        (
+            "http_requests_in_flight",
+            (),
+        ),
+    )
+    assert merged[counter] == 2 * local[counter]  # exited worker's totals kept
+    assert merged.get(gauge) == local.get(gauge)  # ...but not its gauges
+    assert "rate_limit_rejections_total " in metrics.render(merged)
+
+
+def test_reused_pid_keeps_the_dead_workers_snapshot(tmp_path, monkeypatch):
+    metrics.RATE_LIMITED.inc(amount=2)
+    # an earlier worker that had our pid, started long ago
+    monkeypatch.setattr(metrics, "_process", (os.getpid(), 1))
+    metrics.write_snapshot(str(tmp_path))
+    path = tmp_path / f"{os.getpid()}-1.json"
+    snapshot = json.loads(path.read_text())
+    snapshot["samples"].append(["http_requests_in_flight", [], 7])
+    path.write_text(json.dumps(snapshot))
+    monkeypatch.undo()
+    metrics.write_snapshot(str(tmp_path))  # ours: a second file, not a rewrite
+
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    local, merged = metrics.collect_local(), metrics.collect_all(str(tmp_path))
+    counter, gauge = (
+        ("rate_limit_rejections_total", ()),
+        ("http_requests_in_flight", ()),
+    )
+    assert merged[counter] == 2 * local[counter]
+    assert merged.get(gauge) == local.get(gauge)
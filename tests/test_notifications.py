@@ -0,0 +1,185 @@
+# File: /tests/test_notifications.py | Version: 1.0 | Title: Watcher notification fan-out, digests and inbox
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud import notifications as crud_notify
+from app.models import Notification, TaskWatcher, User, WorkspaceMember
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def _seed(client: TestClient, headers) -> Dict[str, str]:
+    wid = client.post("/workspaces/", json={"name": "N"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    tid = client.post(
+        "/tasks/",
+        json={"name": "Watched", "list_id": lid, "space_id": sid},
+        headers=headers,
+    ).json()["id"]
+    return {"wid": wid, "tid": tid}
+
+
+def _join(db: Session, wid: str, user_id: str) -> None:
+    db.add(WorkspaceMember(workspace_id=wid, user_id=user_id, role="member"))
+    db.commit()
+
+
+def _count_statements(db: Session):
+    statements = []
+    engine = db.get_bind().engine
+
+    def _before(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _before)
+
+
+def test_fan_out_digests_and_skips_actor(client: TestClient, db_session: Session):
+    owner = _register_and_login(client, "notify-owner@example.com")
+    headers = _auth_headers(owner["token"])
+    seed = _seed(client, headers)
+    crud_notify.dispatch_all(db_session)  # nobody else watched the creation
+    bob = _register_and_login(client, "notify-bob@example.com")
+    _join(db_session, seed["wid"], bob["id"])
+    assert (
+        client.post(
+            f"/tasks/{seed['tid']}/watch", headers=_auth_headers(bob["token"])
+        ).status_code
+        == 200
+    )
+    # a watcher row for someone outside the workspace is ignored
+    outsider = _register_and_login(client, "notify-outsider@example.com")
+    db_session.add(TaskWatcher(task_id=seed["tid"], user_id=outsider["id"]))
+    db_session.commit()
+
+    # hundreds of watchers cost the same handful of statements as one
+    many = [
+        {"id": f"bulk-watcher-{i:03d}", "email": f"w{i}@n.test", "hashed_password": "x"}
+        for i in range(300)
+    ]
+    db_session.execute(insert(User), many)
+    db_session.execute(
+        insert(WorkspaceMember),
+        [{"workspace_id": seed["wid"], "user_id": u["id"]} for u in many],
+    )
+    db_session.execute(
+        insert(TaskWatcher),
+        [{"task_id": seed["tid"], "user_id": u["id"]} for u in many],
+    )
+    db_session.commit()
+
+    r = client.put(f"/tasks/{seed['tid']}", json={"status": "done"}, headers=headers)
+    assert r.status_code == 200, r.text
+    statements, stop = _count_statements(db_session)
+    try:
+        assert crud_notify.dispatch_pending(db_session) == 1
+    finally:
+        stop()
+    inserts = [s for s in statements if s.startswith("INSERT INTO notification ")]
+    assert len(inserts) == 1 and len(statements) <= 10, statements
+
+    rows = crud_notify.list_notifications(db_session, user_id=bob["id"], limit=10)
+    assert len(rows) == 1
+    first = rows[0]
+    assert first.task_id == seed["tid"] and first.event_count == 1
+    assert first.summary[-1]["fields"] == ["status"]
+    assert first.summary[-1]["actor_id"] == owner["id"]
+    # the owner auto-follows their task but made the change; the outsider isn't a member
+    for user_id in (owner["id"], outsider["id"]):
+        assert (
+            crud_notify.list_notifications(db_session, user_id=user_id, limit=10) == []
+        )
+    assert db_session.scalar(select(func.count(Notification.id))) == 301
+
+    # a burst on the same task folds into the unread digest
+    r = client.post(
+        f"/tasks/{seed['tid']}/comments", json={"body": "ping"}, headers=headers
+    )
+    assert r.status_code == 200, r.text
+    client.put(f"/tasks/{seed['tid']}", json={"priority": "high"}, headers=headers)
+    assert crud_notify.dispatch_all(db_session) == 2
+    db_session.expire_all()
+    (digest,) = crud_notify.list_notifications(db_session, user_id=bob["id"], limit=10)
+    assert digest.id == first.id and digest.event_count == 3
+    assert [s["entity"] for s in digest.summary] == ["task", "comment", "task"]
+    assert crud_notify.unread_count(db_session, user_id=bob["id"]) == 1
+
+    # ...but activity after the digest window opens a new notification
+    client.put(f"/tasks/{seed['tid']}", json={"status": "to_do"}, headers=headers)
+    later = datetime.now(UTC) + timedelta(
+        seconds=settings.NOTIFICATIONS_DIGEST_SECONDS + 1
+    )
+    assert crud_notify.dispatch_pending(db_session, now=later) == 1
+    assert crud_notify.unread_count(db_session, user_id=bob["id"]) == 2
+    assert crud_notify.dispatch_pending(db_session) == 0  # cursor advanced
+
+
+def test_inbox_pagination_and_read_state(client: TestClient, db_session: Session):
+    owner = _register_and_login(client, "inbox-owner@example.com")
+    headers = _auth_headers(owner["token"])
+    tasks = [_seed(client, headers) for _ in range(3)]
+    reader = _register_and_login(client, "inbox-reader@example.com")
+    reader_headers = _auth_headers(reader["token"])
+    for seed in tasks:
+        _join(db_session, seed["wid"], reader["id"])
+        client.post(f"/tasks/{seed['tid']}/watch", headers=reader_headers)
+    crud_notify.dispatch_all(db_session)
+    for seed in tasks:
+        client.put(f"/tasks/{seed['tid']}", json={"status": "done"}, headers=headers)
+    crud_notify.dispatch_all(db_session)
+
+    r = client.get("/me/notifications?limit=2", headers=reader_headers)
+    assert r.status_code == 200, r.text
+    page = r.json()
+    assert page["unread"] == 3 and page["next_before"] is not None
+    newest = [n["task_id"] for n in page["notifications"]]
+    assert newest == [tasks[2]["tid"], tasks[1]["tid"]]
+    r = client.get(
+        f"/me/notifications?limit=2&before={page['next_before']}",
+        headers=reader_headers,
+    )
+    assert [n["task_id"] for n in r.json()["notifications"]] == [tasks[0]["tid"]]
+    assert r.json()["next_before"] is None
+
+    ids = [n["id"] for n in page["notifications"]]
+    r = client.post(
+        "/me/notifications/read", json={"ids": ids + ids[:1]}, headers=reader_headers
+    )
+    assert r.json() == {"marked": 2, "unread": 1}
+    # someone else's ids are not theirs to mark
+    r = client.post("/me/notifications/read", json={"ids": ids}, headers=headers)
+    assert r.json() == {"marked": 0, "unread": 0}
+    r = client.get("/me/notifications?unread_only=true", headers=reader_headers)
+    assert [n["task_id"] for n in r.json()["notifications"]] == [tasks[0]["tid"]]
+
+    r = client.post("/me/notifications/read-all", headers=reader_headers)
+    assert r.json() == {"marked": 1, "unread": 0}
+    r = client.get("/me/notifications/unread-count", headers=reader_headers)
+    assert r.json() == {"unread": 0}
+    assert client.get("/me/notifications").status_code == 401
@@ -0,0 +1,164 @@
+# File: /tests/test_pagination.py | Version: 1.1 | Title: Keyset pagination (cursor/limit/stream) on list endpoints
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from typing import Dict, List
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def _walk(client: TestClient, url: str, headers, **params) -> List[List[dict]]:
+    """Every page of `url`, following X-Next-Cursor until it is absent."""
+    pages, cursor = [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        r = client.get(url, params=query, headers=headers)
+        assert r.status_code == 200, r.text
+        pages.append(r.json())
+        cursor = r.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages
+
+
+def test_list_endpoints_page_by_cursor(
+    client: TestClient, db_session: Session, monkeypatch
+):
+    me = _register_and_login(client, "pages@example.com")
+    headers = _auth_headers(me["token"])
+    wid = client.post("/workspaces/", json={"name": "P"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    tids = [
+        client.post(
+            "/tasks/",
+            json={"name": f"t{i}", "list_id": lid, "space_id": sid},
+            headers=headers,
+        ).json()["id"]
+        for i in range(5)
+    ]
+    tag_ids = [
+        client.post(
+            f"/workspaces/{wid}/tags", json={"name": name}, headers=headers
+        ).json()["id"]
+        for name in ("c", "a", "b")
+    ]
+    for tid in tids:
+        client.post(f"/tasks/{tid}/tags/{tag_ids[0]}", headers=headers)
+
+    # tasks of a list: oldest first, no gaps or repeats across pages
+    pages = _walk(client, f"/tasks/by-list/{lid}", headers, limit=2)
+    assert [len(p) for p in pages] == [2, 2, 1]
+    assert [t["id"] for p in pages for t in p] == tids
+    # no cursor: one default-sized page with nothing after it
+    r = client.get(f"/tasks/by-list/{lid}", headers=headers)
+    assert len(r.json()) == 5 and NEXT_CURSOR_HEADER not in r.headers
+    # the page is part of the ETag
+    first = client.get(f"/tasks/by-list/{lid}?limit=2", headers=headers)
+    assert first.headers["etag"] != r.headers["etag"]
+
+    # sparse pages of a tag's tasks: newest first, cursor columns stay internal
+    pages = _walk(client, f"/tags/{tag_ids[0]}/tasks", headers, limit=2, fields="name")
+    rows = [t for p in pages for t in p]
+    assert [t["id"] for t in rows] == tids[::-1]
+    assert set(rows[0]) == {"id", "name"}
+
+    # workspace tags: name order
+    pages = _walk(client, f"/workspaces/{wid}/tags", headers, limit=2)
+    assert [t["name"] for p in pages for t in p] == ["a", "b", "c"]
+
+    # the server caps the page size
+    monkeypatch.setattr(settings, "PAGE_SIZE_MAX", 3)
+    r = client.get(f"/tasks/by-list/{lid}?limit=500", headers=headers)
+    assert len(r.json()) == 3 and NEXT_CURSOR_HEADER in r.headers
+
+    # spaces, lists, watchers and custom field definitions take the same params
+    for url in (
+        f"/spaces/by-workspace/{wid}",
+        f"/lists/by-space/{sid}",
+        f"/tasks/{tids[0]}/watchers",
+        f"/tasks/{tids[0]}/subtasks",
+        f"/workspaces/{wid}/custom-fields",
+    ):
+        r = client.get(url, params={"limit": 1}, headers=headers)
+        assert r.status_code == 200, (url, r.text)
+
+    r = client.get(f"/tasks/by-list/{lid}?cursor=not-a-cursor", headers=headers)
+    assert r.status_code == 400
+    r = client.get(
+        f"/tasks/by-list/{lid}",
+        params={"cursor": encode_cursor([1, 2])},
+        headers=headers,
+    )
+    assert r.status_code == 400  # right length, wrong types
+    r = client.get(
+        f"/tasks/by-list/{lid}",
+        params={"cursor": encode_cursor(["x"])},
+        headers=headers,
+    )
+    assert r.status_code == 400
+
+
+def test_stream_mode_returns_every_row_as_ndjson(
+    client: TestClient, db_session: Session, monkeypatch
+):
+    me = _register_and_login(client, "stream@example.com")
+    headers = _auth_headers(me["token"])
+    wid = client.post("/workspaces/", json={"name": "N"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    for i in range(7):
+        client.post(
+            "/tasks/",
+            json={"name": f"t{i}", "list_id": lid, "space_id": sid},
+            headers=headers,
+        )
+
+    monkeypatch.setattr(settings, "PAGE_SIZE_MAX", 3)  # stream in chunks of 3
+    r = client.get(f"/tasks/by-list/{lid}?stream=true", headers=headers)
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert len(rows) == 7
+    assert [t["name"] for t in rows] == [f"t{i}" for i in range(7)]
+    full = client.get(f"/tasks/by-list/{lid}?limit=3", headers=headers).json()
+    assert rows[:3] == full
+
+    r = client.get(
+        f"/tasks/by-list/{lid}?stream=true&fields=name,status", headers=headers
+    )
+    assert {tuple(json.loads(line)) for line in r.text.splitlines()} == {
+        ("id", "name", "status")
+    }
+
+
+def test_cursor_round_trips_datetimes():
+    stamp = datetime(2026, 10, 19, 8, 0, tzinfo=UTC)
+    assert decode_cursor(encode_cursor([stamp, "abc"])) == [stamp, "abc"]
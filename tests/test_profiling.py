@@ -0,0 +1,108 @@
+# File: /tests/test_profiling.py | Version: 1.1 | Title: Admin-gated per-request profiling + continuous stack sampler
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.middleware import profiling as profiling_middleware
+from app.observability.profiling import ContinuousSampler
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def test_profile_flag_is_admin_only_and_stores_collapsed_stacks(
+    client: TestClient, monkeypatch, tmp_path
+):
+    admin = _register_and_login(client, "prof-admin@example.com")
+    other = _register_and_login(client, "prof-other@example.com")
+    ops = client.post("/workspaces/", json={"name": "Ops"}, headers=admin).json()
+    monkeypatch.setattr(settings, "PROFILING_WORKSPACE_ID", ops["id"])
+    monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+
+    # off by default: the flag is just an unknown query parameter
+    r = client.get("/workspaces/", params={"__profile": "1"}, headers=other)
+    assert r.status_code == 200 and "X-Profile-Id" not in r.headers
+
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    assert client.get("/workspaces/?__profile=1", headers=other).status_code == 403
+    assert client.get("/workspaces/?__profile=1").status_code == 403
+    assert client.get("/admin/profiles", headers=other).status_code == 403
+
+    r = client.get(
+        "/workspaces/",
+        headers={**admin, "X-Profile": "1", "X-Request-ID": "prof-1"},
+    )
+    assert r.status_code == 200 and "Ops" in [w["name"] for w in r.json()]
+    assert r.headers["X-Profile-Id"] == "prof-1.collapsed"
+    assert (tmp_path / "prof-1.collapsed").exists()
+    listed = client.get("/admin/profiles", headers=admin).json()
+    assert [p["name"] for p in listed] == ["prof-1.collapsed"]
+    got = client.get("/admin/profiles/prof-1.collapsed", headers=admin)
+    assert got.status_code == 200
+    assert client.get("/admin/profiles/..%2Fx", headers=admin).status_code == 404
+
+    inline = client.get("/workspaces/?__profile=inline", headers=admin)
+    assert inline.headers["content-type"].startswith("text/plain")
+    assert int(inline.headers["X-Profile-Samples"]) >= 0
+
+
+def _slow_chunk(n: int) -> str:
+    time.sleep(0.05)
+    return f"{n}\n"
+
+
+def test_profiles_cover_streamed_bodies(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+    monkeypatch.setattr(profiling_middleware, "_denied", lambda request: None)
+    app = FastAPI()
+    app.add_middleware(profiling_middleware.ProfilingMiddleware)
+
+    @app.get("/rows")
+    def rows():
+        return StreamingResponse(_slow_chunk(n) for n in range(2))
+
+    with TestClient(app) as c:
+        r = c.get("/rows", headers={"X-Profile": "1"})
+    assert r.text == "0\n1\n"
+    # sampled until the last chunk went out, not just to the response start
+    stacks = (tmp_path / r.headers["X-Profile-Id"]).read_text()
+    assert "test_profiling.py:_slow_chunk" in stacks
+
+
+def _spin(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_continuous_sampler_writes_collapsed_stacks(tmp_path):
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin, args=(stop,), name="busy")
+    worker.start()
+    sampler = ContinuousSampler(str(tmp_path), interval=0.002, flush_seconds=0.05)
+    sampler.start()
+    time.sleep(0.2)
+    sampler.stop()
+    stop.set()
+    worker.join()
+
+    (path,) = tmp_path.glob("continuous-*.collapsed")
+    lines = path.read_text().splitlines()
+    busy = [line for line in lines if line.startswith("busy;")]
+    assert busy and all("test_profiling.py:_spin" in line for line in busy)
+    stack, count = busy[0].rsplit(" ", 1)
+    assert int(count) >= 1 and "threading.py:Thread.run" in stack
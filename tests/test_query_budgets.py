@@ -0,0 +1,523 @@
+# File: /tests/test_query_budgets.py | Version: 1.1 | Title: Per-route SQL statement budgets from tests/query_budgets.txt
+"""
+Every route under app/routers has a line in tests/query_budgets.txt:
+
+    GET /tasks/{task_id}   <= 2     at most 2 statements
+    GET /tasks/by-list/... == 3     exactly 3 (update the file when one goes away)
+    GET /lists/{id}/events skip     with a reason in a trailing comment
+
+Each budgeted route is called once against a freshly seeded workspace, and
+its statements are counted on the test engine. That count includes auth and
+permission lookups. A failure lists the statements the request ran.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_view_cache
+from app.core.config import settings
+from app.crud import notifications as crud_notify
+from app.jobs.worker import run_next
+from app.main import app
+from app.models import User, WorkspaceMember
+from app.security import create_access_token, create_refresh_token, get_password_hash
+
+MANIFEST = Path(__file__).with_name("query_budgets.txt")
+PASSWORD = "Passw0rd!"
+_LINE = re.compile(
+    r"^(?P<method>[A-Z]+)\s+(?P<path>\S+)\s+(?:(?P<op><=|==)\s*(?P<n>\d+)|skip)$"
+)
+
+Route = Tuple[str, str]
+Budget = Tuple[str, int]  # ("<=" | "==", n); ("skip", 0) for skipped routes
+
+
+def load_manifest(path: Path = MANIFEST) -> Dict[Route, Budget]:
+    budgets: Dict[Route, Budget] = {}
+    for lineno, raw in enumerate(path.read_text().splitlines(), 1):
+        line = raw.split("#", 1)[0].strip()
+        if not line:
+            continue
+        m = _LINE.match(line)
+        if m is None:
+            raise ValueError(f"{path.name}:{lineno}: can't parse {raw!r}")
+        route = (m["method"], m["path"])
+        if route in budgets:
+            raise ValueError(f"{path.name}:{lineno}: duplicate entry for {line}")
+        budgets[route] = (m["op"], int(m["n"])) if m["op"] else ("skip", 0)
+    return budgets
+
+
+def app_routes() -> List[Route]:
+    return sorted(
+        (method, r.path)
+        for r in app.routes
+        if isinstance(r, APIRoute) and r.endpoint.__module__.startswith("app.routers.")
+        for method in r.methods
+    )
+
+
+# --- seeded workspace ----------------------------------------------------------
+
+
+@lru_cache(maxsize=1)
+def _password_hash() -> str:
+    return get_password_hash(PASSWORD)  # once per run: bcrypt is slow on purpose
+
+
+def _user(db: Session, email: str) -> Dict[str, Any]:
+    user = User(email=email, hashed_password=_password_hash(), is_active=True)
+    db.add(user)
+    db.commit()
+    sub = {"sub": str(user.id)}
+    return {
+        "id": str(user.id),
+        "email": email,
+        "headers": {"Authorization": f"Bearer {create_access_token(sub)}"},
+        "refresh": create_refresh_token(sub),
+    }
+
+
+def _seed(client: TestClient, db: Session) -> Dict[str, Any]:
+    owner = _user(db, "budget-owner@example.com")
+    bob = _user(db, "budget-bob@example.com")
+    h = owner["headers"]
+
+    def post(url: str, **kw) -> Dict[str, Any]:
+        r = client.post(url, headers=kw.pop("headers", h), **kw)
+        assert r.status_code < 400, f"seed {url}: {r.status_code} {r.text}"
+        return r.json()
+
+    s: Dict[str, Any] = {"owner": owner, "bob": bob}
+    s["wid"] = wid = post("/workspaces/", json={"name": "Budget"})["id"]
+    db.add(WorkspaceMember(workspace_id=wid, user_id=bob["id"], role="Member"))
+    db.commit()
+    s["sid"] = sid = post("/spaces/", json={"name": "S", "workspace_id": wid})["id"]
+    s["fid"] = fid = post("/folders/", json={"name": "F", "space_id": sid})["id"]
+    s["lid"] = lid = post(
+        "/lists/", json={"name": "L", "space_id": sid, "folder_id": fid}
+    )["id"]
+    task = {"list_id": lid, "space_id": sid}
+    s["t1"] = t1 = post("/tasks/", json={**task, "name": "one"})["id"]
+    s["t2"] = post("/tasks/", json={**task, "name": "two"})["id"]
+    s["sub"] = post(f"/tasks/{t1}/subtasks", json={**task, "name": "child"})["id"]
+    s["comment"] = post(f"/tasks/{t1}/comments", json={"body": "first"})["id"]
+    s["tag"] = tag = post(f"/workspaces/{wid}/tags", json={"name": "urgent"})["id"]
+    s["tag2"] = post(f"/workspaces/{wid}/tags", json={"name": "later"})["id"]
+    post(f"/tasks/{t1}/tags/{tag}")
+    s["cf"] = cf = post(
+        f"/workspaces/{wid}/custom-fields", json={"name": "Team", "field_type": "Text"}
+    )["id"]
+    post(f"/lists/{lid}/custom-fields/{cf}/enable")
+    s["view"] = post(
+        "/views", json={"name": "Open", "scope_type": "list", "scope_id": lid}
+    )["id"]
+    s["entry"] = post(f"/tasks/{t1}/time", json={"minutes": 30})["id"]
+    # bob's comment on a task the owner follows lands in the owner's inbox
+    post(f"/tasks/{t1}/comments", json={"body": "ping"}, headers=bob["headers"])
+    crud_notify.dispatch_all(db)
+    return s
+
+
+# --- one request per route -----------------------------------------------------
+
+# (client, seed) -> kwargs for client.request(). Untimed setup the request
+# depends on (a running timer, a finished job, ...) happens in here too.
+Call = Callable[[TestClient, Dict[str, Any]], Dict[str, Any]]
+
+CSV_BODY = "name,status\nimported,to_do\n"
+
+
+def _filter_payload(s: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "scope": {"workspace_id": s["wid"]},
+        "filters": [{"field": "status", "op": "in", "value": ["to_do", "done"]}],
+    }
+
+
+def _started(c: TestClient, s: Dict[str, Any], request: Dict[str, Any]):
+    r = c.post(f"/tasks/{s['t1']}/time/start", json={}, headers=s["owner"]["headers"])
+    assert r.status_code < 400, r.text
+    return request
+
+
+def _export_job(c: TestClient, s: Dict[str, Any]) -> str:
+    r = c.post(
+        f"/workspaces/{s['wid']}/tasks/export-jobs?format=csv",
+        json=_filter_payload(s),
+        headers=s["owner"]["headers"],
+    )
+    assert r.status_code == 202, r.text
+    return r.json()["id"]
+
+
+def _finished_export(c: TestClient, s: Dict[str, Any]) -> str:
+    job_id = _export_job(c, s)
+    assert run_next(lambda: Session(bind=s["db"].get_bind()), worker_id="budget")
+    s["db"].expire_all()
+    return job_id
+
+
+def _import(c: TestClient, s: Dict[str, Any]) -> str:
+    r = c.post(
+        f"/lists/{s['lid']}/tasks/import",
+        files={"file": ("tasks.csv", CSV_BODY, "text/csv")},
+        headers=s["owner"]["headers"],
+    )
+    assert r.status_code < 400, r.text
+    return r.json()["id"]
+
+
+def _notification_ids(c: TestClient, s: Dict[str, Any]) -> List[str]:
+    r = c.get("/me/notifications", headers=s["owner"]["headers"])
+    ids = [n["id"] for n in r.json()["notifications"]]
+    assert ids, "seed left no notification to mark"
+    return ids
+
+
+def _new_field(c: TestClient, s: Dict[str, Any]) -> str:
+    r = c.post(
+        f"/workspaces/{s['wid']}/custom-fields",
+        json={"name": "Size", "field_type": "Number"},
+        headers=s["owner"]["headers"],
+    )
+    return r.json()["id"]
+
+
+REQUESTS: Dict[Route, Call] = {
+    # auth
+    ("POST", "/auth/register"): lambda c, s: {
+        "url": "/auth/register",
+        "json": {"email": "budget-new@example.com", "password": PASSWORD},
+    },
+    ("POST", "/auth/login"): lambda c, s: {
+        "url": "/auth/login",
+        "json": {"email": s["owner"]["email"], "password": PASSWORD},
+    },
+    ("POST", "/auth/token"): lambda c, s: {
+        "url": "/auth/token",
+        "data": {"username": s["owner"]["email"], "password": PASSWORD},
+    },
+    ("GET", "/auth/protected"): lambda c, s: {"url": "/auth/protected"},
+    ("GET", "/auth/me"): lambda c, s: {"url": "/auth/me"},
+    ("POST", "/auth/refresh"): lambda c, s: {
+        "url": "/auth/refresh",
+        "json": {"refresh_token": s["owner"]["refresh"]},
+    },
+    # hierarchy
+    ("POST", "/workspaces/"): lambda c, s: {
+        "url": "/workspaces/",
+        "json": {"name": "W2"},
+    },
+    ("GET", "/workspaces/"): lambda c, s: {"url": "/workspaces/"},
+    ("GET", "/workspaces/{workspace_id}"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}"
+    },
+    ("POST", "/spaces/"): lambda c, s: {
+        "url": "/spaces/",
+        "json": {"name": "S2", "workspace_id": s["wid"]},
+    },
+    ("GET", "/spaces/by-workspace/{workspace_id}"): lambda c, s: {
+        "url": f"/spaces/by-workspace/{s['wid']}"
+    },
+    ("POST", "/folders/"): lambda c, s: {
+        "url": "/folders/",
+        "json": {"name": "F2", "space_id": s["sid"]},
+    },
+    ("GET", "/folders/by-space/{space_id}"): lambda c, s: {
+        "url": f"/folders/by-space/{s['sid']}"
+    },
+    ("POST", "/lists/"): lambda c, s: {
+        "url": "/lists/",
+        "json": {"name": "L2", "space_id": s["sid"]},
+    },
+    ("GET", "/lists/by-space/{space_id}"): lambda c, s: {
+        "url": f"/lists/by-space/{s['sid']}"
+    },
+    ("GET", "/lists/by-folder/{folder_id}"): lambda c, s: {
+        "url": f"/lists/by-folder/{s['fid']}"
+    },
+    # tasks
+    ("POST", "/tasks/"): lambda c, s: {
+        "url": "/tasks/",
+        "json": {"name": "three", "list_id": s["lid"], "space_id": s["sid"]},
+    },
+    ("GET", "/tasks/{task_id}"): lambda c, s: {"url": f"/tasks/{s['t1']}"},
+    ("GET", "/tasks/by-list/{list_id}"): lambda c, s: {
+        "url": f"/tasks/by-list/{s['lid']}"
+    },
+    ("POST", "/tasks:batchGet"): lambda c, s: {
+        "url": "/tasks:batchGet",
+        "params": {"include": "assignees,tags,custom_fields,watchers,subtask_counts"},
+        "json": {"ids": [s["t1"], s["t2"]]},
+    },
+    ("GET", "/tasks/by-list/{list_id}/search"): lambda c, s: {
+        "url": f"/tasks/by-list/{s['lid']}/search",
+        "params": {"sort": "name"},
+    },
+    ("PUT", "/tasks/{task_id}"): lambda c, s: {
+        "url": f"/tasks/{s['t2']}",
+        "json": {"status": "done"},
+    },
+    ("DELETE", "/tasks/{task_id}"): lambda c, s: {"url": f"/tasks/{s['t2']}"},
+    ("GET", "/tasks/{task_id}/dependencies"): lambda c, s: {
+        "url": f"/tasks/{s['t2']}/dependencies"
+    },
+    ("POST", "/tasks/{task_id}/subtasks"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/subtasks",
+        "json": {"name": "child 2", "list_id": s["lid"], "space_id": s["sid"]},
+    },
+    ("GET", "/tasks/{task_id}/subtasks"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/subtasks"
+    },
+    ("POST", "/tasks/{task_id}/move"): lambda c, s: {
+        "url": f"/tasks/{s['sub']}/move",
+        "json": {"new_parent_task_id": s["t2"]},
+    },
+    ("POST", "/tasks/{task_id}/comments"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/comments",
+        "json": {"body": "second"},
+    },
+    ("GET", "/tasks/{task_id}/comments"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/comments"
+    },
+    ("PUT", "/tasks/{task_id}/comments/{comment_id}"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/comments/{s['comment']}",
+        "json": {"body": "edited"},
+    },
+    ("DELETE", "/tasks/{task_id}/comments/{comment_id}"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/comments/{s['comment']}"
+    },
+    # tags
+    ("POST", "/workspaces/{workspace_id}/tags"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/tags",
+        "json": {"name": "new"},
+    },
+    ("GET", "/workspaces/{workspace_id}/tags"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/tags"
+    },
+    ("GET", "/tasks/{task_id}/tags"): lambda c, s: {"url": f"/tasks/{s['t1']}/tags"},
+    ("POST", "/tasks/{task_id}/tags/{tag_id}"): lambda c, s: {
+        "url": f"/tasks/{s['t2']}/tags/{s['tag']}"
+    },
+    ("DELETE", "/tasks/{task_id}/tags/{tag_id}"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/tags/{s['tag']}"
+    },
+    ("POST", "/tasks/{task_id}/tags:assign"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/tags:assign",
+        "json": {"tag_ids": [s["tag2"]]},
+    },
+    ("POST", "/tasks/{task_id}/tags:unassign"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/tags:unassign",
+        "json": {"tag_ids": [s["tag"]]},
+    },
+    ("GET", "/tags/{tag_id}/tasks"): lambda c, s: {"url": f"/tags/{s['tag']}/tasks"},
+    ("GET", "/workspaces/{workspace_id}/tasks/by-tags"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/tasks/by-tags",
+        "params": {"tag_ids": [s["tag"], s["tag2"]]},
+    },
+    # filter / export
+    ("POST", "/workspaces/{workspace_id}/tasks/filter"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/tasks/filter",
+        "json": _filter_payload(s),
+    },
+    ("POST", "/workspaces/{workspace_id}/tasks/export"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/tasks/export",
+        "params": {"format": "csv"},
+        "json": _filter_payload(s),
+    },
+    ("POST", "/workspaces/{workspace_id}/tasks/export-jobs"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/tasks/export-jobs",
+        "params": {"format": "csv"},
+        "json": _filter_payload(s),
+    },
+    # custom fields
+    ("POST", "/workspaces/{workspace_id}/custom-fields"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/custom-fields",
+        "json": {"name": "Size", "field_type": "Number"},
+    },
+    ("GET", "/workspaces/{workspace_id}/custom-fields"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/custom-fields"
+    },
+    ("POST", "/lists/{list_id}/custom-fields/{field_id}/enable"): lambda c, s: {
+        "url": f"/lists/{s['lid']}/custom-fields/{_new_field(c, s)}/enable"
+    },
+    ("PUT", "/tasks/{task_id}/custom-fields/{field_id}"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/custom-fields/{s['cf']}",
+        "json": {"value": "core"},
+    },
+    # watchers
+    ("GET", "/tasks/{task_id}/watchers"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/watchers"
+    },
+    ("POST", "/tasks/{task_id}/watch"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/watch",
+        "headers": s["bob"]["headers"],
+    },
+    ("DELETE", "/tasks/{task_id}/watch"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/watch"
+    },
+    # ops
+    ("GET", "/healthz"): lambda c, s: {"url": "/healthz"},
+    ("GET", "/readyz"): lambda c, s: {"url": "/readyz"},
+    ("GET", "/metrics"): lambda c, s: {"url": "/metrics"},
+    ("GET", "/admin/profiles"): lambda c, s: {"url": "/admin/profiles"},
+    ("GET", "/admin/profiles/{name}"): lambda c, s: {
+        "url": "/admin/profiles/seed.collapsed"
+    },
+    # views
+    ("GET", "/views"): lambda c, s: {
+        "url": "/views",
+        "params": {"scope_type": "list", "scope_id": s["lid"]},
+    },
+    ("POST", "/views"): lambda c, s: {
+        "url": "/views",
+        "json": {"name": "Mine", "scope_type": "list", "scope_id": s["lid"]},
+    },
+    ("GET", "/views/cache/stats"): lambda c, s: {"url": "/views/cache/stats"},
+    ("GET", "/views/{view_id}"): lambda c, s: {"url": f"/views/{s['view']}"},
+    ("PATCH", "/views/{view_id}"): lambda c, s: {
+        "url": f"/views/{s['view']}",
+        "json": {"name": "Renamed"},
+    },
+    ("DELETE", "/views/{view_id}"): lambda c, s: {"url": f"/views/{s['view']}"},
+    ("GET", "/views/{view_id}/tasks"): lambda c, s: {
+        "url": f"/views/{s['view']}/tasks"
+    },
+    # time tracking
+    ("POST", "/tasks/{task_id}/time/start"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/time/start",
+        "json": {},
+    },
+    ("POST", "/time/stop"): lambda c, s: _started(c, s, {"url": "/time/stop"}),
+    ("GET", "/time/running"): lambda c, s: _started(c, s, {"url": "/time/running"}),
+    ("POST", "/tasks/{task_id}/time"): lambda c, s: {
+        "url": f"/tasks/{s['t1']}/time",
+        "json": {"minutes": 15},
+    },
+    ("GET", "/tasks/{task_id}/time"): lambda c, s: {"url": f"/tasks/{s['t1']}/time"},
+    ("DELETE", "/time/{entry_id}"): lambda c, s: {"url": f"/time/{s['entry']}"},
+    ("POST", "/workspaces/{workspace_id}/time/import"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/time/import",
+        "json": {
+            "entries": [
+                {
+                    "task_id": s[t],
+                    "minutes": 45,
+                    "started_at": datetime(2025, 1, 2, 9, tzinfo=UTC).isoformat(),
+                }
+                for t in ("t1", "t2")
+            ]
+        },
+    },
+    ("GET", "/workspaces/{workspace_id}/time/report"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/time/report",
+        "params": {"start": "2020-01-01", "end": "2030-12-31", "group_by": "user,task"},
+    },
+    ("POST", "/workspaces/{workspace_id}/time/rollup:rebuild"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/time/rollup:rebuild"
+    },
+    ("POST", "/workspaces/{workspace_id}/time/rollup:rebuild-job"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/time/rollup:rebuild-job"
+    },
+    ("POST", "/workspaces/{workspace_id}/comments:recount-job"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/comments:recount-job"
+    },
+    # imports / jobs
+    ("POST", "/lists/{list_id}/tasks/import"): lambda c, s: {
+        "url": f"/lists/{s['lid']}/tasks/import",
+        "files": {"file": ("tasks.csv", CSV_BODY, "text/csv")},
+    },
+    ("POST", "/lists/{list_id}/tasks/import-jobs"): lambda c, s: {
+        "url": f"/lists/{s['lid']}/tasks/import-jobs",
+        "files": {"file": ("tasks.csv", CSV_BODY, "text/csv")},
+    },
+    ("GET", "/imports/{import_id}"): lambda c, s: {"url": f"/imports/{_import(c, s)}"},
+    ("GET", "/jobs"): lambda c, s: _export_job(c, s) and {"url": "/jobs"},
+    ("GET", "/jobs/{job_id}"): lambda c, s: {"url": f"/jobs/{_export_job(c, s)}"},
+    ("POST", "/jobs/{job_id}/cancel"): lambda c, s: {
+        "url": f"/jobs/{_export_job(c, s)}/cancel"
+    },
+    ("GET", "/jobs/{job_id}/download"): lambda c, s: {
+        "url": f"/jobs/{_finished_export(c, s)}/download"
+    },
+    # sync
+    ("GET", "/workspaces/{workspace_id}/changes/cursor"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/changes/cursor"
+    },
+    ("GET", "/workspaces/{workspace_id}/changes"): lambda c, s: {
+        "url": f"/workspaces/{s['wid']}/changes",
+        "params": {"since": 0},
+    },
+    # notifications
+    ("GET", "/me/notifications"): lambda c, s: {"url": "/me/notifications"},
+    ("GET", "/me/notifications/unread-count"): lambda c, s: {
+        "url": "/me/notifications/unread-count"
+    },
+    ("POST", "/me/notifications/read"): lambda c, s: {
+        "url": "/me/notifications/read",
+        "json": {"ids": _notification_ids(c, s)},
+    },
+    ("POST", "/me/notifications/read-all"): lambda c, s: {
+        "url": "/me/notifications/read-all"
+    },
+}
+
+BUDGETS = load_manifest()
+
+
+def test_manifest_covers_every_route():
+    routes = set(app_routes())
+    missing = sorted(routes - BUDGETS.keys())
+    stale = sorted(BUDGETS.keys() - routes)
+    assert not missing, "no budget in query_budgets.txt for:\n" + "\n".join(
+        f"  {m} {p}" for m, p in missing
+    )
+    assert not stale, "budgets for routes that no longer exist:\n" + "\n".join(
+        f"  {m} {p}" for m, p in stale
+    )
+    unmeasured = sorted(
+        r for r, b in BUDGETS.items() if b[0] != "skip" and r not in REQUESTS
+    )
+    assert not unmeasured, f"budgeted but no request to measure: {unmeasured}"
+
+
+@pytest.mark.parametrize(
+    "route",
+    [r for r, b in BUDGETS.items() if b[0] != "skip"],
+    ids=lambda r: f"{r[0]} {r[1]}",
+)
+def test_route_query_budget(
+    route: Route,
+    client: TestClient,
+    db_session: Session,
+    query_budget,
+    tmp_path,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "JOBS_DIR", str(tmp_path / "jobs"))
+    monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+    (tmp_path / "seed.collapsed").write_text("main;handler 1\n")
+    seed = _seed(client, db_session)
+    seed["db"] = db_session
+    monkeypatch.setattr(settings, "PROFILING_WORKSPACE_ID", seed["wid"])
+
+    method, path = route
+    request = REQUESTS[route](client, seed)
+    request.setdefault("headers", seed["owner"]["headers"])
+    get_view_cache().clear()
+    db_session.expire_all()  # nothing served from the seeding session's identity map
+    op, limit = BUDGETS[route]
+    with query_budget(limit, exact=op == "==", label=f"{method} {path}"):
+        r = client.request(method, **request)
+    assert r.status_code < 400, f"{method} {path}: {r.status_code} {r.text[:300]}"
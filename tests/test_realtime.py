@@ -0,0 +1,195 @@
+# File: /tests/test_realtime.py | Version: 1.1 | Title: Realtime broker, SSE framing and subscribe guards
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Dict
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.realtime.backends import Backend, LocalBackend, RedisBackend, make_backend
+from app.realtime.broker import Broker, channels_for
+from app.routers.realtime import event_frames
+
+WS, LIST_A, LIST_B = "ws-1", "list-a", "list-b"
+
+
+def _ev(seq: int, op: str, entity_id: str = "t1", **kw: Any) -> Dict[str, Any]:
+    return {
+        "seq": seq,
+        "workspace_id": WS,
+        "entity": kw.pop("entity", "task"),
+        "entity_id": entity_id,
+        "op": op,
+        "task_id": entity_id,
+        "list_id": kw.pop("list_id", LIST_A),
+        "data": kw.pop("data", {}),
+    }
+
+
+def test_fanout_coalescing_and_backpressure():
+    async def scenario():
+        broker = Broker(LocalBackend(), max_pending=3)
+        broker.start()
+        try:
+            ws_sub = broker.subscribe(f"workspace:{WS}")
+            a_sub = broker.subscribe(f"list:{LIST_A}")
+            b_sub = broker.subscribe(f"list:{LIST_B}")
+            assert broker.stats() == {"channels": 3, "connections": 3}
+
+            # a burst published from a worker thread, as commits are
+            burst = [
+                _ev(1, "created", data={"name": "x", "status": "to_do"}),
+                _ev(2, "updated", data={"status": "doing"}),
+                _ev(3, "updated", data={"status": "done"}),
+                _ev(4, "created", "c1", entity="comment", data={"body": "hi"}),
+            ]
+            t = threading.Thread(target=broker.publish, args=(burst,))
+            t.start()
+            t.join()
+
+            batch, overflowed = await a_sub.next_batch(1.0, coalesce=0.01)
+            assert not overflowed
+            # three task events collapse into one created event with the final state
+            assert [(e["entity"], e["op"], e["seq"]) for e in batch] == [
+                ("task", "created", 3),
+                ("comment", "created", 4),
+            ]
+            assert batch[0]["data"] == {"name": "x", "status": "done"}
+            assert len((await ws_sub.next_batch(1.0))[0]) == 2
+            assert await b_sub.next_batch(0.05) == (None, False)  # nothing for B
+
+            # a move reaches both the old and the new list
+            move = _ev(5, "moved", list_id=LIST_B, data={"from_list_id": LIST_A})
+            assert channels_for(move) == {
+                f"workspace:{WS}",
+                f"list:{LIST_A}",
+                "list:list-b",
+            }
+            broker.publish(
+                [move, _ev(6, "updated", list_id=LIST_B, data={"name": "y"})]
+            )
+            batch, _ = await a_sub.next_batch(1.0)
+            assert [(e["op"], e["seq"]) for e in batch] == [("moved", 5)]
+            # B also gets the follow-up edit, folded into the move
+            batch, _ = await b_sub.next_batch(1.0)
+            assert [(e["op"], e["seq"]) for e in batch] == [("moved", 6)]
+            assert batch[0]["data"] == {"from_list_id": LIST_A, "name": "y"}
+
+            # a slow consumer is told to resync instead of buffering forever
+            broker.publish([_ev(10 + i, "updated", f"t{i}") for i in range(5)])
+            assert await ws_sub.next_batch(1.0) == ([], True)
+            # replayed events (seq <= min_seq) are not sent twice
+            a_sub.min_seq = 20
+            broker.publish([_ev(20, "updated", "t9"), _ev(21, "updated", "t9")])
+            await a_sub.next_batch(1.0)  # drain leftovers of the overflow burst
+            broker.publish([_ev(22, "deleted", "t9")])
+            batch, _ = await a_sub.next_batch(1.0)
+            assert [e["seq"] for e in batch] == [22]
+
+            for sub in (ws_sub, a_sub, b_sub):
+                broker.unsubscribe(sub)
+            assert broker.stats() == {"channels": 0, "connections": 0}
+        finally:
+            broker.stop()
+        assert not broker.running
+
+    asyncio.run(scenario())
+
+
+def test_event_frames_replay_live_and_heartbeat():
+    async def scenario():
+        broker = Broker(LocalBackend())
+        broker.start()
+        sub = broker.subscribe(f"list:{LIST_A}")
+        frames = event_frames(
+            broker, sub, [_ev(1, "created")], heartbeat=0.05, coalesce=0
+        )
+        try:
+            assert await frames.__anext__() == "retry: 3000\n\n"
+            replayed = await frames.__anext__()
+            assert replayed.startswith("id: 1\nevent: task.created\ndata: {")
+            assert await frames.__anext__() == ": ping\n\n"
+            broker.publish([_ev(2, "deleted")])
+            assert (await frames.__anext__()).startswith("id: 2\nevent: task.deleted\n")
+        finally:
+            await frames.aclose()
+            broker.stop()
+        assert broker.stats()["connections"] == 0
+
+        # replay=None means the backlog was too old or too long
+        broker.start()
+        frames = event_frames(
+            broker, broker.subscribe("x"), None, heartbeat=1, coalesce=0
+        )
+        await frames.__anext__()
+        assert await frames.__anext__() == "event: resync\ndata: {}\n\n"
+        await frames.aclose()
+        broker.stop()
+
+    asyncio.run(scenario())
+
+
+def test_backend_selection():
+    assert isinstance(make_backend("local"), LocalBackend)
+    try:
+        make_backend("carrier-pigeon")
+    except ValueError as e:
+        assert "REALTIME_BACKEND" in str(e)
+    else:  # pragma: no cover
+        raise AssertionError("expected ValueError")
+
+
+def test_redis_publish_does_not_block_the_committing_thread():
+    with pytest.raises(TypeError):
+        Backend()  # abstract: publish must be implemented
+
+    release, sent = threading.Event(), []
+
+    class SlowRedis:
+        def publish(self, channel, data):
+            release.wait(5)  # a slow or unreachable server
+            sent.append((channel, data))
+
+    backend = RedisBackend("redis://unused", channel="c")
+    backend._client = SlowRedis()
+    backend._start_publisher()
+    backend.publish([{"seq": 1}])
+    backend.publish([{"seq": 2}])
+    assert sent == []  # returned without waiting on the network
+    release.set()
+    backend.stop()  # drains the outbox
+    assert [data for _, data in sent] == ['[{"seq": 1}]', '[{"seq": 2}]']
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> str:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return r.json()["access_token"]
+
+
+def test_subscribe_requires_workspace_role(client: TestClient):
+    owner = _auth_headers(_register_and_login(client, "live-owner@example.com"))
+    wid = client.post("/workspaces/", json={"name": "Live"}, headers=owner).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=owner
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=owner
+    ).json()["id"]
+    outsider = _auth_headers(_register_and_login(client, "live-out@example.com"))
+
+    assert client.get(f"/workspaces/{wid}/events").status_code == 401
+    assert client.get(f"/workspaces/{wid}/events", headers=outsider).status_code == 403
+    assert client.get(f"/lists/{lid}/events", headers=outsider).status_code == 403
+    missing = "00000000-0000-0000-0000-000000000000"
+    assert client.get(f"/lists/{missing}/events", headers=owner).status_code == 404
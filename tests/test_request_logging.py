@@ -0,0 +1,113 @@
+# File: /tests/test_request_logging.py | Version: 1.1 | Title: Request IDs, sampled access log and the queued JSON log pipeline
+from __future__ import annotations
+
+import json
+import logging
+import logging.handlers
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.logging import close_log_context, configure_logging, open_log_context
+
+
+def _access_records(caplog):
+    return [r for r in caplog.records if r.name == "app.access"]
+
+
+def test_access_log_carries_request_id_route_timing_and_user(
+    client: TestClient, caplog, monkeypatch
+):
+    client.post(
+        "/auth/register",
+        json={"email": "access@example.com", "password": "Passw0rd!"},
+    )
+    token = client.post(
+        "/auth/login", json={"email": "access@example.com", "password": "Passw0rd!"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}", "X-Request-ID": "req-42"}
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        r = client.get("/workspaces/", headers=headers)
+        assert r.headers["X-Request-ID"] == "req-42"
+        bad = client.get("/healthz", headers={"X-Request-ID": "no spaces\nplease"})
+    assert bad.headers["X-Request-ID"] != "no spaces\nplease"
+
+    (rec,) = _access_records(caplog)  # /healthz is sampled at 0 by default
+    assert rec.request_id == "req-42"
+    assert (rec.method, rec.route, rec.status) == ("GET", "/workspaces/", 200)
+    assert rec.duration_ms > 0 and rec.db_queries >= 1 and rec.db_ms is not None
+    assert rec.user_id and rec.sample_rate == 1.0
+
+    caplog.clear()
+    monkeypatch.setattr(settings, "ACCESS_LOG_SAMPLE_RATE", 0.0)
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        client.get("/workspaces/", headers=headers)
+        client.get("/healthz")
+    assert not _access_records(caplog)
+
+
+def test_streamed_bodies_run_inside_the_request_context(
+    client: TestClient, caplog, monkeypatch
+):
+    client.post(
+        "/auth/register",
+        json={"email": "stream-log@example.com", "password": "Passw0rd!"},
+    )
+    token = client.post(
+        "/auth/login",
+        json={"email": "stream-log@example.com", "password": "Passw0rd!"},
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    wid = client.post("/workspaces/", json={"name": "W"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    client.post(
+        "/tasks/", json={"name": "t", "list_id": lid, "space_id": sid}, headers=headers
+    )
+
+    caplog.clear()
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0.0)  # log every statement
+    with caplog.at_level(logging.INFO):
+        r = client.get(
+            f"/tasks/by-list/{lid}?stream=true",
+            headers={**headers, "X-Request-ID": "req-stream"},
+        )
+    assert r.status_code == 200 and len(r.text.splitlines()) == 1
+    # the NDJSON rows are read while the body is sent, still under the request ID
+    (streamed, *_) = [
+        rec
+        for rec in caplog.records
+        if rec.name == "app.sql.slow" and "ORDER BY task.created_at" in rec.sql
+    ]
+    assert streamed.request_id == "req-stream"
+    # and the access record is written once the body is complete
+    (rec,) = _access_records(caplog)
+    assert caplog.records.index(rec) > caplog.records.index(streamed)
+    assert (rec.request_id, rec.route, rec.status) == (
+        "req-stream",
+        "/tasks/by-list/{list_id}",
+        200,
+    )
+
+
+def test_records_are_queued_and_written_as_json(monkeypatch, capsys):
+    monkeypatch.setenv("LOG_JSON", "true")
+    monkeypatch.setenv("LOG_QUEUE", "true")
+    configure_logging()
+    assert isinstance(logging.getLogger().handlers[0], logging.handlers.QueueHandler)
+    token = open_log_context(request_id="r-1", user_id="u-1")
+    logging.getLogger("tests.queue").warning("queued %s", "line", extra={"k": 1})
+    close_log_context(token)
+
+    monkeypatch.undo()
+    configure_logging()  # stops (and drains) the JSON pipeline
+    lines = [json.loads(x) for x in capsys.readouterr().err.splitlines() if "{" in x]
+    (line,) = [x for x in lines if x.get("logger") == "tests.queue"]
+    assert line["message"] == "queued line"
+    assert (line["request_id"], line["user_id"], line["k"]) == ("r-1", "u-1", 1)
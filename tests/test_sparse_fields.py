@@ -0,0 +1,150 @@
+# File: /tests/test_sparse_fields.py | Version: 1.1 | Title: Sparse fieldsets (?fields=) on task list, search, filter, tag and view reads
+from __future__ import annotations
+
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.crud.view import create_view
+from app.schemas.view import ViewCreate
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def _seed(client: TestClient, headers) -> Dict[str, str]:
+    wid = client.post("/workspaces/", json={"name": "F"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    tids = [
+        client.post(
+            "/tasks/",
+            json={
+                "name": name,
+                "list_id": lid,
+                "space_id": sid,
+                "status": status,
+                "description": "x" * 500,
+            },
+            headers=headers,
+        ).json()["id"]
+        for name, status in (("one", "open"), ("two", "done"))
+    ]
+    tag = client.post(
+        f"/workspaces/{wid}/tags", json={"name": "t"}, headers=headers
+    ).json()
+    client.post(f"/tasks/{tids[0]}/tags/{tag['id']}", headers=headers)
+    return {"wid": wid, "lid": lid, "tids": tids, "tag_id": tag["id"]}
+
+
+def test_list_search_and_tag_reads_select_only_requested_columns(
+    client: TestClient, db_session: Session
+):
+    me = _register_and_login(client, "fields@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+    one, two = seed["tids"]
+
+    statements = []
+    engine = db_session.get_bind().engine
+
+    def _before(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+
+    url = f"/tasks/by-list/{seed['lid']}"
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        r = client.get(f"{url}?fields=name,status", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+    assert r.status_code == 200, r.text
+    assert sorted(r.json(), key=lambda t: t["name"]) == [
+        {"id": one, "name": "one", "status": "open"},
+        {"id": two, "name": "two", "status": "done"},
+    ]
+    assert not any("task.description" in s for s in statements)
+
+    # the projection is part of the ETag
+    sparse_tag = r.headers["etag"]
+    full = client.get(url, headers=headers)
+    assert "description" in full.json()[0] and full.headers["etag"] != sparse_tag
+    r = client.get(
+        f"{url}?fields=name,status", headers={**headers, "If-None-Match": sparse_tag}
+    )
+    assert r.status_code == 304
+
+    r = client.get(f"{url}?fields=name,secret", headers=headers)
+    assert r.status_code == 400 and "secret" in r.json()["detail"]
+
+    r = client.get(f"{url}/search?fields=name&sort=name&order=asc", headers=headers)
+    assert r.json()["items"] == [{"id": one, "name": "one"}, {"id": two, "name": "two"}]
+    assert r.json()["total"] == 2
+
+    r = client.get(f"/tags/{seed['tag_id']}/tasks?fields=status", headers=headers)
+    assert r.json() == [{"id": one, "status": "open"}]
+    r = client.get(
+        f"/workspaces/{seed['wid']}/tasks/by-tags",
+        params={"tag_ids": seed["tag_id"], "fields": "name,due_date"},
+        headers=headers,
+    )
+    assert r.json() == [{"id": one, "name": "one", "due_date": None}]
+
+
+def test_filter_and_view_reads_honour_fields(client: TestClient, db_session: Session):
+    me = _register_and_login(client, "fields-filter@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+    one, two = seed["tids"]
+
+    r = client.post(
+        f"/workspaces/{seed['wid']}/tasks/filter?fields=name&sort=name&order=asc",
+        json={"scope": {"list_id": seed["lid"]}, "group_by": "status"},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    groups = {g["group"]: g["tasks"] for g in r.json()["groups"]}
+    assert groups == {
+        "open": [{"id": one, "name": "one"}],
+        "done": [{"id": two, "name": "two"}],
+    }
+
+    view = create_view(
+        db_session,
+        owner_id=me["id"],
+        data=ViewCreate(
+            scope_type="list",
+            scope_id=seed["lid"],
+            name="Board",
+            columns_json=["name", "description"],
+        ),
+    )
+
+    def apply(fields=None):
+        params = {"fields": fields} if fields else {}
+        r = client.get(f"/views/{view.id}/tasks", params=params, headers=headers)
+        assert r.status_code == 200, r.text
+        return r.json()
+
+    assert set(apply()["items"][0]) == {"id", "name", "description"}
+    assert apply("status,tags")["items"] == [
+        {"id": one, "status": "open", "tags": ["t"]},
+        {"id": two, "status": "done", "tags": []},
+    ]
@@ -0,0 +1,98 @@
+# File: /tests/test_sql_timing.py | Version: 1.1 | Title: Per-request SQL stats (Server-Timing) + slow-query log with EXPLAIN
+from __future__ import annotations
+
+import logging
+import re
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.observability.sql import _explain, fingerprint
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def test_requests_report_db_time_and_slow_queries(
+    client: TestClient, monkeypatch, caplog
+):
+    me = _register_and_login(client, "timing@example.com")
+    headers = _auth_headers(me["token"])
+    wid = client.post("/workspaces/", json={"name": "T"}, headers=headers).json()["id"]
+
+    r = client.get(f"/spaces/by-workspace/{wid}", headers=headers)
+    timing = r.headers["server-timing"]
+    match = re.search(r'db;dur=([\d.]+);desc="(\d+) queries"', timing)
+    assert match and int(match.group(2)) >= 2  # auth user + membership + spaces
+    assert "db-slowest;dur=" in timing
+
+    # everything is "slow" and every slow SELECT gets its plan
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0.0)
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN_SAMPLE", 1.0)
+    with caplog.at_level(logging.WARNING, logger="app.sql.slow"):
+        client.get(f"/spaces/by-workspace/{wid}", headers=headers)
+    slow = [rec for rec in caplog.records if rec.name == "app.sql.slow"]
+    assert slow
+    spaces = next(rec for rec in slow if "FROM space" in rec.sql)
+    assert "?" in spaces.sql and wid not in spaces.sql
+    assert "space" in spaces.plan.lower()
+
+
+def test_streamed_responses_count_the_queries_behind_the_body(
+    client: TestClient, caplog
+):
+    me = _register_and_login(client, "timing-stream@example.com")
+    headers = _auth_headers(me["token"])
+    wid = client.post("/workspaces/", json={"name": "T"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG, logger="app.sql"):
+        r = client.get(f"/tasks/by-list/{lid}?stream=true", headers=headers)
+    # the header went out before the NDJSON rows were read; the log came after
+    started = int(re.search(r'desc="(\d+) queries"', r.headers["server-timing"])[1])
+    (rec,) = [rec for rec in caplog.records if rec.name == "app.sql"]
+    assert rec.db_queries > started
+
+
+def test_explain_failures_leave_the_transaction_usable():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+        assert "EXPLAIN failed" in _explain(conn, "SELECT * FROM missing", ())
+        assert "t" in _explain(conn, "SELECT id FROM t WHERE id = ?", (1,))
+        conn.execute(text("INSERT INTO t VALUES (2)"))
+        assert conn.in_transaction()
+    with engine.connect() as conn:
+        assert conn.scalar(text("SELECT count(*) FROM t")) == 2
+
+
+def test_fingerprint_strips_literals_and_in_lists():
+    sql = (
+        "SELECT task.id FROM task WHERE task.name = 'x''y' AND task.id IN (?, ?, ?)"
+        "\n  LIMIT 20 OFFSET :offset"
+    )
+    assert fingerprint(sql) == (
+        "SELECT task.id FROM task WHERE task.name = ? AND task.id IN (...) "
+        "LIMIT ? OFFSET ?"
+    )
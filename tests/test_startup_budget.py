@@ -0,0 +1,89 @@
+# File: /tests/test_startup_budget.py
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+
+from app.core.config import Settings
+from app.routers.registry import ROUTERS, RouterSpec, enabled_specs, include_routers
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Wall-clock, so opt-in: cold imports vary too much across runners to gate on.
+# Set e.g. IMPORT_TIME_BUDGET_MS=2500 to enforce it locally.
+IMPORT_BUDGET_MS = os.getenv("IMPORT_TIME_BUDGET_MS")
+
+# Heavy modules that must stay off the import path of app.main
+DEFERRED_MODULES = ("passlib", "bcrypt", "jose", "cryptography", "sentry_sdk")
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, SENTRY_DSN="", PYTHONPATH=str(ROOT))
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def test_registry_has_no_missing_modules():
+    import importlib.util
+
+    for spec in ROUTERS:
+        assert importlib.util.find_spec(spec.module) is not None, spec.module
+    names = [s.name for s in ROUTERS]
+    assert len(names) == len(set(names))
+
+
+def test_enabled_specs_respects_flags_and_disabled_list():
+    cfg = Settings(ASYNC_DB_ENABLED=False, DISABLED_ROUTERS="views, watchers")
+    names = [s.name for s in enabled_specs(config=cfg)]
+    assert "task_async" not in names
+    assert "views" not in names and "watchers" not in names
+    assert "task" in names
+
+    cfg = Settings(ASYNC_DB_ENABLED=True)
+    names = [s.name for s in enabled_specs(config=cfg)]
+    assert names[0] == "task_async"  # must shadow the sync routes
+
+
+def test_include_routers_mounts_only_enabled():
+    app = FastAPI()
+    specs = (
+        RouterSpec("health", "app.routers.health"),
+        RouterSpec("views", "app.routers.views", enabled_by="NOT_A_FLAG"),
+    )
+    assert include_routers(app, specs, config=Settings()) == ["health"]
+    paths = {r.path for r in app.routes}
+    assert "/healthz" in paths and "/views" not in paths
+
+
+def test_app_import_defers_heavy_modules():
+    probe = (
+        "import sys, app.main; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    r = _run(probe)
+    assert r.returncode == 0, r.stderr
+    assert r.stdout.strip() == "", f"imported at startup: {r.stdout.strip()}"
+
+
+@pytest.mark.skipif(not IMPORT_BUDGET_MS, reason="set IMPORT_TIME_BUDGET_MS to enforce")
+def test_app_import_time_budget():
+    budget_ms = int(IMPORT_BUDGET_MS)
+    r = _run("import app.main", "-X", "importtime")
+    assert r.returncode == 0, r.stderr
+    # "import time: self [us] | cumulative | imported package"
+    m = re.search(r"\|\s*(\d+)\s*\|\s*app\.main\s*$", r.stderr, re.MULTILINE)
+    assert m, r.stderr[-2000:]
+    cumulative_ms = int(m.group(1)) / 1000
+    assert cumulative_ms <= budget_ms, (
+        f"import app.main took {cumulative_ms:.0f}ms (budget {budget_ms}ms)"
+    )
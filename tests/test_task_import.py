@@ -0,0 +1,299 @@
+# File: /tests/test_task_import.py | Version: 1.1 | Title: Bulk task import (API, resume, CLI)
+from __future__ import annotations
+
+import argparse
+import io
+import json
+from typing import Dict
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.cli import import_tasks as cli
+from app.crud import task_import as crud_import
+from app.jobs.registry import JobCancelled, JobLeaseLost
+from app.models.core_entities import Tag, Task, TaskAssignee, TaskTag
+from app.models.custom_fields import CustomFieldValue
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(
+    client: TestClient, email: str, password: str = "Passw0rd!"
+) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": password, "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": password})
+    assert r.status_code == 200, r.text
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def _seed(client: TestClient, headers) -> Dict[str, str]:
+    wid = client.post("/workspaces/", json={"name": "Imp"}, headers=headers).json()[
+        "id"
+    ]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    client.post(f"/workspaces/{wid}/tags", json={"name": "existing"}, headers=headers)
+    client.post(
+        f"/workspaces/{wid}/custom-fields",
+        json={"name": "Estimate", "field_type": "Number"},
+        headers=headers,
+    )
+    return {"wid": wid, "lid": lid}
+
+
+CSV_BODY = (
+    "name,status,due_date,tags,assignees,cf:Estimate\n"
+    "Alpha,done,2026-01-05,existing;fresh,import-owner@example.com,3\n"
+    ",to_do,,,,\n"  # row 2: no name
+    "Gamma,,not-a-date,,,\n"  # row 3: bad date
+    "Delta,,,fresh,nobody@example.com,\n"  # row 4: unknown assignee
+    "Epsilon,,,,,2.5\n"
+)
+
+
+def test_csv_import_maps_columns_and_reports_errors(client: TestClient, db_session):
+    me = _register_and_login(client, "import-owner@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+
+    r = client.post(
+        f"/lists/{seed['lid']}/tasks/import?chunk_size=2",
+        files={"file": ("tasks.csv", CSV_BODY, "text/csv")},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    job = r.json()
+    assert job["status"] == "completed" and job["format"] == "csv"
+    assert (job["rows_processed"], job["rows_imported"], job["rows_failed"]) == (
+        5,
+        2,
+        3,
+    )
+    assert [e["row"] for e in job["errors"]] == [2, 3, 4]
+    assert "nobody@example.com" in job["errors"][2]["error"]
+
+    tasks = {t.name: t for t in db_session.query(Task).filter_by(list_id=seed["lid"])}
+    assert set(tasks) == {"Alpha", "Epsilon"}
+    alpha = tasks["Alpha"]
+    assert alpha.status == "done" and alpha.due_date is not None
+    assert tasks["Epsilon"].status == "to_do"
+
+    tag_names = {
+        tag.name
+        for tag in db_session.query(Tag)
+        .join(TaskTag, TaskTag.tag_id == Tag.id)
+        .filter(TaskTag.task_id == alpha.id)
+    }
+    assert tag_names == {"existing", "fresh"}
+    # "fresh" was created once for the workspace
+    assert db_session.query(Tag).filter_by(workspace_id=seed["wid"]).count() == 2
+    assert [
+        a.user_id for a in db_session.query(TaskAssignee).filter_by(task_id=alpha.id)
+    ] == [me["id"]]
+    values = {
+        v.task_id: v.value["value"] for v in db_session.query(CustomFieldValue).all()
+    }
+    assert values[alpha.id] == 3 and values[tasks["Epsilon"].id] == 2.5
+
+    r = client.get(f"/imports/{job['id']}", headers=headers)
+    assert r.status_code == 200 and r.json()["rows_failed"] == 3
+
+    # completed imports cannot be resumed
+    r = client.post(
+        f"/lists/{seed['lid']}/tasks/import?import_id={job['id']}",
+        files={"file": ("tasks.csv", CSV_BODY, "text/csv")},
+        headers=headers,
+    )
+    assert r.status_code == 409
+
+
+def test_ndjson_import_and_access(client: TestClient):
+    me = _register_and_login(client, "import-nd@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+    lines = [
+        json.dumps(
+            {
+                "name": "From export",
+                "tags": ["a", "b"],
+                "assignee_ids": [me["id"]],
+                "custom_fields": {"Estimate": 5},
+                "id": "ignored",
+            }
+        ),
+        "{not json",
+        "",
+        json.dumps(["not", "an", "object"]),
+        json.dumps({"name": "Bad field", "cf:Unknown": "x"}),
+    ]
+    r = client.post(
+        f"/lists/{seed['lid']}/tasks/import",
+        files={"file": ("tasks.ndjson", "\n".join(lines), "application/x-ndjson")},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    job = r.json()
+    assert job["format"] == "ndjson"
+    assert (job["rows_imported"], job["rows_failed"]) == (1, 3)
+    assert "unknown custom field" in job["errors"][-1]["error"]
+
+    outsider = _register_and_login(client, "import-outsider@example.com")
+    out_headers = _auth_headers(outsider["token"])
+    r = client.post(
+        f"/lists/{seed['lid']}/tasks/import",
+        files={"file": ("t.csv", "name\nX\n", "text/csv")},
+        headers=out_headers,
+    )
+    assert r.status_code == 403
+    assert client.get(f"/imports/{job['id']}", headers=out_headers).status_code == 403
+    missing = "00000000-0000-0000-0000-000000000000"
+    assert client.get(f"/imports/{missing}", headers=headers).status_code == 404
+
+
+class _CrashingStream(io.StringIO):
+    """Raises after `fail_after` lines, like a connection dropping mid-upload."""
+
+    def __init__(self, text: str, fail_after: int):
+        super().__init__(text)
+        self.left = fail_after
+
+    def __next__(self):
+        if self.left == 0:
+            raise RuntimeError("stream interrupted")
+        self.left -= 1
+        return super().__next__()
+
+
+def test_interrupted_import_resumes_from_checkpoint(client: TestClient, db_session):
+    me = _register_and_login(client, "import-resume@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers)
+    body = "name\n" + "".join(f"Task {i}\n" for i in range(10))
+
+    job = crud_import.create_import(
+        db_session,
+        workspace_id=seed["wid"],
+        list_id=seed["lid"],
+        user_id=me["id"],
+        fmt="csv",
+    )
+    # header + 7 data rows readable -> chunks of 3 commit rows 1..6 only
+    with pytest.raises(RuntimeError):
+        crud_import.run_import(
+            db_session, job=job, stream=_CrashingStream(body, 8), chunk_size=3
+        )
+    db_session.refresh(job)
+    assert job.status == "failed" and job.rows_processed == 6
+    assert db_session.query(Task).filter_by(list_id=seed["lid"]).count() == 6
+
+    r = client.post(
+        f"/lists/{seed['lid']}/tasks/import?import_id={job.id}&chunk_size=3",
+        files={"file": ("tasks.csv", body, "text/csv")},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["status"] == "completed"
+    assert r.json()["rows_processed"] == 10 and r.json()["rows_imported"] == 10
+    names = sorted(
+        t.name for t in db_session.query(Task).filter_by(list_id=seed["lid"])
+    )
+    assert names == sorted(f"Task {i}" for i in range(10))
+
+
+def _raise_after_first_chunk(exc: Exception):
+    def on_chunk(_job):
+        raise exc
+
+    return on_chunk
+
+
+def test_cancelled_import_is_recorded_as_cancelled(client: TestClient, db_session):
+    me = _register_and_login(client, "import-cancel@example.com")
+    seed = _seed(client, _auth_headers(me["token"]))
+    job = crud_import.create_import(
+        db_session,
+        workspace_id=seed["wid"],
+        list_id=seed["lid"],
+        user_id=me["id"],
+        fmt="csv",
+    )
+    body = "name\n" + "".join(f"Task {i}\n" for i in range(6))
+    with pytest.raises(JobCancelled):
+        crud_import.run_import(
+            db_session,
+            job=job,
+            stream=io.StringIO(body),
+            chunk_size=3,
+            on_chunk=_raise_after_first_chunk(JobCancelled()),
+        )
+    db_session.refresh(job)
+    assert job.status == "cancelled" and job.rows_processed == 3
+    assert not job.errors
+
+
+def test_lost_lease_leaves_import_row_untouched(client: TestClient, db_session):
+    me = _register_and_login(client, "import-lease@example.com")
+    seed = _seed(client, _auth_headers(me["token"]))
+    job = crud_import.create_import(
+        db_session,
+        workspace_id=seed["wid"],
+        list_id=seed["lid"],
+        user_id=me["id"],
+        fmt="csv",
+    )
+    body = "name\n" + "".join(f"Task {i}\n" for i in range(6))
+    with pytest.raises(JobLeaseLost):
+        crud_import.run_import(
+            db_session,
+            job=job,
+            stream=io.StringIO(body),
+            chunk_size=3,
+            on_chunk=_raise_after_first_chunk(JobLeaseLost()),
+        )
+    db_session.refresh(job)
+    # the new lease owner resumes from the committed checkpoint
+    assert job.status == "running" and job.finished_at is None
+    assert job.rows_processed == 3 and not job.errors
+
+
+def test_cli_import_writes_error_report(
+    client: TestClient, db_session, tmp_path, capsys
+):
+    me = _register_and_login(client, "import-cli@example.com")
+    seed = _seed(client, _auth_headers(me["token"]))
+    src = tmp_path / "tasks.csv"
+    src.write_text("name,priority\nOne,high\n,low\nTwo,\n", encoding="utf-8")
+    report = tmp_path / "errors.csv"
+
+    args = cli._parser().parse_args(
+        [
+            str(src),
+            "--list-id",
+            seed["lid"],
+            "--user",
+            "IMPORT-CLI@example.com",
+            "--errors",
+            str(report),
+        ]
+    )
+    assert cli.run(args, db_session) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["rows_imported"] == 2 and summary["rows_failed"] == 1
+    assert report.read_text().splitlines() == ["row,error", "2,name is required"]
+
+    bad = argparse.Namespace(**{**vars(args), "user": "stranger@example.com"})
+    assert cli.run(bad, db_session) == 2
+    bad = argparse.Namespace(**{**vars(args), "resume": "nope"})
+    assert cli.run(bad, db_session) == 2
@@ -0,0 +1,118 @@
+# File: /tests/test_tasks_batch_get.py | Version: 1.1 | Title: POST /tasks:batchGet (many tasks + related data in one call)
+from __future__ import annotations
+
+from typing import Dict
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def _workspace_with_list(client: TestClient, headers, name: str) -> Dict[str, str]:
+    wid = client.post("/workspaces/", json={"name": name}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    return {"wid": wid, "sid": sid, "lid": lid}
+
+
+def test_batch_get_returns_readable_tasks_with_includes(
+    client: TestClient, db_session: Session, monkeypatch, query_budget
+):
+    me = _register_and_login(client, "batch@example.com")
+    headers = _auth_headers(me["token"])
+    other = _register_and_login(client, "batch-other@example.com")
+    other_headers = _auth_headers(other["token"])
+
+    # my tasks live in two workspaces; the third task is someone else's
+    a = _workspace_with_list(client, headers, "A")
+    b = _workspace_with_list(client, headers, "B")
+    hidden = _workspace_with_list(client, other_headers, "Hidden")
+
+    def _task(scope, hdrs, name, **extra):
+        r = client.post(
+            "/tasks/",
+            json={
+                "name": name,
+                "list_id": scope["lid"],
+                "space_id": scope["sid"],
+                **extra,
+            },
+            headers=hdrs,
+        )
+        assert r.status_code == 200, r.text
+        return r.json()["id"]
+
+    t1 = _task(a, headers, "one", assignee_ids=[me["id"]])
+    t2 = _task(b, headers, "two")
+    secret = _task(hidden, other_headers, "secret")
+    _task(a, headers, "child", parent_task_id=t1)
+    tag_id = client.post(
+        f"/workspaces/{a['wid']}/tags", json={"name": "urgent"}, headers=headers
+    ).json()["id"]
+    client.post(f"/tasks/{t1}/tags/{tag_id}", headers=headers)
+    client.post(f"/tasks/{t1}/watch", headers=headers)
+    field_id = client.post(
+        f"/workspaces/{a['wid']}/custom-fields",
+        json={"name": "Team", "field_type": "text"},
+        headers=headers,
+    ).json()["id"]
+    client.post(f"/lists/{a['lid']}/custom-fields/{field_id}/enable", headers=headers)
+    client.put(
+        f"/tasks/{t1}/custom-fields/{field_id}", json={"value": "Eng"}, headers=headers
+    )
+
+    unknown = "00000000-0000-0000-0000-000000000000"
+    # auth user + tasks/access + one per include (tags ride along with task_tag)
+    with query_budget(7):
+        r = client.post(
+            "/tasks:batchGet",
+            params={"include": "assignees,tags,custom_fields,watchers,subtask_counts"},
+            json={"ids": [t2, secret, t1, unknown]},
+            headers=headers,
+        )
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert [t["id"] for t in body["tasks"]] == [t2, t1]  # request order
+    assert sorted(body["missing"]) == sorted([secret, unknown])
+    one = body["tasks"][1]
+    assert one["assignee_ids"] == [me["id"]]
+    assert [t["name"] for t in one["tags"]] == ["urgent"]
+    assert one["custom_fields"] == {"Team": "Eng"}
+    assert one["watcher_ids"] == [me["id"]]
+    assert one["subtask_count"] == 1
+    assert body["tasks"][0]["subtask_count"] == 0
+
+    # without include the tasks come back bare
+    r = client.post("/tasks:batchGet", json={"ids": [t1]}, headers=headers)
+    assert "tags" not in r.json()["tasks"][0]
+
+    r = client.post(
+        "/tasks:batchGet",
+        params={"include": "nope"},
+        json={"ids": [t1]},
+        headers=headers,
+    )
+    assert r.status_code == 400
+    monkeypatch.setattr(settings, "TASK_BATCH_MAX", 1)
+    r = client.post("/tasks:batchGet", json={"ids": [t1, t2]}, headers=headers)
+    assert r.status_code == 400
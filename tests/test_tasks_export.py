@@ -0,0 +1,166 @@
+# File: /tests/test_tasks_export.py | Version: 1.0 | Title: Streaming NDJSON/CSV task export
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Dict
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(
+    client: TestClient, email: str, password: str = "Passw0rd!"
+) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": password, "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": password})
+    assert r.status_code == 200, r.text
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def _seed(client: TestClient, headers, user_id: str, n_tasks: int) -> Dict[str, str]:
+    wid = client.post("/workspaces/", json={"name": "Exp"}, headers=headers).json()[
+        "id"
+    ]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    tag_id = client.post(
+        f"/workspaces/{wid}/tags", json={"name": "urgent"}, headers=headers
+    ).json()["id"]
+    field_id = client.post(
+        f"/workspaces/{wid}/custom-fields",
+        json={"name": "Estimate", "field_type": "Number"},
+        headers=headers,
+    ).json()["id"]
+
+    ids = []
+    for i in range(n_tasks):
+        r = client.post(
+            "/tasks/",
+            json={
+                "name": f"Task {i:02d}",
+                "status": "done" if i % 2 else "to_do",
+                "list_id": lid,
+                "space_id": sid,
+                "assignee_ids": [user_id] if i % 3 == 0 else [],
+            },
+            headers=headers,
+        )
+        assert r.status_code == 200, r.text
+        ids.append(r.json()["id"])
+
+    client.post(f"/tasks/{ids[0]}/tags/{tag_id}", headers=headers)
+    client.put(
+        f"/tasks/{ids[0]}/custom-fields/{field_id}",
+        json={"value": 8},
+        headers=headers,
+    )
+    return {"wid": wid, "sid": sid, "lid": lid, "first": ids[0]}
+
+
+def test_export_ndjson_streams_all_rows_in_chunks(client: TestClient, monkeypatch):
+    me = _register_and_login(client, "export-ndjson@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers, me["id"], n_tasks=7)
+
+    # chunk size smaller than the result forces several partitions
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 3)
+    r = client.post(
+        f"/workspaces/{seed['wid']}/tasks/export?format=ndjson&sort=name&order=asc",
+        json={"scope": {"workspace_id": seed["wid"]}, "limit": 1},
+        headers=headers,
+    )
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in r.text.splitlines()]
+
+    # limit is ignored for exports; order follows sort
+    assert [row["name"] for row in rows] == [f"Task {i:02d}" for i in range(7)]
+    first = rows[0]
+    assert first["id"] == seed["first"]
+    assert first["assignee_ids"] == [me["id"]]
+    assert first["tags"] == ["urgent"]
+    assert first["custom_fields"] == {"Estimate": 8}
+    assert rows[1]["assignee_ids"] == [] and rows[1]["custom_fields"] == {}
+
+    # filters reuse the filter endpoint's predicates
+    r = client.post(
+        f"/workspaces/{seed['wid']}/tasks/export",
+        json={
+            "scope": {"list_id": seed["lid"]},
+            "filters": [{"field": "status", "op": "eq", "value": "done"}],
+        },
+        headers=headers,
+    )
+    assert r.status_code == 200
+    assert len(r.text.splitlines()) == 3
+
+
+def test_export_csv_has_cf_columns(client: TestClient):
+    me = _register_and_login(client, "export-csv@example.com")
+    headers = _auth_headers(me["token"])
+    seed = _seed(client, headers, me["id"], n_tasks=2)
+
+    r = client.post(
+        f"/workspaces/{seed['wid']}/tasks/export?format=csv",
+        json={"scope": {"workspace_id": seed["wid"]}},
+        headers=headers,
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
+    assert "attachment" in r.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(r.text)))
+    assert len(rows) == 2
+    by_id = {row["id"]: row for row in rows}
+    first = by_id[seed["first"]]
+    assert first["tags"] == "urgent"
+    assert first["assignee_ids"] == me["id"]
+    assert first["cf:Estimate"] == "8"
+
+
+def test_export_guards(client: TestClient):
+    owner = _register_and_login(client, "export-owner@example.com")
+    seed = _seed(client, _auth_headers(owner["token"]), owner["id"], n_tasks=1)
+    other = _register_and_login(client, "export-other@example.com")
+    other_headers = _auth_headers(other["token"])
+    other_wid = client.post(
+        "/workspaces/", json={"name": "Mine"}, headers=other_headers
+    ).json()["id"]
+
+    url = f"/workspaces/{seed['wid']}/tasks/export"
+    body = {"scope": {"workspace_id": seed["wid"]}}
+    assert client.post(url, json=body, headers=other_headers).status_code == 403
+
+    # a narrower scope from another workspace yields nothing
+    r = client.post(
+        f"/workspaces/{other_wid}/tasks/export",
+        json={"scope": {"list_id": seed["lid"]}},
+        headers=other_headers,
+    )
+    assert r.status_code == 200 and r.text == ""
+
+    r = client.post(
+        f"/workspaces/{other_wid}/tasks/export",
+        json=body,
+        headers=other_headers,
+    )
+    assert r.status_code == 400
+    r = client.post(
+        f"{url}?format=xml", json=body, headers=_auth_headers(owner["token"])
+    )
+    assert r.status_code == 422
@@ -0,0 +1,263 @@
+from datetime import UTC, date, datetime, timedelta
+from typing import Dict, Tuple
+
+from sqlalchemy import create_mock_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.crud import time_tracking as crud_time
+from app.models.core_entities import TimeEntry
+from app.models.time_tracking import TimeEntryDaily
+
+
+def _register(
+    client, email: str, password: str = "Passw0rd!", full_name: str = "Test User"
+):
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": password, "full_name": full_name},
+    )
+    assert r.status_code in (200, 201), r.text
+    return r.json()
+
+
+def _login_token(client, email: str, password: str = "Passw0rd!") -> str:
+    r = client.post(
+        "/auth/token",
+        data={"username": email, "password": password, "grant_type": "password"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    if r.status_code == 200 and "access_token" in r.json():
+        return r.json()["access_token"]
+    r = client.post("/auth/login", json={"username": email, "password": password})
+    assert r.status_code == 200 and "access_token" in r.json(), r.text
+    return r.json()["access_token"]
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _bootstrap(client, headers) -> Tuple[str, str, str, str, str]:
+    r = client.post("/workspaces/", json={"name": "W"}, headers=headers)
+    wid = r.json()["id"]
+    r = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    )
+    sid = r.json()["id"]
+    r = client.post("/lists/", json={"name": "L", "space_id": sid}, headers=headers)
+    lid = r.json()["id"]
+    tids = []
+    for name in ("T1", "T2"):
+        r = client.post(
+            "/tasks/",
+            json={"name": name, "list_id": lid, "space_id": sid},
+            headers=headers,
+        )
+        tids.append(r.json()["id"])
+    return wid, sid, lid, tids[0], tids[1]
+
+
+def _rollup(db_session, wid):
+    rows = db_session.execute(
+        select(
+            TimeEntryDaily.user_id,
+            TimeEntryDaily.task_id,
+            TimeEntryDaily.day,
+            TimeEntryDaily.minutes,
+        ).where(TimeEntryDaily.workspace_id == wid)
+    ).all()
+    return sorted(tuple(r) for r in rows)
+
+
+def test_timer_start_stop_and_conflict(client, db_session):
+    _register(client, "timer@example.com")
+    headers = _auth_headers(_login_token(client, "timer@example.com"))
+    wid, _, _, t1, t2 = _bootstrap(client, headers)
+
+    r = client.post(
+        f"/tasks/{t1}/time/start", json={"note": "deep work"}, headers=headers
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["ended_at"] is None and r.json()["note"] == "deep work"
+
+    # one running timer per user
+    r = client.post(f"/tasks/{t2}/time/start", headers=headers)
+    assert r.status_code == 409 and t1 in r.json()["detail"]
+
+    r = client.get("/time/running", headers=headers)
+    assert r.status_code == 200 and r.json()["task_id"] == t1
+
+    r = client.post("/time/stop", headers=headers)
+    assert r.status_code == 200 and r.json()["ended_at"] is not None
+    user_id = r.json()["user_id"]
+    assert client.get("/time/running", headers=headers).json() is None
+    assert client.post("/time/stop", headers=headers).status_code == 404
+    # the sub-minute timer above contributes nothing to the rollup
+    assert _rollup(db_session, wid) == []
+
+    started = datetime(2026, 3, 2, 9, 0, tzinfo=UTC)
+    crud_time.start_timer(db_session, task_id=t2, user_id=user_id, now=started)
+    stopped = crud_time.stop_timer(
+        db_session, user_id=user_id, now=started + timedelta(minutes=90)
+    )
+    assert stopped.minutes == 90
+    assert _rollup(db_session, wid) == [(user_id, t2, date(2026, 3, 2), 90)]
+
+
+def test_manual_entries_report_and_delete(client, db_session):
+    _register(client, "manual@example.com")
+    headers = _auth_headers(_login_token(client, "manual@example.com"))
+    wid, _, lid, t1, t2 = _bootstrap(client, headers)
+
+    for tid, minutes, when in (
+        (t1, 30, "2026-01-05T10:00:00Z"),
+        (t1, 45, "2026-01-05T14:00:00Z"),
+        (t2, 60, "2026-01-06T09:00:00Z"),
+    ):
+        r = client.post(
+            f"/tasks/{tid}/time",
+            json={"minutes": minutes, "started_at": when},
+            headers=headers,
+        )
+        assert r.status_code == 200, r.text
+    last_id = r.json()["id"]
+
+    r = client.get(f"/tasks/{t1}/time", headers=headers)
+    assert r.status_code == 200 and len(r.json()) == 2
+
+    base = f"/workspaces/{wid}/time/report?start=2026-01-01&end=2026-01-31"
+    r = client.get(f"{base}&group_by=task", headers=headers)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["total_minutes"] == 135
+    assert {row["task_id"]: row["minutes"] for row in body["rows"]} == {
+        t1: 75,
+        t2: 60,
+    }
+
+    r = client.get(f"{base}&group_by=list,day", headers=headers)
+    assert [
+        (row["list_id"], row["day"], row["minutes"]) for row in r.json()["rows"]
+    ] == [
+        (lid, "2026-01-05", 75),
+        (lid, "2026-01-06", 60),
+    ]
+
+    # range and filters narrow the sum
+    r = client.get(
+        f"/workspaces/{wid}/time/report?start=2026-01-06&end=2026-01-06&group_by=",
+        headers=headers,
+    )
+    assert r.json()["rows"] == [
+        {"user_id": None, "task_id": None, "list_id": None, "day": None, "minutes": 60}
+    ]
+    r = client.get(f"{base}&group_by=user&task_id={t1}", headers=headers)
+    assert r.json()["total_minutes"] == 75
+
+    assert client.get(f"{base}&group_by=project", headers=headers).status_code == 422
+    r = client.get(
+        f"/workspaces/{wid}/time/report?start=2026-02-01&end=2026-01-01",
+        headers=headers,
+    )
+    assert r.status_code == 422
+
+    # deleting the only entry of a day drops its rollup row
+    r = client.delete(f"/time/{last_id}", headers=headers)
+    assert r.status_code == 200
+    assert [row[2] for row in _rollup(db_session, wid)] == [date(2026, 1, 5)]
+    assert client.delete(f"/time/{last_id}", headers=headers).status_code == 404
+
+
+def test_bulk_import_matches_rebuilt_rollup(client, db_session):
+    _register(client, "bulk@example.com")
+    headers = _auth_headers(_login_token(client, "bulk@example.com"))
+    wid, _, _, t1, t2 = _bootstrap(client, headers)
+
+    start = datetime(2025, 1, 1, 8, 0, tzinfo=UTC)
+    entries = [
+        {
+            "task_id": (t1, t2)[i % 2],
+            "minutes": 15 + (i % 4) * 15,
+            "started_at": (start + timedelta(hours=7 * i)).isoformat(),
+        }
+        for i in range(1200)  # ~a year of entries
+    ]
+    r = client.post(
+        f"/workspaces/{wid}/time/import", json={"entries": entries}, headers=headers
+    )
+    assert r.status_code == 200, r.text
+    assert r.json() == {"imported": 1200}
+
+    expected_total = sum(e["minutes"] for e in entries)
+    r = client.get(
+        f"/workspaces/{wid}/time/report?start=2025-01-01&end=2026-12-31&group_by=user",
+        headers=headers,
+    )
+    assert r.json()["total_minutes"] == expected_total
+    assert len(r.json()["rows"]) == 1
+
+    incremental = _rollup(db_session, wid)
+    r = client.post(f"/workspaces/{wid}/time/rollup:rebuild", headers=headers)
+    assert r.status_code == 200 and r.json()["rows"] == len(incremental)
+    assert _rollup(db_session, wid) == incremental
+
+    # importing again folds into existing rollup rows instead of duplicating them
+    r = client.post(
+        f"/workspaces/{wid}/time/import",
+        json={"entries": entries[:10]},
+        headers=headers,
+    )
+    assert r.status_code == 200
+    assert len(_rollup(db_session, wid)) == len(incremental)
+
+
+def test_rebuild_buckets_days_in_utc_on_postgres():
+    # DATE(timestamptz) follows the session time zone; the rebuild must not
+    engine = create_mock_engine("postgresql://", executor=None)
+    day = crud_time.utc_day(Session(bind=engine), TimeEntry.started_at)
+    sql = str(day.compile(dialect=postgresql.dialect()))
+    assert sql == "date(timezone(%(timezone_1)s, time_entry.started_at))"
+    assert day.compile(dialect=postgresql.dialect()).params == {"timezone_1": "UTC"}
+
+
+def test_time_tracking_access_rules(client):
+    _register(client, "owner+time@example.com")
+    owner = _auth_headers(_login_token(client, "owner+time@example.com"))
+    wid, _, _, t1, _ = _bootstrap(client, owner)
+    _, _, _, other_task, _ = _bootstrap(client, owner)
+
+    outsider_user = _register(client, "outsider+time@example.com")
+    outsider = _auth_headers(_login_token(client, "outsider+time@example.com"))
+
+    assert client.post(f"/tasks/{t1}/time/start", headers=outsider).status_code == 403
+    assert client.get(f"/tasks/{t1}/time", headers=outsider).status_code == 403
+    r = client.get(
+        f"/workspaces/{wid}/time/report?start=2026-01-01&end=2026-01-31",
+        headers=outsider,
+    )
+    assert r.status_code == 403
+    assert (
+        client.post(
+            f"/workspaces/{wid}/time/rollup:rebuild", headers=outsider
+        ).status_code
+        == 403
+    )
+    missing = "00000000-0000-0000-0000-000000000000"
+    assert client.post(f"/tasks/{missing}/time/start", headers=owner).status_code == 404
+
+    row = {"minutes": 30, "started_at": "2026-01-05T10:00:00Z"}
+    # tasks must belong to the target workspace
+    r = client.post(
+        f"/workspaces/{wid}/time/import",
+        json={"entries": [{**row, "task_id": other_task}]},
+        headers=owner,
+    )
+    assert r.status_code == 422 and other_task in r.json()["detail"]
+    # entries for non-members are rejected
+    r = client.post(
+        f"/workspaces/{wid}/time/import",
+        json={"entries": [{**row, "task_id": t1, "user_id": outsider_user["id"]}]},
+        headers=owner,
+    )
+    assert r.status_code == 422
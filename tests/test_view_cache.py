@@ -0,0 +1,115 @@
+# File: /tests/test_view_cache.py | Version: 1.2 | Title: Saved-view result cache (LRU/TTL backends + scope-version invalidation)
+from __future__ import annotations
+
+from typing import Dict
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.cache import (
+    LocalCache,
+    NullCache,
+    ResultCache,
+    cache_key,
+    get_view_cache,
+    make_cache,
+)
+from app.core.config import settings
+from app.crud.view import create_view
+from app.schemas.view import ViewCreate
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register_and_login(client: TestClient, email: str) -> Dict[str, str]:
+    r = client.post(
+        "/auth/register",
+        json={"email": email, "password": "Passw0rd!", "full_name": "Tester"},
+    )
+    assert r.status_code in (200, 201), r.text
+    user_id = r.json()["id"]
+    r = client.post("/auth/login", json={"email": email, "password": "Passw0rd!"})
+    return {"id": user_id, "token": r.json()["access_token"]}
+
+
+def test_local_cache_lru_ttl_and_stats():
+    now = [0.0]
+    cache = LocalCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    cache.set("a", {"n": 1})
+    cache.set("b", {"n": 2})
+    assert cache.get("a") == {"n": 1}  # a is now most recently used
+    cache.set("c", {"n": 3})  # evicts b
+    assert cache.get("b") is None and cache.get("c") == {"n": 3}
+    now[0] = 10.0
+    assert cache.get("a") is None and len(cache) == 1  # expired entries are dropped
+
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 2 and stats["evictions"] == 1
+    assert stats["hit_ratio"] == 0.5 and stats["backend"] == "LocalCache"
+
+    assert cache_key("v", 1, None) == cache_key("v", 1, None) != cache_key("v", 2, None)
+    off = make_cache("off")
+    off.set("a", 1)
+    assert isinstance(off, NullCache) and off.get("a") is None
+    with pytest.raises(ValueError):
+        make_cache("memcached")
+    with pytest.raises(TypeError):
+        ResultCache()  # backends must implement _get and set
+
+
+def test_view_results_are_cached_until_the_list_changes(
+    client: TestClient, db_session: Session, monkeypatch
+):
+    me = _register_and_login(client, "view-cache@example.com")
+    headers = _auth_headers(me["token"])
+    wid = client.post("/workspaces/", json={"name": "V"}, headers=headers).json()["id"]
+    sid = client.post(
+        "/spaces/", json={"name": "S", "workspace_id": wid}, headers=headers
+    ).json()["id"]
+    lid = client.post(
+        "/lists/", json={"name": "L", "space_id": sid}, headers=headers
+    ).json()["id"]
+    tid = client.post(
+        "/tasks/", json={"name": "b", "list_id": lid, "space_id": sid}, headers=headers
+    ).json()["id"]
+
+    view = create_view(
+        db_session,
+        owner_id=me["id"],
+        data=ViewCreate(scope_type="list", scope_id=lid, name="Cached"),
+    )
+
+    def apply(page=1):
+        r = client.get(
+            f"/views/{view.id}/tasks", params={"page": page}, headers=headers
+        )
+        assert r.status_code == 200, r.text
+        return r.json(), r.headers["x-cache"]
+
+    before = get_view_cache().stats()
+    assert apply() == (
+        {"total": 1, "pages": 1, "items": [{"id": tid, "name": "b"}]},
+        "MISS",
+    )
+    assert apply()[1] == "HIT"
+    assert apply(page=2)[1] == "MISS"  # pages are cached separately
+
+    # a task write bumps the list version, so the old entry is never served again
+    client.post(
+        "/tasks/", json={"name": "a", "list_id": lid, "space_id": sid}, headers=headers
+    )
+    result, status = apply()
+    assert status == "MISS" and [i["name"] for i in result["items"]] == ["a", "b"]
+    assert apply()[1] == "HIT"
+
+    # counters are ops data: profiling admins only
+    assert client.get("/views/cache/stats", headers=headers).status_code == 403
+    monkeypatch.setattr(settings, "PROFILING_WORKSPACE_ID", wid)
+    r = client.get("/views/cache/stats", headers=headers)
+    assert r.status_code == 200
+    assert r.json()["hits"] - before["hits"] == 2
+    assert r.json()["misses"] - before["misses"] == 3
+    assert client.get("/views/cache/stats").status_code == 401
@@ -8,7 +8,16 @@ from sqlalchemy.orm import Session
 
 # Import the function-under-test directly (bypass HTTP client)
 from app.routers.views import apply_view_to_tasks
-from app.models.core_entities import User, Workspace, Space, List as ListModel, Task
+from app.models.core_entities import (
+    User,
+    Workspace,
+    WorkspaceMember,
+    Space,
+    List as ListModel,
+    Tag,
+    Task,
+    TaskTag,
+)
 from app.models.view import View as ViewModel
 
 
@@ -78,7 +87,8 @@ def test_apply_view_lists_tasks_sorted_and_paged(db_session: Session):
     """
     # Seed data
     user = _get_or_create_user(db_session, "vapply@example.com")
-    _, _, lst = _seed_scope_with_list(db_session, user.id)
+    ws, _, lst = _seed_scope_with_list(db_session, user.id)
+    db_session.add(WorkspaceMember(workspace_id=ws.id, user_id=user.id, role="member"))
 
     _add_tasks(db_session, lst.id, ["Bravo", "Alpha", "Charlie"])
     view = _make_view(
@@ -154,23 +164,125 @@ def test_apply_view_rejects_non_owner(db_session: Session):
     assert "View not found" in ex.value.detail
 
 
-def test_apply_view_rejects_non_list_scope(db_session: Session):
+def test_apply_view_list_scope_requires_membership(db_session: Session):
     """
-    Only 'list'-scoped views can be applied to tasks; any other scope returns 400.
+    A list-scoped view over someone else's list must not expose its tasks:
+    owning the view is not enough without membership in the list's workspace.
+    """
+    owner = _get_or_create_user(db_session, "list-owner@example.com")
+    _, _, lst = _seed_scope_with_list(db_session, owner.id)
+    _add_tasks(db_session, lst.id, ["Secret"])
+    outsider = _get_or_create_user(db_session, "list-outsider@example.com")
+    view = _make_view(
+        db_session, owner_id=outsider.id, scope_type="list", scope_id=lst.id
+    )
+
+    with pytest.raises(HTTPException) as ex:
+        apply_view_to_tasks(
+            view_id=view.id,
+            sort=None,
+            page=1,
+            per_page=10,
+            db=db_session,
+            current_user=outsider,
+        )
+    assert ex.value.status_code == 403
+
+
+def test_apply_view_space_scope_requires_membership(db_session: Session):
+    """
+    Space- and workspace-scoped views read across lists, so (like /tasks/filter)
+    they need workspace membership; members get the view's filters applied.
     """
     user = _get_or_create_user(db_session, "scoper@example.com")
-    ws, sp, _ = _seed_scope_with_list(db_session, user.id)  # we’ll use the space scope
+    ws, sp, lst = _seed_scope_with_list(db_session, user.id)
+    other = ListModel(name="L2", space_id=sp.id)
+    db_session.add(other)
+    db_session.flush()
+    _add_tasks(db_session, lst.id, ["Alpha"])
+    _add_tasks(db_session, other.id, ["Bravo", "Charlie"])
 
     view = _make_view(
         db_session,
         owner_id=user.id,
-        scope_type="space",  # not 'list'
+        scope_type="space",
         scope_id=sp.id,
         sort_spec="name:asc",
     )
 
+    def apply():
+        return apply_view_to_tasks(
+            view_id=view.id,
+            sort=None,
+            page=1,
+            per_page=10,
+            db=db_session,
+            current_user=user,
+        )
+
+    with pytest.raises(HTTPException) as ex:
+        apply()
+    assert ex.value.status_code == 403
+
+    db_session.add(WorkspaceMember(workspace_id=ws.id, user_id=user.id, role="member"))
+    db_session.commit()
+    assert [it["name"] for it in apply()["items"]] == ["Alpha", "Bravo", "Charlie"]
+
+    view.filters_json = {"filters": [{"field": "name", "op": "ne", "value": "Bravo"}]}
+    db_session.commit()
+    assert [it["name"] for it in apply()["items"]] == ["Alpha", "Charlie"]
+
+
+def test_apply_view_filters_and_projects_columns(db_session: Session):
+    """
+    filters_json goes through the /tasks/filter engine (shorthand and rule form),
+    columns_json picks the returned fields and side data is fetched only on request.
+    """
+    user = _get_or_create_user(db_session, "vcols@example.com")
+    ws, _, lst = _seed_scope_with_list(db_session, user.id)
+    db_session.add(WorkspaceMember(workspace_id=ws.id, user_id=user.id, role="member"))
+    tasks = [
+        Task(name="Open high", list_id=lst.id, status="open", priority="high"),
+        Task(name="Open low", list_id=lst.id, status="open", priority="low"),
+        Task(name="Done", list_id=lst.id, status="done", priority="high"),
+    ]
+    db_session.add_all(tasks)
+    tag = Tag(workspace_id=ws.id, name="urgent")
+    db_session.add(tag)
+    db_session.flush()
+    db_session.add(TaskTag(task_id=tasks[0].id, tag_id=tag.id))
+    view = _make_view(
+        db_session,
+        owner_id=user.id,
+        scope_type="workspace",
+        scope_id=ws.id,
+        sort_spec="name:asc",
+    )
+    view.filters_json = {
+        "status": ["open", "in_progress"],
+        "filters": [{"field": "priority", "op": "eq", "value": "high"}],
+    }
+    view.columns_json = ["status", "tags", "bogus"]
+    db_session.commit()
+
+    result = apply_view_to_tasks(
+        view_id=view.id,
+        sort=None,
+        page=1,
+        per_page=10,
+        db=db_session,
+        current_user=user,
+    )
+    assert result == {
+        "total": 1,
+        "pages": 1,
+        "items": [{"id": tasks[0].id, "status": "open", "tags": ["urgent"]}],
+    }
+
+    view.filters_json = {"filters": [{"field": "status", "op": "bogus"}]}
+    db_session.commit()
     with pytest.raises(HTTPException) as ex:
-        _ = apply_view_to_tasks(
+        apply_view_to_tasks(
             view_id=view.id,
             sort=None,
             page=1,
@@ -179,4 +291,3 @@ def test_apply_view_rejects_non_list_scope(db_session: Session):
             current_user=user,
         )
     assert ex.value.status_code == 400
-    assert "Only list-scoped views" in ex.value.detail